@@ -8,34 +8,63 @@
 """The main program for the RAMSTK application."""
 
 # Standard Library Imports
+import argparse
 import os
 import shutil
 import sys
-from time import sleep
-from typing import Tuple
+from typing import List, Tuple
 
 # Third Party Imports
 from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk import RAMSTKProgramManager
+from ramstk.batch import (
+    BATCH_MODULES, do_run_batch, get_batch_modules, get_timing_report
+)
 from ramstk.configuration import (
     RAMSTKSiteConfiguration, RAMSTKUserConfiguration
 )
-from ramstk.controllers import (
-    amAllocation, amFMEA, amHardware, amHazards, amSimilarItem,
-    amStakeholder, amValidation, dmAllocation, dmFailureDefinition,
-    dmFMEA, dmFunction, dmHardware, dmHazards, dmOptions, dmPoF,
-    dmPreferences, dmProgramStatus, dmRequirement, dmRevision,
-    dmSimilarItem, dmStakeholder, dmUsageProfile, dmValidation
-)
-from ramstk.db.base import BaseDatabase
-from ramstk.db.common import do_load_variables
-from ramstk.exim import Export, Import
+from ramstk.db.base import BaseDatabase, do_configure_pool
+from ramstk.exceptions import DataAccessError
 from ramstk.logger import RAMSTKLogManager
+from ramstk.profiler import RAMSTKImportProfiler
 from ramstk.utilities import file_exists
-from ramstk.views.gtk3 import Gtk, RAMSTKDesktop, _
-from ramstk.views.gtk3.widgets import RAMSTKDatabaseSelect
+
+# The controllers, export/import, and GTK3 views are imported when they're
+# needed rather than here.  This keeps them out of the import of this module
+# so the --startup-profile switch can time them.
+
+
+def do_batch(args: argparse.Namespace) -> int:
+    """Calculate a RAMSTK program database without the GUI.
+
+    The program database connection information not passed on the command
+    line is taken from the user configuration.  The time taken by each stage
+    of the batch is printed when the batch is finished.
+
+    :param args: the parsed command line arguments.
+    :return: the exit status; zero if the batch succeeded.
+    :rtype: int
+    """
+    user_configuration, _logger = do_read_user_configuration()
+
+    _database = dict(user_configuration.RAMSTK_PROG_INFO)
+    _database['database'] = args.db
+    for _key in ['dialect', 'host', 'port', 'user']:
+        if getattr(args, _key) is not None:
+            _database[_key] = getattr(args, _key)
+
+    try:
+        _timings = do_run_batch(_database, args.revision, args.calculate,
+                                user_configuration)
+    except DataAccessError as _error:
+        print(_error.msg, file=sys.stderr)
+        return 1
+
+    print(get_timing_report(_timings))
+
+    return 0
 
 
 def do_connect_to_site_db(conn_info) -> BaseDatabase:
@@ -70,6 +99,11 @@ def do_first_run(configuration: RAMSTKSiteConfiguration) -> None:
     :return: _site_db
     :rtype: dict
     """
+    # pylint: disable=import-outside-toplevel
+    # RAMSTK Package Imports
+    from ramstk.views.gtk3 import Gtk, _
+    from ramstk.views.gtk3.widgets import RAMSTKDatabaseSelect
+
     _dialog = RAMSTKDatabaseSelect(
         dlgtitle=_("Set up RAMSTK Site Database Server Connection"),
         dao=BaseDatabase(),
@@ -126,6 +160,58 @@ def do_initialize_loggers(log_file: str, log_level: str) -> RAMSTKLogManager:
     return _logger
 
 
+def do_parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """Parse the RAMSTK command line arguments.
+
+    Unknown arguments are ignored so they can be passed on to GTK.  The
+    batch command runs the calculations without the GUI.
+
+    :param argv: the list of command line arguments less the program name.
+    :return: the parsed arguments.
+    :rtype: :class:`argparse.Namespace`
+    """
+    _parser = argparse.ArgumentParser(
+        prog='ramstk',
+        description="The Reliability, Availability, Maintainability, and "
+        "Safety ToolKit.")
+    _parser.add_argument(
+        '--startup-profile',
+        action='store_true',
+        help="print the time taken to import each module while RAMSTK "
+        "starts.")
+
+    _subparsers = _parser.add_subparsers(dest='command')
+    _batch = _subparsers.add_parser(
+        'batch',
+        help="calculate a program database without the GUI.",
+        description="Calculate and save a RAMSTK program database without "
+        "the GUI and print the time taken by each stage.")
+    _batch.add_argument(
+        '--db',
+        required=True,
+        help="the program database; the file for SQLite or the database "
+        "name for PostgreSQL.")
+    _batch.add_argument(
+        '--revision',
+        type=int,
+        default=1,
+        help="the ID of the revision to calculate (default: %(default)s).")
+    _batch.add_argument(
+        '--calculate',
+        type=get_batch_modules,
+        default=BATCH_MODULES,
+        help="the comma-separated list of modules to calculate (default: "
+        "{0}).".format(','.join(BATCH_MODULES)))
+    _batch.add_argument('--dialect',
+                        choices=['postgres', 'sqlite'],
+                        help="the program database dialect.")
+    _batch.add_argument('--host', help="the program database server.")
+    _batch.add_argument('--port', help="the program database server port.")
+    _batch.add_argument('--user', help="the program database user.")
+
+    return _parser.parse_known_args(argv)[0]
+
+
 def do_read_site_configuration() -> RAMSTKSiteConfiguration:
     """Create a site configuration instance.
 
@@ -187,6 +273,10 @@ def do_read_user_configuration(
     _configuration.set_user_directories()
     _configuration.get_user_configuration()
 
+    do_configure_pool(pool_size=_configuration.RAMSTK_POOL_SIZE,
+                      max_overflow=_configuration.RAMSTK_POOL_OVERFLOW,
+                      pool_pre_ping=_configuration.RAMSTK_POOL_PRE_PING)
+
     if _configuration.RAMSTK_DATA_DIR == '':
         _configuration.RAMSTK_DATA_DIR = _configuration.RAMSTK_CONF_DIR + \
                                          '/layouts'
@@ -210,6 +300,41 @@ def do_read_user_configuration(
 
 def the_one_ring() -> None:
     """Execute the main function for RAMSTK."""
+    _args = do_parse_arguments(sys.argv[1:])
+    if _args.command == 'batch':
+        sys.exit(do_batch(_args))
+
+    _profiler = RAMSTKImportProfiler()
+    if _args.startup_profile:
+        _profiler.do_start()
+
+    # pylint: disable=import-outside-toplevel
+    # RAMSTK Package Imports
+    from ramstk.controllers import (
+        amAllocation, amFMEA, amHardware, amHazards, amSimilarItem,
+        amStakeholder, amValidation, dmAllocation, dmFailureDefinition,
+        dmFMEA, dmFunction, dmHardware, dmHazards, dmOptions, dmPoF,
+        dmPreferences, dmProgramStatus, dmRequirement, dmRevision,
+        dmSimilarItem, dmStakeholder, dmUsageProfile, dmValidation
+    )
+    from ramstk.db.common import do_load_cached_variables, do_load_variables
+    from ramstk.exim import Export, Import
+    from ramstk.views.gtk3 import Gtk, RAMSTKDesktop
+
+    def on_map_desktop(desktop: RAMSTKDesktop, __event) -> bool:
+        """Print the startup profile once the RAMSTK desktop is shown.
+
+        :param desktop: the RAMSTKDesktop() that was mapped.
+        :param __event: the Gdk.EventAny() that triggered the signal.
+        :return: False to let the event propagate.
+        :rtype: bool
+        """
+        desktop.disconnect_by_func(on_map_desktop)
+        _profiler.do_stop()
+        print(_profiler.get_report())
+
+        return False
+
     # ISSUE: Implement splash screen.
     # //
     # // Add a splash screen to the launch of RAMSTK.
@@ -234,9 +359,16 @@ def the_one_ring() -> None:
                     logger_name='DEBUG',
                     message="Validated the RAMSTK license.")
 
+    # Check the site variables cache before connecting to the site database
+    # so a cached SQLite site database isn't opened just to fingerprint it.
+    _cache_file = user_configuration.RAMSTK_CONF_DIR + '/site_variables.cache'
+    _cached = do_load_cached_variables(site_configuration.RAMSTK_COM_INFO,
+                                       user_configuration, _cache_file)
+
     site_db = do_connect_to_site_db(site_configuration.RAMSTK_COM_INFO)
 
-    do_load_variables(site_db, user_configuration)
+    if not _cached:
+        do_load_variables(site_db, user_configuration, cache_file=_cache_file)
 
     pub.sendMessage('do_log_info_msg',
                     logger_name='INFO',
@@ -293,12 +425,14 @@ def the_one_ring() -> None:
     # while Gtk.events_pending():
     #     Gtk.main_iteration()
 
-    sleep(1)
     # splScreen.window.destroy()
 
     # Create the RAMSTK Book.  This needs to be initialized after reading the
     # configuration and creating the logger.
-    RAMSTKDesktop([user_configuration, site_configuration], _logger)
+    _desktop = RAMSTKDesktop([user_configuration, site_configuration],
+                             _logger)
+    if _args.startup_profile:
+        _desktop.connect('map_event', on_map_desktop)
 
     pub.sendMessage(
         'do_log_info_msg',
@@ -307,3 +441,7 @@ def the_one_ring() -> None:
     )
 
     Gtk.main()
+
+
+if __name__ == '__main__':
+    the_one_ring()
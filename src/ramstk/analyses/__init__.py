@@ -1,8 +1,27 @@
-# pylint: disable=unused-import
 """The RAMSTK Analyses Package."""
 
-# RAMSTK Local Imports
-from . import (
-    allocation, criticality, derating, dormancy,
-    fha, improvementfactor, similaritem, stress
-)
+# Standard Library Imports
+import importlib
+from types import ModuleType
+
+# The analysis modules are imported the first time they're used because some
+# of them pull in sympy and scipy which are slow to import.
+__all__ = [
+    'allocation', 'criticality', 'derating', 'dormancy', 'fha',
+    'improvementfactor', 'similaritem', 'stress'
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import an analysis module the first time it is used.
+
+    :param name: the name of the analysis module.
+    :return: the analysis module.
+    :rtype: :class:`types.ModuleType`
+    :raise: AttributeError if name isn't an analysis module.
+    """
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module '{0}' has no attribute '{1}'".format(
+        __name__, name))
@@ -6,6 +6,12 @@
 # Copyright 2019 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """FMEA Criticality Analysis Module."""
 
+# Standard Library Imports
+from typing import Any, Dict, List, Tuple
+
+# Third Party Imports
+import numpy as np
+
 # RAMSTK Package Imports
 from ramstk.exceptions import OutOfRangeError
 
@@ -100,3 +106,149 @@ def calculate_mode_criticality(mode_hr, mode_op_time, eff_prob):
                                "of [0.0, 1.0]."))
 
     return mode_hr * mode_op_time * eff_prob
+
+
+def calculate_mode_hazard_rates(item_hr: np.ndarray,
+                                mode_ratio: np.ndarray) -> np.ndarray:
+    """Calculate the failure mode hazard rates for an array of failure modes.
+
+    This is the array version of calculate_mode_hazard_rate() used to
+    calculate the hazard rate of every failure mode in a system at once.
+
+        >>> item_hr = np.array([0.000617, 0.000617])
+        >>> mode_ratio = np.array([0.23, 0.77])
+        >>> calculate_mode_hazard_rates(item_hr, mode_ratio)
+        array([0.00014191, 0.00047509])
+
+    :param item_hr: the hazard rate of the (hardware) item each mode is
+        associated with.
+    :param mode_ratio: the ratio of each failure mode.
+    :return: the hazard rate of each failure mode.
+    :rtype: :class:`numpy.ndarray`
+    :raise: OutOfRangeError if passed a negative or missing (NaN) item hazard
+        rate or a mode ratio outside [0.0, 1.0].
+    """
+    item_hr = np.asarray(item_hr, dtype=float)
+    mode_ratio = np.asarray(mode_ratio, dtype=float)
+
+    # Written so NaN, which fails every comparison, is rejected too.
+    if not np.all(item_hr >= 0.0):
+        raise OutOfRangeError(("calculate_mode_hazard_rates() was passed a "
+                               "negative or missing value for an item hazard "
+                               "rate."))
+    if not np.all((mode_ratio >= 0.0) & (mode_ratio <= 1.0)):
+        raise OutOfRangeError(("calculate_mode_hazard_rates() was passed a "
+                               "failure mode ratio outside the range of "
+                               "[0.0, 1.0]."))
+
+    return item_hr * mode_ratio
+
+
+def calculate_mode_criticalities(mode_hr: np.ndarray,
+                                 mode_op_time: np.ndarray,
+                                 eff_prob: np.ndarray) -> np.ndarray:
+    """Calculate the MIL-STD-1629A, Task 102 criticality of failure modes.
+
+    This is the array version of calculate_mode_criticality() used to
+    calculate the criticality of every failure mode in a system at once.
+
+    :param mode_hr: the hazard rate of each failure mode.
+    :param mode_op_time: the operating time of each failure mode (i.e., the
+        time at risk).
+    :param eff_prob: the probability the end effect is the one observed for
+        each failure mode.
+    :return: the Task 102 criticality of each failure mode.
+    :rtype: :class:`numpy.ndarray`
+    :raise: OutOfRangeError if passed a missing (NaN) mode hazard rate, a
+        negative or missing mode operating time, or an effect probability
+        outside [0.0, 1.0].
+    """
+    mode_hr = np.asarray(mode_hr, dtype=float)
+    mode_op_time = np.asarray(mode_op_time, dtype=float)
+    eff_prob = np.asarray(eff_prob, dtype=float)
+
+    if np.any(np.isnan(mode_hr)):
+        raise OutOfRangeError(("calculate_mode_criticalities() was passed a "
+                               "missing value for a failure mode hazard "
+                               "rate."))
+    # Written as not all() so NaN, which fails every comparison, is rejected
+    # too.
+    if not np.all(mode_op_time >= 0.0):
+        raise OutOfRangeError(("calculate_mode_criticalities() was passed a "
+                               "negative or missing value for failure mode "
+                               "operating time."))
+    if not np.all((eff_prob >= 0.0) & (eff_prob <= 1.0)):
+        raise OutOfRangeError(("calculate_mode_criticalities() was passed a "
+                               "failure effect probability outside the range "
+                               "of [0.0, 1.0]."))
+
+    return mode_hr * mode_op_time * eff_prob
+
+
+def do_calculate_criticality_matrix(
+        item_id: List[Any], severity_class: List[str],
+        mode_criticality: np.ndarray) -> Dict[Any, Dict[str, float]]:
+    """Sum failure mode criticalities into a system criticality matrix.
+
+    The matrix has one row for each item and one column for each severity
+    class.  Each cell is the item criticality; the sum of the criticality of
+    the item's failure modes having that severity class.
+
+        >>> do_calculate_criticality_matrix([1, 1, 2], ['I', 'II', 'I'],
+        ...                                 np.array([0.1, 0.2, 0.3]))
+        {1: {'I': 0.1, 'II': 0.2}, 2: {'I': 0.3, 'II': 0.0}}
+
+    :param item_id: the ID of the item each failure mode belongs to.
+    :param severity_class: the severity class of each failure mode.
+    :param mode_criticality: the criticality of each failure mode.
+    :return: the criticality matrix as {item ID: {severity class: item
+        criticality}}.
+    :rtype: dict
+    """
+    _items, _rows = np.unique(np.asarray(item_id), return_inverse=True)
+    _classes, _columns = np.unique(np.asarray(severity_class, dtype=str),
+                                   return_inverse=True)
+
+    _matrix = np.zeros((len(_items), len(_classes)))
+    np.add.at(_matrix, (_rows, _columns),
+              np.asarray(mode_criticality, dtype=float))
+
+    return {
+        _item.item(): {
+            str(_class): float(_matrix[_row, _column])
+            for _column, _class in enumerate(_classes)
+        }
+        for _row, _item in enumerate(_items)
+    }
+
+
+def do_calculate_pareto_index(
+    criticality_matrix: Dict[Any, Dict[str, float]]
+) -> List[Tuple[Any, float, float]]:
+    """Rank the items in a criticality matrix by their total criticality.
+
+    The Pareto index lists the items from most to least critical along with
+    the cumulative fraction of the system criticality accounted for by the
+    item and all the items ranked above it.
+
+        >>> do_calculate_pareto_index({1: {'I': 0.125, 'II': 0.125},
+        ...                            2: {'I': 0.5, 'II': 0.25}})
+        [(2, 0.75, 0.75), (1, 0.25, 1.0)]
+
+    :param criticality_matrix: the criticality matrix produced by
+        do_calculate_criticality_matrix().
+    :return: a list of (item ID, item criticality, cumulative fraction)
+        tuples sorted by descending item criticality.
+    :rtype: list
+    """
+    _items = list(criticality_matrix.keys())
+    _totals = np.array(
+        [sum(criticality_matrix[_item].values()) for _item in _items])
+
+    _order = np.argsort(-_totals, kind='stable')
+    _cumulative = np.cumsum(_totals[_order])
+    if _cumulative.size > 0 and _cumulative[-1] > 0.0:
+        _cumulative = _cumulative / _cumulative[-1]
+
+    return [(_items[_idx], float(_totals[_idx]), float(_cumulative[_rank]))
+            for _rank, _idx in enumerate(_order)]
@@ -2,7 +2,7 @@
 """The MIL-HDBK-217F Analyses Package."""
 
 # RAMSTK Local Imports
-from . import milhdbk217f
+from . import batch, milhdbk217f, tables
 from .models import (
     capacitor, connection, crystal, efilter, fuse, inductor,
     integratedcircuit, lamp, meter, relay, resistor, semiconductor, switch
@@ -0,0 +1,1144 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.milhdbk217f.batch.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2019 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""MIL-HDBK-217F Batch Calculations Module.
+
+The functions in this module predict the active hazard rate of many parts at
+once.  Inputs are passed as columns (one array per attribute) rather than one
+attributes dict per part.  Parts are grouped by hazard rate method, category,
+and subcategory and each group is evaluated as a set of NumPy expressions that
+mirror the scalar models in ramstk.analyses.milhdbk217f.models.
+
+Where the scalar models would raise an exception (unknown ID, division by
+zero, negative input to a fractional power, etc.) the batch functions return
+NaN for the affected part.  ID's less than one are always treated as unknown;
+they do not wrap around to the end of the factor list as they would when used
+as a Python list index.
+"""
+
+# Standard Library Imports
+from typing import Any, Callable, Dict, List
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from . import milhdbk217f, tables
+from .models import (
+    capacitor, connection, crystal, efilter, fuse, inductor,
+    integratedcircuit, lamp, meter, relay, resistor, semiconductor, switch
+)
+
+ATTRIBUTES: List[str] = [
+    'application_id', 'area', 'capacitance', 'category_id',
+    'configuration_id', 'construction_id', 'contact_form_id',
+    'contact_gauge', 'contact_rating_id', 'current_operating',
+    'current_rated', 'current_ratio', 'duty_cycle', 'environment_active_id',
+    'family_id', 'feature_size', 'frequency_operating', 'hazard_rate_active',
+    'hazard_rate_method_id', 'insert_id', 'insulation_id', 'manufacturing_id',
+    'matching_id', 'n_active_pins', 'n_circuit_planes', 'n_cycles',
+    'n_elements', 'n_hand_soldered', 'n_wave_soldered', 'package_id',
+    'page_number', 'piE', 'piQ', 'power_operating', 'power_rated',
+    'power_ratio', 'quality_id', 'resistance', 'specification_id',
+    'subcategory_id', 'technology_id', 'temperature_active',
+    'temperature_case', 'temperature_rated_max', 'theta_jc', 'type_id',
+    'voltage_ac_operating', 'voltage_dc_operating', 'voltage_esd',
+    'voltage_rated', 'voltage_ratio', 'weight', 'years_in_production'
+]
+
+
+def _do_calculate_capacitor(subcategory_id: int,
+                            attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for capacitors.
+
+    :param subcategory_id: the capacitor subcategory identifier.
+    :param attributes: the columns of the capacitors being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _f0, _f1, _f2, _f3, _f4 = capacitor.LAMBDA_B_FACTORS[subcategory_id]
+
+    # Use the reference temperature for the REF_TEMPS key closest to the
+    # maximum rated temperature.  Ties go to the smaller key.
+    _temperatures = np.array(list(capacitor.REF_TEMPS))
+    _ref_temp = np.array(list(capacitor.REF_TEMPS.values()))[np.argmin(
+        np.abs(_temperatures[np.newaxis, :]
+               - attributes['temperature_rated_max'][:, np.newaxis]),
+        axis=1)]
+
+    attributes['lambda_b'] = _f0 * (
+        (attributes['voltage_ratio'] / _f1)**_f2 + 1.0) * np.exp(_f3 * (
+            (attributes['temperature_active'] + 273.0) / _ref_temp)**_f4)
+    _c0, _c1 = capacitor.PI_CV_FACTORS[subcategory_id]
+    attributes['piCV'] = _c0 * attributes['capacitance']**_c1
+
+    _hazard_rate = (attributes['lambda_b'] * attributes['piQ']
+                    * attributes['piE'] * attributes['piCV'])
+    if subcategory_id == 12:
+        _resistance = _do_divide(
+            attributes['resistance'], attributes['voltage_dc_operating']
+            + attributes['voltage_ac_operating'])
+        attributes['piSR'] = np.select([
+            np.isnan(_resistance), (_resistance > 0.0) & (_resistance <= 0.1),
+            (_resistance > 0.1) & (_resistance <= 0.2),
+            (_resistance > 0.2) & (_resistance <= 0.4),
+            (_resistance > 0.4) & (_resistance <= 0.6),
+            (_resistance > 0.6) & (_resistance <= 0.8)
+        ], [np.nan, 0.33, 0.27, 0.2, 0.13, 0.1], 0.066)
+        _hazard_rate = _hazard_rate * attributes['piSR']
+    elif subcategory_id == 13:
+        attributes['piC'] = _get_factor(capacitor.PI_C,
+                                        attributes['construction_id'])
+        _hazard_rate = _hazard_rate * attributes['piC']
+    elif subcategory_id == 19:
+        attributes['piCF'] = _get_factor(capacitor.PI_CF,
+                                         attributes['configuration_id'])
+        _hazard_rate = _hazard_rate * attributes['piCF'] / attributes['piCV']
+
+    return _hazard_rate
+
+
+def _do_calculate_connection(subcategory_id: int,
+                             attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for connections.
+
+    :param subcategory_id: the connection subcategory identifier.
+    :param attributes: the columns of the connections being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _gauge_factor = _get_factor(connection.CONTACT_GAUGE_FACTORS,
+                                attributes['contact_gauge'])
+    attributes['temperature_rise'] = (
+        _gauge_factor * attributes['current_operating']**1.85)
+    attributes['piC'] = np.where(
+        attributes['n_circuit_planes'] > 2,
+        0.65 * attributes['n_circuit_planes']**0.63, 1.0)
+    attributes['piP'] = np.exp(
+        ((attributes['n_active_pins'] - 1) / 10.0)**0.51064)
+    attributes['piK'] = _get_factor(
+        connection.PI_K,
+        np.searchsorted([0.05, 0.5, 5.0, 50.0], attributes['n_cycles']))
+
+    if subcategory_id == 1:
+        _factor_key = _get_factor(connection.FACTOR_KEYS,
+                                  attributes['type_id'],
+                                  attributes['specification_id'],
+                                  attributes['insert_id'] - 1)
+    else:
+        _factor_key = np.full(attributes['type_id'].shape, 5.0)
+    _ref_temp = _get_factor(connection.REF_TEMPS, _factor_key)
+    _factors = _get_factor(connection.LAMBDA_B_FACTORS, _factor_key)
+
+    if subcategory_id in [4, 5]:
+        attributes['lambda_b'] = _get_factor(
+            connection.PART_STRESS_LAMBDA_B[subcategory_id],
+            attributes['type_id'] - 1)
+    elif subcategory_id == 3:
+        attributes['lambda_b'] = np.full(_ref_temp.shape, 0.00042)
+    else:
+        _contact_temp = (attributes['temperature_active']
+                         + attributes['temperature_rise'] + 273.0)
+        attributes['lambda_b'] = _factors[:, 0] * np.exp(
+            _do_divide(_factors[:, 1], _contact_temp)
+            + (_contact_temp / _ref_temp)**_factors[:, 2])
+
+    _hazard_rate = attributes['lambda_b'] * attributes['piE']
+    if subcategory_id == 3:
+        _hazard_rate = _hazard_rate * attributes['piP']
+    elif subcategory_id == 4:
+        _hazard_rate = (_hazard_rate * (
+            attributes['n_wave_soldered'] * attributes['piC']
+            + attributes['n_hand_soldered'] *
+            (attributes['piC'] + 13.0)) * attributes['piQ'])
+    elif subcategory_id == 5:
+        _hazard_rate = _hazard_rate * attributes['piQ']
+    else:
+        _hazard_rate = _hazard_rate * attributes['piK'] * attributes['piP']
+
+    return _do_mask_invalid(_hazard_rate, _gauge_factor, attributes['piP'],
+                            _ref_temp)
+
+
+def _do_calculate_inductor(subcategory_id: int,
+                           attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for inductive devices.
+
+    :param subcategory_id: the inductor subcategory identifier.
+    :param attributes: the columns of the inductors being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    attributes['piC'] = attributes['construction_id']
+    if subcategory_id == 1:
+        attributes['piQ'] = _get_factor(inductor.PART_STRESS_PI_Q[1],
+                                        attributes['family_id'],
+                                        attributes['quality_id'] - 1)
+    else:
+        attributes['piQ'] = _get_factor(
+            inductor.PART_STRESS_PI_Q[subcategory_id],
+            attributes['quality_id'] - 1)
+
+    _power_operating = attributes['power_operating']
+    _power_input = (attributes['voltage_dc_operating']
+                    * attributes['current_operating'])
+    _weight = attributes['weight']
+    attributes['temperature_rise'] = np.select(
+        [(attributes['specification_id'] == 2) & (subcategory_id == 2),
+         (_power_operating > 0.0) & (attributes['area'] > 0.0),
+         (_power_operating > 0.0) & (_weight > 0.0),
+         (_power_input > 0.0) & (_weight > 0.0)], [
+             _get_factor(inductor.TEMPERATURE_RISE_SPEC_SHEET,
+                         attributes['page_number']),
+             125.0 * _do_divide(_power_operating, attributes['area']),
+             11.5 * _do_divide(_power_operating, _weight**0.6766),
+             2.1 * _do_divide(_power_input, _weight**0.6766)
+         ], 0.0)
+    attributes['temperature_hot_spot'] = (
+        attributes['temperature_active']
+        + 1.1 * attributes['temperature_rise'])
+
+    _ref_temp = _get_factor(inductor.REF_TEMPS[subcategory_id],
+                            attributes['insulation_id'])
+    _factors = _get_factor(inductor.LAMBDA_B_FACTORS[subcategory_id],
+                           attributes['insulation_id'])
+    attributes['lambda_b'] = _factors[:, 0] * np.exp(
+        ((attributes['temperature_hot_spot'] + 273.0) / _ref_temp)**
+        _factors[:, 1])
+
+    _hazard_rate = (attributes['lambda_b'] * attributes['piQ']
+                    * attributes['piE'])
+    if subcategory_id == 2:
+        _hazard_rate = _hazard_rate * attributes['piC']
+
+    return _hazard_rate
+
+
+def _do_calculate_integrated_circuit(subcategory_id: int,
+                                     attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for integrated circuits.
+
+    :param subcategory_id: the integrated circuit subcategory identifier.
+    :param attributes: the columns of the integrated circuits being
+        calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    attributes['temperature_junction'] = (
+        attributes['temperature_case']
+        + attributes['power_operating'] * attributes['theta_jc'])
+    if subcategory_id == 2:
+        _ref_temp = 296.0
+        _ea = _get_factor(integratedcircuit.ACTIVATION_ENERGY[2],
+                          attributes['family_id'] - 1)
+    elif subcategory_id == 9:
+        _ref_temp = 423.0
+        _ea = _get_factor(integratedcircuit.ACTIVATION_ENERGY[9],
+                          attributes['type_id'] - 1)
+    else:
+        _ref_temp = 296.0
+        _ea = integratedcircuit.ACTIVATION_ENERGY[subcategory_id]
+    attributes['piT'] = 0.1 * np.exp((-_ea / 8.617E-5) * (
+        _do_divide(1.0, attributes['temperature_junction'] + 273.0)
+        - 1.0 / _ref_temp))
+    attributes['piL'] = 0.01 * np.exp(
+        5.35 - 0.35 * attributes['years_in_production'])
+
+    if subcategory_id == 10:
+        attributes['lambdaBD'] = np.where(attributes['type_id'] == 1, 0.16,
+                                          0.24)
+        attributes['lambdaBP'] = 0.0022 + 1.72E-5 * attributes['n_active_pins']
+        attributes['lambdaEOS'] = -np.log(
+            1.0 - 0.00057 * np.exp(-0.0002 * attributes['voltage_esd']))
+        attributes['lambdaEOS'] = attributes['lambdaEOS'] / 0.00876
+        attributes['piCD'] = ((attributes['area'] / 0.21) * _do_divide(
+            2.0, attributes['feature_size'])**2.0 * 0.64) + 0.36
+        attributes['piMFG'] = np.where(attributes['manufacturing_id'] == 1,
+                                       0.55, 2.0)
+        attributes['piPT'] = _get_factor(integratedcircuit.PI_PT,
+                                         attributes['package_id'])
+
+        return (attributes['lambdaBD'] * attributes['piMFG']
+                * attributes['piT'] * attributes['piCD']
+                + attributes['lambdaBP'] * attributes['piE']
+                * attributes['piQ'] * attributes['piPT']
+                + attributes['lambdaEOS'])
+
+    attributes['C1'] = _get_die_complexity_factor(subcategory_id, attributes)
+    _package = np.select([
+        np.isin(attributes['package_id'], [1, 2, 3]),
+        attributes['package_id'] == 4, attributes['package_id'] == 5,
+        attributes['package_id'] == 6
+    ], [1, 2, 3, 4], 5)
+    _factors = _get_factor(integratedcircuit.C2, _package)
+    attributes['C2'] = (_factors[:, 0]
+                        * attributes['n_active_pins']**_factors[:, 1])
+
+    if subcategory_id == 6:
+        attributes['piECC'] = _get_factor(integratedcircuit.PI_ECC,
+                                          attributes['type_id'])
+        attributes['lambda_cyc'] = _get_lambda_cyclic(attributes)
+    else:
+        attributes['lambda_cyc'] = 0.0
+
+    if subcategory_id == 9:
+        attributes['piA'] = _get_factor(integratedcircuit.PI_A,
+                                        attributes['type_id'],
+                                        attributes['application_id'] - 1)
+        _die = attributes['C1'] * attributes['piT'] * attributes['piA']
+    else:
+        _die = attributes['C1'] * attributes['piT']
+
+    return ((_die + attributes['C2'] * attributes['piE']
+             + attributes['lambda_cyc']) * attributes['piQ']
+            * attributes['piL'])
+
+
+def _do_calculate_meter(subcategory_id: int,
+                        attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for meters.
+
+    :param subcategory_id: the meter subcategory identifier.
+    :param attributes: the columns of the meters being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    """
+    if subcategory_id == 1:
+        attributes['lambda_b'] = _get_factor(meter.PART_STRESS_LAMBDA_B[1],
+                                             attributes['type_id'] - 1)
+    elif subcategory_id == 2:
+        attributes['lambda_b'] = np.full(attributes['type_id'].shape,
+                                         meter.PART_STRESS_LAMBDA_B[2])
+    else:
+        attributes['lambda_b'] = np.zeros(attributes['type_id'].shape)
+
+    _ratio = _do_divide(attributes['temperature_active'],
+                        attributes['temperature_rated_max'])
+    attributes['piT'] = np.select([(_ratio > 0.0) & (_ratio <= 0.5),
+                                   (_ratio > 0.5) & (_ratio <= 0.6),
+                                   (_ratio > 0.6) & (_ratio <= 0.8),
+                                   (_ratio > 0.8) & (_ratio <= 1.0)],
+                                  [0.5, 0.6, 0.8, 1.0], np.nan)
+
+    _hazard_rate = attributes['lambda_b'] * attributes['piE']
+    if subcategory_id == 2:
+        attributes['piA'] = np.where(attributes['type_id'] == 1, 1.0, 1.7)
+        attributes['piF'] = _get_factor(meter.PI_F,
+                                        attributes['application_id'] - 1)
+        _hazard_rate = (_hazard_rate * attributes['piA'] * attributes['piF']
+                        * attributes['piQ'])
+    elif subcategory_id == 1:
+        _hazard_rate = _hazard_rate * attributes['piT']
+
+    return _do_mask_invalid(_hazard_rate, attributes['piT'])
+
+
+def _do_calculate_miscellaneous(subcategory_id: int,
+                                attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for miscellaneous parts.
+
+    Miscellaneous parts are crystals, electronic filters, fuses, and lamps.
+
+    :param subcategory_id: the miscellaneous part subcategory identifier.
+    :param attributes: the columns of the parts being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    if subcategory_id == 1:
+        attributes['lambda_b'] = 0.013 * attributes[
+            'frequency_operating']**0.23
+        _hazard_rate = (attributes['lambda_b'] * attributes['piQ']
+                        * attributes['piE'])
+    elif subcategory_id == 2:
+        attributes['lambda_b'] = _get_factor(efilter.PART_STRESS_LAMBDA_B,
+                                             attributes['type_id'])
+        _hazard_rate = (attributes['lambda_b'] * attributes['piQ']
+                        * attributes['piE'])
+    elif subcategory_id == 3:
+        _hazard_rate = 0.010 * attributes['piE']
+    elif subcategory_id == 4:
+        attributes['lambda_b'] = 0.074 * attributes['voltage_rated']**1.29
+        attributes['piU'] = np.select([
+            attributes['duty_cycle'] < 10.0, attributes['duty_cycle'] < 90.0
+        ], [0.1, 0.72], 1.0)
+        attributes['piA'] = np.where(attributes['application_id'] == 1, 1.0,
+                                     3.3)
+        _hazard_rate = (attributes['lambda_b'] * attributes['piU']
+                        * attributes['piA'] * attributes['piE'])
+    else:
+        raise KeyError(subcategory_id)
+
+    return _hazard_rate
+
+
+def _do_calculate_part_count(category_id: int, subcategory_id: int,
+                             attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the MIL-HDBK-217F parts count active hazard rates.
+
+    :param category_id: the category ID of the parts being calculated.
+    :param subcategory_id: the subcategory ID of the parts being calculated.
+    :param attributes: the columns of the parts being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _key = tables.PART_COUNT_KEYS.get(category_id, {}).get(subcategory_id)
+    attributes['lambda_b'] = tables.get_factor(
+        tables.PART_COUNT_LAMBDA_B, category_id, subcategory_id,
+        attributes[_key] if _key else 0, attributes['environment_active_id'])
+
+    if category_id == 2 and subcategory_id == 2:
+        attributes['piQ'] = _get_factor(
+            semiconductor.PART_COUNT_PI_Q_HF_DIODE,
+            np.where(attributes['type_id'] == 5, 1, 0),
+            attributes['quality_id'] - 1)
+    else:
+        attributes['piQ'] = tables.get_factor(tables.PART_COUNT_PI_Q,
+                                              category_id, subcategory_id,
+                                              attributes['quality_id'])
+
+    return attributes['lambda_b'] * attributes['piQ']
+
+
+def _do_calculate_part_count_item(columns: Dict[str, Any],
+                                  index: int) -> float:
+    """Calculate the parts count active hazard rate for one hardware item.
+
+    :param columns: the attribute columns for the hardware items.
+    :param index: the index of the hardware item to calculate.
+    :return: the active hazard rate or NaN if it could not be calculated.
+    :rtype: float
+    """
+    _attributes = {_key: 0 for _key in ATTRIBUTES}
+    for _key, _values in columns.items():
+        _attributes[_key] = np.asarray(_values)[index].item()
+
+    try:
+        # pylint: disable=protected-access
+        _hazard_rate = milhdbk217f._do_calculate_part_count(
+            **_attributes)['hazard_rate_active']
+    except (ArithmeticError, LookupError, NameError, TypeError,
+            ValueError):
+        _hazard_rate = np.nan
+
+    return _hazard_rate
+
+
+def _do_calculate_part_stress(category_id: int, subcategory_id: int,
+                              attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the MIL-HDBK-217F parts stress active hazard rates.
+
+    :param category_id: the category ID of the parts being calculated.
+    :param subcategory_id: the subcategory ID of the parts being calculated.
+    :param attributes: the columns of the parts being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if there is no model for the category ID or subcategory
+        ID.
+    """
+    _functions: Dict[int, Callable[[int, Dict[str, Any]], np.ndarray]] = {
+        1: _do_calculate_integrated_circuit,
+        2: _do_calculate_semiconductor,
+        3: _do_calculate_resistor,
+        4: _do_calculate_capacitor,
+        5: _do_calculate_inductor,
+        6: _do_calculate_relay,
+        7: _do_calculate_switch,
+        8: _do_calculate_connection,
+        9: _do_calculate_meter,
+        10: _do_calculate_miscellaneous
+    }
+
+    attributes['piE'] = tables.get_factor(tables.PI_E, category_id,
+                                          subcategory_id,
+                                          attributes['quality_id'],
+                                          attributes['environment_active_id'])
+    if category_id not in [2, 5]:
+        attributes['piQ'] = tables.get_factor(tables.PART_STRESS_PI_Q,
+                                              category_id, subcategory_id,
+                                              attributes['quality_id'])
+
+    _hazard_rate = _functions[category_id](subcategory_id, attributes)
+
+    return _do_mask_invalid(_hazard_rate, attributes['piE'],
+                            attributes['piQ'])
+
+
+def _do_calculate_relay(subcategory_id: int,
+                        attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for relays.
+
+    :param subcategory_id: the relay subcategory identifier.
+    :param attributes: the columns of the relays being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _quality_id = attributes['quality_id']
+    _quality = np.where(np.isin(_quality_id, [1, 2, 3, 4, 5, 6]), 1, 2)
+    _n_cycles = attributes['n_cycles']
+
+    if subcategory_id == 1:
+        _factors = _get_factor(relay.LAMBDA_B_FACTORS[1],
+                               attributes['type_id'] - 1)
+        attributes['lambda_b'] = _factors[:, 0] * np.exp(
+            ((attributes['temperature_active'] + 273.0) / _factors[:, 1])**
+            _factors[:, 2])
+    elif subcategory_id == 2:
+        attributes['lambda_b'] = _get_factor(relay.LAMBDA_B_FACTORS[2],
+                                             attributes['type_id'] - 1)
+    else:
+        attributes['lambda_b'] = np.zeros(_quality.shape)
+
+    attributes['piCYC'] = np.select([
+        (_quality == 1) & (_n_cycles < 1.0), (_quality_id == 7) &
+        (_n_cycles > 1000.0), (_quality_id == 7) & (_n_cycles > 10.0) &
+        (_n_cycles < 1000.0)
+    ], [0.1, (_n_cycles / 100.0)**2.0, _n_cycles / 10.0], 0.0)
+    attributes['piL'] = _do_divide(
+        attributes['current_ratio'],
+        _get_factor([0.8, 0.4, 0.2], attributes['technology_id'] - 1))**2.0
+    attributes['piL'] = np.where(np.isnan(attributes['piL']), 0.0,
+                                 attributes['piL'])
+
+    attributes['piF'] = _get_factor(relay.PI_F,
+                                    attributes['contact_rating_id'],
+                                    attributes['application_id'],
+                                    attributes['construction_id'],
+                                    _quality - 1)
+
+    _hazard_rate = (attributes['lambda_b'] * attributes['piQ']
+                    * attributes['piE'])
+    if subcategory_id == 1:
+        attributes['piC'] = _get_factor(relay.PI_C[1],
+                                        attributes['contact_form_id'] - 1)
+        _hazard_rate = (_hazard_rate * attributes['piL'] * attributes['piC']
+                        * attributes['piCYC'] * attributes['piF'])
+
+    return _do_mask_invalid(_hazard_rate, attributes['piCYC'],
+                            attributes['piL'], attributes['piF'])
+
+
+def _do_calculate_resistor(subcategory_id: int,
+                           attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for resistors.
+
+    :param subcategory_id: the resistor subcategory identifier.
+    :param attributes: the columns of the resistors being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _temperature_active = attributes['temperature_active']
+    _power_ratio = attributes['power_ratio']
+    _shape = _temperature_active.shape
+
+    if subcategory_id == 4:
+        attributes['lambda_b'] = np.full(_shape, 0.00006)
+    elif subcategory_id == 8:
+        attributes['lambda_b'] = _get_factor(resistor.LAMBDA_B_FACTORS[8],
+                                             attributes['type_id'] - 1)
+    else:
+        if subcategory_id == 2:
+            _ref_temp = _get_factor(resistor.REF_TEMPS_FILM,
+                                    attributes['specification_id'])
+            _factors = _get_factor(resistor.LAMBDA_B_FACTORS_FILM,
+                                   attributes['specification_id'])
+        else:
+            _ref_temp = np.full(_shape, resistor.REF_TEMPS[subcategory_id])
+            _factors = np.broadcast_to(
+                resistor.LAMBDA_B_FACTORS[subcategory_id], _shape + (6, ))
+        attributes['lambda_b'] = _factors[:, 0] * np.exp(
+            _factors[:, 1] * ((_temperature_active + 273.0) / _ref_temp))**(
+                _factors[:, 2]) * np.exp(
+                    ((_power_ratio / _factors[:, 3]) *
+                     ((_temperature_active + 273.0) / 273.0)**_factors[:, 4])**
+                    _factors[:, 5])
+
+    attributes['piR'] = _get_resistance_factor(subcategory_id, attributes)
+    attributes['temperature_case'] = _temperature_active + 55.0 * _power_ratio
+    attributes['piT'] = np.exp(-4056.0 * (_do_divide(
+        1.0, attributes['temperature_case'] + 273.0) - 1.0 / 298.0))
+
+    _hazard_rate = (attributes['lambda_b'] * attributes['piQ']
+                    * attributes['piE'])
+    if subcategory_id in [9, 10, 11, 12, 13, 14, 15]:
+        attributes['piV'] = _get_factor(
+            resistor.PI_V[subcategory_id],
+            _get_breakpoint_index(
+                resistor.VOLTAGE_BREAKPOINTS[subcategory_id],
+                attributes['voltage_ratio']))
+        attributes['piTAPS'] = (attributes['n_elements']**1.5 / 25.0) + 0.792
+        _hazard_rate = (_hazard_rate * attributes['piTAPS']
+                        * attributes['piR'] * attributes['piV'])
+        if subcategory_id in [10, 12]:
+            attributes['piC'] = _get_factor(resistor.PI_C[subcategory_id],
+                                            attributes['construction_id'] - 1)
+            _hazard_rate = _hazard_rate * attributes['piC']
+    elif subcategory_id == 4:
+        _hazard_rate = (_hazard_rate * attributes['piT']
+                        * attributes['n_elements'])
+    elif subcategory_id != 8:
+        _hazard_rate = _hazard_rate * attributes['piR']
+
+    return _do_mask_invalid(_hazard_rate, attributes['piT'])
+
+
+# pylint: disable=too-many-locals, too-many-statements
+def _do_calculate_semiconductor(subcategory_id: int,
+                                attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for semiconductors.
+
+    :param subcategory_id: the semiconductor subcategory identifier.
+    :param attributes: the columns of the semiconductors being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _type_id = attributes['type_id']
+    _application_id = attributes['application_id']
+    _duty_cycle = attributes['duty_cycle']
+    _power_rated = attributes['power_rated']
+    _voltage_ratio = attributes['voltage_ratio']
+    _shape = _type_id.shape
+
+    # Retrieve the quality factor (piQ).
+    if subcategory_id == 2:
+        attributes['piQ'] = _get_factor(
+            semiconductor.PART_STRESS_PI_Q_HF_DIODE, _type_id,
+            attributes['quality_id'] - 1)
+    else:
+        attributes['piQ'] = _get_factor(
+            semiconductor.PART_STRESS_PI_Q[subcategory_id],
+            attributes['quality_id'] - 1)
+
+    # Calculate the base hazard rate (lambda b).
+    _frequency = attributes['frequency_operating']
+    _power = attributes['power_operating']
+    if subcategory_id in [3, 5, 6, 10]:
+        attributes['lambda_b'] = np.full(
+            _shape, semiconductor.PART_STRESS_LAMBDA_B_SCALAR[subcategory_id])
+    elif subcategory_id == 7:
+        attributes['lambda_b'] = 0.032 * np.exp(0.354 * _frequency
+                                                + 0.00558 * _power)
+    elif subcategory_id == 8:
+        attributes['lambda_b'] = np.where(
+            (_frequency > 1.0) & (_frequency <= 10.0) & (_power < 0.1), 0.052,
+            0.0093 * np.exp(0.429 * _frequency + 0.486 * _power))
+    elif subcategory_id == 12:
+        attributes['lambda_b'] = np.where(
+            np.isin(_application_id, [1, 3]),
+            0.00043 * attributes['n_elements'] + 0.000043,
+            0.00043 * attributes['n_elements'])
+    else:
+        attributes['lambda_b'] = _get_factor(
+            semiconductor.PART_STRESS_LAMBDA_B_LIST[subcategory_id],
+            _type_id - 1)
+
+    # Calculate the junction temperature and temperature factor (piT).
+    attributes['temperature_case'] = np.where(
+        attributes['temperature_case'] <= 0.0,
+        _get_factor(semiconductor.CASE_TEMPERATURE,
+                    attributes['environment_active_id'] - 1),
+        attributes['temperature_case'])
+    attributes['theta_jc'] = np.where(
+        attributes['theta_jc'] <= 0.0,
+        _get_factor(semiconductor.THETA_JC, attributes['package_id'] - 1),
+        attributes['theta_jc'])
+    attributes['temperature_junction'] = (
+        attributes['temperature_case']
+        + attributes['theta_jc'] * attributes['power_operating'])
+    _temperature = (
+        _do_divide(1.0, attributes['temperature_junction'] + 273.0)
+        - 1.0 / 298.0)
+    if subcategory_id == 7:
+        _factors = _get_factor(semiconductor.PI_T_DICT, _type_id)
+        attributes['piT'] = np.where(
+            _voltage_ratio <= 0.4,
+            _factors[:, 1] * np.exp(-_factors[:, 0] * _temperature),
+            _factors[:, 2] * (_voltage_ratio - 0.35)
+            * np.exp(-_factors[:, 0] * _temperature))
+    else:
+        if subcategory_id in [1, 2]:
+            _factor = _get_factor(semiconductor.PI_T_LIST[subcategory_id],
+                                  _type_id - 1)
+        else:
+            _factor = semiconductor.PI_T_SCALAR[subcategory_id]
+        attributes['piT'] = np.exp(-_factor * _temperature)
+
+    # Calculate the application factor (piA).
+    if subcategory_id in [2, 4, 7, 13]:
+        _application_id = _get_default(_application_id, 2.0)
+    elif subcategory_id == 3:
+        _application_id = _get_default(
+            _application_id, _get_factor({
+                0: 0.0,
+                1: 2.0,
+                2: 1.0
+            }, _type_id))
+    elif subcategory_id == 8:
+        _application_id = _get_default(_application_id, 1.0)
+
+    if subcategory_id == 2:
+        attributes['piA'] = _get_factor([0.5, 2.5, 1.0], _application_id - 1)
+    elif subcategory_id == 3:
+        attributes['piA'] = _get_factor([1.5, 0.7], _application_id - 1)
+    elif subcategory_id == 4:
+        attributes['piA'] = _get_factor([1.5, 0.7, 2.0, 4.0, 8.0, 10.0],
+                                        _application_id - 1)
+    elif subcategory_id == 7:
+        attributes['piA'] = np.where(
+            _application_id == 1, 7.6,
+            0.06 * (_get_default(_duty_cycle, 0.2) / 100.0) + 0.4)
+    elif subcategory_id == 8:
+        attributes['piA'] = _get_factor([1.0, 4.0], _application_id - 1)
+    elif subcategory_id == 13:
+        attributes['piA'] = np.where(
+            _application_id == 1, 4.4,
+            np.sqrt(_get_default(_duty_cycle, 0.6) / 100.0))
+    else:
+        attributes['piA'] = np.zeros(_shape)
+
+    # Calculate the power rating factor (piR).
+    if subcategory_id == 2:
+        attributes['piR'] = np.where(
+            _type_id == 4,
+            0.326 * np.log(_get_default(_power_rated, 1000.0)) - 0.25, 1.0)
+    elif subcategory_id in [3, 6]:
+        if subcategory_id == 3:
+            _power_rated = _get_default(
+                _power_rated,
+                _get_factor({
+                    0: 0.0,
+                    1: 0.5,
+                    2: 100.0
+                }, _type_id))
+        else:
+            _power_rated = _get_default(_power_rated, 0.5)
+        attributes['piR'] = np.where(
+            _power_rated < 0.1, 0.43,
+            np.where(np.isnan(_power_rated), np.nan, _power_rated**0.37))
+    elif subcategory_id == 10:
+        attributes['piR'] = attributes['current_rated']**0.4
+    else:
+        attributes['piR'] = np.zeros(_shape)
+
+    # Calculate the electrical stress factor (piS).
+    if subcategory_id == 1:
+        _voltage_ratio = _get_default(_voltage_ratio, 0.7)
+        attributes['piS'] = np.where(
+            _type_id < 5,
+            np.where(_voltage_ratio <= 0.3, 0.054, _voltage_ratio**2.43),
+            1.0)
+    elif subcategory_id in [3, 6]:
+        if subcategory_id == 3:
+            _voltage_ratio = _get_default(
+                _voltage_ratio,
+                _get_factor({
+                    0: 0.0,
+                    1: 0.5,
+                    2: 0.8
+                }, _type_id))
+        else:
+            _voltage_ratio = _get_default(_voltage_ratio, 0.7)
+        attributes['piS'] = 0.045 * np.exp(3.1 * _voltage_ratio)
+    elif subcategory_id == 10:
+        _voltage_ratio = _get_default(_voltage_ratio, 0.7)
+        attributes['piS'] = np.where(_voltage_ratio <= 0.3, 0.1,
+                                     _voltage_ratio**1.9)
+    else:
+        attributes['piS'] = np.zeros(_shape)
+
+    attributes['piC'] = _get_factor(semiconductor.PI_C,
+                                    attributes['construction_id'] - 1)
+    attributes['piM'] = _get_factor(semiconductor.PI_M,
+                                    attributes['matching_id'] - 1)
+    attributes['piI'] = attributes['current_operating']**0.68
+    attributes['piP'] = _do_divide(1.0,
+                                   2.0 * (1.0 - attributes['power_ratio']))
+
+    _hazard_rate = (attributes['lambda_b'] * attributes['piT']
+                    * attributes['piQ'] * attributes['piE'])
+    if subcategory_id == 1:
+        _hazard_rate = _hazard_rate * attributes['piS'] * attributes['piC']
+    elif subcategory_id == 2:
+        _hazard_rate = _hazard_rate * attributes['piA'] * attributes['piR']
+    elif subcategory_id == 3:
+        _hazard_rate = (_hazard_rate * attributes['piA'] * attributes['piR']
+                        * attributes['piS'])
+    elif subcategory_id == 4:
+        _hazard_rate = _hazard_rate * attributes['piA']
+    elif subcategory_id in [6, 10]:
+        _hazard_rate = _hazard_rate * attributes['piR'] * attributes['piS']
+    elif subcategory_id in [7, 8]:
+        _hazard_rate = _hazard_rate * attributes['piA'] * attributes['piM']
+    elif subcategory_id == 13:
+        _hazard_rate = (_hazard_rate * attributes['piI'] * attributes['piA']
+                        * attributes['piP'])
+
+    return _do_mask_invalid(_hazard_rate, attributes['piQ'],
+                            attributes['piC'], attributes['piM'],
+                            attributes['piP'])
+
+
+def _do_calculate_switch(subcategory_id: int,
+                         attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the part stress active hazard rate for switches.
+
+    :param subcategory_id: the switch subcategory identifier.
+    :param attributes: the columns of the switches being calculated.
+    :return: the active hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _quality_id = attributes['quality_id']
+    _construction_id = attributes['construction_id']
+    _application_id = attributes['application_id']
+    _n_elements = attributes['n_elements']
+
+    if subcategory_id == 1:
+        attributes['lambda_b'] = _get_factor(
+            switch.PART_STRESS_LAMBDA_B_TOGGLE, _construction_id,
+            _quality_id - 1)
+    elif subcategory_id in [2, 3]:
+        _factors = _get_factor(switch.LAMBDA_B_FACTORS[subcategory_id],
+                               _quality_id - 1)
+        attributes['lambda_b'] = np.where(
+            _construction_id == 1,
+            _factors[:, 0] + _n_elements * _factors[:, 1],
+            _factors[:, 0] + _n_elements * _factors[:, 2])
+    elif subcategory_id == 4:
+        _factors = _get_factor(switch.LAMBDA_B_FACTORS[4], _quality_id - 1)
+        attributes['lambda_b'] = _factors[:, 0] + _n_elements * _factors[:, 1]
+    elif subcategory_id == 5:
+        attributes['lambda_b'] = _get_factor(
+            switch.PART_STRESS_LAMBDA_B_BREAKER, _application_id - 1)
+    else:
+        attributes['lambda_b'] = np.zeros(_quality_id.shape)
+
+    attributes['piL'] = np.exp(
+        _do_divide(attributes['current_ratio'],
+                   _get_factor([0.8, 0.4, 0.2], _application_id - 1))**2.0)
+    attributes['piL'] = np.where(np.isin(_application_id, [1, 2, 3]),
+                                 attributes['piL'], 0.0)
+    attributes['piCYC'] = np.where(attributes['n_cycles'] > 1,
+                                   attributes['n_cycles'], 1.0)
+    attributes['piU'] = np.where(_application_id == 1, 1.0, 10.0)
+
+    _hazard_rate = attributes['lambda_b'] * attributes['piE']
+    if subcategory_id in [1, 5]:
+        attributes['piC'] = _get_factor(switch.PI_C[subcategory_id],
+                                        attributes['contact_form_id'])
+    if subcategory_id == 1:
+        _hazard_rate = (_hazard_rate * attributes['piCYC']
+                        * attributes['piL'] * attributes['piC'])
+    elif subcategory_id in [2, 3, 4]:
+        _hazard_rate = _hazard_rate * attributes['piCYC'] * attributes['piL']
+    elif subcategory_id == 5:
+        _hazard_rate = (_hazard_rate * attributes['piC'] * attributes['piU']
+                        * attributes['piQ'])
+
+    return _do_mask_invalid(_hazard_rate, attributes['piL'])
+
+
+def _do_divide(numerator: Any, denominator: Any) -> np.ndarray:
+    """Divide element-wise, returning NaN wherever the denominator is zero.
+
+    :param numerator: the dividend(s).
+    :param denominator: the divisor(s).
+    :return: the quotients.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _denominator = np.asarray(denominator, dtype=float)
+    _safe = np.where(_denominator == 0.0, 1.0, _denominator)
+
+    return np.where(_denominator == 0.0, np.nan, numerator / _safe)
+
+
+def _do_make_dense(table: Any) -> np.ndarray:
+    """Convert a nested factor table to a dense array.
+
+    Lists are indexed by position and dicts are indexed by key.  Ragged
+    levels are padded and missing entries are filled with NaN.
+
+    :param table: the (nested) list or dict of factors.
+    :return: the dense array of factors.
+    :rtype: :class:`numpy.ndarray`
+    """
+    if isinstance(table, dict):
+        table = [table.get(_key) for _key in range(max(table) + 1)]
+    if not isinstance(table, (list, tuple)):
+        return np.asarray(np.nan if table is None else table, dtype=float)
+
+    _rows = [_do_make_dense(_row) for _row in table]
+    _ndim = max(_row.ndim for _row in _rows)
+    _shape = [len(_rows)] + [
+        max(_row.shape[_dim] for _row in _rows if _row.ndim == _ndim)
+        for _dim in range(_ndim)
+    ]
+    _dense = np.full(_shape, np.nan)
+    for _index, _row in enumerate(_rows):
+        if _row.ndim == _ndim:
+            _dense[(_index, )
+                   + tuple(slice(0, _n) for _n in _row.shape)] = _row
+
+    return _dense
+
+
+def _do_mask_invalid(values: np.ndarray, *factors: Any) -> np.ndarray:
+    """Set values to NaN wherever one of the factors is not finite.
+
+    This is used for factors the scalar models calculate (and fail on) even
+    though they are not part of the hazard rate model for the subcategory.
+
+    :param values: the values to mask.
+    :param factors: the factors that must be finite.
+    :return: the masked values.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _valid = np.ones(np.shape(values), dtype=bool)
+    for _factor in factors:
+        _valid &= np.isfinite(_factor)
+
+    return np.where(_valid, values, np.nan)
+
+
+def _get_breakpoint_index(breakpoints: List[float],
+                          values: np.ndarray) -> np.ndarray:
+    """Find the index of the first breakpoint greater than or equal to value.
+
+    Values greater than the last breakpoint return the index of the last
+    breakpoint.
+
+    :param breakpoints: the (ascending) breakpoints.
+    :param values: the values to locate.
+    :return: the breakpoint indices.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.minimum(np.searchsorted(breakpoints, values, side='left'),
+                      len(breakpoints) - 1)
+
+
+def _get_default(values: np.ndarray, default: Any) -> np.ndarray:
+    """Replace zero values with the default value.
+
+    This is the element-wise equivalent of `values or default`.
+
+    :param values: the values to check.
+    :param default: the default value(s).
+    :return: the values with zeros replaced.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.where(values == 0, default, values)
+
+
+def _get_die_complexity_factor(subcategory_id: int,
+                               attributes: Dict[str, Any]) -> np.ndarray:
+    """Retrieve the die complexity hazard rate (C1) for integrated circuits.
+
+    :param subcategory_id: the integrated circuit subcategory identifier.
+    :param attributes: the columns of the integrated circuits being
+        calculated.
+    :return: the die complexity factors.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _n_elements = attributes['n_elements']
+    if subcategory_id == 2:
+        _technology = np.where(attributes['technology_id'] == 11, 2, 1)
+    else:
+        _technology = attributes['technology_id']
+
+    _breakpoints = integratedcircuit.C1_BREAKPOINTS[subcategory_id]
+    if subcategory_id in [3, 9]:
+        _keys = (_technology
+                 if subcategory_id == 3 else attributes['application_id'])
+        _index = np.full(_n_elements.shape, np.nan)
+        for _key, _values in _breakpoints.items():
+            _rows = _keys == _key
+            _index[_rows] = _get_nearest_index(_values, _n_elements[_rows])
+    else:
+        _index = _get_nearest_index(_breakpoints, _n_elements)
+
+    return _get_factor(integratedcircuit.C1[subcategory_id], _technology - 1,
+                       _index)
+
+
+def _get_factor(table: Any, *indices: Any) -> np.ndarray:
+    """Gather factors from a nested factor table.
+
+    There is one index per level of the table.  Levels that are lists are
+    indexed by zero-based position and levels that are dicts are indexed by
+    key.  If fewer indices than levels are passed, the remaining levels are
+    returned as trailing dimensions.  Unknown indices return NaN.
+
+    :param table: the (nested) list or dict of factors.
+    :param indices: the index, or array of indices, for each level.
+    :return: the selected factors.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return tables.get_factor(_do_make_dense(table), *indices)
+
+
+def _get_lambda_cyclic(attributes: Dict[str, Any]) -> np.ndarray:
+    """Calculate the EEPROM read/write cycling induced hazard rates.
+
+    :param attributes: the columns of the EEPROMs being calculated.
+    :return: the read/write cycling hazard rates.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _n_cycles = attributes['n_cycles']
+    _n_elements = attributes['n_elements']
+    _construction_id = attributes['construction_id']
+    _temperature = _do_divide(1.0,
+                              attributes['temperature_junction'] + 273.0)
+
+    _a_1 = 6.817E-6 * _n_cycles
+    _a_2 = np.select([(_construction_id == 2) & (_n_cycles > 300000)
+                      & (_n_cycles <= 400000), _construction_id == 2],
+                     [1.1, 2.3], 0.0)
+    _b_1 = np.select([_construction_id == 1, _construction_id == 2], [
+        ((_n_elements / 16000.0)**0.5) * np.exp(
+            (-0.15 / 8.63E-5) * (_temperature - (1.0 / 333.0))),
+        ((_n_elements / 64000.0)**0.25) * np.exp(
+            (0.1 / 8.63E-5) * (_temperature - (1.0 / 303.0)))
+    ], 0.0)
+    _b_2 = np.where(
+        _construction_id == 2, ((_n_elements / 64000.0)**0.25) * np.exp(
+            (-0.12 / 8.63E-5) * (_temperature - (1.0 / 303.0))), 0.0)
+
+    return (_a_1 * _b_1 + (_a_2 * _b_2 / attributes['piQ'])) * attributes[
+        'piECC']
+
+
+def _get_nearest_index(breakpoints: List[float],
+                       values: np.ndarray) -> np.ndarray:
+    """Find the index of the breakpoint closest to each value.
+
+    Ties go to the first of the closest breakpoints.
+
+    :param breakpoints: the breakpoints.
+    :param values: the values to locate.
+    :return: the breakpoint indices.
+    :rtype: :class:`numpy.ndarray`
+    """
+    return np.argmin(np.abs(
+        np.asarray(breakpoints)[np.newaxis, :] - values[:, np.newaxis]),
+                     axis=1)
+
+
+def _get_resistance_factor(subcategory_id: int,
+                           attributes: Dict[str, Any]) -> np.ndarray:
+    """Retrieve the resistance factor (piR) for resistors.
+
+    :param subcategory_id: the resistor subcategory identifier.
+    :param attributes: the columns of the resistors being calculated.
+    :return: the resistance factors.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if passed an unknown subcategory ID.
+    """
+    _resistance = attributes['resistance']
+    _specification_id = attributes['specification_id']
+
+    if subcategory_id in [4, 8]:
+        return np.zeros(_resistance.shape)
+
+    if subcategory_id == 6:
+        _index = np.full(_resistance.shape, np.nan)
+        for _specification, _breakpoints in enumerate(
+                resistor.RESISTANCE_BREAKPOINTS[6], start=1):
+            _rows = _specification_id == _specification
+            _index[_rows] = _get_breakpoint_index(_breakpoints,
+                                                  _resistance[_rows])
+    else:
+        _index = _get_breakpoint_index(
+            resistor.RESISTANCE_BREAKPOINTS[subcategory_id], _resistance)
+
+    if subcategory_id in [6, 7]:
+        _pi_r = _get_factor(resistor.PI_R[subcategory_id],
+                            _specification_id - 1,
+                            attributes['family_id'] - 1, _index + 1)
+    else:
+        _pi_r = _get_factor(resistor.PI_R[subcategory_id], _index + 1)
+
+    return _pi_r
+
+
+def do_predict_active_hazard_rate_many(
+        columns: Dict[str, Any]) -> np.ndarray:
+    """Calculate the active hazard rate for many hardware items.
+
+    The columns dict is keyed by the same attribute names used by
+    do_predict_active_hazard_rate() and each value is a sequence (or array)
+    with one entry per hardware item.  The category_id, subcategory_id, and
+    hazard_rate_method_id columns are required; missing columns default to
+    zero.
+
+    Predictions are calculated as NumPy expressions for each group of items
+    with the same category and subcategory.  The environment and quality
+    factors, and the parts count base hazard rates, are gathered from the
+    compiled tables in ramstk.analyses.milhdbk217f.tables.  Integrated
+    circuit parts count predictions are calculated one item at a time with
+    the scalar models.
+
+    .. attention:: The programmer is responsible for ensuring appropriate
+        stress analyses (e.g., voltage ratios) are performed and results
+        assigned to the columns prior to calling this function.
+
+    :param columns: the attribute columns for the hardware items.
+    :return: the active hazard rate of each hardware item; NaN for items
+        that could not be calculated.
+    :rtype: :class:`numpy.ndarray`
+    :raise: KeyError if the category_id, subcategory_id, or
+        hazard_rate_method_id column is missing.
+    """
+    _n_items = len(columns['category_id'])
+    _columns = {
+        _key: np.broadcast_to(np.asarray(columns.get(_key, 0.0), dtype=float),
+                              (_n_items, ))
+        for _key in ATTRIBUTES
+    }
+    _hazard_rates = _columns['hazard_rate_active'].copy()
+
+    _keys = np.stack([
+        np.asarray(columns[_key], dtype=float).astype(int) for _key in
+        ['hazard_rate_method_id', 'category_id', 'subcategory_id']
+    ])
+    _order = np.lexsort(_keys[::-1])
+    _splits = np.flatnonzero(
+        np.any(np.diff(_keys[:, _order], axis=1) != 0, axis=0)) + 1
+
+    with np.errstate(all='ignore'):
+        for _group in np.split(_order, _splits):
+            if not _group.size:
+                continue
+            _method_id, _category_id, _subcategory_id = _keys[:, _group[0]]
+
+            _attributes = {
+                _key: _value[_group]
+                for _key, _value in _columns.items()
+            }
+            if _method_id == 1 and _category_id == 1:
+                _hazard_rates[_group] = [
+                    _do_calculate_part_count_item(columns, _index)
+                    for _index in _group
+                ]
+            elif _method_id == 1:
+                _hazard_rates[_group] = _do_calculate_part_count(
+                    _category_id, _subcategory_id, _attributes)
+            elif _method_id == 2:
+                try:
+                    _hazard_rates[_group] = _do_calculate_part_stress(
+                        _category_id, _subcategory_id, _attributes)
+                except (IndexError, KeyError):
+                    _hazard_rates[_group] = np.nan
+
+    _hazard_rates[~np.isfinite(_hazard_rates)] = np.nan
+
+    return _hazard_rates
+
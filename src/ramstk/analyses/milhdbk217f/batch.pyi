@@ -0,0 +1,137 @@
+# Standard Library Imports
+from typing import Any, Dict, List
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from . import milhdbk217f as milhdbk217f
+from . import tables as tables
+from .models import capacitor as capacitor
+from .models import connection as connection
+from .models import crystal as crystal
+from .models import efilter as efilter
+from .models import fuse as fuse
+from .models import inductor as inductor
+from .models import integratedcircuit as integratedcircuit
+from .models import lamp as lamp
+from .models import meter as meter
+from .models import relay as relay
+from .models import resistor as resistor
+from .models import semiconductor as semiconductor
+from .models import switch as switch
+
+ATTRIBUTES: List[str]
+
+def _do_calculate_capacitor(subcategory_id: int,
+                            attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_connection(subcategory_id: int,
+                             attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_inductor(subcategory_id: int,
+                           attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_integrated_circuit(subcategory_id: int,
+                                     attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_meter(subcategory_id: int,
+                        attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_miscellaneous(subcategory_id: int,
+                                attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_part_count(category_id: int, subcategory_id: int,
+                             attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_part_count_item(columns: Dict[str, Any],
+                                  index: int) -> float:
+    ...
+
+
+def _do_calculate_part_stress(category_id: int, subcategory_id: int,
+                              attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_relay(subcategory_id: int,
+                        attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_resistor(subcategory_id: int,
+                           attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_semiconductor(subcategory_id: int,
+                                attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_calculate_switch(subcategory_id: int,
+                         attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _do_divide(numerator: Any, denominator: Any) -> np.ndarray:
+    ...
+
+
+def _do_make_dense(table: Any) -> np.ndarray:
+    ...
+
+
+def _do_mask_invalid(values: np.ndarray, *factors: Any) -> np.ndarray:
+    ...
+
+
+def _get_breakpoint_index(breakpoints: List[float],
+                          values: np.ndarray) -> np.ndarray:
+    ...
+
+
+def _get_default(values: np.ndarray, default: Any) -> np.ndarray:
+    ...
+
+
+def _get_die_complexity_factor(subcategory_id: int,
+                               attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _get_factor(table: Any, *indices: Any) -> np.ndarray:
+    ...
+
+
+def _get_lambda_cyclic(attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def _get_nearest_index(breakpoints: List[float],
+                       values: np.ndarray) -> np.ndarray:
+    ...
+
+
+def _get_resistance_factor(subcategory_id: int,
+                           attributes: Dict[str, Any]) -> np.ndarray:
+    ...
+
+
+def do_predict_active_hazard_rate_many(
+        columns: Dict[str, Any]) -> np.ndarray:
+    ...
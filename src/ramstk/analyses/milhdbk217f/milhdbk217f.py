@@ -11,9 +11,11 @@
 from typing import Any, Dict
 
 # Third Party Imports
+import numpy as np
 from pubsub import pub
 
 # RAMSTK Local Imports
+from . import tables
 from .models import (
     capacitor, connection, crystal, efilter, fuse, inductor,
     integratedcircuit, lamp, meter, relay, resistor, semiconductor, switch
@@ -123,12 +125,13 @@ def _do_calculate_part_stress(**attributes: Dict[str, Any]) -> Dict[str, Any]:
 
 def _get_environment_factor(category_id: int,
                             environment_active_id: int,
-                            subcategory_id: int = -1,
-                            quality_id: int = -1) -> float:
+                            subcategory_id: int = 0,
+                            quality_id: int = 0) -> float:
     """Retrieve the MIL-HDBK-217F environment factor (piE) for the component.
 
     Most component types have a single list of piE factors, but some require
-    additional indices to select the correct list of factors.
+    additional indices to select the correct list of factors.  The factor is
+    read from the compiled piE table.
 
     :param category_id: the category ID of the component.
     :param environment_active_id: the active environment ID for the
@@ -137,40 +140,28 @@ def _get_environment_factor(category_id: int,
     :keyword int quality_id: the quality level ID of the component.
     :return: _pi_e; the selected piE value.
     :rtype: float
-    :raise: IndexError if there is no list entry for the passed active
-        environment ID.
-    :raise: KeyError if there is no piE list for the passed category ID (or
-        subcategory ID, quality ID when appllicable).
+    :raise: KeyError if there is no piE value for the passed category ID,
+        subcategory ID, quality ID, or active environment ID.
     """
-    _pi_e_lists = {
-        1: integratedcircuit.PI_E,
-        2: semiconductor.PI_E,
-        3: resistor.PI_E,
-        4: capacitor.PI_E,
-        5: inductor.PI_E,
-        7: switch.PI_E,
-        8: connection.PI_E,
-        9: meter.PI_E,
-        10: {
-            1: crystal.PI_E,
-            2: efilter.PI_E,
-            3: fuse.PI_E,
-            4: lamp.PI_E
-        }
-    }
+    return _get_factor(tables.PI_E, category_id, subcategory_id, quality_id,
+                       environment_active_id)
 
-    if category_id == 8 and subcategory_id in [1, 2]:
-        _pi_e = _pi_e_lists[category_id][subcategory_id][quality_id][
-            environment_active_id - 1]
-    elif category_id in [
-            2, 3, 5, 7, 9, 10
-    ] or (category_id == 8 and subcategory_id not in [1, 2]):
-        _pi_e = _pi_e_lists[category_id][subcategory_id][environment_active_id
-                                                         - 1]
-    else:
-        _pi_e = _pi_e_lists[category_id][environment_active_id - 1]
 
-    return _pi_e
+def _get_factor(table: np.ndarray, *indices: int) -> float:
+    """Retrieve a single factor from a compiled MIL-HDBK-217F table.
+
+    :param table: the compiled table to read the factor from.
+    :param indices: the ID for each axis of the table.
+    :return: _factor; the selected factor.
+    :rtype: float
+    :raise: KeyError if there is no factor for the passed ID's.
+    """
+    _factor = tables.get_factor(table, *indices).item()
+
+    if np.isnan(_factor):
+        raise KeyError(indices)
+
+    return _factor
 
 
 def _get_part_count_quality_factor(category_id: int, subcategory_id: int,
@@ -188,35 +179,11 @@ def _get_part_count_quality_factor(category_id: int, subcategory_id: int,
     :param quality_id: the quality level ID for the component.
     :return: _pi_q; the selected piQ value.
     :rtype: float
-    :raise: IndexError if there is no list entry for the passed active
-        environment ID.
-    :raise: KeyError if there is no piQ list for the passed category ID.
+    :raise: KeyError if there is no piQ value for the passed category ID,
+        subcategory ID, or quality ID.
     """
-    _pi_q_lists = {
-        1: integratedcircuit.PI_Q,
-        3: resistor.PART_COUNT_PI_Q,
-        4: capacitor.PART_COUNT_PI_Q,
-        5: inductor.PART_COUNT_PI_Q,
-        6: relay.PART_COUNT_PI_Q,
-        7: switch.PART_COUNT_PI_Q,
-        8: connection.PART_COUNT_PI_Q,
-        9: meter.PART_COUNT_PI_Q,
-        10: {
-            1: crystal.PART_COUNT_PI_Q,
-            2: efilter.PI_Q
-        }
-    }
-
-    if category_id in [6, 7, 9]:
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-    elif category_id == 10 and subcategory_id in [1, 2]:
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-    elif category_id == 10 and subcategory_id in [3, 4]:
-        _pi_q = 1.0
-    else:
-        _pi_q = _pi_q_lists[category_id][quality_id - 1]
-
-    return _pi_q
+    return _get_factor(tables.PART_COUNT_PI_Q, category_id, subcategory_id,
+                       quality_id)
 
 
 def _get_part_stress_quality_factor(category_id: int, subcategory_id: int,
@@ -230,41 +197,40 @@ def _get_part_stress_quality_factor(category_id: int, subcategory_id: int,
     :param quality_id: the quality level ID for the component.
     :return: _pi_q; the selected piQ value.
     :rtype: float
-    :raise: IndexError if there is no list entry for the passed quality ID.
-    :raise: KeyError if there is no piQ list for the passed category ID.
+    :raise: KeyError if there is no piQ value for the passed category ID,
+        subcategory ID, or quality ID.
     """
-    _pi_q_lists = {
-        1: integratedcircuit.PI_Q,
-        3: resistor.PART_STRESS_PI_Q,
-        4: capacitor.PART_STRESS_PI_Q,
-        6: relay.PART_STRESS_PI_Q,
-        7: switch.PART_STRESS_PI_Q,
-        8: connection.PART_STRESS_PI_Q,
-        9: meter.PART_STRESS_PI_Q,
-        10: {
-            1: crystal.PART_STRESS_PI_Q,
-            2: efilter.PI_Q
-        },
-    }
+    return _get_factor(tables.PART_STRESS_PI_Q, category_id, subcategory_id,
+                       quality_id)
 
-    if category_id == 1:
-        _pi_q = _pi_q_lists[category_id][quality_id - 1]
-    elif (category_id == 8
-          and subcategory_id in [4, 5]) or (category_id == 7
-                                            and subcategory_id == 5):
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
-    elif category_id == 7 and subcategory_id != 5:
-        _pi_q = 0.0
-    elif category_id == 8 and subcategory_id not in [4, 5]:
-        _pi_q = 0.0
-    elif category_id == 9 and subcategory_id == 1:
-        _pi_q = 0.0
-    elif category_id == 10 and subcategory_id in [3, 4]:
-        _pi_q = 0.0
-    else:
-        _pi_q = _pi_q_lists[category_id][subcategory_id][quality_id - 1]
 
-    return _pi_q
+# noinspection PyTypeChecker
+def do_calculate_active_hazard_rate(
+        **attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """Calculate the active hazard rate for a hardware item.
+
+    Unlike do_predict_active_hazard_rate(), no messages are sent.  The
+    intermediate factors (e.g., piE, piQ, lambda b) are returned along with
+    the hazard rate for the caller to use.
+
+    .. attention:: The programmer is responsible for ensuring appropriate
+        stress analyses (e.g., voltage ratios) are performed and results
+        assigned to the attributes dict prior to calling the MIL-HDBK-217F
+        methods.
+
+    :return: attributes; the attributes dict updated with the factors and
+        the active hazard rate.
+    :rtype: dict
+    :raise: KeyError if there is no factor for one of the ID's.
+    :raise: ValueError if one or more inputs has a negative or missing value.
+    :raise: ZeroDivisionError if one or more inputs has a value of 0.0.
+    """
+    if attributes['hazard_rate_method_id'] == 1:
+        attributes = _do_calculate_part_count(**attributes)
+    elif attributes['hazard_rate_method_id'] == 2:
+        attributes = _do_calculate_part_stress(**attributes)
+
+    return attributes
 
 
 # noinspection PyTypeChecker
@@ -283,51 +249,64 @@ def do_predict_active_hazard_rate(**attributes: Dict[str, Any]) -> float:
     :rtype: float
     """
     try:
-        if attributes['hazard_rate_method_id'] == 1:
-            attributes = _do_calculate_part_count(**attributes)
-        elif attributes['hazard_rate_method_id'] == 2:
-            attributes = _do_calculate_part_stress(**attributes)
+        attributes = do_calculate_active_hazard_rate(**attributes)
 
         pub.sendMessage('succeed_predict_reliability', attributes=attributes)
 
         return attributes['hazard_rate_active']
-    except ValueError:
+    except (KeyError, ValueError, ZeroDivisionError) as _error:
         pub.sendMessage('fail_predict_reliability',
-                        error_message=("Failed to predict MIL-HDBK-217F "
-                                       "hazard rate for hardware ID {0:d}; "
-                                       "one or more inputs has a negative or "
-                                       "missing value. Hardware item category "
-                                       "ID={1:d}, subcategory ID={2:d}, rated "
-                                       "power={3:f}, number of "
-                                       "elements={4:d}.").format(
-                                           attributes['hardware_id'],
-                                           attributes['category_id'],
-                                           attributes['subcategory_id'],
-                                           attributes['power_rated'],
-                                           attributes['n_elements']))
-    except ZeroDivisionError:
-        pub.sendMessage('fail_predict_reliability',
-                        error_message=("Failed to predict MIL-HDBK-217F "
-                                       "hazard rate for hardware ID {0:d}; "
-                                       "one or more inputs has a value of "
-                                       "0.0.  Hardware item category "
-                                       "ID={1:d}, subcategory ID={2:d}, "
-                                       "operating ac voltage={3:f}, operating "
-                                       "DC voltage={4:f}, operating "
-                                       "temperature={5:f}, temperature "
-                                       "rise={10:f}, rated maximum "
-                                       "temperature={6:f}, "
-                                       "feature size={7:f}, "
-                                       "surface area={8:f}, and item "
-                                       "weight={9:f}.").format(
-                                           attributes['hardware_id'],
-                                           attributes['category_id'],
-                                           attributes['subcategory_id'],
-                                           attributes['voltage_ac_operating'],
-                                           attributes['voltage_dc_operating'],
-                                           attributes['temperature_active'],
-                                           attributes['temperature_rated_max'],
-                                           attributes['feature_size'],
-                                           attributes['area'],
-                                           attributes['weight'],
-                                           attributes['temperature_rise']))
+                        error_message=get_error_message(_error, attributes))
+
+
+def get_error_message(error: Exception, attributes: Dict[str, Any]) -> str:
+    """Get the message describing why a hazard rate prediction failed.
+
+    :param error: the KeyError, ValueError, or ZeroDivisionError raised by
+        the prediction.
+    :param attributes: the attributes dict passed to the prediction.
+    :return: _error_msg; the error message.
+    :rtype: str
+    """
+    if isinstance(error, KeyError):
+        _error_msg = ("Failed to predict MIL-HDBK-217F hazard rate for "
+                      "hardware ID {0:d}; there is no factor for one or more "
+                      "of the inputs. Hardware item category ID={1:d}, "
+                      "subcategory ID={2:d}, quality ID={3:d}, active "
+                      "environment ID={4:d}.").format(
+                          attributes['hardware_id'],
+                          attributes['category_id'],
+                          attributes['subcategory_id'],
+                          attributes['quality_id'],
+                          attributes['environment_active_id'])
+    elif isinstance(error, ValueError):
+        _error_msg = ("Failed to predict MIL-HDBK-217F hazard rate for "
+                      "hardware ID {0:d}; one or more inputs has a negative "
+                      "or missing value. Hardware item category ID={1:d}, "
+                      "subcategory ID={2:d}, rated power={3:f}, number of "
+                      "elements={4:d}.").format(attributes['hardware_id'],
+                                                attributes['category_id'],
+                                                attributes['subcategory_id'],
+                                                attributes['power_rated'],
+                                                attributes['n_elements'])
+    else:
+        _error_msg = ("Failed to predict MIL-HDBK-217F hazard rate for "
+                      "hardware ID {0:d}; one or more inputs has a value of "
+                      "0.0.  Hardware item category ID={1:d}, subcategory "
+                      "ID={2:d}, operating ac voltage={3:f}, operating DC "
+                      "voltage={4:f}, operating temperature={5:f}, "
+                      "temperature rise={10:f}, rated maximum "
+                      "temperature={6:f}, feature size={7:f}, surface "
+                      "area={8:f}, and item weight={9:f}.").format(
+                          attributes['hardware_id'],
+                          attributes['category_id'],
+                          attributes['subcategory_id'],
+                          attributes['voltage_ac_operating'],
+                          attributes['voltage_dc_operating'],
+                          attributes['temperature_active'],
+                          attributes['temperature_rated_max'],
+                          attributes['feature_size'], attributes['area'],
+                          attributes['weight'],
+                          attributes['temperature_rise'])
+
+    return _error_msg
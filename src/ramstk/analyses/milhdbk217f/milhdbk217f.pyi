@@ -1,7 +1,11 @@
 # Standard Library Imports
 from typing import Any, Dict
 
+# Third Party Imports
+import numpy as np
+
 # RAMSTK Local Imports
+from . import tables as tables
 from .models import capacitor as capacitor
 from .models import connection as connection
 from .models import crystal as crystal
@@ -31,6 +35,10 @@ def _get_environment_factor(category_id: int,
     ...
 
 
+def _get_factor(table: np.ndarray, *indices: int) -> float:
+    ...
+
+
 def _get_part_count_quality_factor(category_id: int, subcategory_id: int,
                                    quality_id: int) -> float:
     ...
@@ -41,5 +49,14 @@ def _get_part_stress_quality_factor(category_id: int, subcategory_id: int,
     ...
 
 
+def do_calculate_active_hazard_rate(
+        **attributes: Dict[str, Any]) -> Dict[str, Any]:
+    ...
+
+
 def do_predict_active_hazard_rate(**attributes: Dict[str, Any]) -> float:
     ...
+
+
+def get_error_message(error: Exception, attributes: Dict[str, Any]) -> str:
+    ...
@@ -11,6 +11,27 @@
 from math import exp
 from typing import Any, Dict
 
+LAMBDA_B_FACTORS = {
+    1: [0.00086, 0.4, 5.0, 2.5, 1.8],
+    2: [0.00115, 0.4, 5.0, 2.5, 1.8],
+    3: [0.0005, 0.4, 5.0, 2.5, 1.8],
+    4: [0.00069, 0.4, 5.0, 2.5, 1.8],
+    5: [0.00099, 0.4, 5.0, 2.5, 1.8],
+    6: [0.00055, 0.4, 5.0, 2.5, 1.8],
+    7: [8.6E-10, 0.4, 3.0, 16.0, 1.0],
+    8: [0.0053, 0.4, 3.0, 1.2, 6.3],
+    9: [8.25E-10, 0.5, 4.0, 16.0, 1.0],
+    10: [0.0003, 0.3, 3.0, 1.0, 1.0],
+    11: [2.6E-9, 0.3, 3.0, 14.3, 1.0],
+    12: [0.00375, 0.4, 3.0, 2.6, 9.0],
+    13: [0.00165, 0.4, 3.0, 2.6, 9.0],
+    14: [0.00254, 0.5, 3.0, 5.09, 5.0],
+    15: [0.0028, 0.55, 3.0, 4.09, 5.9],
+    16: [0.00224, 0.17, 3.0, 1.59, 10.1],
+    17: [7.3E-7, 0.33, 3.0, 12.1, 1.0],
+    18: [1.92E-6, 0.33, 3.0, 10.8, 1.0],
+    19: [0.0112, 0.17, 3.0, 1.59, 10.1]
+}
 PART_COUNT_LAMBDA_B = {
     1: {
         1: [
@@ -119,6 +140,27 @@ PART_STRESS_PI_Q = {
 }
 PI_C = {1: 0.3, 2: 1.0, 3: 2.0, 4: 2.5, 5: 3.0}
 PI_CF = {1: 0.1, 2: 1.0}
+PI_CV_FACTORS = {
+    1: [1.2, 0.095],
+    2: [1.4, 0.12],
+    3: [1.6, 0.13],
+    4: [1.2, 0.092],
+    5: [1.1, 0.085],
+    6: [1.2, 0.092],
+    7: [0.45, 0.14],
+    8: [0.31, 0.23],
+    9: [0.62, 0.14],
+    10: [0.41, 0.11],
+    11: [0.59, 0.12],
+    12: [1.0, 0.12],
+    13: [0.82, 0.066],
+    14: [0.34, 0.18],
+    15: [0.321, 0.19],
+    16: [1.0, 0.0],
+    17: [1.0, 0.0],
+    18: [1.0, 0.0],
+    19: [1.0, 0.0]
+}
 PI_E = [
     1.0, 6.0, 9.0, 9.0, 19.0, 13.0, 29.0, 20.0, 43.0, 24.0, 0.5, 14.0, 32.0,
     320.0
@@ -146,29 +188,8 @@ def calculate_capacitance_factor(subcategory_id: int,
     :rtype: float
     :raise: KeyError if passed an unknown subcategor ID.
     """
-    _dic_factors = {
-        1: [1.2, 0.095],
-        2: [1.4, 0.12],
-        3: [1.6, 0.13],
-        4: [1.2, 0.092],
-        5: [1.1, 0.085],
-        6: [1.2, 0.092],
-        7: [0.45, 0.14],
-        8: [0.31, 0.23],
-        9: [0.62, 0.14],
-        10: [0.41, 0.11],
-        11: [0.59, 0.12],
-        12: [1.0, 0.12],
-        13: [0.82, 0.066],
-        14: [0.34, 0.18],
-        15: [0.321, 0.19],
-        16: [1.0, 0.0],
-        17: [1.0, 0.0],
-        18: [1.0, 0.0],
-        19: [1.0, 0.0]
-    }
-    _f0 = _dic_factors[subcategory_id][0]
-    _f1 = _dic_factors[subcategory_id][1]
+    _f0 = PI_CV_FACTORS[subcategory_id][0]
+    _f1 = PI_CV_FACTORS[subcategory_id][1]
     _pi_cv = _f0 * capacitance**_f1
 
     return _pi_cv
@@ -254,39 +275,17 @@ def calculate_part_stress_lambda_b(subcategory_id: int,
     :rtype: float
     :raise: KeyError if passed an unknown subcategory ID.
     """
-    _dic_factors = {
-        1: [0.00086, 0.4, 5.0, 2.5, 1.8],
-        2: [0.00115, 0.4, 5.0, 2.5, 1.8],
-        3: [0.0005, 0.4, 5.0, 2.5, 1.8],
-        4: [0.00069, 0.4, 5.0, 2.5, 1.8],
-        5: [0.00099, 0.4, 5.0, 2.5, 1.8],
-        6: [0.00055, 0.4, 5.0, 2.5, 1.8],
-        7: [8.6E-10, 0.4, 3.0, 16.0, 1.0],
-        8: [0.0053, 0.4, 3.0, 1.2, 6.3],
-        9: [8.25E-10, 0.5, 4.0, 16.0, 1.0],
-        10: [0.0003, 0.3, 3.0, 1.0, 1.0],
-        11: [2.6E-9, 0.3, 3.0, 14.3, 1.0],
-        12: [0.00375, 0.4, 3.0, 2.6, 9.0],
-        13: [0.00165, 0.4, 3.0, 2.6, 9.0],
-        14: [0.00254, 0.5, 3.0, 5.09, 5.0],
-        15: [0.0028, 0.55, 3.0, 4.09, 5.9],
-        16: [0.00224, 0.17, 3.0, 1.59, 10.1],
-        17: [7.3E-7, 0.33, 3.0, 12.1, 1.0],
-        18: [1.92E-6, 0.33, 3.0, 10.8, 1.0],
-        19: [0.0112, 0.17, 3.0, 1.59, 10.1]
-    }
-
     # This will retrieve the reference temperature for the maximum rated
     # temperature closest (round up) to one of the keys in the REF_TEMPS dict.
     _ref_temp = REF_TEMPS.get(
         temperature_rated_max,
         REF_TEMPS[min(REF_TEMPS.keys(),
                       key=lambda k: abs(k - temperature_rated_max))])
-    _f0 = _dic_factors[subcategory_id][0]
-    _f1 = _dic_factors[subcategory_id][1]
-    _f2 = _dic_factors[subcategory_id][2]
-    _f3 = _dic_factors[subcategory_id][3]
-    _f4 = _dic_factors[subcategory_id][4]
+    _f0 = LAMBDA_B_FACTORS[subcategory_id][0]
+    _f1 = LAMBDA_B_FACTORS[subcategory_id][1]
+    _f2 = LAMBDA_B_FACTORS[subcategory_id][2]
+    _f3 = LAMBDA_B_FACTORS[subcategory_id][3]
+    _f4 = LAMBDA_B_FACTORS[subcategory_id][4]
     _lambda_b = _f0 * ((voltage_ratio / _f1)**_f2 + 1.0) * exp(_f3 * (
         (temperature_active + 273.0) / _ref_temp)**_f4)
 
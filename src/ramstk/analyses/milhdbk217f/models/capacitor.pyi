@@ -1,11 +1,13 @@
 # Standard Library Imports
 from typing import Any, Dict
 
+LAMBDA_B_FACTORS: Any
 PART_COUNT_LAMBDA_B: Any
 PART_COUNT_PI_Q: Any
 PART_STRESS_PI_Q: Any
 PI_C: Any
 PI_CF: Any
+PI_CV_FACTORS: Any
 PI_E: Any
 REF_TEMPS: Any
 
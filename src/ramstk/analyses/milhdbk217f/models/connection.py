@@ -11,6 +11,51 @@
 from math import exp
 from typing import Any, Dict
 
+CONTACT_GAUGE_FACTORS = {12: 0.1, 16: 0.274, 20: 0.64, 22: 0.989, 26: 2.1}
+FACTOR_KEYS = {
+    1: {
+        1: [2, 2, 2, 2, 2, 2],
+        2: [2, 2, 2, 2, 2, 2],
+        3: [1, 1, 1, 2, 2, 2, 2, 2, 2],
+        4: [1, 1, 1, 2, 2, 2, 2, 2, 2],
+        5: [1, 1, 1, 2, 2, 2, 2, 2, 2]
+    },
+    2: {
+        1: [2, 2, 2, 2, 2, 2, 4, 4, 4],
+        2: [1, 1, 1, 2, 2, 2, 2, 2, 2, 4, 4, 4],
+        3: [1, 1, 1, 2, 2, 2, 2, 2, 2],
+        4: [1, 1, 1, 2, 2, 2, 2, 2, 2],
+        5: [2, 2, 2, 2, 2, 2],
+        6: [2, 2, 2, 2, 2, 2]
+    },
+    3: {
+        1: [2, 2, 2, 2, 2, 2, 4, 4, 4],
+        2: [2, 2, 2, 2, 2, 2, 4, 4, 4]
+    },
+    4: {
+        1: [3, 3],
+        2: [3, 3],
+        3: [3, 3],
+        4: [3, 3],
+        5: [3, 3],
+        6: [3, 3],
+        7: [3, 3],
+        8: [3, 3, 2, 2, 2, 2, 2, 2]
+    },
+    5: {
+        1: [3, 3, 2, 2, 2, 2, 2, 2]
+    }
+}
+# Factors used to calculate the base hazard rate for circular/rack and panel
+# connectors.  The key is the factor key from FACTOR_KEYS (1 - 4) or 5 for all
+# other connections.
+LAMBDA_B_FACTORS = {
+    1: [0.2, -1592.0, 5.36],
+    2: [0.431, -2073.6, 4.66],
+    3: [0.19, -1298.0, 4.25],
+    4: [0.77, -1528.8, 4.72],
+    5: [0.216, -2073.6, 4.66],
+}
 PART_COUNT_LAMBDA_B = {
     1: {
         1: [
@@ -168,9 +213,7 @@ def calculate_insert_temperature(contact_gauge: int,
     :raise: KeyError when an unknown contact gauge is passed.
     :raise: TypeError when the operating current is passed as a string.
     """
-    _dic_factors = {12: 0.1, 16: 0.274, 20: 0.64, 22: 0.989, 26: 2.1}
-
-    _fo = _dic_factors[contact_gauge]
+    _fo = CONTACT_GAUGE_FACTORS[contact_gauge]
     _temperature_rise = (_fo * current_operating**1.85)
 
     return _temperature_rise
@@ -266,21 +309,10 @@ def calculate_part_stress_lambda_b(subcategory_id: int, type_id: int,
     :raise: IndexError if passed an unknown type ID.
     :raise: ZeroDivisionError if passed contact temperature = 0.0.
     """
-    # Factors are used to calculate base hazard rate for circular/rack and
-    # panel connectors.  Key is from dictionary above (1 - 4) or contact
-    # gauge (22 - 12).
-    _dic_factors = {
-        1: [0.2, -1592.0, 5.36],
-        2: [0.431, -2073.6, 4.66],
-        3: [0.19, -1298.0, 4.25],
-        4: [0.77, -1528.8, 4.72],
-        5: [0.216, -2073.6, 4.66],
-    }
-
     _ref_temp = REF_TEMPS[factor_key]
-    _f0 = _dic_factors[factor_key][0]
-    _f1 = _dic_factors[factor_key][1]
-    _f2 = _dic_factors[factor_key][2]
+    _f0 = LAMBDA_B_FACTORS[factor_key][0]
+    _f1 = LAMBDA_B_FACTORS[factor_key][1]
+    _f2 = LAMBDA_B_FACTORS[factor_key][2]
 
     if subcategory_id in [4, 5]:
         _lambda_b = PART_STRESS_LAMBDA_B[subcategory_id][type_id - 1]
@@ -310,41 +342,7 @@ def get_factor_key(type_id: int, specification_id: int, insert_id: int) -> int:
     # dictionary key, we quesry the key dictionary in which the first key is
     # the connector type ID, second key is the specification ID.  The insert
     # material ID is the index in the list returned.
-    _dic_keys = {
-        1: {
-            1: [2, 2, 2, 2, 2, 2],
-            2: [2, 2, 2, 2, 2, 2],
-            3: [1, 1, 1, 2, 2, 2, 2, 2, 2],
-            4: [1, 1, 1, 2, 2, 2, 2, 2, 2],
-            5: [1, 1, 1, 2, 2, 2, 2, 2, 2]
-        },
-        2: {
-            1: [2, 2, 2, 2, 2, 2, 4, 4, 4],
-            2: [1, 1, 1, 2, 2, 2, 2, 2, 2, 4, 4, 4],
-            3: [1, 1, 1, 2, 2, 2, 2, 2, 2],
-            4: [1, 1, 1, 2, 2, 2, 2, 2, 2],
-            5: [2, 2, 2, 2, 2, 2],
-            6: [2, 2, 2, 2, 2, 2]
-        },
-        3: {
-            1: [2, 2, 2, 2, 2, 2, 4, 4, 4],
-            2: [2, 2, 2, 2, 2, 2, 4, 4, 4]
-        },
-        4: {
-            1: [3, 3],
-            2: [3, 3],
-            3: [3, 3],
-            4: [3, 3],
-            5: [3, 3],
-            6: [3, 3],
-            7: [3, 3],
-            8: [3, 3, 2, 2, 2, 2, 2, 2]
-        },
-        5: {
-            1: [3, 3, 2, 2, 2, 2, 2, 2]
-        }
-    }
-    return _dic_keys[type_id][specification_id][insert_id - 1]
+    return FACTOR_KEYS[type_id][specification_id][insert_id - 1]
 
 
 def get_mate_unmate_factor(n_cycles: float) -> float:
@@ -11,6 +11,22 @@
 from math import exp
 from typing import Any, Dict, List
 
+LAMBDA_B_FACTORS = {
+    1: {
+        1: [0.0018, 15.6],
+        2: [0.002, 14.0],
+        3: [0.0018, 8.7],
+        4: [0.002, 10.0],
+        5: [0.00125, 3.8],
+        6: [0.00159, 8.4]
+    },
+    2: {
+        1: [0.000335, 15.6],
+        2: [0.000379, 14.0],
+        3: [0.000319, 8.7],
+        4: [0.00035, 10.0]
+    }
+}
 PART_COUNT_LAMBDA_B = {
     1: {
         1: [
@@ -77,6 +93,22 @@ REF_TEMPS = {
         4: 409.0
     }
 }
+TEMPERATURE_RISE_SPEC_SHEET = {
+    1: 15.0,
+    2: 15.0,
+    3: 15.0,
+    4: 35.0,
+    5: 15.0,
+    6: 35.0,
+    7: 15.0,
+    8: 35.0,
+    9: 15.0,
+    10: 15.0,
+    11: 35.0,
+    12: 35.0,
+    13: 15.0,
+    14: 15.0
+}
 
 
 def calculate_hot_spot_temperature(temperature_active: float,
@@ -170,26 +202,9 @@ def calculate_part_stress_lambda_b(subcategory_id: int, insulation_id: int,
     :rtype: float
     :raise: KeyError when passed an unknown subcategory ID or insulation ID.
     """
-    _dic_factors = {
-        1: {
-            1: [0.0018, 15.6],
-            2: [0.002, 14.0],
-            3: [0.0018, 8.7],
-            4: [0.002, 10.0],
-            5: [0.00125, 3.8],
-            6: [0.00159, 8.4]
-        },
-        2: {
-            1: [0.000335, 15.6],
-            2: [0.000379, 14.0],
-            3: [0.000319, 8.7],
-            4: [0.00035, 10.0]
-        }
-    }
-
     _ref_temp = REF_TEMPS[subcategory_id][insulation_id]
-    _f0 = _dic_factors[subcategory_id][insulation_id][0]
-    _f1 = _dic_factors[subcategory_id][insulation_id][1]
+    _f0 = LAMBDA_B_FACTORS[subcategory_id][insulation_id][0]
+    _f1 = LAMBDA_B_FACTORS[subcategory_id][insulation_id][1]
     _lambda_b = _f0 * exp(((temperature_hot_spot + 273.0) / _ref_temp)**_f1)
 
     return _lambda_b
@@ -308,19 +323,4 @@ def get_temperature_rise_spec_sheet(page_number: int) -> float:
     :rtype: float
     :raise: KeyError if an unknown spec sheet is passed.
     """
-    return {
-        1: 15.0,
-        2: 15.0,
-        3: 15.0,
-        4: 35.0,
-        5: 15.0,
-        6: 35.0,
-        7: 15.0,
-        8: 35.0,
-        9: 15.0,
-        10: 15.0,
-        11: 35.0,
-        12: 35.0,
-        13: 15.0,
-        14: 15.0
-    }[page_number]
+    return TEMPERATURE_RISE_SPEC_SHEET[page_number]
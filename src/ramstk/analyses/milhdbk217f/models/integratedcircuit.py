@@ -47,6 +47,23 @@ C1 = {
     8: [[0.0078, 0.016, 0.031, 0.062], [0.0052, 0.011, 0.021, 0.042]],
     9: [[4.5, 7.2], [25.0, 51.0]]
 }
+C1_BREAKPOINTS = {
+    1: [100, 300, 1000, 10000],
+    2: [100, 1000, 3000, 10000, 30000, 60000],
+    3: {
+        1: [200, 1000, 5000],
+        2: [16000, 64000, 256000, 1000000],
+    },
+    4: [8, 16, 32],
+    5: [16000, 64000, 256000, 100000],
+    6: [16000, 64000, 256000, 100000],
+    7: [16000, 64000, 256000, 100000],
+    8: [16000, 64000, 256000, 100000],
+    9: {
+        1: [10, 1000],
+        2: [1000, 10000]
+    }
+}
 C2 = {
     1: [2.8E-4, 1.08],
     2: [9.0E-5, 1.51],
@@ -334,6 +351,7 @@ PI_A = {1: [1.0, 3.0, 3.0], 2: [1.0]}
 PI_E = [
     0.5, 2.0, 4.0, 4.0, 6.0, 4.0, 5.0, 5.0, 8.0, 8.0, 0.5, 5.0, 12.0, 220.0
 ]
+PI_ECC = {1: 1.0, 2: 0.72, 3: 0.68}
 PI_PT = {1: 1.0, 7: 1.3, 2: 2.2, 8: 2.9, 3: 4.7, 9: 6.1}
 PI_Q = [0.25, 1.0, 2.0]
 
@@ -617,24 +635,6 @@ def get_die_complexity_factor(subcategory_id: int, technology_id: int,
     :raise: ValueError if passed a number of elements not associated with the
         breakpoints in MIL-HDBK-217F.
     """
-    _dic_breakpoints = {
-        1: [100, 300, 1000, 10000],
-        2: [100, 1000, 3000, 10000, 30000, 60000],
-        3: {
-            1: [200, 1000, 5000],
-            2: [16000, 64000, 256000, 1000000],
-        },
-        4: [8, 16, 32],
-        5: [16000, 64000, 256000, 100000],
-        6: [16000, 64000, 256000, 100000],
-        7: [16000, 64000, 256000, 100000],
-        8: [16000, 64000, 256000, 100000],
-        9: {
-            1: [10, 1000],
-            2: [1000, 10000]
-        }
-    }
-
     if subcategory_id == 2 and technology_id == 11:
         _technology = 2
     elif subcategory_id == 2 and technology_id != 11:
@@ -643,11 +643,11 @@ def get_die_complexity_factor(subcategory_id: int, technology_id: int,
         _technology = technology_id
 
     if subcategory_id == 3:
-        _lst_index = _dic_breakpoints[subcategory_id][_technology]
+        _lst_index = C1_BREAKPOINTS[subcategory_id][_technology]
     elif subcategory_id == 9:
-        _lst_index = _dic_breakpoints[subcategory_id][application_id]
+        _lst_index = C1_BREAKPOINTS[subcategory_id][application_id]
     else:
-        _lst_index = _dic_breakpoints[subcategory_id]
+        _lst_index = C1_BREAKPOINTS[subcategory_id]
 
     # This will retrieve the breakpoint value for the number of elements
     # closest (round up) to the number of elements passed.
@@ -680,7 +680,7 @@ def get_error_correction_factor(type_id: int) -> float:
     :rtype: float
     :raise: KeyError if passed an unknown type_id.
     """
-    return {1: 1.0, 2: 0.72, 3: 0.68}[type_id]
+    return PI_ECC[type_id]
 
 
 def get_manufacturing_process_factor(manufacturing_id: int) -> float:
@@ -3,10 +3,12 @@ from typing import Any, Dict, Tuple
 
 ACTIVATION_ENERGY: Any
 C1: Any
+C1_BREAKPOINTS: Any
 C2: Any
 PART_COUNT_LAMBDA_B: Any
 PI_A: Any
 PI_E: Any
+PI_ECC: Any
 PI_PT: Any
 PI_Q: Any
 
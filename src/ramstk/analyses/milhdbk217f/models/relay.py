@@ -12,6 +12,10 @@
 from math import exp
 from typing import Any, Dict
 
+LAMBDA_B_FACTORS = {
+    1: [[0.00555, 352.0, 15.7], [0.0054, 377.0, 10.4]],
+    2: [0.4, 0.5, 0.5]
+}
 PART_COUNT_LAMBDA_B = {
     1: {
         1: [
@@ -254,19 +258,15 @@ def calculate_part_stress_lambda_b(subcategory_id: int, type_id: int,
         passed an unknown subcategory ID.
     :rtype: float
     """
-    _dic_factors = {
-        1: [[0.00555, 352.0, 15.7], [0.0054, 377.0, 10.4]],
-        2: [0.4, 0.5, 0.5]
-    }
     _lambda_b = 0.0
 
     if subcategory_id == 1:
-        _f0 = _dic_factors[subcategory_id][type_id - 1][0]
-        _f1 = _dic_factors[subcategory_id][type_id - 1][1]
-        _f2 = _dic_factors[subcategory_id][type_id - 1][2]
+        _f0 = LAMBDA_B_FACTORS[subcategory_id][type_id - 1][0]
+        _f1 = LAMBDA_B_FACTORS[subcategory_id][type_id - 1][1]
+        _f2 = LAMBDA_B_FACTORS[subcategory_id][type_id - 1][2]
         _lambda_b = _f0 * exp(((temperature_active + 273.0) / _f1)**_f2)
     elif subcategory_id == 2:
-        _lambda_b = _dic_factors[subcategory_id][type_id - 1]
+        _lambda_b = LAMBDA_B_FACTORS[subcategory_id][type_id - 1]
 
     return _lambda_b
 
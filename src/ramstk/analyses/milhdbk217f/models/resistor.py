@@ -11,6 +11,27 @@
 from math import exp
 from typing import Any, Dict, List
 
+LAMBDA_B_FACTORS: Dict[int, List[float]] = {
+    1: [4.5E-9, 12.0, 1.0, 0.6, 1.0, 1.0],
+    3: [7.33E-3, 0.202, 2.6, 1.45, 0.89, 1.3],
+    5: [0.0031, 1.0, 10.0, 1.0, 1.0, 1.5],
+    6: [0.00148, 1.0, 2.0, 0.5, 1.0, 1.0],
+    7: [0.00015, 2.64, 1.0, 0.466, 1.0, 1.0],
+    8: [0.021, 0.065, 0.105, 0.0, 0.0, 0.0],
+    9: [0.0062, 1.0, 5.0, 1.0, 1.0, 1.0],
+    10: [0.0735, 1.03, 4.45, 2.74, 3.51, 1.0],
+    11: [0.0398, 0.514, 5.28, 1.44, 4.46, 1.0],
+    12: [0.0481, 0.334, 4.66, 1.47, 2.83, 1.0],
+    13: [0.019, 0.445, 7.3, 2.69, 2.46, 1.0],
+    14: [0.0246, 0.459, 9.3, 2.32, 5.3, 1.0],
+    15: [0.018, 1.0, 7.4, 2.55, 3.6, 1.0]
+}
+LAMBDA_B_FACTORS_FILM: Dict[int, List[float]] = {
+    1: [3.25E-4, 1.0, 3.0, 1.0, 1.0, 1.0],
+    2: [3.25E-4, 1.0, 3.0, 1.0, 1.0, 1.0],
+    3: [5.0E-5, 3.5, 1.0, 1.0, 1.0, 1.0],
+    4: [5.0E-5, 3.5, 1.0, 1.0, 1.0, 1.0]
+}
 PART_COUNT_LAMBDA_B = {
     1: [
         0.0005, 0.0022, 0.0071, 0.0037, 0.012, 0.0052, 0.0065, 0.016, 0.025,
@@ -235,6 +256,31 @@ REF_TEMPS: Dict[int, float] = {
     15: 343.0
 }
 REF_TEMPS_FILM: Dict[int, float] = {1: 343.0, 2: 343.0, 3: 398.0, 4: 398.0}
+RESISTANCE_BREAKPOINTS = {
+    1: [1.0E5, 1.0E6, 1.0E7],
+    2: [1.0E5, 1.0E6, 1.0E7],
+    3: [100.0, 1.0E5, 1.0E6],
+    5: [1.0E4, 1.0E5, 1.0E6],
+    6: [[500.0, 1.0E3, 5.0E3, 7.5E3, 1.0E4, 1.5E4, 2.0E4],
+        [100.0, 1.0E3, 1.0E4, 1.0E5, 1.5E5, 2.0E5]],
+    7: [500.0, 1.0E3, 5.0E3, 1.0E4, 2.0E4],
+    9: [2.0E3, 5.0E3],
+    10: [1.0E4, 2.0E4, 5.0E4, 1.0E5, 2.0E5],
+    11: [2.0E3, 5.0E3],
+    12: [2.0E3, 5.0E3],
+    13: [5.0E4, 1.0E5, 2.0E5, 5.0E5],
+    14: [5.0E4, 1.0E5, 2.0E5, 5.0E5],
+    15: [1.0E4, 5.0E4, 2.0E5, 1.0E6]
+}
+VOLTAGE_BREAKPOINTS = {
+    9: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    10: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    11: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    12: [0.1, 0.2, 0.6, 0.7, 0.8, 0.9],
+    13: [0.8, 0.9],
+    14: [0.8, 0.9],
+    15: [0.8, 0.9]
+}
 
 
 def calculate_part_count(**attributes: Dict[str, Any]) -> float:
@@ -321,49 +367,27 @@ def calculate_part_stress_lambda_b(
     _temperature_active: Any = attributes['temperature_active']
     _power_ratio: Any = attributes['power_ratio']
 
-    _dic_factors: Dict[int, List[float]] = {
-        1: [4.5E-9, 12.0, 1.0, 0.6, 1.0, 1.0],
-        3: [7.33E-3, 0.202, 2.6, 1.45, 0.89, 1.3],
-        5: [0.0031, 1.0, 10.0, 1.0, 1.0, 1.5],
-        6: [0.00148, 1.0, 2.0, 0.5, 1.0, 1.0],
-        7: [0.00015, 2.64, 1.0, 0.466, 1.0, 1.0],
-        8: [0.021, 0.065, 0.105, 0.0, 0.0, 0.0],
-        9: [0.0062, 1.0, 5.0, 1.0, 1.0, 1.0],
-        10: [0.0735, 1.03, 4.45, 2.74, 3.51, 1.0],
-        11: [0.0398, 0.514, 5.28, 1.44, 4.46, 1.0],
-        12: [0.0481, 0.334, 4.66, 1.47, 2.83, 1.0],
-        13: [0.019, 0.445, 7.3, 2.69, 2.46, 1.0],
-        14: [0.0246, 0.459, 9.3, 2.32, 5.3, 1.0],
-        15: [0.018, 1.0, 7.4, 2.55, 3.6, 1.0]
-    }
-    _dic_factors_film: Dict[int, List[float]] = {
-        1: [3.25E-4, 1.0, 3.0, 1.0, 1.0, 1.0],
-        2: [3.25E-4, 1.0, 3.0, 1.0, 1.0, 1.0],
-        3: [5.0E-5, 3.5, 1.0, 1.0, 1.0, 1.0],
-        4: [5.0E-5, 3.5, 1.0, 1.0, 1.0, 1.0]
-    }
-
     if _subcategory_id == 2:
         _ref_temp = REF_TEMPS_FILM[_specification_id]
-        _f0 = _dic_factors_film[_specification_id][0]
-        _f1 = _dic_factors_film[_specification_id][1]
-        _f2 = _dic_factors_film[_specification_id][2]
-        _f3 = _dic_factors_film[_specification_id][3]
-        _f4 = _dic_factors_film[_specification_id][4]
-        _f5 = _dic_factors_film[_specification_id][5]
+        _f0 = LAMBDA_B_FACTORS_FILM[_specification_id][0]
+        _f1 = LAMBDA_B_FACTORS_FILM[_specification_id][1]
+        _f2 = LAMBDA_B_FACTORS_FILM[_specification_id][2]
+        _f3 = LAMBDA_B_FACTORS_FILM[_specification_id][3]
+        _f4 = LAMBDA_B_FACTORS_FILM[_specification_id][4]
+        _f5 = LAMBDA_B_FACTORS_FILM[_specification_id][5]
     elif _subcategory_id not in [4, 8]:
         _ref_temp = REF_TEMPS[_subcategory_id]
-        _f0 = _dic_factors[_subcategory_id][0]
-        _f1 = _dic_factors[_subcategory_id][1]
-        _f2 = _dic_factors[_subcategory_id][2]
-        _f3 = _dic_factors[_subcategory_id][3]
-        _f4 = _dic_factors[_subcategory_id][4]
-        _f5 = _dic_factors[_subcategory_id][5]
+        _f0 = LAMBDA_B_FACTORS[_subcategory_id][0]
+        _f1 = LAMBDA_B_FACTORS[_subcategory_id][1]
+        _f2 = LAMBDA_B_FACTORS[_subcategory_id][2]
+        _f3 = LAMBDA_B_FACTORS[_subcategory_id][3]
+        _f4 = LAMBDA_B_FACTORS[_subcategory_id][4]
+        _f5 = LAMBDA_B_FACTORS[_subcategory_id][5]
 
     if _subcategory_id == 4:
         _lambda_b = 0.00006
     elif _subcategory_id == 8:
-        _lambda_b = _dic_factors[_subcategory_id][_type_id - 1]
+        _lambda_b = LAMBDA_B_FACTORS[_subcategory_id][_type_id - 1]
     else:
         _lambda_b = _f0 * exp(
             _f1 * ((_temperature_active + 273.0) / _ref_temp), )**_f2 * exp(
@@ -502,30 +526,15 @@ def get_resistance_factor(attributes: Dict[str, Any]) -> Dict[str, Any]:
     _family_id: Any = attributes['family_id']
     _resistance: Any = attributes['resistance']
 
-    _dic_breakpoints = {
-        1: [1.0E5, 1.0E6, 1.0E7],
-        2: [1.0E5, 1.0E6, 1.0E7],
-        3: [100.0, 1.0E5, 1.0E6],
-        5: [1.0E4, 1.0E5, 1.0E6],
-        6: [[500.0, 1.0E3, 5.0E3, 7.5E3, 1.0E4, 1.5E4, 2.0E4],
-            [100.0, 1.0E3, 1.0E4, 1.0E5, 1.5E5, 2.0E5]],
-        7: [500.0, 1.0E3, 5.0E3, 1.0E4, 2.0E4],
-        9: [2.0E3, 5.0E3],
-        10: [1.0E4, 2.0E4, 5.0E4, 1.0E5, 2.0E5],
-        11: [2.0E3, 5.0E3],
-        12: [2.0E3, 5.0E3],
-        13: [5.0E4, 1.0E5, 2.0E5, 5.0E5],
-        14: [5.0E4, 1.0E5, 2.0E5, 5.0E5],
-        15: [1.0E4, 5.0E4, 2.0E5, 1.0E6]
-    }
     _pi_r = 0.0
 
     if _subcategory_id not in [4, 8]:
         _index = -1
         if _subcategory_id == 6:
-            _breaks = _dic_breakpoints[_subcategory_id][_specification_id - 1]
+            _breaks = RESISTANCE_BREAKPOINTS[_subcategory_id][
+                _specification_id - 1]
         else:
-            _breaks = _dic_breakpoints[_subcategory_id]
+            _breaks = RESISTANCE_BREAKPOINTS[_subcategory_id]
 
         for _index, _value in enumerate(_breaks):
             _diff = _value - _resistance
@@ -563,11 +572,7 @@ def get_voltage_factor(attributes: Dict[str, Any]) -> Dict[str, Any]:
     _voltage_ratio: float = float(attributes['voltage_ratio'])
 
     _index = -1
-    _breaks = [0.0]
-    if _subcategory_id in [9, 10, 11, 12]:
-        _breaks = [0.1, 0.2, 0.6, 0.7, 0.8, 0.9]
-    elif _subcategory_id in [13, 14, 15]:
-        _breaks = [0.8, 0.9]
+    _breaks = VOLTAGE_BREAKPOINTS.get(_subcategory_id, [0.0])
 
     for _index, _value in enumerate(_breaks):
         _diff = _value - _voltage_ratio
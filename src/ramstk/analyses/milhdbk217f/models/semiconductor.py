@@ -161,6 +161,23 @@ PART_COUNT_PI_Q: Dict[int, List[float]] = {
 PART_COUNT_PI_Q_HF_DIODE: List[List[float]] = [[0.5, 1.0, 5.0, 25, 50],
                                                [0.5, 1.0, 1.8, 2.5]]
 
+PART_STRESS_LAMBDA_B_LIST: Dict[int, List[float]] = {
+    1: [0.0038, 0.0010, 0.069, 0.003, 0.005, 0.0013, 0.0034, 0.002],
+    2: [0.22, 0.18, 0.0023, 0.0081, 0.027, 0.0025, 0.0025],
+    4: [0.012, 0.0045],
+    9: [0.06, 0.023],
+    11: [
+        0.0055, 0.004, 0.0025, 0.013, 0.013, 0.0064, 0.0033, 0.017, 0.017,
+        0.0086, 0.0013, 0.00023
+    ],
+    13: [3.23, 5.65]
+}
+PART_STRESS_LAMBDA_B_SCALAR: Dict[int, float] = {
+    3: 0.00074,
+    5: 0.0083,
+    6: 0.18,
+    10: 0.0022
+}
 PART_STRESS_PI_Q: Dict[int, List[float]] = {
     1: [0.7, 1.0, 2.4, 5.5, 8.0],
     3: [0.7, 1.0, 2.4, 5.5, 8.0],
@@ -455,26 +472,8 @@ def calculate_part_stress_lambda_b(
     :raise: IndexError if passed an unknown type ID.
     :raise: KeyError if passed an unkown subcategory ID.
     """
-    _dic_lambdab_scalar: Dict[int, float] = {
-        3: 0.00074,
-        5: 0.0083,
-        6: 0.18,
-        10: 0.0022
-    }
-    _dic_lambdab_list: Dict[int, List[float]] = {
-        1: [0.0038, 0.0010, 0.069, 0.003, 0.005, 0.0013, 0.0034, 0.002],
-        2: [0.22, 0.18, 0.0023, 0.0081, 0.027, 0.0025, 0.0025],
-        4: [0.012, 0.0045],
-        9: [0.06, 0.023],
-        11: [
-            0.0055, 0.004, 0.0025, 0.013, 0.013, 0.0064, 0.0033, 0.017, 0.017,
-            0.0086, 0.0013, 0.00023
-        ],
-        13: [3.23, 5.65]
-    }
-
     if attributes['subcategory_id'] in [3, 5, 6, 10]:
-        attributes['lambda_b'] = _dic_lambdab_scalar[
+        attributes['lambda_b'] = PART_STRESS_LAMBDA_B_SCALAR[
             attributes['subcategory_id']]
     elif attributes['subcategory_id'] == 7:
         attributes['lambda_b'] = 0.032 * exp(
@@ -495,7 +494,7 @@ def calculate_part_stress_lambda_b(
         else:
             attributes['lambda_b'] = 0.00043 * attributes['n_elements']
     else:
-        attributes['lambda_b'] = _dic_lambdab_list[
+        attributes['lambda_b'] = PART_STRESS_LAMBDA_B_LIST[
             attributes['subcategory_id']][attributes['type_id'] - 1]
 
     return attributes
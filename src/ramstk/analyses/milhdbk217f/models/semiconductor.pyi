@@ -5,6 +5,8 @@ PART_COUNT_LAMBDA_B_DICT: Any
 PART_COUNT_LAMBDA_B_LIST: Any
 PART_COUNT_PI_Q: Dict[int, List[float]]
 PART_COUNT_PI_Q_HF_DIODE: List[List[float]]
+PART_STRESS_LAMBDA_B_LIST: Dict[int, List[float]]
+PART_STRESS_LAMBDA_B_SCALAR: Dict[int, float]
 PART_STRESS_PI_Q: Dict[int, List[float]]
 PART_STRESS_PI_Q_HF_DIODE: Dict[int, List[float]]
 PI_T_DICT: Dict[int, List[float]]
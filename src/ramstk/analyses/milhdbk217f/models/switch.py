@@ -10,6 +10,11 @@
 from math import exp
 from typing import Any, Dict, List
 
+LAMBDA_B_FACTORS: Dict[int, List[List[float]]] = {
+    2: [[0.1, 0.00045, 0.0009], [0.1, 0.23, 0.63]],
+    3: [[0.0067, 0.00003, 0.00003], [0.1, 0.02, 0.06]],
+    4: [[0.0067, 0.062], [0.086, 0.089]]
+}
 PART_COUNT_LAMBDA_B: Dict[int, List[float]] = {
     1: [
         0.0010, 0.0030, 0.018, 0.0080, 0.029, 0.010, 0.018, 0.013, 0.022,
@@ -135,26 +140,20 @@ def calculate_part_stress_lambda_b(
     _application_id: Any = attributes['application_id']
     _n_elements: Any = attributes['n_elements']
 
-    _dic_factors: Dict[int, List[List[float]]] = {
-        2: [[0.1, 0.00045, 0.0009], [0.1, 0.23, 0.63]],
-        3: [[0.0067, 0.00003, 0.00003], [0.1, 0.02, 0.06]],
-        4: [[0.0067, 0.062], [0.086, 0.089]]
-    }
-
     if _subcategory_id == 1:
         _lambda_b: Any = PART_STRESS_LAMBDA_B_TOGGLE[_construction_id][
             _quality_id - 1]
     elif _subcategory_id in [2, 3]:
-        _lambda_bE = _dic_factors[_subcategory_id][_quality_id - 1][0]
-        _lambda_bC = _dic_factors[_subcategory_id][_quality_id - 1][1]
-        _lambda_b0 = _dic_factors[_subcategory_id][_quality_id - 1][2]
+        _lambda_bE = LAMBDA_B_FACTORS[_subcategory_id][_quality_id - 1][0]
+        _lambda_bC = LAMBDA_B_FACTORS[_subcategory_id][_quality_id - 1][1]
+        _lambda_b0 = LAMBDA_B_FACTORS[_subcategory_id][_quality_id - 1][2]
         if _construction_id == 1:
             _lambda_b = (_lambda_bE + _n_elements * _lambda_bC)
         else:
             _lambda_b = (_lambda_bE + _n_elements * _lambda_b0)
     elif _subcategory_id == 4:
-        _lambda_b1 = _dic_factors[_subcategory_id][_quality_id - 1][0]
-        _lambda_b2 = _dic_factors[_subcategory_id][_quality_id - 1][1]
+        _lambda_b1 = LAMBDA_B_FACTORS[_subcategory_id][_quality_id - 1][0]
+        _lambda_b2 = LAMBDA_B_FACTORS[_subcategory_id][_quality_id - 1][1]
         _lambda_b = (_lambda_b1 + _n_elements * _lambda_b2)
     elif _subcategory_id == 5:
         _lambda_b = PART_STRESS_LAMBDA_B_BREAKER[_application_id - 1]
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.analyses.milhdbk217f.tables.py is part of the RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2019 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""MIL-HDBK-217F Factor Tables Module.
+
+The environment factors (piE), quality factors (piQ), and parts count base
+hazard rates (lambda b) in the model modules are nested dicts and lists that
+are keyed differently for each category.  This module compiles them, once at
+import, into dense NumPy arrays with a uniform layout:
+
+    PI_E[category, subcategory, quality, environment]
+    PART_COUNT_LAMBDA_B[category, subcategory, key, environment]
+    PART_COUNT_PI_Q[category, subcategory, quality]
+    PART_STRESS_PI_Q[category, subcategory, quality]
+
+Every axis is indexed directly by the ID from the database.  The key axis of
+PART_COUNT_LAMBDA_B is the ID named in PART_COUNT_KEYS (e.g., type_id or
+specification_id) for the subcategories that have one.  Factors that do not
+depend on an axis are repeated along it.  Combinations that have no factor
+hold NaN.
+
+The integrated circuit parts count base hazard rates are selected using the
+number of elements as well as the technology and are not included in
+PART_COUNT_LAMBDA_B.  Neither are the factors that depend on attributes other
+than those above (e.g., the semiconductor high frequency diode piQ).
+"""
+
+# Standard Library Imports
+from typing import Any, Dict
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from .models import (
+    capacitor, connection, crystal, efilter, fuse, inductor,
+    integratedcircuit, lamp, meter, relay, resistor, semiconductor, switch
+)
+
+N_CATEGORIES = 10
+N_ENVIRONMENTS = 14
+N_KEYS = 7
+N_QUALITIES = 9
+N_SUBCATEGORIES = 19
+
+# The ID attribute used to index the key axis of PART_COUNT_LAMBDA_B.  The
+# key is the category ID, then the subcategory ID.  Subcategories not listed
+# have the same base hazard rate for every key.
+PART_COUNT_KEYS: Dict[int, Dict[int, str]] = {
+    2: {
+        1: 'type_id',
+        2: 'type_id',
+        3: 'type_id',
+        8: 'type_id',
+        11: 'type_id',
+        13: 'type_id'
+    },
+    3: {
+        2: 'specification_id',
+        6: 'specification_id'
+    },
+    4: {
+        1: 'specification_id'
+    },
+    5: {
+        1: 'family_id',
+        2: 'family_id'
+    },
+    6: {
+        1: 'type_id',
+        2: 'type_id'
+    },
+    7: {
+        5: 'construction_id'
+    },
+    8: {
+        1: 'type_id',
+        5: 'type_id'
+    },
+    9: {
+        1: 'type_id',
+        2: 'type_id'
+    },
+    10: {
+        2: 'type_id',
+        4: 'application_id'
+    }
+}
+
+
+def _do_build_part_count_lambda_b() -> np.ndarray:
+    """Build the parts count base hazard rate (lambda b) array.
+
+    :return: the lambda b array indexed by [category, subcategory, key,
+        environment].
+    :rtype: :class:`numpy.ndarray`
+    """
+    _lambda_b = np.full((N_CATEGORIES + 1, N_SUBCATEGORIES + 1, N_KEYS + 1,
+                         N_ENVIRONMENTS + 1), np.nan)
+
+    _tables: Dict[int, Dict[int, Any]] = {
+        2: {
+            **semiconductor.PART_COUNT_LAMBDA_B_LIST,
+            **semiconductor.PART_COUNT_LAMBDA_B_DICT
+        },
+        3: resistor.PART_COUNT_LAMBDA_B,
+        4: capacitor.PART_COUNT_LAMBDA_B,
+        5: inductor.PART_COUNT_LAMBDA_B,
+        6: relay.PART_COUNT_LAMBDA_B,
+        7: {
+            **switch.PART_COUNT_LAMBDA_B,
+            5: switch.PART_COUNT_LAMBDA_B_BREAKER
+        },
+        8: connection.PART_COUNT_LAMBDA_B,
+        9: meter.PART_COUNT_LAMBDA_B,
+        10: {
+            1: crystal.PART_COUNT_LAMBDA_B,
+            2: efilter.PART_COUNT_LAMBDA_B,
+            3: fuse.PART_COUNT_LAMBDA_B,
+            4: lamp.PART_COUNT_LAMBDA_B
+        }
+    }
+
+    for _category_id, _table in _tables.items():
+        for _subcategory_id, _factors in _table.items():
+            if _subcategory_id in PART_COUNT_KEYS.get(_category_id, {}):
+                _do_set_keyed_factors(
+                    _lambda_b[_category_id, _subcategory_id], _factors)
+            else:
+                _do_set_factors(_lambda_b[_category_id, _subcategory_id],
+                                _factors)
+
+    return _lambda_b
+
+
+def _do_build_part_count_pi_q() -> np.ndarray:
+    """Build the parts count quality factor (piQ) array.
+
+    :return: the piQ array indexed by [category, subcategory, quality].
+    :rtype: :class:`numpy.ndarray`
+    """
+    _pi_q = np.full((N_CATEGORIES + 1, N_SUBCATEGORIES + 1, N_QUALITIES + 1),
+                    np.nan)
+
+    _do_set_factors(_pi_q[1], integratedcircuit.PI_Q)
+    _do_set_keyed_factors(_pi_q[2], semiconductor.PART_COUNT_PI_Q)
+    _do_set_factors(_pi_q[3], resistor.PART_COUNT_PI_Q)
+    _do_set_factors(_pi_q[4], capacitor.PART_COUNT_PI_Q)
+    _do_set_factors(_pi_q[5], inductor.PART_COUNT_PI_Q)
+    _do_set_keyed_factors(_pi_q[6], relay.PART_COUNT_PI_Q)
+    _do_set_keyed_factors(_pi_q[7], switch.PART_COUNT_PI_Q)
+    _do_set_factors(_pi_q[8], connection.PART_COUNT_PI_Q)
+    _do_set_keyed_factors(_pi_q[9], meter.PART_COUNT_PI_Q)
+    _do_set_factors(_pi_q[10, 1], crystal.PART_COUNT_PI_Q)
+    _do_set_factors(_pi_q[10, 2], efilter.PI_Q)
+    _pi_q[10, 3:5] = 1.0
+
+    return _pi_q
+
+
+def _do_build_part_stress_pi_q() -> np.ndarray:
+    """Build the part stress quality factor (piQ) array.
+
+    :return: the piQ array indexed by [category, subcategory, quality].
+    :rtype: :class:`numpy.ndarray`
+    """
+    _pi_q = np.full((N_CATEGORIES + 1, N_SUBCATEGORIES + 1, N_QUALITIES + 1),
+                    np.nan)
+
+    _do_set_factors(_pi_q[1], integratedcircuit.PI_Q)
+    _do_set_keyed_factors(_pi_q[2], semiconductor.PART_STRESS_PI_Q)
+    _do_set_keyed_factors(_pi_q[3], resistor.PART_STRESS_PI_Q)
+    _do_set_keyed_factors(_pi_q[4], capacitor.PART_STRESS_PI_Q)
+    _do_set_factors(_pi_q[5, 2], inductor.PART_STRESS_PI_Q[2])
+    _do_set_keyed_factors(_pi_q[6], relay.PART_STRESS_PI_Q)
+    _pi_q[7, 1:5] = 0.0
+    _do_set_keyed_factors(_pi_q[7], switch.PART_STRESS_PI_Q)
+    _pi_q[8, 1:4] = 0.0
+    _do_set_keyed_factors(_pi_q[8], connection.PART_STRESS_PI_Q)
+    _pi_q[9, 1] = 0.0
+    _do_set_keyed_factors(_pi_q[9], meter.PART_STRESS_PI_Q)
+    _do_set_factors(_pi_q[10, 1], crystal.PART_STRESS_PI_Q)
+    _do_set_factors(_pi_q[10, 2], efilter.PI_Q)
+    _pi_q[10, 3:5] = 0.0
+
+    return _pi_q
+
+
+def _do_build_pi_e() -> np.ndarray:
+    """Build the environment factor (piE) array.
+
+    :return: the piE array indexed by [category, subcategory, quality,
+        environment].
+    :rtype: :class:`numpy.ndarray`
+    """
+    _pi_e = np.full((N_CATEGORIES + 1, N_SUBCATEGORIES + 1, N_QUALITIES + 1,
+                     N_ENVIRONMENTS + 1), np.nan)
+
+    _do_set_factors(_pi_e[1], integratedcircuit.PI_E)
+    _do_set_keyed_factors(_pi_e[2], semiconductor.PI_E)
+    _do_set_keyed_factors(_pi_e[3], resistor.PI_E)
+    _do_set_factors(_pi_e[4], capacitor.PI_E)
+    _do_set_keyed_factors(_pi_e[5], inductor.PI_E)
+
+    # Established reliability relays (quality 1 - 6) use the first list of
+    # piE values and all other relays use the second.
+    _do_set_factors(_pi_e[6, 1, 1:7], relay.PI_E[1][1])
+    _do_set_factors(_pi_e[6, 1, 7:], relay.PI_E[1][2])
+    _do_set_factors(_pi_e[6, 2], relay.PI_E[2])
+
+    _do_set_keyed_factors(_pi_e[7], switch.PI_E)
+    for _subcategory_id, _factors in connection.PI_E.items():
+        if _subcategory_id in [1, 2]:
+            _do_set_keyed_factors(_pi_e[8, _subcategory_id], _factors)
+        else:
+            _do_set_factors(_pi_e[8, _subcategory_id], _factors)
+    _do_set_keyed_factors(_pi_e[9], meter.PI_E)
+    _do_set_factors(_pi_e[10, 1], crystal.PI_E)
+    _do_set_factors(_pi_e[10, 2], efilter.PI_E)
+    _do_set_factors(_pi_e[10, 3], fuse.PI_E)
+    _do_set_factors(_pi_e[10, 4], lamp.PI_E)
+
+    return _pi_e
+
+
+def _do_set_factors(array: np.ndarray, factors: Any) -> None:
+    """Set the last axis of an array from a list of factors.
+
+    The factors are stored starting at index one so that the list can be
+    indexed by ID.  The factors are repeated along all other axes.
+
+    :param array: the (view of the) array to set the factors in.
+    :param factors: the list of factors or the single factor.
+    :return: None
+    :rtype: None
+    """
+    if isinstance(factors, list):
+        array[..., 1:len(factors) + 1] = factors
+    else:
+        array[...] = factors
+
+
+def _do_set_keyed_factors(array: np.ndarray, factors: Any) -> None:
+    """Set an array from factors keyed by the first axis of the array.
+
+    Dicts are stored at their key and lists at their index.
+
+    :param array: the (view of the) array to set the factors in.
+    :param factors: the dict or list of factors for each key.
+    :return: None
+    :rtype: None
+    """
+    _items = factors.items() if isinstance(factors,
+                                           dict) else enumerate(factors)
+    for _key, _factors in _items:
+        _do_set_factors(array[_key], _factors)
+
+
+def get_factor(table: np.ndarray, *indices: Any) -> np.ndarray:
+    """Gather factors from a dense factor array.
+
+    There is one index, or array of indices, for each leading axis of the
+    table.  Indices are broadcast against each other.  If fewer indices than
+    axes are passed, the remaining axes are returned as trailing dimensions.
+
+    :param table: the dense array of factors.
+    :param indices: the index, or array of indices, for each axis.
+    :return: the selected factors; NaN for indices that are negative, not
+        whole numbers, or outside the table.
+    :rtype: :class:`numpy.ndarray`
+    """
+    _indices = np.broadcast_arrays(
+        *[np.asarray(_index, dtype=float) for _index in indices])
+
+    _valid = np.ones(_indices[0].shape, dtype=bool)
+    _positions = []
+    for _axis, _index in enumerate(_indices):
+        _known = ((_index >= 0) & (_index < table.shape[_axis])
+                  & (_index == np.floor(_index)))
+        _valid &= _known
+        _positions.append(np.where(_known, _index, 0).astype(int))
+
+    _factors = table[tuple(_positions)]
+    _valid = _valid.reshape(_valid.shape + (1, ) *
+                            (_factors.ndim - _valid.ndim))
+
+    return np.where(_valid, _factors, np.nan)
+
+
+PART_COUNT_LAMBDA_B = _do_build_part_count_lambda_b()
+PART_COUNT_PI_Q = _do_build_part_count_pi_q()
+PART_STRESS_PI_Q = _do_build_part_stress_pi_q()
+PI_E = _do_build_pi_e()
@@ -0,0 +1,58 @@
+# Standard Library Imports
+from typing import Any, Dict
+
+# Third Party Imports
+import numpy as np
+
+# RAMSTK Local Imports
+from .models import capacitor as capacitor
+from .models import connection as connection
+from .models import crystal as crystal
+from .models import efilter as efilter
+from .models import fuse as fuse
+from .models import inductor as inductor
+from .models import integratedcircuit as integratedcircuit
+from .models import lamp as lamp
+from .models import meter as meter
+from .models import relay as relay
+from .models import resistor as resistor
+from .models import semiconductor as semiconductor
+from .models import switch as switch
+
+N_CATEGORIES: int
+N_ENVIRONMENTS: int
+N_KEYS: int
+N_QUALITIES: int
+N_SUBCATEGORIES: int
+PART_COUNT_KEYS: Dict[int, Dict[int, str]]
+PART_COUNT_LAMBDA_B: np.ndarray
+PART_COUNT_PI_Q: np.ndarray
+PART_STRESS_PI_Q: np.ndarray
+PI_E: np.ndarray
+
+def _do_build_part_count_lambda_b() -> np.ndarray:
+    ...
+
+
+def _do_build_part_count_pi_q() -> np.ndarray:
+    ...
+
+
+def _do_build_part_stress_pi_q() -> np.ndarray:
+    ...
+
+
+def _do_build_pi_e() -> np.ndarray:
+    ...
+
+
+def _do_set_factors(array: np.ndarray, factors: Any) -> None:
+    ...
+
+
+def _do_set_keyed_factors(array: np.ndarray, factors: Any) -> None:
+    ...
+
+
+def get_factor(table: np.ndarray, *indices: Any) -> np.ndarray:
+    ...
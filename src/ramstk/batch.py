@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.batch.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""RAMSTK Batch Calculation Module.
+
+This module runs the RAMSTK calculations for an entire program database
+without the GUI.  It uses the same data and analysis managers the GUI does;
+the messages the GUI would send when the user presses a calculate button are
+sent here instead.  Nothing in ramstk.views is imported.
+"""
+
+# Standard Library Imports
+import argparse
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+# Third Party Imports
+from pubsub import pub
+from pubsub.core import Listener
+
+# RAMSTK Package Imports
+from ramstk.configuration import RAMSTKUserConfiguration
+from ramstk.db.base import BaseDatabase
+from ramstk.exceptions import DataAccessError
+from ramstk.ramstk import RAMSTKProgramManager
+from ramstk.utilities import lazy_import
+
+# The controllers aren't needed to build the command line parser.
+controllers = lazy_import('ramstk.controllers')
+
+# The modules that can be calculated in batch mode in the order they're
+# calculated.  Hardware comes first because the allocation and FMEA use the
+# hardware hazard rates.
+BATCH_MODULES = ['hardware', 'allocation', 'fmea', 'validation']
+
+
+def do_calculate_allocation(program_mgr: RAMSTKProgramManager,
+                            revision_id: int) -> None:
+    """Allocate the reliability goal of every allocation item to its children.
+
+    The items are allocated from the top of the tree down so each item's goal
+    is allocated before it's allocated to its children.
+
+    :param program_mgr: the RAMSTKProgramManager() for the open program.
+    :param revision_id: the ID of the revision being calculated.
+    :return: None
+    :rtype: None
+    """
+    # pylint: disable=unused-argument
+    _tree = program_mgr.dic_managers['allocation']['data'].tree
+    for _node_id in list(_tree.expand_tree(sorting=False)):
+        if _node_id != _tree.root and _tree.children(_node_id):
+            _do_request_calculation('request_calculate_allocation',
+                                    node_id=_node_id)
+
+
+def do_calculate_fmea(program_mgr: RAMSTKProgramManager,
+                      revision_id: int) -> None:
+    """Calculate the criticality of every hardware failure mode.
+
+    :param program_mgr: the RAMSTKProgramManager() for the open program.
+    :param revision_id: the ID of the revision being calculated.
+    :return: None
+    :rtype: None
+    """
+    # The failure modes are selected along with the hardware hazard rates so
+    # any hazard rates calculated in this batch must be flushed first.
+    program_mgr.program_dao.session.flush()
+    _do_request_calculation('request_retrieve_system_fmea',
+                            revision_id=revision_id)
+
+
+def do_calculate_hardware(program_mgr: RAMSTKProgramManager,
+                          revision_id: int) -> None:
+    """Calculate every hardware item in the revision.
+
+    :param program_mgr: the RAMSTKProgramManager() for the open program.
+    :param revision_id: the ID of the revision being calculated.
+    :return: None
+    :rtype: None
+    """
+    # pylint: disable=unused-argument
+    _tree = program_mgr.dic_managers['hardware']['data'].tree
+    for _node in _tree.children(_tree.root):
+        _do_request_calculation('request_calculate_hardware',
+                                node_id=_node.identifier)
+
+
+def do_calculate_validation(program_mgr: RAMSTKProgramManager,
+                            revision_id: int) -> None:
+    """Calculate the time and cost of every validation task.
+
+    :param program_mgr: the RAMSTKProgramManager() for the open program.
+    :param revision_id: the ID of the revision being calculated.
+    :return: None
+    :rtype: None
+    """
+    # pylint: disable=unused-argument
+    _do_request_calculation('request_calculate_validation_tasks')
+
+
+def do_run_batch(database: Dict[str, str], revision_id: int,
+                 modules: List[str],
+                 configuration: RAMSTKUserConfiguration) -> Dict[str, float]:
+    """Calculate and save the selected modules of a RAMSTK program database.
+
+    Every calculation and the save of the results are done in a single unit
+    of work.  If the database rejects any of the results, none of them are
+    saved.
+
+    :param database: the program database connection information.
+    :param revision_id: the ID of the revision to calculate.
+    :param modules: the list of modules to calculate.
+    :param configuration: the RAMSTKUserConfiguration() to calculate with.
+    :return: the time in seconds taken by each stage of the batch keyed by
+        stage name.  The stages are open, load, one per calculated module,
+        and save.
+    :rtype: dict
+    :raise: DataAccessError if the program database can't be opened or the
+        results can't be saved.
+    """
+    _errors: List[str] = []
+
+    def on_fail_open_program(error_message: str) -> None:
+        """Save the error message when the program database can't be opened.
+
+        :param error_message: the error message sent with the failure.
+        :return: None
+        :rtype: None
+        """
+        _errors.append(error_message)
+
+    pub.subscribe(on_fail_open_program, 'fail_connect_program_database')
+
+    _timings: Dict[str, float] = OrderedDict()
+
+    _program_mgr = RAMSTKProgramManager()
+    _program_mgr.user_configuration = configuration
+    _managers = _program_mgr.dic_managers
+    _managers['hardware']['analysis'] = controllers.amHardware(configuration)
+    _managers['hardware']['data'] = controllers.dmHardware()
+    _managers['allocation']['analysis'] = controllers.amAllocation(
+        configuration)
+    _managers['allocation']['data'] = controllers.dmAllocation()
+    _managers['fmea']['analysis'] = controllers.amFMEA(configuration)
+    _managers['fmea']['data'] = controllers.dmFMEA()
+    _managers['validation']['analysis'] = controllers.amValidation(
+        configuration)
+    _managers['validation']['data'] = controllers.dmValidation()
+
+    try:
+        _start = time.perf_counter()
+        _program_mgr.do_open_program(BaseDatabase(), database)
+        if _errors:
+            raise DataAccessError(_errors[0])
+        _timings['open'] = time.perf_counter() - _start
+
+        try:
+            _start = time.perf_counter()
+            pub.sendMessage('selected_revision',
+                            attributes={'revision_id': revision_id})
+            _timings['load'] = time.perf_counter() - _start
+
+            _do_calculate_and_save(_program_mgr, revision_id, modules,
+                                   _timings)
+        finally:
+            _program_mgr.do_close_program()
+    finally:
+        pub.unsubscribe(on_fail_open_program, 'fail_connect_program_database')
+        _do_unsubscribe_managers(_program_mgr)
+
+    return _timings
+
+
+def get_batch_modules(modules: str) -> List[str]:
+    """Convert the comma-separated list of modules to calculate to a list.
+
+    :param modules: the comma-separated list of modules.
+    :return: the list of modules.
+    :rtype: list
+    :raise: argparse.ArgumentTypeError if passed a module that can't be
+        calculated in batch mode.
+    """
+    _modules = [_module.strip() for _module in modules.split(',')]
+    for _module in _modules:
+        if _module not in BATCH_MODULES:
+            raise argparse.ArgumentTypeError(
+                "invalid module '{0}'; choose from {1}.".format(
+                    _module, ', '.join(BATCH_MODULES)))
+
+    return _modules
+
+
+def get_timing_report(timings: Dict[str, float]) -> str:
+    """Get the batch timing report.
+
+    :param timings: the time in seconds taken by each stage keyed by stage
+        name.
+    :return: the report with one stage per line.
+    :rtype: str
+    """
+    _lines = ['{0:<12s} {1:>12s}'.format('stage', 'time [ms]')]
+    for _stage, _time in timings.items():
+        _lines.append('{0:<12s} {1:12.1f}'.format(_stage, _time * 1000.0))
+    _lines.append('{0:<12s} {1:12.1f}'.format(
+        'total',
+        sum(timings.values()) * 1000.0))
+
+    return '\n'.join(_lines)
+
+
+def _do_calculate_and_save(program_mgr: RAMSTKProgramManager,
+                           revision_id: int, modules: List[str],
+                           timings: Dict[str, float]) -> None:
+    """Calculate the selected modules and save the results.
+
+    The calculations and the save are done in a single unit of work.
+
+    :param program_mgr: the RAMSTKProgramManager() for the open program.
+    :param revision_id: the ID of the revision to calculate.
+    :param modules: the list of modules to calculate.
+    :param timings: the dict to add the time taken by each module and the
+        save to.
+    :return: None
+    :rtype: None
+    :raise: DataAccessError if the results can't be saved.
+    """
+    _dic_calculate = {
+        'allocation': do_calculate_allocation,
+        'fmea': do_calculate_fmea,
+        'hardware': do_calculate_hardware,
+        'validation': do_calculate_validation,
+    }
+
+    # The save is part of the batch's unit of work so the bulk profile must
+    # be set before the unit of work begins.
+    _program_dao = program_mgr.program_dao
+    _profile = _program_dao.do_set_sqlite_profile('bulk')
+    _program_dao.do_begin_transaction()
+    try:
+        try:
+            for _module in [
+                    _module for _module in BATCH_MODULES
+                    if _module in modules
+            ]:
+                _start = time.perf_counter()
+                _dic_calculate[_module](program_mgr, revision_id)
+                timings[_module] = time.perf_counter() - _start
+
+            _start = time.perf_counter()
+            program_mgr.do_save_program()
+        except Exception:
+            _program_dao.do_rollback_transaction()
+            raise
+
+        # The commit ends the unit of work even when it raises an error.
+        _program_dao.do_commit_transaction()
+        timings['save'] = time.perf_counter() - _start
+    except Exception:
+        # Report the error that stopped the batch, not one raised while
+        # restoring the profile.
+        try:
+            _program_dao.do_set_sqlite_profile(_profile)
+        except DataAccessError:
+            pass
+        raise
+
+    _program_dao.do_set_sqlite_profile(_profile)
+
+
+def _do_request_calculation(topic: str, **kwargs: Any) -> None:
+    """Request a calculation and log it if the calculation fails.
+
+    The analyses raise an exception when passed inputs they can't calculate
+    with (e.g., a zero mission time).  One item with bad inputs shouldn't
+    stop the rest of the program from being calculated so the failure is
+    logged and the batch continues.
+
+    :param topic: the PyPubSub message requesting the calculation.
+    :return: None
+    :rtype: None
+    """
+    try:
+        pub.sendMessage(topic, **kwargs)
+    except (ArithmeticError, ValueError) as _error:
+        pub.sendMessage(
+            'do_log_warning_msg',
+            logger_name='WARNING',
+            message="Batch calculation {0} {1} failed: {2}.".format(
+                topic, kwargs, _error),
+        )
+
+
+def _do_unsubscribe_managers(program_mgr: RAMSTKProgramManager) -> None:
+    """Unsubscribe the program manager and its managers from every message.
+
+    The managers aren't deleted until they're garbage collected so they'd
+    still respond to the messages sent by any later batch.
+
+    :param program_mgr: the RAMSTKProgramManager() used by the batch.
+    :return: None
+    :rtype: None
+    """
+    _owners = [program_mgr] + [
+        _manager for _managers in program_mgr.dic_managers.values()
+        for _manager in _managers.values() if _manager is not None
+    ]
+
+    def _is_owned(listener: Listener) -> bool:
+        """Determine whether a listener is a method of a batch manager.
+
+        :param listener: the pubsub Listener() to check.
+        :return: True if the listener's method belongs to one of the
+            batch's managers.
+        :rtype: bool
+        """
+        _self = getattr(listener.getCallable(), '__self__', None)
+        return any(_self is _owner for _owner in _owners)
+
+    pub.unsubAll(listenerFilter=_is_owned)
@@ -0,0 +1,63 @@
+# Standard Library Imports
+from types import ModuleType
+from typing import Any, Dict, List
+
+# RAMSTK Package Imports
+from ramstk.configuration import (
+    RAMSTKUserConfiguration as RAMSTKUserConfiguration
+)
+from ramstk.db.base import BaseDatabase as BaseDatabase
+from ramstk.exceptions import DataAccessError as DataAccessError
+from ramstk.ramstk import RAMSTKProgramManager as RAMSTKProgramManager
+from ramstk.utilities import lazy_import as lazy_import
+
+BATCH_MODULES: List[str]
+controllers: ModuleType
+
+
+def do_calculate_allocation(program_mgr: RAMSTKProgramManager,
+                            revision_id: int) -> None:
+    ...
+
+
+def do_calculate_fmea(program_mgr: RAMSTKProgramManager,
+                      revision_id: int) -> None:
+    ...
+
+
+def do_calculate_hardware(program_mgr: RAMSTKProgramManager,
+                          revision_id: int) -> None:
+    ...
+
+
+def do_calculate_validation(program_mgr: RAMSTKProgramManager,
+                            revision_id: int) -> None:
+    ...
+
+
+def do_run_batch(database: Dict[str, str], revision_id: int,
+                 modules: List[str],
+                 configuration: RAMSTKUserConfiguration) -> Dict[str, float]:
+    ...
+
+
+def get_batch_modules(modules: str) -> List[str]:
+    ...
+
+
+def get_timing_report(timings: Dict[str, float]) -> str:
+    ...
+
+
+def _do_calculate_and_save(program_mgr: RAMSTKProgramManager,
+                           revision_id: int, modules: List[str],
+                           timings: Dict[str, float]) -> None:
+    ...
+
+
+def _do_request_calculation(topic: str, **kwargs: Any) -> None:
+    ...
+
+
+def _do_unsubscribe_managers(program_mgr: RAMSTKProgramManager) -> None:
+    ...
@@ -288,6 +288,10 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             | password | User password                 |
             +----------+-------------------------------+
 
+    :ivar dict RAMSTK_SQLITE_PROFILES: Dictionary of the SQLite PRAGMA profile
+        to use with a program database when it isn't RAMSTK_SQLITE_PROFILE.
+        The key is the path to the program database file.
+
     :ivar dict RAMSTK_TABPOS: Dictionary containing the location of tabs in the
         three main Gtk.Notebook() widgets.  Can be one of:
 
@@ -340,6 +344,12 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
     :ivar float RAMSTK_MTIME: The default mission time for new RAMSTK Programs.
     :ivar int RAMSTK_DEC_PLACES: Number of decimal places to show in numerical
         results.  Default value is *6*.
+    :ivar int RAMSTK_PREDICTION_WORKERS: Number of worker processes used to
+        perform MIL-HDBK-217F hazard rate predictions when calculating
+        hardware.  Predictions are performed serially in the RAMSTK process
+        when less than two.  Default value is *0*.
+    :ivar int RAMSTK_PREDICTION_CHUNK_SIZE: Number of parts sent to a worker
+        process at a time.  Default value is *500*.
     :ivar int RAMSTK_MODE_SOURCE: Indicator variable used to determine which
         failure mode source to use.  Sources are:
 
@@ -377,6 +387,20 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             * mysql (future)
             * sqlite
 
+    :ivar int RAMSTK_POOL_SIZE: Number of connections kept open to each
+        database.  Default value is *5*.
+    :ivar int RAMSTK_POOL_OVERFLOW: Number of connections that may be opened
+        to a database beyond RAMSTK_POOL_SIZE.  Default value is *10*.
+    :ivar bool RAMSTK_POOL_PRE_PING: Whether to test each pooled connection
+        before it's used.  Default value is *True*.
+    :ivar str RAMSTK_SQLITE_PROFILE: The SQLite PRAGMA profile to use with
+        SQLite program databases.  Options are:
+
+            * default - SQLite's own defaults.
+            * performance - WAL journal and fewer syncs to disk.
+            * bulk - no syncs to disk; only for imports and saves.
+
+        Default value is *performance*.
     :ivar str RAMSTK_LOCALE: The language locale to use with RAMSTK.  Default
         value is *en_US*.
     :ivar str RAMSTK_OS: The operating system RAMSTK is currently running on.
@@ -465,6 +489,7 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             "user": '',
             "password": ''
         }
+        self.RAMSTK_SQLITE_PROFILES: Dict[str, str] = {}
         self.RAMSTK_TABPOS = {
             "listbook": "top",
             "modulebook": "bottom",
@@ -489,6 +514,12 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
         self.RAMSTK_HR_MULTIPLIER = 1.0
         self.RAMSTK_DEC_PLACES = 6
         self.RAMSTK_MTIME = 100.0
+        self.RAMSTK_PREDICTION_CHUNK_SIZE = 500
+        self.RAMSTK_PREDICTION_WORKERS = 0
+        self.RAMSTK_POOL_OVERFLOW = 10
+        self.RAMSTK_POOL_PRE_PING = True
+        self.RAMSTK_POOL_SIZE = 5
+        self.RAMSTK_SQLITE_PROFILE = "performance"
         self.RAMSTK_GUI_LAYOUT = "advanced"
         self.RAMSTK_METHOD = "STANDARD"  # STANDARD or LRM
         self.RAMSTK_LOCALE = "en_US.UTF8"
@@ -653,7 +684,9 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "moduletabpos": "top",
                 "listtabpos": "bottom",
                 "worktabpos": "bottom",
-                "loglevel": "INFO"
+                "loglevel": "INFO",
+                "predictionworkers": "0",
+                "predictionchunksize": "500"
             },
             "backend": {
                 "dialect": "postgres",
@@ -661,8 +694,13 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "port": "5432",
                 "database": "",
                 "user": "",
-                "password": ""
+                "password": "",
+                "sqliteprofile": "performance",
+                "poolsize": "5",
+                "pooloverflow": "10",
+                "poolpreping": "True"
             },
+            "sqliteprofiles": {},
             "directories": {
                 "datadir": self.RAMSTK_DATA_DIR,
                 "icondir": self.RAMSTK_ICON_DIR,
@@ -744,6 +782,16 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             pub.sendMessage('fail_create_user_configuration',
                             error_message=_error_msg)
 
+    def get_sqlite_profile(self, database: str) -> str:
+        """Get the SQLite PRAGMA profile to use with a program database.
+
+        :param database: the path to the SQLite program database file.
+        :return: the name of the PRAGMA profile.
+        :rtype: str
+        """
+        return self.RAMSTK_SQLITE_PROFILES.get(database,
+                                               self.RAMSTK_SQLITE_PROFILE)
+
     def get_user_configuration(self) -> None:
         """Read the RAMSTK user configuration file.
 
@@ -776,6 +824,18 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
             self.RAMSTK_PROG_INFO["database"] = _config["backend"]["database"]
             self.RAMSTK_PROG_INFO["user"] = _config["backend"]["user"]
             self.RAMSTK_PROG_INFO["password"] = _config["backend"]["password"]
+            # Configuration files created before SQLite PRAGMA profiles and
+            # connection pooling existed do not have these keys.
+            self.RAMSTK_SQLITE_PROFILE = _config["backend"].get(
+                "sqliteprofile", self.RAMSTK_SQLITE_PROFILE)
+            self.RAMSTK_SQLITE_PROFILES = dict(
+                _config.get("sqliteprofiles", {}))
+            self.RAMSTK_POOL_SIZE = int(_config["backend"].get(
+                "poolsize", self.RAMSTK_POOL_SIZE))
+            self.RAMSTK_POOL_OVERFLOW = int(_config["backend"].get(
+                "pooloverflow", self.RAMSTK_POOL_OVERFLOW))
+            self.RAMSTK_POOL_PRE_PING = str(_config["backend"].get(
+                "poolpreping", self.RAMSTK_POOL_PRE_PING)) == "True"
 
             self.RAMSTK_DATA_DIR = _config["directories"]["datadir"]
             self.RAMSTK_ICON_DIR = _config["directories"]["icondir"]
@@ -793,6 +853,12 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "moduletabpos"]
             self.RAMSTK_TABPOS["workbook"] = _config["general"]["worktabpos"]
             self.RAMSTK_LOGLEVEL = _config["general"]["loglevel"]
+            # Configuration files created before parallel predictions
+            # existed do not have these keys.
+            self.RAMSTK_PREDICTION_WORKERS = int(_config["general"].get(
+                "predictionworkers", self.RAMSTK_PREDICTION_WORKERS))
+            self.RAMSTK_PREDICTION_CHUNK_SIZE = int(_config["general"].get(
+                "predictionchunksize", self.RAMSTK_PREDICTION_CHUNK_SIZE))
             if self.RAMSTK_LOG_DIR == '':
                 self.RAMSTK_USER_LOG = "./ramstk_run.log"
                 self.RAMSTK_IMPORT_LOG = "./ramstk_import.log"
@@ -825,7 +891,9 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "moduletabpos": self.RAMSTK_TABPOS["modulebook"],
                 "listtabpos": self.RAMSTK_TABPOS["listbook"],
                 "worktabpos": self.RAMSTK_TABPOS["workbook"],
-                "loglevel": self.RAMSTK_LOGLEVEL
+                "loglevel": self.RAMSTK_LOGLEVEL,
+                "predictionworkers": str(self.RAMSTK_PREDICTION_WORKERS),
+                "predictionchunksize": str(self.RAMSTK_PREDICTION_CHUNK_SIZE)
             },
             "backend": {
                 "dialect": self.RAMSTK_PROG_INFO["dialect"],
@@ -833,8 +901,13 @@ class RAMSTKUserConfiguration:  # pylint: disable=too-many-instance-attributes
                 "port": str(self.RAMSTK_PROG_INFO["port"]),
                 "database": str(self.RAMSTK_PROG_INFO["database"]),
                 "user": str(self.RAMSTK_PROG_INFO["user"]),
-                "password": str(self.RAMSTK_PROG_INFO["password"])
+                "password": str(self.RAMSTK_PROG_INFO["password"]),
+                "sqliteprofile": self.RAMSTK_SQLITE_PROFILE,
+                "poolsize": str(self.RAMSTK_POOL_SIZE),
+                "pooloverflow": str(self.RAMSTK_POOL_OVERFLOW),
+                "poolpreping": str(self.RAMSTK_POOL_PRE_PING)
             },
+            "sqliteprofiles": self.RAMSTK_SQLITE_PROFILES,
             "directories": {
                 "datadir": self.RAMSTK_DATA_DIR,
                 "icondir": self.RAMSTK_ICON_DIR,
@@ -89,6 +89,7 @@ class RAMSTKUserConfiguration:
     RAMSTK_FORMAT_FILE: Any = ...
     RAMSTK_PAGE_NUMBER: Any = ...
     RAMSTK_PROG_INFO: Any = ...
+    RAMSTK_SQLITE_PROFILES: Any = ...
     RAMSTK_TABPOS: Any = ...
     RAMSTK_WORKGROUPS: Any = ...
     RAMSTK_FAILURE_PROBABILITY: Any = ...
@@ -100,6 +101,12 @@ class RAMSTKUserConfiguration:
     RAMSTK_HR_MULTIPLIER: float = ...
     RAMSTK_DEC_PLACES: int = ...
     RAMSTK_MTIME: float = ...
+    RAMSTK_PREDICTION_CHUNK_SIZE: int = ...
+    RAMSTK_PREDICTION_WORKERS: int = ...
+    RAMSTK_POOL_OVERFLOW: int = ...
+    RAMSTK_POOL_PRE_PING: bool = ...
+    RAMSTK_POOL_SIZE: int = ...
+    RAMSTK_SQLITE_PROFILE: str = ...
     RAMSTK_GUI_LAYOUT: str = ...
     RAMSTK_METHOD: str = ...
     RAMSTK_LOCALE: str = ...
@@ -137,6 +144,9 @@ class RAMSTKUserConfiguration:
     def do_create_user_configuration(self) -> None:
         ...
 
+    def get_sqlite_profile(self, database: str) -> str:
+        ...
+
     def get_user_configuration(self) -> None:
         ...
 
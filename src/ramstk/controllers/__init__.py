@@ -11,6 +11,7 @@
 from ramstk.controllers.managers import (
     RAMSTKAnalysisManager, RAMSTKDataManager
 )
+from ramstk.controllers.tree import RAMSTKTree
 
 # RAMSTK Local Imports
 from .allocation.analysismanager import AnalysisManager as amAllocation
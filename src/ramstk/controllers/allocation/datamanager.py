@@ -25,6 +25,7 @@ from ramstk.models.programdb import RAMSTKAllocation
 class DataManager(RAMSTKDataManager):
     """Contain the attributes and methods of the Allocation data manager."""
 
+    _tables = {'allocation': RAMSTKAllocation}
     _tag: str = 'allocations'
     _root: int = 0
 
@@ -117,9 +118,7 @@ class DataManager(RAMSTKDataManager):
         :return: None
         :rtype: None
         """
-        for _key in attributes:
-            super().do_set_attributes(node_id=[attributes['hardware_id'], -1],
-                                      package={_key: attributes[_key]})
+        super().do_set_attributes_many(attributes['hardware_id'], attributes)
 
     def do_update(self, node_id: int) -> None:
         """Update record associated with node ID in RAMSTK Program database.
@@ -131,10 +130,7 @@ class DataManager(RAMSTKDataManager):
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['allocation'])
 
-            pub.sendMessage(
-                'succeed_update_allocation',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_allocation')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
@@ -7,6 +7,7 @@ from ramstk.exceptions import DataAccessError as DataAccessError
 from ramstk.models.programdb import RAMSTKAllocation as RAMSTKAllocation
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _root: int = ...
     _pkey: Any = ...
@@ -28,6 +28,7 @@ class DataManager(RAMSTKDataManager):
     RAMSTKFailureDefinition data models.
     """
 
+    _tables = {'failure_definition': RAMSTKFailureDefinition}
     _tag = 'failure_definitions'
 
     def __init__(self, **kwargs: Dict[Any, Any]) -> None:
@@ -121,10 +122,7 @@ class DataManager(RAMSTKDataManager):
             self.dao.do_update(
                 self.tree.get_node(node_id).data['failure_definition'])
 
-            pub.sendMessage(
-                'succeed_update_failure_definitions',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_failure_definitions')
         except AttributeError:
             _error_msg: str = (
                 '{1}: Attempted to save non-existent failure definition with '
@@ -8,10 +8,12 @@
 """FMEA Controller Package analysis manager."""
 
 # Standard Library Imports
+import inspect
 from collections import defaultdict
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Third Party Imports
+import numpy as np
 import treelib
 from pubsub import pub
 
@@ -19,6 +21,7 @@ from pubsub import pub
 from ramstk.analyses import criticality
 from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.controllers import RAMSTKAnalysisManager
+from ramstk.exceptions import OutOfRangeError
 
 
 class AnalysisManager(RAMSTKAnalysisManager):
@@ -51,6 +54,8 @@ class AnalysisManager(RAMSTKAnalysisManager):
         pub.subscribe(self._do_calculate_criticality,
                       'request_calculate_criticality')
         pub.subscribe(self._do_calculate_rpn, 'request_calculate_rpn')
+        pub.subscribe(self._do_calculate_system_criticality,
+                      'succeed_retrieve_system_fmea')
 
     def _do_calculate_criticality(self, item_hr: float) -> None:
         """Calculate MIL-STD-1629A, Task 102 criticality of a hardware item.
@@ -78,6 +83,68 @@ class AnalysisManager(RAMSTKAnalysisManager):
             item_criticality=_item_criticality,
         )
 
+    def _do_calculate_system_criticality(self, modes: List[Any],
+                                         item_hr: List[float]) -> None:
+        """Calculate MIL-STD-1629A, Task 102 criticality of an entire system.
+
+        The mode hazard rate and mode criticality of every failure mode are
+        calculated at once and sent to the FMEA data manager to be set in the
+        failure mode records.  The mode criticalities are then summed into the
+        system criticality matrix and the items ranked by criticality.
+
+        :param modes: the list of RAMSTKMode records for every hardware
+            failure mode in the system.
+        :param item_hr: the active hazard rate of the hardware item each
+            failure mode belongs to.
+        :return: None
+        :rtype: None
+        """
+        try:
+            _mode_hr = criticality.calculate_mode_hazard_rates(
+                np.array(item_hr, dtype=float),
+                np.array([_mode.mode_ratio for _mode in modes], dtype=float))
+            _mode_criticality = criticality.calculate_mode_criticalities(
+                _mode_hr,
+                np.array([_mode.mode_op_time for _mode in modes],
+                         dtype=float),
+                np.array([_mode.effect_probability for _mode in modes],
+                         dtype=float))
+        except OutOfRangeError as _error:
+            _method_name: str = inspect.currentframe(  # type: ignore
+            ).f_code.co_name
+            _error_msg = ('{0}: Failed to calculate the system criticality.  '
+                          '{1}').format(_method_name, _error.msg)
+            pub.sendMessage(
+                'do_log_debug',
+                logger_name='DEBUG',
+                message=_error_msg,
+            )
+            pub.sendMessage('fail_calculate_system_criticality',
+                            error_message=_error_msg)
+            return
+
+        pub.sendMessage(
+            'request_set_system_fmea_attributes',
+            package={
+                _mode.mode_id: {
+                    'mode_hazard_rate': float(_mode_hr[_idx]),
+                    'mode_criticality': float(_mode_criticality[_idx]),
+                }
+                for _idx, _mode in enumerate(modes)
+            },
+        )
+
+        _criticality_matrix = criticality.do_calculate_criticality_matrix(
+            [_mode.hardware_id for _mode in modes],
+            [_mode.severity_class for _mode in modes], _mode_criticality)
+
+        pub.sendMessage(
+            'succeed_calculate_system_criticality',
+            criticality_matrix=_criticality_matrix,
+            pareto_index=criticality.do_calculate_pareto_index(
+                _criticality_matrix),
+        )
+
     def _do_calculate_rpn(self, method: str = 'mechanism') -> None:
         """Calculate the risk priority number (RPN) of a hardware item's modes.
 
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Third Party Imports
 import treelib
@@ -19,6 +19,10 @@ class AnalysisManager(RAMSTKAnalysisManager):
     def _do_calculate_criticality(self, item_hr: float) -> None:
         ...
 
+    def _do_calculate_system_criticality(self, modes: List[Any],
+                                         item_hr: List[float]) -> None:
+        ...
+
     def _do_calculate_rpn(self, method: str = ...) -> None:
         ...
 
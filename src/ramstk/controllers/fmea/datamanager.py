@@ -8,7 +8,7 @@
 
 # Standard Library Imports
 import inspect
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # Third Party Imports
 from pubsub import pub
@@ -18,7 +18,8 @@ from treelib.exceptions import NodeIDAbsentError
 from ramstk.controllers import RAMSTKDataManager
 from ramstk.exceptions import DataAccessError
 from ramstk.models.programdb import (
-    RAMSTKAction, RAMSTKCause, RAMSTKControl, RAMSTKMechanism, RAMSTKMode
+    RAMSTKAction, RAMSTKCause, RAMSTKControl,
+    RAMSTKMechanism, RAMSTKMode, RAMSTKReliability
 )
 
 
@@ -29,6 +30,13 @@ class DataManager(RAMSTKDataManager):
     RAMSTKHazardAnalysis data models.
     """
 
+    _tables = {
+        'mode': RAMSTKMode,
+        'mechanism': RAMSTKMechanism,
+        'cause': RAMSTKCause,
+        'control': RAMSTKControl,
+        'action': RAMSTKAction,
+    }
     _tag = 'fmeas'
     _root = 0
 
@@ -55,6 +63,7 @@ class DataManager(RAMSTKDataManager):
                 'cause_id', 'action_id'
             ]
         }
+        self._dic_system_modes: Dict[int, RAMSTKMode] = {}
 
         # Initialize private list attributes.
 
@@ -91,12 +100,16 @@ class DataManager(RAMSTKDataManager):
                       'request_get_action_attributes')
         pub.subscribe(super().do_set_attributes, 'wvw_editing_fmea')
         pub.subscribe(super().do_set_attributes, 'request_set_fmea_attributes')
-        pub.subscribe(super().do_update_all, 'request_update_all_fmeas')
 
         pub.subscribe(self.do_select_all, 'selected_function')
         pub.subscribe(self.do_select_all, 'selected_hardware')
         pub.subscribe(self.do_update, 'request_update_fmea')
+        pub.subscribe(self.do_update_all, 'request_update_all_fmeas')
         pub.subscribe(self.do_get_tree, 'request_get_fmea_tree')
+        pub.subscribe(self.do_select_system_fmea,
+                      'request_retrieve_system_fmea')
+        pub.subscribe(self.do_set_system_attributes,
+                      'request_set_system_fmea_attributes')
 
         pub.subscribe(self._do_delete, 'request_delete_fmea')
         pub.subscribe(self._do_insert_action, 'request_insert_fmea_action')
@@ -138,6 +151,67 @@ class DataManager(RAMSTKDataManager):
             self._is_functional = True
             self._parent_id = attributes['function_id']
 
+    def do_select_system_fmea(self, revision_id: int) -> None:
+        """Retrieve every hardware failure mode in the revision.
+
+        The failure modes are retrieved along with the active hazard rate of
+        the hardware item each belongs to in a single query.  These are used
+        to calculate the system criticality matrix without loading the FMEA
+        of each hardware item into the tree.  The failure modes are kept so
+        the results of the calculation can be set and saved.
+
+        :param revision_id: the ID of the revision to retrieve the failure
+            modes for.
+        :return: None
+        :rtype: None
+        """
+        _modes = []
+        _item_hr = []
+        for _mode, _hazard_rate in self.dao.session.query(
+                RAMSTKMode, RAMSTKReliability.hazard_rate_active).join(
+                    RAMSTKReliability, RAMSTKReliability.hardware_id
+                    == RAMSTKMode.hardware_id).filter(
+                        RAMSTKMode.revision_id == revision_id).order_by(
+                            RAMSTKMode.hardware_id, RAMSTKMode.mode_id).all():
+            _modes.append(_mode)
+            _item_hr.append(_hazard_rate)
+        self._dic_system_modes = {_mode.mode_id: _mode for _mode in _modes}
+
+        pub.sendMessage(
+            'succeed_retrieve_system_fmea',
+            modes=_modes,
+            item_hr=_item_hr,
+        )
+
+    def do_set_system_attributes(self, package: Dict[int, Dict[str,
+                                                               Any]]) -> None:
+        """Set the attributes of the failure modes in the system FMEA.
+
+        Failure modes in the FMEA tree are set with do_set_attributes_many()
+        so the change is announced.  The others are set in the records
+        retrieved by do_select_system_fmea() and saved by do_update_all().
+
+        :param package: the attributes to set keyed by failure mode ID.
+        :return: None
+        :rtype: None
+        """
+        self.do_begin_batch()
+        for _mode_id, _attributes in package.items():
+            if self.tree.contains(str(_mode_id)):
+                self.do_set_attributes_many(str(_mode_id), _attributes)
+            elif _mode_id in self._dic_system_modes:
+                self._dic_system_modes[_mode_id].set_attributes(_attributes)
+            else:
+                _method_name: str = inspect.currentframe(  # type: ignore
+                ).f_code.co_name
+                pub.sendMessage(
+                    'do_log_debug',
+                    logger_name='DEBUG',
+                    message='{1}: No failure mode ID {0}.'.format(
+                        _mode_id, _method_name),
+                )
+        self.do_end_batch()
+
     def do_update(self, node_id: int) -> None:
         """Update record associated with node ID in RAMSTK Program database.
 
@@ -151,10 +225,7 @@ class DataManager(RAMSTKDataManager):
             self.dao.session.add(self.tree.get_node(node_id).data[_table])
 
             self.dao.do_update()
-            pub.sendMessage(
-                'succeed_update_fmea',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_fmea')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
@@ -200,6 +271,49 @@ class DataManager(RAMSTKDataManager):
                     error_message=_error_msg,
                 )
 
+    def do_update_all(self) -> None:
+        """Update all FMEA data table records in the RAMSTK Program database.
+
+        The failure modes of the system FMEA that aren't in the FMEA tree are
+        saved in the same unit of work as the records in the tree.
+
+        :return: None
+        :rtype: None
+        """
+        for _mode in self._do_select_dirty_system_modes():
+            self.dao.session.add(_mode)
+
+        super().do_update_all()
+
+    def get_dirty_count(self) -> int:
+        """Return the number of FMEA records with unsaved changes.
+
+        :return: the number of dirty records in the FMEA tree and the system
+            FMEA.
+        :rtype: int
+        """
+        return super().get_dirty_count() + len(
+            self._do_select_dirty_system_modes())
+
+    def _add_action_node(self, action: RAMSTKAction, parent_id: str) -> None:
+        """Add a node to the treelib Tree() to hold a cause action.
+
+        :param action: an instance of RAMSTKAction.
+        :param parent_id: the parent node ID the action is associated with.
+        :return: None
+        :rtype: None
+        """
+        _identifier = '{0:s}.{1:d}.a'.format(parent_id,
+                                             action.action_id)  # type: ignore
+
+        self.tree.create_node(tag='action',
+                              identifier=_identifier,
+                              parent=parent_id,
+                              data={'action': action})
+
+        self.last_id['action'] = max(self.last_id['action'],
+                                     action.action_id)  # type: ignore
+
     def _add_cause_node(self, cause: RAMSTKCause, parent_id: str) -> None:
         """Add a node to the treelib Tree() to hold a failure cause.
 
@@ -223,8 +337,44 @@ class DataManager(RAMSTKDataManager):
         self.last_id['cause'] = max(self.last_id['cause'],
                                     cause.cause_id)  # type: ignore
 
-        self._do_select_all_control(_identifier)
-        self._do_select_all_action(_identifier)
+    def _add_control_node(self, control: RAMSTKControl,
+                          parent_id: str) -> None:
+        """Add a node to the treelib Tree() to hold a cause control.
+
+        :param control: an instance of RAMSTKControl.
+        :param parent_id: the parent node ID the control is associated with.
+        :return: None
+        :rtype: None
+        """
+        _identifier = '{0:s}.{1:d}.c'.format(
+            parent_id, control.control_id)  # type: ignore
+
+        self.tree.create_node(tag='control',
+                              identifier=_identifier,
+                              parent=parent_id,
+                              data={'control': control})
+
+        self.last_id['control'] = max(self.last_id['control'],
+                                      control.control_id)  # type: ignore
+
+    def _add_mechanism_node(self, mechanism: RAMSTKMechanism) -> None:
+        """Add a node to the treelib Tree() to hold a failure mechanism.
+
+        :param mechanism: an instance of RAMSTKMechanism.
+        :return: None
+        :rtype: None
+        """
+        _identifier = '{0:d}.{1:d}'.format(
+            mechanism.mode_id, mechanism.mechanism_id)  # type: ignore
+
+        self.tree.create_node(tag='mechanism',
+                              identifier=_identifier,
+                              parent=str(mechanism.mode_id),
+                              data={'mechanism': mechanism})
+
+        self.last_id['mechanism'] = max(
+            self.last_id['mechanism'],
+            mechanism.mechanism_id)  # type: ignore
 
     def _add_mode_node(self, mode: RAMSTKMode) -> None:
         """Add a node to the treelib Tree() to hold a failure mode.
@@ -553,15 +703,7 @@ class DataManager(RAMSTKDataManager):
                 RAMSTKAction.mechanism_id == int(_mechanism_id),
                 RAMSTKAction.cause_id == int(_cause_id)).all():
 
-            _identifier = '{0:s}.{1:d}.a'.format(parent_id, _action.action_id)
-
-            self.tree.create_node(tag='action',
-                                  identifier=_identifier,
-                                  parent=parent_id,
-                                  data={'action': _action})
-
-            self.last_id['action'] = max(self.last_id['action'],
-                                         _action.action_id)
+            self._add_action_node(_action, parent_id)
 
     def _do_select_all_cause(self, parent_id: str) -> None:
         """Retrieve all the failure causes for the mechanism ID.
@@ -578,6 +720,10 @@ class DataManager(RAMSTKDataManager):
 
             self._add_cause_node(_cause, parent_id)
 
+            _identifier = '{0:s}.{1:d}'.format(parent_id, _cause.cause_id)
+            self._do_select_all_control(_identifier)
+            self._do_select_all_action(_identifier)
+
     def _do_select_all_control(self, parent_id: str) -> None:
         """Retrieve all the controls for the cause ID.
 
@@ -592,18 +738,7 @@ class DataManager(RAMSTKDataManager):
                 RAMSTKControl.mechanism_id == int(_mechanism_id),
                 RAMSTKControl.cause_id == int(_cause_id)).all():
 
-            _data_package = {'control': _control}
-
-            _identifier = '{0:s}.{1:d}.c'.format(parent_id,
-                                                 _control.control_id)
-
-            self.tree.create_node(tag='control',
-                                  identifier=_identifier,
-                                  parent=parent_id,
-                                  data=_data_package)
-
-            self.last_id['control'] = max(self.last_id['control'],
-                                          _control.control_id)
+            self._add_control_node(_control, parent_id)
 
     def _do_select_all_functional_fmea(self) -> None:
         """Retrieve all functional FMEA data from the RAMSTK Program database.
@@ -625,40 +760,65 @@ class DataManager(RAMSTKDataManager):
     def _do_select_all_hardware_fmea(self) -> None:
         """Retrieve all hardware FMEA data from the RAMSTK Program database.
 
+        Every table in the FMEA carries the revision and hardware ID of the
+        hardware item it belongs to.  Each level of the FMEA is retrieved with
+        a single query on those IDs and the node identifiers are assembled
+        from the mode, mechanism, and cause IDs of each record.  Selecting a
+        hardware item costs five queries no matter how large the FMEA is.
+
         :return: None
         :rtype: None
         """
-        for _mode in self.dao.session.query(RAMSTKMode).filter(
-                RAMSTKMode.revision_id == self._revision_id,
-                RAMSTKMode.hardware_id == self._parent_id).all():
-
+        for _mode in self._do_select_fmea_level(RAMSTKMode):
             self._add_mode_node(_mode)
-            self._do_select_all_mechanism(_mode.mode_id)
+
+        for _mechanism in self._do_select_fmea_level(RAMSTKMechanism):
+            self._add_mechanism_node(_mechanism)
+
+        for _cause in self._do_select_fmea_level(RAMSTKCause):
+            self._add_cause_node(
+                _cause, '{0:d}.{1:d}'.format(_cause.mode_id,
+                                             _cause.mechanism_id))
+
+        for _control in self._do_select_fmea_level(RAMSTKControl):
+            self._add_control_node(
+                _control, '{0:d}.{1:d}.{2:d}'.format(_control.mode_id,
+                                                     _control.mechanism_id,
+                                                     _control.cause_id))
+
+        for _action in self._do_select_fmea_level(RAMSTKAction):
+            self._add_action_node(
+                _action, '{0:d}.{1:d}.{2:d}'.format(_action.mode_id,
+                                                    _action.mechanism_id,
+                                                    _action.cause_id))
 
         pub.sendMessage(
             'succeed_retrieve_hardware_fmea',
             tree=self.tree,
         )
 
-    def _do_select_all_mechanism(self, mode_id: int) -> None:
-        """Retrieve all the failure mechanisms for the mode ID.
+    def _do_select_dirty_system_modes(self) -> List[RAMSTKMode]:
+        """Select the system FMEA failure modes with unsaved changes.
 
-        :param mode_id: the mode ID to select the mechanisms for.
-        :return: None
-        :rtype: None
-        """
-        for _mechanism in self.dao.session.query(RAMSTKMechanism).filter(
-                RAMSTKMechanism.mode_id == mode_id).all():
-
-            _identifier = '{0:d}.{1:d}'.format(mode_id,
-                                               _mechanism.mechanism_id)
+        Failure modes in the FMEA tree are left for the tree to save.
 
-            self.tree.create_node(tag='mechanism',
-                                  identifier=_identifier,
-                                  parent=str(mode_id),
-                                  data={'mechanism': _mechanism})
-
-            self.last_id['mechanism'] = max(self.last_id['mechanism'],
-                                            _mechanism.mechanism_id)
-
-            self._do_select_all_cause(_identifier)
+        :return: the dirty failure modes that aren't in the FMEA tree.
+        :rtype: list
+        """
+        return [
+            _mode for _mode_id, _mode in self._dic_system_modes.items()
+            if _mode.is_dirty and not self.tree.contains(str(_mode_id))
+        ]
+
+    def _do_select_fmea_level(self, table: Any) -> List[Any]:
+        """Retrieve all the records in one FMEA table for the hardware item.
+
+        :param table: the RAMSTK<MODULE> table class to select the records
+            from.
+        :return: the list of records in the table for the selected revision
+            and hardware item.
+        :rtype: list
+        """
+        return self.dao.session.query(table).filter(
+            table.revision_id == self._revision_id,
+            table.hardware_id == self._parent_id).all()
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # RAMSTK Package Imports
 from ramstk.controllers import RAMSTKDataManager as RAMSTKDataManager
@@ -9,11 +9,14 @@ from ramstk.models.programdb import RAMSTKCause as RAMSTKCause
 from ramstk.models.programdb import RAMSTKControl as RAMSTKControl
 from ramstk.models.programdb import RAMSTKMechanism as RAMSTKMechanism
 from ramstk.models.programdb import RAMSTKMode as RAMSTKMode
+from ramstk.models.programdb import RAMSTKReliability as RAMSTKReliability
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _root: int = ...
     _pkey: Any = ...
+    _dic_system_modes: Dict[int, RAMSTKMode] = ...
     _is_functional: Any = ...
     _parent_id: int = ...
     last_id: Any = ...
@@ -29,12 +32,35 @@ class DataManager(RAMSTKDataManager):
     def do_select_all(self, attributes: Dict[str, Any]) -> None:
         ...
 
+    def do_select_system_fmea(self, revision_id: int) -> None:
+        ...
+
+    def do_set_system_attributes(self, package: Dict[int, Dict[str,
+                                                               Any]]) -> None:
+        ...
+
     def do_update(self, node_id: int) -> None:
         ...
 
+    def do_update_all(self) -> None:
+        ...
+
+    def get_dirty_count(self) -> int:
+        ...
+
+    def _add_action_node(self, action: RAMSTKAction, parent_id: str) -> None:
+        ...
+
     def _add_cause_node(self, cause: RAMSTKCause, parent_id: str) -> None:
         ...
 
+    def _add_control_node(self, control: RAMSTKControl,
+                          parent_id: str) -> None:
+        ...
+
+    def _add_mechanism_node(self, mechanism: RAMSTKMechanism) -> None:
+        ...
+
     def _add_mode_node(self, mode: RAMSTKMode) -> None:
         ...
 
@@ -71,5 +97,8 @@ class DataManager(RAMSTKDataManager):
     def _do_select_all_hardware_fmea(self) -> None:
         ...
 
-    def _do_select_all_mechanism(self, mode_id: int) -> None:
+    def _do_select_dirty_system_modes(self) -> List[RAMSTKMode]:
+        ...
+
+    def _do_select_fmea_level(self, table: Any) -> List[Any]:
         ...
@@ -28,6 +28,9 @@ class DataManager(RAMSTKDataManager):
     RAMSTKHazardAnalysis data models.
     """
 
+    # Define private dictionary class attributes.
+    _tables = {'function': RAMSTKFunction}
+
     # Define private scalar class attributes.
     _tag = 'functions'
 
@@ -113,10 +116,7 @@ class DataManager(RAMSTKDataManager):
         """
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['function'])
-            pub.sendMessage(
-                'succeed_update_function',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_function')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
@@ -9,20 +9,26 @@
 
 # Standard Library Imports
 import inspect
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from math import exp
-from typing import Any, Dict, List, Tuple
+from multiprocessing import get_context
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Third Party Imports
 import treelib
 from pubsub import pub
-# noinspection PyPackageRequirements
-from scipy.stats import expon, lognorm, norm, weibull_min
 
 # RAMSTK Package Imports
 from ramstk.analyses import derating, dormancy, stress
 from ramstk.analyses.milhdbk217f import milhdbk217f
 from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.controllers import RAMSTKAnalysisManager
+from ramstk.utilities import lazy_import
+
+# scipy.stats is slow to import and only needed for s-distribution hazard
+# rates.
+stats = lazy_import('scipy.stats')
 
 
 def hazard_rate_from_s_distribution(dist: str = 'expon', **kwargs) -> float:
@@ -38,17 +44,18 @@ def hazard_rate_from_s_distribution(dist: str = 'expon', **kwargs) -> float:
     _time = kwargs.get('time', 1.0)
 
     if dist == 'expon':
-        _hazard_rate = 1.0 / expon.mean(scale=_scale, loc=_location)
+        _hazard_rate = 1.0 / stats.expon.mean(scale=_scale, loc=_location)
     elif dist == 'gaussian':
-        _hazard_rate = norm.pdf(_shape, loc=_location, scale=_scale) / norm.sf(
-            _shape, loc=_location, scale=_scale)
+        _hazard_rate = stats.norm.pdf(
+            _shape, loc=_location, scale=_scale) / stats.norm.sf(
+                _shape, loc=_location, scale=_scale)
     elif dist == 'lognorm':
-        _hazard_rate = lognorm.pdf(
-            _time, _shape, loc=_location, scale=_scale) / lognorm.sf(
+        _hazard_rate = stats.lognorm.pdf(
+            _time, _shape, loc=_location, scale=_scale) / stats.lognorm.sf(
                 _time, _shape, loc=_location, scale=_scale)
     elif dist == 'weibull':
-        _hazard_rate = weibull_min.pdf(
-            _time, _shape, loc=_location, scale=_scale) / weibull_min.sf(
+        _hazard_rate = stats.weibull_min.pdf(
+            _time, _shape, loc=_location, scale=_scale) / stats.weibull_min.sf(
                 _time, _shape, loc=_location, scale=_scale)
     else:
         _hazard_rate = 0.0
@@ -96,19 +103,54 @@ def mtbf_from_s_distribution(dist: str = 'expon', **kwargs) -> float:
     _shape = kwargs.get('shape', 1.0)
 
     if dist == 'expon':
-        _mtbf = expon.mean(scale=_scale, loc=_location)
+        _mtbf = stats.expon.mean(scale=_scale, loc=_location)
     elif dist == 'gaussian':
-        _mtbf = norm.mean(scale=_shape, loc=_scale)
+        _mtbf = stats.norm.mean(scale=_shape, loc=_scale)
     elif dist == 'lognorm':
-        _mtbf = lognorm.mean(_shape, scale=_scale, loc=_location)
+        _mtbf = stats.lognorm.mean(_shape, scale=_scale, loc=_location)
     elif dist == 'weibull':
-        _mtbf = weibull_min.mean(_shape, scale=_scale, loc=_location)
+        _mtbf = stats.weibull_min.mean(_shape, scale=_scale, loc=_location)
     else:
         _mtbf = 0.0
 
     return _mtbf
 
 
+def predict_hazard_rates(
+        parts: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+    """Predict the MIL-HDBK-217F active hazard rates of a list of parts.
+
+    This function only uses the attributes passed to it and sends no
+    messages so it can be run in a worker process.
+
+    :param parts: the list of aggregate attributes dicts for the parts to
+        predict.
+    :return: a (results, error message) tuple for each part.  The results
+        dict holds the active hazard rate and the attributes the prediction
+        changed (e.g., piE, piQ, lambda b).  A part whose hazard rate can't be
+        predicted has an active hazard rate of zero.  The error message is
+        empty unless an input to the prediction was invalid or unknown.
+    :rtype: list
+    """
+    _predictions: List[Tuple[Dict[str, Any], str]] = []
+    for _attributes in parts:
+        _error_msg = ''
+        try:
+            _results = milhdbk217f.do_calculate_active_hazard_rate(
+                **_attributes)
+        except (KeyError, ValueError, ZeroDivisionError) as _error:
+            _results = {'hazard_rate_active': 0.0}
+            _error_msg = milhdbk217f.get_error_message(_error, _attributes)
+
+        _predictions.append(({
+            _key: _value
+            for _key, _value in _results.items()
+            if _key == 'hazard_rate_active' or _attributes.get(_key) != _value
+        }, _error_msg))
+
+    return _predictions
+
+
 class AnalysisManager(RAMSTKAnalysisManager):
     """Contain the attributes and methods of the Hardware analysis manager.
 
@@ -117,6 +159,15 @@ class AnalysisManager(RAMSTKAnalysisManager):
 
     :ivar dict _attributes: the dict used to hold the aggregate attributes for
         the hardware item being analyzed.
+    :ivar dict _dic_dirty: the IDs of the hardware items whose inputs changed
+        since each previously calculated hardware item was calculated.  The
+        key is the ID of the calculated hardware item.
+    :ivar dict _dic_prediction_results: the MIL-HDBK-217F prediction
+        results to save to each part's records when the calculation in
+        progress finishes.  The key is the hardware ID.
+    :ivar dict _dic_predictions: the MIL-HDBK-217F predictions made by worker
+        processes for the calculation in progress.  The key is the hardware
+        ID.
     """
     def __init__(self, configuration: RAMSTKUserConfiguration,
                  **kwargs: Dict[Any, Any]) -> None:
@@ -128,6 +179,9 @@ class AnalysisManager(RAMSTKAnalysisManager):
         super().__init__(configuration, **kwargs)
 
         # Initialize private dictionary attributes.
+        self._dic_dirty: Dict[int, Set[int]] = {}
+        self._dic_prediction_results: Dict[int, Dict[str, Any]] = {}
+        self._dic_predictions: Dict[int, Tuple[Dict[str, Any], str]] = {}
 
         # Initialize private list attributes.
 
@@ -149,6 +203,15 @@ class AnalysisManager(RAMSTKAnalysisManager):
         pub.subscribe(self._do_calculate_hardware,
                       'request_calculate_hardware')
         pub.subscribe(self._do_derating_analysis, 'request_derate_hardware')
+        pub.subscribe(self._on_edit_hardware,
+                      'request_set_hardware_attributes')
+        pub.subscribe(self._on_edit_hardware, 'wvw_editing_component')
+        pub.subscribe(self._on_edit_hardware, 'mvw_editing_hardware')
+        pub.subscribe(self._on_edit_hardware, 'wvw_editing_hardware')
+        pub.subscribe(self._on_insert_hardware, 'succeed_insert_hardware')
+        pub.subscribe(self._on_reset_hardware, 'succeed_delete_hardware')
+        pub.subscribe(self._on_reset_hardware, 'succeed_retrieve_hardware')
+        pub.subscribe(self._on_tree_changed, 'tree_changed')
 
     def _do_calculate_cost_metrics(self, node: treelib.Node) -> float:
         """Calculate the cost related metrics.
@@ -157,24 +220,9 @@ class AnalysisManager(RAMSTKAnalysisManager):
         :return: _total_cost; the total cost.
         :rtype: float
         """
-        _hardware: Dict[str, Any] = node.data
-        _total_cost: float = 0.0
-
-        if _hardware['hardware'].cost_type_id == 2:
-            if _hardware['hardware'].part == 1:
-                _total_cost = _hardware['hardware'].cost * _hardware[
-                    'hardware'].quantity
-            else:
-                for _node_id in node.successors(self._tree.identifier):
-                    _node = self._tree.get_node(_node_id)
-                    _total_cost += self._do_calculate_cost_metrics(_node)
-                _total_cost = _total_cost * _hardware['hardware'].quantity
-        else:
-            _total_cost = _hardware['hardware'].total_cost
-
-        _hardware['hardware'].total_cost = _total_cost
+        self._do_calculate_roll_up(node, ['cost'])
 
-        return _total_cost
+        return node.data['hardware'].total_cost
 
     @staticmethod
     def _do_calculate_current_ratio(node: treelib.Node) -> None:
@@ -209,20 +257,93 @@ class AnalysisManager(RAMSTKAnalysisManager):
                 error_message=_error_msg,
             )
 
+    def _do_calculate_dirty(self, node: treelib.Node, metrics: List[str],
+                            dirty: Set[int]) -> None:
+        """Recalculate the hardware items in a subtree whose inputs changed.
+
+        Each dirty hardware item is recalculated along with its children.
+        Only the ancestors of the dirty items are then recalculated, summing
+        the results already stored for their other children.  A single edit
+        to a part is recalculated in time proportional to its depth.
+
+        :param node: the treelib.Node() at the top of the tree to calculate.
+        :param metrics: the list of metrics to calculate.
+        :param dirty: the IDs of the hardware items whose inputs changed.
+        :return: None
+        :rtype: None
+        :raises: ZeroDivisionError if the hazard rate multiplier is zero.
+        """
+        # Find the path from the top of the tree to each dirty item.
+        _paths: List[List[treelib.Node]] = []
+        for _node_id in dirty:
+            _path = [self._tree.get_node(_node_id)]
+            while (_path[-1] is not None
+                   and _path[-1].identifier != node.identifier):
+                _path.append(self._tree.parent(_path[-1].identifier))
+            if _path[-1] is not None:
+                _paths.append(_path[::-1])
+
+        # Shallower items first so an item inside another dirty item's
+        # subtree is skipped rather than recalculated twice.
+        _ancestors: Dict[int, Tuple[int, treelib.Node, Tuple[bool, bool,
+                                                             bool]]] = {}
+        _recalculated: Set[int] = set()
+        for _path in sorted(_paths, key=len):
+            if any(_node.identifier in _recalculated for _node in _path):
+                continue
+
+            _flags: Tuple[bool, bool, bool] = ('cost' in metrics, True,
+                                               'hazard_rates' in metrics)
+            for _level, _node in enumerate(_path[:-1]):
+                _node_flags, _flags = self._get_roll_up_flags(
+                    _node, _flags, metrics)
+                _ancestors[_node.identifier] = (_level, _node, _node_flags)
+
+            self._do_calculate_roll_up(_path[-1], metrics, _flags)
+            _recalculated.add(_path[-1].identifier)
+
+        for __, _node, _flags in sorted(_ancestors.values(),
+                                        key=lambda _ancestor: -_ancestor[0]):
+            self._do_calculate_item(_node, self._tree.children(
+                _node.identifier), _flags, metrics)
+
     def _do_calculate_hardware(self, node_id: int) -> None:
         """Calculate all metrics for the hardware associated with node ID.
 
+        The first time a hardware item is calculated, every item in its
+        subtree is calculated.  After that, only the items whose inputs
+        changed and their ancestors are recalculated.  The results are set
+        in a batch so the data managers announce their changes once.
+
         :param node_id: the node (hardware) ID to calculate metrics.
         :return: None
         :rtype: None
         """
         _node: treelib.Node = self._tree.get_node(node_id)
+        _metrics = ['cost', 'part_count', 'power', 'reliabilities']
 
-        self._do_calculate_cost_metrics(_node)
-        self._do_calculate_part_count(_node)
-        self._do_calculate_power_dissipation(_node)
-        self._request_do_stress_analysis(_node)
-        self._do_calculate_reliabilities(_node)
+        pub.sendMessage('request_begin_batch')
+        try:
+            self._request_do_stress_analysis(_node)
+            if node_id in self._dic_dirty:
+                self._do_calculate_dirty(_node, _metrics,
+                                         self._dic_dirty[node_id])
+            else:
+                self._do_predict_hazard_rates(_node)
+                self._do_calculate_roll_up(_node, _metrics)
+                self._dic_predictions = {}
+        finally:
+            pub.sendMessage('request_end_batch')
+
+        # Items calculated from a higher item must be recalculated from
+        # scratch next time and this item must be recalculated the next time
+        # any item above it is.
+        for _calculated_id in list(self._dic_dirty):
+            if self._tree.is_ancestor(node_id, _calculated_id):
+                self._dic_dirty.pop(_calculated_id)
+            elif self._tree.is_ancestor(_calculated_id, node_id):
+                self._dic_dirty[_calculated_id].add(node_id)
+        self._dic_dirty[node_id] = set()
 
         # Let everyone know we succeeded calculating the hardware and
         # auto-save the results.
@@ -252,7 +373,7 @@ class AnalysisManager(RAMSTKAnalysisManager):
         _time = self.RAMSTK_USER_CONFIGURATION.RAMSTK_HR_MULTIPLIER or 1.0
 
         if _hardware['reliability'].hazard_rate_type_id == 1:
-            _hazard_rate_active = (self._do_predict_active_hazard_rate(node))
+            _hazard_rate_active = self._do_predict_active_hazard_rate(node)
         elif _hardware['reliability'].hazard_rate_type_id == 2:
             _hazard_rate_active = _hardware[
                 'reliability'].hazard_rate_specified / _time
@@ -313,55 +434,113 @@ class AnalysisManager(RAMSTKAnalysisManager):
         :return: _hazard_rate_active; the active hazard rate.
         :rtype: float
         """
+        self._do_calculate_roll_up(node, ['hazard_rates'])
+
+        _reliability = node.data['reliability']
+
+        return (_reliability.hazard_rate_active,
+                _reliability.hazard_rate_dormant,
+                _reliability.hazard_rate_logistics,
+                _reliability.hazard_rate_mission)
+
+    def _do_calculate_item(self, node: treelib.Node,
+                           children: List[treelib.Node],
+                           flags: Tuple[bool, bool, bool],
+                           metrics: List[str]) -> None:
+        """Calculate the metrics of a single hardware item.
+
+        The results of an assembly are calculated from the results of its
+        children, which must be calculated first.
+
+        :param node: the treelib.Node() to calculate.
+        :param children: the child treelib.Node()s of the item.
+        :param flags: the (cost, totals, hazard rates) flags for the item.
+        :param metrics: the list of metrics to calculate.
+        :return: None
+        :rtype: None
+        :raises: ZeroDivisionError if the hazard rate multiplier is zero.
+        """
+        _cost, _totals, _hazard_rates = flags
+        _hardware = node.data['hardware']
+        _reliability = node.data['reliability']
+        _is_part = _hardware.part == 1
+
+        if _cost and _hardware.cost_type_id == 2:
+            _hardware.total_cost = (_hardware.cost if _is_part else sum(
+                _child.data['hardware'].total_cost
+                for _child in children)) * _hardware.quantity
+
+        if _totals and 'part_count' in metrics:
+            _hardware.total_part_count = (1 if _is_part else sum(
+                _child.data['hardware'].total_part_count
+                for _child in children)) * _hardware.quantity
+
+        if _totals and 'power' in metrics:
+            _hardware.total_power_dissipation = (
+                node.data['design_electric'].power_operating
+                if _is_part else sum(
+                    _child.data['hardware'].total_power_dissipation
+                    for _child in children)) * _hardware.quantity
+
+        if _hazard_rates:
+            self._do_calculate_item_hazard_rates(node, children)
+
+        if 'reliabilities' in metrics:
+            _time = self.RAMSTK_USER_CONFIGURATION.RAMSTK_HR_MULTIPLIER or 1.0
+
+            _reliability.reliability_logistics = exp(
+                -1.0 * _reliability.hazard_rate_logistics / _time)
+            _reliability.reliability_mission = exp(
+                -1.0 * (_reliability.hazard_rate_mission / _time)
+                * _hardware.mission_time)
+
+    def _do_calculate_item_hazard_rates(
+            self, node: treelib.Node, children: List[treelib.Node]) -> None:
+        """Calculate the hazard rates and MTBFs of a single hardware item.
+
+        The hazard rates of an assembly are the sum of the hazard rates of
+        its children, which must be calculated first.
+
+        :param node: the treelib.Node() to calculate.
+        :param children: the child treelib.Node()s of the item.
+        :return: None
+        :rtype: None
+        """
         _hardware: Dict[str, Any] = node.data
+        _reliability = _hardware['reliability']
 
-        # Iterate through all parts if this is an assembly.
         if _hardware['hardware'].part != 1:
             _hazard_rate_active: float = 0.0
             _hazard_rate_dormant: float = 0.0
             _hazard_rate_logistics: float = 0.0
             _hazard_rate_mission: float = 0.0
-            _p_node = node.identifier
-            for _node_id in node.successors(self._tree.identifier):
-                _node = self._tree.get_node(_node_id)
-                (_temp_hr_active, _temp_hr_dormant, _temp_hr_logistics,
-                 _temp_hr_mission) = self._do_calculate_hazard_rates(_node)
-                _hazard_rate_active += _temp_hr_active
-                _hazard_rate_dormant += _temp_hr_dormant
-                _hazard_rate_logistics += _temp_hr_logistics
-                _hazard_rate_mission += _temp_hr_mission
-
-            self._tree.get_node(_p_node).data[
-                'reliability'].hazard_rate_active = _hazard_rate_active
-            self._tree.get_node(_p_node).data[
-                'reliability'].hazard_rate_dormant = _hazard_rate_dormant
-            self._tree.get_node(_p_node).data[
-                'reliability'].hazard_rate_logistics = _hazard_rate_logistics
-            self._tree.get_node(_p_node).data[
-                'reliability'].hazard_rate_mission = _hazard_rate_mission
-
-            self._do_calculate_mtbfs(self._tree.get_node(_p_node))
-
+            for _child in children:
+                _child_reliability = _child.data['reliability']
+                _hazard_rate_active += _child_reliability.hazard_rate_active
+                _hazard_rate_dormant += _child_reliability.hazard_rate_dormant
+                _hazard_rate_logistics += (
+                    _child_reliability.hazard_rate_logistics)
+                _hazard_rate_mission += _child_reliability.hazard_rate_mission
+
+            _reliability.hazard_rate_active = _hazard_rate_active
+            _reliability.hazard_rate_dormant = _hazard_rate_dormant
+            _reliability.hazard_rate_logistics = _hazard_rate_logistics
+            _reliability.hazard_rate_mission = _hazard_rate_mission
         else:
-            _hardware['reliability'].hazard_rate_active = (
+            _reliability.hazard_rate_active = (
                 self._do_calculate_hazard_rate_active(node))
-            _hardware['reliability'].hazard_rate_dormant = (
+            _reliability.hazard_rate_dormant = (
                 self._do_calculate_hazard_rate_dormant(node))
 
-            _hardware['reliability'].hazard_rate_logistics = (
-                _hardware['reliability'].hazard_rate_active
-                + _hardware['reliability'].hazard_rate_dormant
-                + _hardware['reliability'].hazard_rate_software)
-            _hardware['reliability'].hazard_rate_mission = (
-                _hardware['reliability'].hazard_rate_active
-                + _hardware['reliability'].hazard_rate_software)
+            _reliability.hazard_rate_logistics = (
+                _reliability.hazard_rate_active
+                + _reliability.hazard_rate_dormant
+                + _reliability.hazard_rate_software)
+            _reliability.hazard_rate_mission = (
+                _reliability.hazard_rate_active
+                + _reliability.hazard_rate_software)
 
-            self._do_calculate_mtbfs(node)
-
-        return (_hardware['reliability'].hazard_rate_active,
-                _hardware['reliability'].hazard_rate_dormant,
-                _hardware['reliability'].hazard_rate_logistics,
-                _hardware['reliability'].hazard_rate_mission)
+        self._do_calculate_mtbfs(node)
 
     def _do_calculate_mtbfs(self, node: treelib.Node) -> None:
         """Calculate the MTBF related metrics.
@@ -405,20 +584,9 @@ class AnalysisManager(RAMSTKAnalysisManager):
         :return: _part_count; the total part count.
         :rtype: int
         """
-        _hardware: Dict[str, Any] = node.data
-        _part_count: int = 0
-
-        if _hardware['hardware'].part == 1:
-            _part_count = _hardware['hardware'].quantity
-        else:
-            for _node_id in node.successors(self._tree.identifier):
-                _node = self._tree.get_node(_node_id)
-                _part_count += self._do_calculate_part_count(_node)
-            _part_count = _part_count * _hardware['hardware'].quantity
+        self._do_calculate_roll_up(node, ['part_count'])
 
-        _hardware['hardware'].total_part_count = _part_count
-
-        return _part_count
+        return node.data['hardware'].total_part_count
 
     def _do_calculate_power_dissipation(self, node: treelib.Node) -> float:
         """Calculate the total power dissipation of a hardware item.
@@ -427,24 +595,9 @@ class AnalysisManager(RAMSTKAnalysisManager):
         :return: _power_dissipation; the total power dissipation.
         :rtype: float
         """
-        _hardware: Dict[str, Any] = node.data
-        _power_dissipation: float = 0.0
+        self._do_calculate_roll_up(node, ['power'])
 
-        if _hardware['hardware'].part == 1:
-            _power_dissipation = _hardware[
-                'design_electric'].power_operating * _hardware[
-                    'hardware'].quantity
-        else:
-            for _node_id in node.successors(self._tree.identifier):
-                _node = self._tree.get_node(_node_id)
-                _power_dissipation += self._do_calculate_power_dissipation(
-                    _node)
-            _power_dissipation = _power_dissipation * _hardware[
-                'hardware'].quantity
-
-        _hardware['hardware'].total_power_dissipation = _power_dissipation
-
-        return _power_dissipation
+        return node.data['hardware'].total_power_dissipation
 
     @staticmethod
     def _do_calculate_power_ratio(node: treelib.Node) -> None:
@@ -486,23 +639,58 @@ class AnalysisManager(RAMSTKAnalysisManager):
         :rtype: None
         :raises: ZeroDivisionError if the hazard rate multiplier is zero.
         """
-        _hardware: Dict[str, Any] = node.data
-
-        if _hardware['reliability'].hazard_rate_type_id != 0:
-            self._do_calculate_hazard_rates(node)
-
-        _time = self.RAMSTK_USER_CONFIGURATION.RAMSTK_HR_MULTIPLIER or 1.0
-
-        _hardware['reliability'].reliability_logistics = exp(
-            -1.0 * _hardware['reliability'].hazard_rate_logistics / _time)
-        _hardware['reliability'].reliability_mission = exp(
-            -1.0 * (_hardware['reliability'].hazard_rate_mission / _time)
-            * _hardware['hardware'].mission_time)
-
-        # Calculate reliabilities for any child hardware.
-        for _node_id in node.successors(self._tree.identifier):
-            _node = self._tree.get_node(_node_id)
-            self._do_calculate_reliabilities(_node)
+        self._do_calculate_roll_up(node, ['reliabilities'])
+
+    def _do_calculate_roll_up(self,
+                              node: treelib.Node,
+                              metrics: List[str],
+                              flags: Optional[Tuple[bool, bool,
+                                                    bool]] = None) -> None:
+        """Calculate metrics for every hardware item in a subtree.
+
+        The subtree is walked once, without recursion, and each hardware item
+        is calculated after all of its children so assemblies can sum the
+        results of their children.  Metrics are:
+
+            * cost: the total cost of items with calculated costs.
+            * part_count: the total part count.
+            * power: the total power dissipation.
+            * hazard_rates: the hazard rates and MTBFs of the subtree.
+            * reliabilities: the hazard rates and MTBFs below any item with a
+              hazard rate type and the reliabilities of every item.
+
+        :param node: the treelib.Node() at the top of the tree to calculate.
+        :param metrics: the list of metrics to calculate.
+        :param flags: the (cost, totals, hazard rates) flags node inherits
+            from its parent; defaults to those of the top of a calculation.
+        :return: None
+        :rtype: None
+        :raises: ZeroDivisionError if the hazard rate multiplier is zero.
+        """
+        if flags is None:
+            flags = ('cost' in metrics, True, 'hazard_rates' in metrics)
+
+        # Walk the subtree depth-first, recording each item's children and
+        # which metrics to calculate for the item.
+        _items = []
+        _stack = [(node, flags)]
+        while _stack:
+            _node, _flags = _stack.pop()
+            _flags, _child_flags = self._get_roll_up_flags(
+                _node, _flags, metrics)
+            _children = [
+                self._tree.get_node(_node_id)
+                for _node_id in _node.successors(self._tree.identifier)
+            ]
+            _items.append((_node, _children, _flags))
+            _stack.extend((_child, _child_flags) for _child in _children)
+
+        # Reversed, the depth-first order visits every child before its
+        # parent.
+        for _node, _children, _flags in reversed(_items):
+            self._do_calculate_item(_node, _children, _flags, metrics)
+
+        self._do_set_prediction_results()
 
     @staticmethod
     def _do_calculate_s_distribution(
@@ -683,10 +871,12 @@ class AnalysisManager(RAMSTKAnalysisManager):
 
         pub.sendMessage('succeed_derate_hardware', attributes=self._attributes)
 
-    @staticmethod
-    def _do_predict_active_hazard_rate(node: treelib.Node) -> float:
+    def _do_predict_active_hazard_rate(self, node: treelib.Node) -> float:
         """Request that the hazard rate prediction be performed.
 
+        The prediction results are saved to the part's records when the
+        calculation finishes.
+
         :return: None
         :rtype: None
         """
@@ -696,23 +886,202 @@ class AnalysisManager(RAMSTKAnalysisManager):
         if _hardware['hardware'].part != 1:
             _hazard_rate_active = _hardware['reliability'].hazard_rate_active
         elif _hardware['reliability'].hazard_rate_method_id in [1, 2]:
-            _attributes = {
-                **_hardware['hardware'].get_attributes(),
-                **_hardware['design_mechanic'].get_attributes(),
-                **_hardware['design_electric'].get_attributes(),
-                **_hardware['mil_hdbk_217f'].get_attributes(),
-                **_hardware['nswc'].get_attributes(),
-                **_hardware['reliability'].get_attributes()
-            }
-
             try:
-                _hazard_rate_active = (
-                    milhdbk217f.do_predict_active_hazard_rate(**_attributes))
+                _results, _error_msg = self._dic_predictions.pop(
+                    node.identifier)
             except KeyError:
-                _hazard_rate_active = 0.0
+                [(_results, _error_msg)] = predict_hazard_rates(
+                    [self._get_prediction_attributes(node)])
+
+            if _error_msg:
+                pub.sendMessage('fail_predict_reliability',
+                                error_message=_error_msg)
+
+            self._dic_prediction_results[node.identifier] = _results
+            _hazard_rate_active = _results['hazard_rate_active']
 
         return _hazard_rate_active
 
+    def _do_predict_hazard_rates(self, node: treelib.Node) -> None:
+        """Predict the hazard rates of the parts in a subtree in parallel.
+
+        The attributes of each part with a MIL-HDBK-217F hazard rate are
+        copied into a dict and sent in chunks to a pool of worker processes.
+        The predictions are then used in place of predicting each part in
+        this process when the hazard rates are calculated.  Nothing is done
+        unless more than one worker is configured and there is more than one
+        chunk of parts.
+
+        :param node: the treelib.Node() at the top of the tree to predict.
+        :return: None
+        :rtype: None
+        """
+        _n_workers = self.RAMSTK_USER_CONFIGURATION.RAMSTK_PREDICTION_WORKERS
+        _chunk_size = max(
+            self.RAMSTK_USER_CONFIGURATION.RAMSTK_PREDICTION_CHUNK_SIZE, 1)
+
+        if _n_workers < 2:
+            return
+
+        _parts: List[treelib.Node] = []
+        _stack = [node]
+        while _stack:
+            _node = _stack.pop()
+            if (_node.data['hardware'].part == 1
+                    and _node.data['reliability'].hazard_rate_type_id == 1
+                    and _node.data['reliability'].hazard_rate_method_id
+                    in [1, 2]):
+                _parts.append(_node)
+            _stack.extend(
+                self._tree.get_node(_node_id)
+                for _node_id in _node.successors(self._tree.identifier))
+
+        if len(_parts) <= _chunk_size:
+            return
+
+        _attributes = [
+            self._get_prediction_attributes(_node) for _node in _parts
+        ]
+        with ProcessPoolExecutor(max_workers=_n_workers,
+                                 mp_context=get_context('spawn')) as _executor:
+            self._dic_predictions = dict(
+                zip([_node.identifier for _node in _parts],
+                    chain.from_iterable(
+                        _executor.map(predict_hazard_rates, [
+                            _attributes[_index:_index + _chunk_size] for
+                            _index in range(0, len(_attributes), _chunk_size)
+                        ]))))
+
+    def _do_set_prediction_results(self) -> None:
+        """Save the MIL-HDBK-217F prediction results to the part's records.
+
+        Each result is set on every record of the part with that attribute.
+        The active hazard rate isn't set because the roll-up has already
+        replaced the predicted hazard rate with the adjusted hazard rate.
+
+        :return: None
+        :rtype: None
+        """
+        for _node_id, _results in self._dic_prediction_results.items():
+            _records = [
+                _record
+                for _record in self._tree.get_node(_node_id).data.values()
+                if _record is not None
+            ]
+            for _key, _value in _results.items():
+                if _key == 'hazard_rate_active':
+                    continue
+                for _record in _records:
+                    if _key in _record.__mapper__.column_attrs:
+                        setattr(_record, _key, _value)
+
+        self._dic_prediction_results = {}
+
+    @staticmethod
+    def _get_prediction_attributes(node: treelib.Node) -> Dict[str, Any]:
+        """Get the attributes used to predict the hazard rate of a part.
+
+        :param node: the treelib.Node() of the part to predict.
+        :return: the aggregate attributes dict for the part.
+        :rtype: dict
+        """
+        _hardware: Dict[str, Any] = node.data
+
+        return {
+            **_hardware['hardware'].get_attributes(),
+            **_hardware['design_mechanic'].get_attributes(),
+            **_hardware['design_electric'].get_attributes(),
+            **_hardware['mil_hdbk_217f'].get_attributes(),
+            **_hardware['nswc'].get_attributes(),
+            **_hardware['reliability'].get_attributes()
+        }
+
+    @staticmethod
+    def _get_roll_up_flags(
+        node: treelib.Node, flags: Tuple[bool, bool, bool], metrics: List[str]
+    ) -> Tuple[Tuple[bool, bool, bool], Tuple[bool, bool, bool]]:
+        """Get the metrics to calculate for a hardware item and its children.
+
+        The flags are whether to calculate the total cost, the totals (part
+        count and power dissipation), and the hazard rates.  Items below a
+        part are only calculated when they have a hazard rate type of their
+        own.
+
+        :param node: the treelib.Node() to get the flags for.
+        :param flags: the (cost, totals, hazard rates) flags the item inherits
+            from its parent.
+        :param metrics: the list of metrics to calculate.
+        :return: the flags for the item and the flags for its children.
+        :rtype: tuple
+        """
+        _cost, _totals, _hazard_rates = flags
+        _hardware = node.data['hardware']
+        _is_assembly = _hardware.part != 1
+
+        _hazard_rates = _hazard_rates or (
+            'reliabilities' in metrics
+            and node.data['reliability'].hazard_rate_type_id != 0)
+
+        return ((_cost, _totals, _hazard_rates),
+                (_cost and _is_assembly and _hardware.cost_type_id == 2,
+                 _totals and _is_assembly, _hazard_rates and _is_assembly))
+
+    # pylint: disable=unused-argument
+    # noinspection PyUnusedLocal
+    def _on_edit_hardware(self, node_id: List, package: Dict[str,
+                                                             Any]) -> None:
+        """Mark the hardware item as dirty when one of its inputs is edited.
+
+        :param node_id: the ID of the hardware item being edited.
+        :param package: the key:value pair of the attribute being edited.
+        :return: None
+        :rtype: None
+        """
+        for _dirty in self._dic_dirty.values():
+            _dirty.add(node_id[0])
+
+    def _on_insert_hardware(self, node_id: int, tree: treelib.Tree) -> None:
+        """Mark a newly inserted hardware item as dirty.
+
+        :param node_id: the ID of the hardware item that was inserted.
+        :param tree: the data manager's treelib Tree().
+        :return: None
+        :rtype: None
+        """
+        self._tree = tree
+        for _dirty in self._dic_dirty.values():
+            _dirty.add(node_id)
+
+    def _on_reset_hardware(self, tree: treelib.Tree) -> None:
+        """Forget the previous calculations when hardware is loaded or deleted.
+
+        :param tree: the data manager's treelib Tree().
+        :return: None
+        :rtype: None
+        """
+        self._tree = tree
+        self._dic_dirty = {}
+
+    def _on_tree_changed(self, module: str, node_ids: Set[Any],
+                         tree: treelib.Tree) -> None:
+        """Mark the changed hardware items as dirty.
+
+        Only the hardware items in node_ids are marked so the next
+        calculation recalculates them and their ancestors.
+
+        :param module: the tag of the module whose tree changed.
+        :param node_ids: the IDs of the nodes that changed.
+        :param tree: the data manager's treelib Tree().
+        :return: None
+        :rtype: None
+        """
+        if module != 'hardwares':
+            return
+
+        self._tree = tree
+        for _dirty in self._dic_dirty.values():
+            _dirty.update(node_ids)
+
     def _request_do_stress_analysis(self, node: treelib.Node) -> None:
         """Perform a stress analysis.
 
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Third Party Imports
 import treelib
@@ -26,7 +26,17 @@ def mtbf_from_s_distribution(dist: str = ..., **kwargs: Any) -> float:
     ...
 
 
+def predict_hazard_rates(
+    parts: List[Dict[str, Any]]
+) -> List[Tuple[Dict[str, Any], str]]:
+    ...
+
+
 class AnalysisManager(RAMSTKAnalysisManager):
+    _dic_dirty: Dict[int, Set[int]] = ...
+    _dic_prediction_results: Dict[int, Dict[str, Any]] = ...
+    _dic_predictions: Dict[int, Tuple[Dict[str, Any], str]] = ...
+
     def __init__(self, configuration: RAMSTKUserConfiguration,
                  **kwargs: Dict[Any, Any]) -> None:
         ...
@@ -38,6 +48,10 @@ class AnalysisManager(RAMSTKAnalysisManager):
     def _do_calculate_current_ratio(node: treelib.Node) -> None:
         ...
 
+    def _do_calculate_dirty(self, node: treelib.Node, metrics: List[str],
+                            dirty: Set[int]) -> None:
+        ...
+
     def _do_calculate_hardware(self, node_id: int) -> None:
         ...
 
@@ -52,6 +66,16 @@ class AnalysisManager(RAMSTKAnalysisManager):
             self, node: treelib.Node) -> Tuple[float, float, float, float]:
         ...
 
+    def _do_calculate_item(self, node: treelib.Node,
+                           children: List[treelib.Node],
+                           flags: Tuple[bool, bool, bool],
+                           metrics: List[str]) -> None:
+        ...
+
+    def _do_calculate_item_hazard_rates(
+            self, node: treelib.Node, children: List[treelib.Node]) -> None:
+        ...
+
     def _do_calculate_mtbfs(self, node: treelib.Node) -> None:
         ...
 
@@ -68,6 +92,13 @@ class AnalysisManager(RAMSTKAnalysisManager):
     def _do_calculate_reliabilities(self, node: treelib.Node) -> None:
         ...
 
+    def _do_calculate_roll_up(self,
+                              node: treelib.Node,
+                              metrics: List[str],
+                              flags: Optional[Tuple[bool, bool,
+                                                    bool]] = ...) -> None:
+        ...
+
     @staticmethod
     def _do_calculate_s_distribution(
             hardware: Dict[str, object]) -> Tuple[float, float]:
@@ -80,8 +111,37 @@ class AnalysisManager(RAMSTKAnalysisManager):
     def _do_derating_analysis(self, node_id: int) -> None:
         ...
 
+    def _do_predict_active_hazard_rate(self, node: treelib.Node) -> float:
+        ...
+
+    def _do_predict_hazard_rates(self, node: treelib.Node) -> None:
+        ...
+
+    def _do_set_prediction_results(self) -> None:
+        ...
+
     @staticmethod
-    def _do_predict_active_hazard_rate(node: treelib.Node) -> float:
+    def _get_prediction_attributes(node: treelib.Node) -> Dict[str, Any]:
+        ...
+
+    @staticmethod
+    def _get_roll_up_flags(
+        node: treelib.Node, flags: Tuple[bool, bool, bool], metrics: List[str]
+    ) -> Tuple[Tuple[bool, bool, bool], Tuple[bool, bool, bool]]:
+        ...
+
+    def _on_edit_hardware(self, node_id: List, package: Dict[str,
+                                                             Any]) -> None:
+        ...
+
+    def _on_insert_hardware(self, node_id: int, tree: treelib.Tree) -> None:
+        ...
+
+    def _on_reset_hardware(self, tree: treelib.Tree) -> None:
+        ...
+
+    def _on_tree_changed(self, module: str, node_ids: Set[Any],
+                         tree: treelib.Tree) -> None:
         ...
 
     def _request_do_stress_analysis(self, node: treelib.Node) -> None:
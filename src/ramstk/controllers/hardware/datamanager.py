@@ -31,6 +31,14 @@ class DataManager(RAMSTKDataManager):
     RAMSTKDesignElectric, and RAMSTKDesignMechanic data models.
     """
 
+    _tables = {
+        'hardware': RAMSTKHardware,
+        'design_electric': RAMSTKDesignElectric,
+        'design_mechanic': RAMSTKDesignMechanic,
+        'mil_hdbk_217f': RAMSTKMilHdbkF,
+        'nswc': RAMSTKNSWC,
+        'reliability': RAMSTKReliability,
+    }
     _tag: str = 'hardwares'
     _root: int = 0
 
@@ -95,6 +103,10 @@ class DataManager(RAMSTKDataManager):
     def do_select_all(self, attributes: Dict[str, Any]) -> None:
         """Retrieve all the Hardware BoM data from the RAMSTK Program database.
 
+        The design electric, design mechanic, MIL-HDBK-217F, NSWC, and
+        reliability records are loaded along with the hardware records so the
+        entire BoM is retrieved in a single query regardless of its size.
+
         :param attributes: the attributes dict for the selected Revision.
         :return: None
         :rtype: None
@@ -108,24 +120,24 @@ class DataManager(RAMSTKDataManager):
                 RAMSTKHardware,
                 key=['revision_id'],
                 value=[self._revision_id],
-                order=[RAMSTKHardware.parent_id, RAMSTKHardware.ref_des]):
-
-            _design_e = self._do_select_electrical(_hardware.hardware_id)
-            _design_m = self._do_select_mechanical(_hardware.hardware_id)
-            _milhdbkf = self._do_select_milhdbk217f(_hardware.hardware_id)
-            _nswc = self._do_select_nswc(_hardware.hardware_id)
-            _reliability = self._do_select_reliability(_hardware.hardware_id)
+                order=[RAMSTKHardware.parent_id, RAMSTKHardware.ref_des],
+                eager=[
+                    'design_electric', 'design_mechanic', 'milhdbkf', 'nswc',
+                    'reliability'
+                ]):
 
             self.tree.create_node(tag='hardware',
                                   identifier=_hardware.hardware_id,
                                   parent=_hardware.parent_id,
                                   data={
                                       'hardware': _hardware,
-                                      'design_electric': _design_e,
-                                      'design_mechanic': _design_m,
-                                      'mil_hdbk_217f': _milhdbkf,
-                                      'nswc': _nswc,
-                                      'reliability': _reliability
+                                      'design_electric':
+                                      _hardware.design_electric,
+                                      'design_mechanic':
+                                      _hardware.design_mechanic,
+                                      'mil_hdbk_217f': _hardware.milhdbkf,
+                                      'nswc': _hardware.nswc,
+                                      'reliability': _hardware.reliability
                                   })
 
         self.last_id = max(self.tree.nodes.keys())
@@ -145,9 +157,7 @@ class DataManager(RAMSTKDataManager):
         :return: None
         :rtype: None
         """
-        for _key in attributes:
-            super().do_set_attributes(node_id=[attributes['hardware_id'], ''],
-                                      package={_key: attributes[_key]})
+        super().do_set_attributes_many(attributes['hardware_id'], attributes)
 
     def do_update(self, node_id: int) -> None:
         """Update record associated with node ID in RAMSTK Program database.
@@ -167,10 +177,7 @@ class DataManager(RAMSTKDataManager):
             self.dao.do_update(self.tree.get_node(node_id).data['nswc'])
             self.dao.do_update(self.tree.get_node(node_id).data['reliability'])
 
-            pub.sendMessage(
-                'succeed_update_hardware',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_hardware')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
@@ -216,76 +223,6 @@ class DataManager(RAMSTKDataManager):
                     error_message=_error_msg,
                 )
 
-    def _do_select_electrical(self, hardware_id: int) -> RAMSTKDesignElectric:
-        """Select the electrical attributes for hardware ID.
-
-        :param hardware_id: the ID of the hardware item whose electrical
-            attributes are needed.
-        :return: the RAMSTKDesignElectric() record for the hardware ID.
-        :rtype: RAMSTKDesignElectric
-        """
-        return self.dao.do_select_all(RAMSTKDesignElectric,
-                                      key=['hardware_id'],
-                                      value=[hardware_id],
-                                      order=None,
-                                      _all=False)
-
-    def _do_select_mechanical(self, hardware_id: int) -> RAMSTKDesignMechanic:
-        """Select the mechanical attributes for hardware ID.
-
-        :param hardware_id: the ID of the hardware item whose mechanical
-            attributes are needed.
-        :return: the RAMSTKDesignMechanic() record for the hardware ID.
-        :rtype: RAMSTKDesignMechanic
-        """
-        return self.dao.do_select_all(RAMSTKDesignMechanic,
-                                      key=['hardware_id'],
-                                      value=[hardware_id],
-                                      order=None,
-                                      _all=False)
-
-    def _do_select_milhdbk217f(self, hardware_id: int) -> RAMSTKMilHdbkF:
-        """Select the MIL-HDBK-217F attributes for hardware ID.
-
-        :param hardware_id: the ID of the hardware item whose MIL-HDBK-217F
-            attributes are needed.
-        :return: the RAMSTKMilHdbkF() record for the hardware ID.
-        :rtype: RAMSTKDesignMilHdbkF
-        """
-        return self.dao.do_select_all(RAMSTKMilHdbkF,
-                                      key=['hardware_id'],
-                                      value=[hardware_id],
-                                      order=None,
-                                      _all=False)
-
-    def _do_select_nswc(self, hardware_id: int) -> RAMSTKNSWC:
-        """Select the NSWC attributes for hardware ID.
-
-        :param hardware_id: the ID of the hardware item whose NSWC
-            attributes are needed.
-        :return: the RAMSTKNSWC() record for the hardware ID.
-        :rtype: RAMSTKSWC
-        """
-        return self.dao.do_select_all(RAMSTKNSWC,
-                                      key=['hardware_id'],
-                                      value=[hardware_id],
-                                      order=None,
-                                      _all=False)
-
-    def _do_select_reliability(self, hardware_id: int) -> RAMSTKReliability:
-        """Select the reliability attributes for hardware ID.
-
-        :param hardware_id: the ID of the hardware item whose reliability
-            attributes are needed.
-        :return: the RAMSTKReliability() record for the hardware ID.
-        :rtype: RAMSTKReliability
-        """
-        return self.dao.do_select_all(RAMSTKReliability,
-                                      key=['hardware_id'],
-                                      value=[hardware_id],
-                                      order=None,
-                                      _all=False)
-
     def _do_delete(self, node_id: int) -> None:
         """Remove a Hardware item.
 
@@ -373,23 +310,36 @@ class DataManager(RAMSTKDataManager):
                 _hardware.parent_id = parent_id
                 _hardware.part = part
 
-                self.dao.do_insert(_hardware)
-
-                self.last_id = _hardware.hardware_id
-
-                _design_e = RAMSTKDesignElectric()
-                _design_e.hardware_id = self.last_id
-                _design_m = RAMSTKDesignMechanic()
-                _design_m.hardware_id = self.last_id
-                _milhdbkf = RAMSTKMilHdbkF()
-                _milhdbkf.hardware_id = self.last_id
-                _nswc = RAMSTKNSWC()
-                _nswc.hardware_id = self.last_id
-                _reliability = RAMSTKReliability()
-                _reliability.hardware_id = self.last_id
-
-                self.dao.do_insert_many(
-                    [_design_e, _design_m, _milhdbkf, _nswc, _reliability])
+                # The hardware record and its five sibling records are
+                # added in a single transaction.  The sibling records are
+                # kept in the tree so they must be added to the session
+                # rather than bulk inserted.
+                self.dao.do_begin_transaction()
+                try:
+                    self.dao.do_insert(_hardware)
+
+                    self.last_id = _hardware.hardware_id
+
+                    _design_e = RAMSTKDesignElectric()
+                    _design_e.hardware_id = self.last_id
+                    _design_m = RAMSTKDesignMechanic()
+                    _design_m.hardware_id = self.last_id
+                    _milhdbkf = RAMSTKMilHdbkF()
+                    _milhdbkf.hardware_id = self.last_id
+                    _nswc = RAMSTKNSWC()
+                    _nswc.hardware_id = self.last_id
+                    _reliability = RAMSTKReliability()
+                    _reliability.hardware_id = self.last_id
+
+                    for _record in [
+                            _design_e, _design_m, _milhdbkf, _nswc,
+                            _reliability
+                    ]:
+                        self.dao.do_insert(_record)
+                except DataAccessError:
+                    self.dao.do_rollback_transaction()
+                    raise
+                self.dao.do_commit_transaction()
 
                 self.tree.create_node(tag='hardware',
                                       identifier=_hardware.hardware_id,
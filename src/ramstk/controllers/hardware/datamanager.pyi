@@ -16,6 +16,7 @@ from ramstk.models.programdb import RAMSTKMilHdbkF as RAMSTKMilHdbkF
 from ramstk.models.programdb import RAMSTKReliability as RAMSTKReliability
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _root: int = ...
     _pkey: Any = ...
@@ -38,21 +39,6 @@ class DataManager(RAMSTKDataManager):
     def do_update(self, node_id: int) -> None:
         ...
 
-    def _do_select_electrical(self, hardware_id: int) -> RAMSTKDesignElectric:
-        ...
-
-    def _do_select_mechanical(self, hardware_id: int) -> RAMSTKDesignMechanic:
-        ...
-
-    def _do_select_milhdbk217f(self, hardware_id: int) -> RAMSTKMilHdbkF:
-        ...
-
-    def _do_select_nswc(self, hardware_id: int) -> RAMSTKNSWC:
-        ...
-
-    def _do_select_reliability(self, hardware_id: int) -> RAMSTKReliability:
-        ...
-
     def _do_delete(self, node_id: int) -> None:
         ...
 
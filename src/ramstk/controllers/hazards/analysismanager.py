@@ -15,9 +15,12 @@ from typing import Any, Dict
 from pubsub import pub
 
 # RAMSTK Package Imports
-from ramstk.analyses import fha
 from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.controllers import RAMSTKAnalysisManager
+from ramstk.utilities import lazy_import
+
+# The FHA uses sympy which is slow to import.
+fha = lazy_import('ramstk.analyses.fha')
 
 
 class AnalysisManager(RAMSTKAnalysisManager):
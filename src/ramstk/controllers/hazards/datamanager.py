@@ -28,6 +28,7 @@ class DataManager(RAMSTKDataManager):
     RAMSTKHazardAnalysis data models.
     """
 
+    _tables = {'hazard': RAMSTKHazardAnalysis}
     _tag = 'hazards'
 
     def __init__(self, **kwargs: Dict[Any, Any]) -> None:
@@ -113,9 +114,7 @@ class DataManager(RAMSTKDataManager):
         :return: None
         :rtype: None
         """
-        for _key in attributes:
-            super().do_set_attributes(node_id=[attributes['hazard_id'], ''],
-                                      package={_key: attributes[_key]})
+        super().do_set_attributes_many(attributes['hazard_id'], attributes)
 
     def do_update(self, node_id: int) -> None:
         """Update record associated with node ID in RAMSTK Program database.
@@ -126,10 +125,7 @@ class DataManager(RAMSTKDataManager):
         """
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['hazard'])
-            pub.sendMessage(
-                'succeed_update_hazard',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_hazard')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
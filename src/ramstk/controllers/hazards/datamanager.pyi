@@ -9,6 +9,7 @@ from ramstk.models.programdb import (
 )
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _pkey: Any = ...
 
@@ -8,7 +8,7 @@
 
 # Standard Library Imports
 import inspect
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple
 
 # Third Party Imports
 # noinspection PyPackageRequirements
@@ -17,7 +17,9 @@ from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk.configuration import RAMSTKUserConfiguration
+from ramstk.controllers.tree import RAMSTKTree
 from ramstk.db.base import BaseDatabase
+from ramstk.models import RAMSTKBaseTable
 
 
 class RAMSTKAnalysisManager:
@@ -54,7 +56,7 @@ class RAMSTKAnalysisManager:
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._tree: treelib.Tree = treelib.Tree()
+        self._tree: treelib.Tree = RAMSTKTree()
 
         # Initialize public dictionary attributes.
 
@@ -85,12 +87,25 @@ class RAMSTKAnalysisManager:
 class RAMSTKDataManager:
     """The meta-class for all RAMSTK Data Managers.
 
-    :ivar tree: the treelib Tree()that will contain the structure of the RAMSTK
+    :cvar dict _tables: the RAMSTK data table class of each table in the
+        node data package.  The key is the table key used in the data
+        package.
+    :cvar dict column_index: the tables holding each attribute.  The key is
+        the attribute name and the value is the list of (table key, database
+        column name) tuples for the tables mapping that attribute.  The index
+        is built from the SQLAlchemy mapper of each class in _tables when the
+        data manager class is defined.
+    :ivar set _changed_ids: the IDs of the nodes changed since the last
+        tree_changed message was sent.
+    :ivar int _batch_depth: the number of batches in progress.  The
+        tree_changed message is deferred until the outermost batch ends.
+    :ivar tree: the RAMSTKTree() that will contain the structure of the RAMSTK
         module being modeled.
-    :type tree: :class:`treelib.Tree`
+    :type tree: :class:`ramstk.controllers.tree.RAMSTKTree`
     """
 
     # Define private dictionary class attributes.
+    _tables: Dict[str, Any] = {}
 
     # Define private list class attributes.
 
@@ -99,11 +114,26 @@ class RAMSTKDataManager:
     _tag = ''
 
     # Define public dictionary class attributes.
+    column_index: Dict[str, List[Tuple[str, str]]] = {}
 
     # Define public list class attributes.
 
     # Define public scalar class attributes.
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the column index when a RAMSTK data manager is defined.
+
+        :return: None
+        :rtype: None
+        """
+        super().__init_subclass__(**kwargs)
+
+        cls.column_index = {}
+        for _table, _class in cls._tables.items():
+            for _attribute in _class.__mapper__.column_attrs:
+                cls.column_index.setdefault(_attribute.key, []).append(
+                    (_table, _attribute.columns[0].name))
+
     # pylint: disable=unused-argument
     # noinspection PyUnusedLocal
     def __init__(self, **kwargs: Dict[str, Any]) -> None:
@@ -112,8 +142,11 @@ class RAMSTKDataManager:
         self._pkey: Dict[str, List[str]] = {}
 
         # Initialize private list attributes.
+        self._changed_ids: Set[Any] = set()
+        self._update_topics: Set[str] = set()
 
         # Initialize private scalar attributes.
+        self._batch_depth: int = 0
         self._parent_id: int = 0
         self._revision_id: int = 0
 
@@ -124,7 +157,7 @@ class RAMSTKDataManager:
         # Initialize public scalar attributes.
         self.dao: BaseDatabase = BaseDatabase()
         self.last_id: int = 0
-        self.tree: treelib.Tree = treelib.Tree()
+        self.tree: treelib.Tree = RAMSTKTree()
 
         # Add the root to the Tree().  This is necessary to allow multiple
         # entries at the top level as there can only be one root in a treelib
@@ -133,11 +166,25 @@ class RAMSTKDataManager:
         self.tree.create_node(tag=self._tag, identifier=self._root)
 
         # Subscribe to PyPubSub messages.
+        pub.subscribe(self.do_begin_batch, 'request_begin_batch')
         pub.subscribe(self.do_connect, 'succeed_connect_program_database')
+        pub.subscribe(self.do_end_batch, 'request_end_batch')
         pub.subscribe(self.do_update_all, 'request_save_project')
         pub.subscribe(self.do_set_tree,
                       'succeed_calculate_{0}'.format(self._tag))
 
+    def do_begin_batch(self) -> None:
+        """Start a batch of changes to the MODULE tree.
+
+        Until the batch ends, changes and saved records are collected rather
+        than announced.  Batches may be nested; only the end of the outermost
+        batch sends the notifications.
+
+        :return: None
+        :rtype: None
+        """
+        self._batch_depth += 1
+
     def do_connect(self, dao: BaseDatabase) -> None:
         """Connect data manager to a database.
 
@@ -170,6 +217,26 @@ class RAMSTKDataManager:
         """
         return self.dao.do_delete(self.do_select(node_id, table))
 
+    def do_end_batch(self) -> None:
+        """End a batch of changes to the MODULE tree.
+
+        When the outermost batch ends, each succeed_update message for the
+        records saved during the batch is sent once.  Then the tree is sent
+        once and one tree_changed message is sent with the IDs of every node
+        changed during the batch.
+
+        :return: None
+        :rtype: None
+        """
+        self._batch_depth = max(self._batch_depth - 1, 0)
+        if self._batch_depth == 0:
+            _topics = self._update_topics
+            self._update_topics = set()
+            for _topic in sorted(_topics):
+                pub.sendMessage(_topic, tree=self.tree)
+
+            self._do_notify_tree_changed()
+
     def do_get_attributes(self, node_id: int, table: str) -> None:
         """Retrieve the RAMSTK data table attributes for node ID.
 
@@ -228,49 +295,80 @@ class RAMSTKDataManager:
 
         return _entity
 
+    def do_select_dirty(self) -> List[treelib.Node]:
+        """Retrieve the nodes holding at least one record with unsaved changes.
+
+        :return: the list of treelib Node() in the MODULE tree with a dirty
+            record in their data package.
+        :rtype: list
+        """
+        return [
+            _node for _node in self.tree.all_nodes()
+            if _node.data is not None and any(
+                isinstance(_record, RAMSTKBaseTable) and _record.is_dirty
+                for _record in _node.data.values())
+        ]
+
     def do_set_attributes(self, node_id: List, package: Dict[str,
                                                              Any]) -> None:
         """Set the attributes of the record associated with node ID.
 
+        This is the handler for the per-attribute editing messages.  It is
+        kept for compatibility and sets the attribute using
+        do_set_attributes_many().
+
         :param node_id: the ID of the record in the RAMSTK Program database
             table whose attributes are to be set.
         :param package: the key:value pair of the attribute to set.
         :return: None
         :rtype: None
         """
-        [[_key, _value]] = package.items()
-
-        for _table in self._pkey:
-            try:
-                _attributes = self.do_select(node_id[0],
-                                             table=_table).get_attributes()
-            except (AttributeError, KeyError):
-                _method_name = inspect.currentframe(  # type: ignore
-                ).f_code.co_name
-                _error_msg: str = (
-                    '{2}: No data package for node ID {0} in module '
-                    '{1}.'.format(node_id[0], _table, _method_name))
-                pub.sendMessage(
-                    'do_log_debug',
-                    logger_name='DEBUG',
-                    message=_error_msg,
-                )
-                _attributes = {}
-
-            for _field in self._pkey[_table]:
-                try:
-                    _attributes.pop(_field)
-                except KeyError:
-                    pass
-
-            if _key in _attributes:
-                _attributes[_key] = _value
-
-                self.do_select(node_id[0],
-                               table=_table).set_attributes(_attributes)
+        self.do_set_attributes_many(node_id[0], package)
+
+    def do_set_attributes_many(self, node_id: Any,
+                               package: Dict[str, Any]) -> None:
+        """Set one or more attributes of the records associated with node ID.
+
+        Each attribute is set in the table(s) holding it using the column
+        index so no attributes dicts are built to find the tables.  Each
+        table is set once with all of its attributes in the package.  Keys
+        that aren't an attribute of any table and the primary and foreign
+        keys are ignored.  The change is announced once for the entire
+        package or, during a batch, once when the batch ends.
+
+        :param node_id: the ID of the node in the treelib Tree() whose
+            records are to be set.
+        :param package: the key:value pairs of the attributes to set.
+        :return: None
+        :rtype: None
+        """
+        try:
+            _data = dict(self.tree.get_node(node_id).data)
+        except (AttributeError, treelib.tree.NodeIDAbsentError, TypeError):
+            _method_name = inspect.currentframe(  # type: ignore
+            ).f_code.co_name
+            _error_msg: str = ('{1}: No data package for node ID {0}.'.format(
+                node_id, _method_name))
+            pub.sendMessage(
+                'do_log_debug',
+                logger_name='DEBUG',
+                message=_error_msg,
+            )
+            _data = {}
 
-        # noinspection PyUnresolvedReferences
-        self.do_get_tree()  # type: ignore
+        _attributes: Dict[str, Dict[str, Any]] = {}
+        for _key, _value in package.items():
+            for _table, _ in self.column_index.get(_key, []):
+                if (_data.get(_table) is not None
+                        and _key not in self._pkey[_table]):
+                    _attributes.setdefault(_table, {})[_key] = _value
+
+        for _table, _table_attributes in _attributes.items():
+            _data[_table].set_attributes(_table_attributes)
+
+        self._changed_ids.add(node_id)
+        if self._batch_depth == 0:
+            self._do_notify_tree_changed()
 
     def do_set_tree(self, tree: treelib.Tree) -> None:
         """Set the MODULE treelib Tree().
@@ -288,9 +386,113 @@ class RAMSTKDataManager:
     def do_update_all(self) -> None:
         """Update all MODULE data table records in the RAMSTK Program database.
 
+        Only the nodes with unsaved changes are updated.  All the records are
+        written in a single unit of work so the database is committed once
+        rather than once per record.  If the database rejects any record,
+        none of the changes are saved.
+
+        When the update is part of a larger unit of work, such as saving the
+        whole program, the changes aren't written until the larger unit of
+        work is committed so succeed_update_all is not sent.
+
+        The records are saved in a batch so the module's succeed_update
+        message is sent once rather than once per record.
+
         :return: None
         :rtype: None
         """
-        for _node in self.tree.all_nodes():
-            self.do_update(_node.identifier)  # type: ignore
-        pub.sendMessage('succeed_update_all')
+        self.do_begin_batch()
+        self.dao.do_begin_transaction()
+        try:
+            for _node in self.do_select_dirty():
+                self.do_update(_node.identifier)  # type: ignore
+        except Exception as _error:  # pylint: disable=broad-except
+            # End the unit of work here so it isn't left open.
+            self.dao.do_rollback_transaction()
+            self._do_fail_update_all(str(_error))
+            return
+
+        try:
+            # The commit ends the unit of work even when it raises an error.
+            _committed = self.dao.do_commit_transaction()
+        except Exception as _error:  # pylint: disable=broad-except
+            self._do_fail_update_all(str(_error))
+            return
+
+        self.do_end_batch()
+        if _committed:
+            pub.sendMessage('succeed_update_all')
+
+    def get_dirty_count(self) -> int:
+        """Return the number of MODULE records with unsaved changes.
+
+        :return: the number of dirty records in the MODULE tree.
+        :rtype: int
+        """
+        return sum(
+            isinstance(_record, RAMSTKBaseTable) and _record.is_dirty
+            for _node in self.tree.all_nodes() if _node.data is not None
+            for _record in _node.data.values())
+
+    def _do_fail_update_all(self, error_message: str) -> None:
+        """End the batch of a failed update and send the fail message.
+
+        None of the records were saved so the queued update messages are
+        discarded rather than sent.
+
+        :param error_message: the message describing why the update failed.
+        :return: None
+        :rtype: None
+        """
+        self._update_topics = set()
+        self.do_end_batch()
+        pub.sendMessage(
+            'do_log_debug',
+            logger_name='DEBUG',
+            message=error_message,
+        )
+        pub.sendMessage(
+            'fail_update_all',
+            error_message=error_message,
+        )
+
+    def _do_notify_updated(self, topic: str) -> None:
+        """Announce that MODULE records were saved.
+
+        The tree is sent with the topic.  During a batch, the topic is sent
+        once when the outermost batch ends instead.
+
+        :param topic: the succeed_update message to send.
+        :return: None
+        :rtype: None
+        """
+        if self._batch_depth > 0:
+            self._update_topics.add(topic)
+        else:
+            pub.sendMessage(topic, tree=self.tree)
+
+    def _do_notify_tree_changed(self) -> None:
+        """Announce the nodes changed since the last announcement.
+
+        The tree is sent using the module's do_get_tree() for subscribers
+        that reload the entire tree.  Then the tree_changed message is sent
+        with the module tag and the set of changed node IDs so subscribers
+        can process only those nodes.  Nothing is sent if no nodes changed.
+
+        :return: None
+        :rtype: None
+        """
+        if not self._changed_ids:
+            return
+
+        _node_ids = self._changed_ids
+        self._changed_ids = set()
+
+        # noinspection PyUnresolvedReferences
+        self.do_get_tree()  # type: ignore
+        pub.sendMessage(
+            'tree_changed',
+            module=self._tag,
+            node_ids=_node_ids,
+            tree=self.tree,
+        )
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple
 
 # Third Party Imports
 import treelib
@@ -29,16 +29,27 @@ class RAMSTKAnalysisManager:
 class RAMSTKDataManager:
     _root: int = ...
     _tag: str = ...
+    _tables: Dict[str, Any] = ...
     _pkey: Any = ...
+    _changed_ids: Set[Any] = ...
+    _update_topics: Set[str] = ...
+    _batch_depth: int = ...
     _parent_id: int = ...
     _revision_id: int = ...
     dao: Any = ...
     last_id: int = ...
     tree: Any = ...
+    column_index: Dict[str, List[Tuple[str, str]]] = ...
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        ...
 
     def __init__(self, **kwargs: Dict[str, Any]) -> None:
         ...
 
+    def do_begin_batch(self) -> None:
+        ...
+
     def do_connect(self, dao: BaseDatabase) -> None:
         ...
 
@@ -48,18 +59,40 @@ class RAMSTKDataManager:
     def do_delete(self, node_id: int, table: str) -> None:
         ...
 
+    def do_end_batch(self) -> None:
+        ...
+
     def do_get_attributes(self, node_id: int, table: str) -> None:
         ...
 
     def do_select(self, node_id: Any, table: str) -> Any:
         ...
 
+    def do_select_dirty(self) -> List[treelib.Node]:
+        ...
+
     def do_set_attributes(self, node_id: List, package: Dict[str,
                                                              Any]) -> None:
         ...
 
+    def do_set_attributes_many(self, node_id: Any,
+                               package: Dict[str, Any]) -> None:
+        ...
+
     def do_set_tree(self, tree: treelib.Tree) -> None:
         ...
 
     def do_update_all(self) -> None:
         ...
+
+    def get_dirty_count(self) -> int:
+        ...
+
+    def _do_fail_update_all(self, error_message: str) -> None:
+        ...
+
+    def _do_notify_updated(self, topic: str) -> None:
+        ...
+
+    def _do_notify_tree_changed(self) -> None:
+        ...
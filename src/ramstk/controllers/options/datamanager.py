@@ -27,6 +27,7 @@ class DataManager(RAMSTKDataManager):
     """
 
     # Define private dict class attributes.
+    _tables = {'siteinfo': RAMSTKSiteInfo}
 
     # Define private list class attributes.
 
@@ -7,6 +7,7 @@ from ramstk.exceptions import DataAccessError as DataAccessError
 from ramstk.models.commondb import RAMSTKSiteInfo as RAMSTKSiteInfo
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _root: int = ...
     _pkey: Any = ...
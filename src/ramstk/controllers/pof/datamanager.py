@@ -31,6 +31,11 @@ class DataManager(RAMSTKDataManager):
     data models.
     """
 
+    _tables = {
+        'opload': RAMSTKOpLoad,
+        'opstress': RAMSTKOpStress,
+        'testmethod': RAMSTKTestMethod,
+    }
     _tag = 'pofs'
     _root = 0
 
@@ -147,10 +152,7 @@ class DataManager(RAMSTKDataManager):
             self.dao.session.add(self.tree.get_node(node_id).data[_table])
 
             self.dao.do_update()
-            pub.sendMessage(
-                'succeed_update_pof',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_pof')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
@@ -11,6 +11,7 @@ from ramstk.models.programdb import RAMSTKOpStress as RAMSTKOpStress
 from ramstk.models.programdb import RAMSTKTestMethod as RAMSTKTestMethod
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _root: int = ...
     _pkey: Any = ...
@@ -30,6 +30,7 @@ class DataManager(RAMSTKDataManager):
     """
 
     # Define private dict class attributes.
+    _tables = {'programinfo': RAMSTKProgramInfo}
 
     # Define private list class attributes.
 
@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any
+from typing import Any, Dict
 
 # RAMSTK Package Imports
 from ramstk.controllers import RAMSTKDataManager as RAMSTKDataManager
@@ -8,6 +8,7 @@ from ramstk.exceptions import DataAccessError as DataAccessError
 from ramstk.models.programdb import RAMSTKProgramInfo as RAMSTKProgramInfo
 
 class DataManager(RAMSTKDataManager):
+    _tables: Dict[str, Any] = ...
     _tag: str = ...
     _root: int = ...
     _pkey: Any = ...
@@ -28,6 +28,7 @@ class DataManager(RAMSTKDataManager):
     and RAMSKTProgramStatus data models.
     """
 
+    _tables = {'status': RAMSTKProgramStatus}
     _tag: str = 'program_status'
 
     def __init__(self, **kwargs: Dict[Any, Any]) -> None:
@@ -119,10 +120,7 @@ class DataManager(RAMSTKDataManager):
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['status'])
 
-            pub.sendMessage(
-                'succeed_update_program_status',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_program_status')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
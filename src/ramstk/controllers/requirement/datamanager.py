@@ -27,6 +27,7 @@ class DataManager(RAMSTKDataManager):
     and RAMSTKStakeholder data models.
     """
     # Define private dictionary class attributes.
+    _tables = {'requirement': RAMSTKRequirement}
 
     # Define private list class attributes.
 
@@ -156,10 +157,7 @@ class DataManager(RAMSTKDataManager):
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['requirement'])
 
-            pub.sendMessage(
-                'succeed_update_requirement',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_requirement')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
@@ -29,6 +29,7 @@ class DataManager(RAMSTKDataManager):
     RAMSKTEnvironment data models.
     """
 
+    _tables = {'revision': RAMSTKRevision}
     _tag = 'revision'
 
     def __init__(self, **kwargs: Dict[Any, Any]) -> None:
@@ -110,10 +111,7 @@ class DataManager(RAMSTKDataManager):
 
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['revision'])
-            pub.sendMessage(
-                'succeed_update_revision',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_revision')
         except AttributeError:
             _error_msg: str = (
                 '{1}: Attempted to save non-existent revision with revision '
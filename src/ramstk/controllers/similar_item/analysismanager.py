@@ -17,9 +17,12 @@ import treelib
 from pubsub import pub
 
 # RAMSTK Package Imports
-from ramstk.analyses import similaritem
 from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.controllers import RAMSTKAnalysisManager
+from ramstk.utilities import lazy_import
+
+# The similar item analysis uses sympy which is slow to import.
+similaritem = lazy_import('ramstk.analyses.similaritem')
 
 
 class AnalysisManager(RAMSTKAnalysisManager):
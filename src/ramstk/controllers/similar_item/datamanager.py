@@ -25,6 +25,7 @@ from ramstk.models.programdb import RAMSTKSimilarItem
 class DataManager(RAMSTKDataManager):
     """Contain the attributes and methods of the Similar Item data manager."""
 
+    _tables = {'similar_item': RAMSTKSimilarItem}
     _tag = 'similar_items'
     _root = 0
 
@@ -117,10 +118,7 @@ class DataManager(RAMSTKDataManager):
             self.dao.do_update(
                 self.tree.get_node(node_id).data['similar_item'])
 
-            pub.sendMessage(
-                'succeed_update_similar_item',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_similar_item')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
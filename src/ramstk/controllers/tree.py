@@ -0,0 +1,391 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.controllers.tree.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""RAMSTK Module Tree."""
+
+# Standard Library Imports
+from typing import Any, Dict, List, Optional
+
+# Third Party Imports
+import numpy as np
+import treelib
+
+
+class RAMSTKTree(treelib.Tree):
+    """The treelib Tree() used by the RAMSTK data managers.
+
+    The RAMSTKTree is a treelib Tree() so it can be used anywhere a treelib
+    Tree() is expected.  It adds a compact, array-based index of the tree's
+    structure.  Each node is given an index equal to its position in a
+    depth-first, pre-order walk of the tree so the nodes in any subtree have
+    consecutive indices.  The index holds:
+
+        * the node ID at each index.
+        * the index of the parent of each node; -1 for the root.
+        * the children of each node as CSR-style offset and index arrays.
+        * the index one past the last node in each node's subtree.
+        * the depth of each node.
+        * the node indices in post-order.
+
+    Subtree and ancestor queries are O(1) using the index.  The index is
+    built the first time it is needed and rebuilt only after the structure
+    of the tree changes.  Changes to the data packages of the nodes do not
+    affect the index.
+    """
+
+    # pylint: disable=redefined-builtin
+    def __init__(self,
+                 tree: Optional[treelib.Tree] = None,
+                 deep: bool = False,
+                 node_class: Any = None,
+                 identifier: Optional[str] = None) -> None:
+        """Initialize a RAMSTKTree instance.
+
+        :param tree: the treelib Tree() to copy; defaults to an empty tree.
+        :param deep: whether to deep copy the nodes of tree.
+        :param node_class: the treelib Node() class of the tree's nodes.
+        :param identifier: the ID of the tree; defaults to a UUID.
+        """
+        # Initialize private dictionary attributes.
+        self._dic_node_index: Dict[Any, int] = {}
+
+        # Initialize private list attributes.
+        self._lst_node_ids: List[Any] = []
+
+        # Initialize private scalar attributes.
+        self._child_indices: np.ndarray = np.empty(0, dtype=np.int32)
+        self._child_offsets: np.ndarray = np.zeros(1, dtype=np.int32)
+        self._depths: np.ndarray = np.empty(0, dtype=np.int32)
+        self._ends: np.ndarray = np.empty(0, dtype=np.int32)
+        self._index_valid: bool = False
+        self._parents: np.ndarray = np.empty(0, dtype=np.int32)
+        self._postorder: np.ndarray = np.empty(0, dtype=np.int32)
+
+        super().__init__(tree=tree,
+                         deep=deep,
+                         node_class=node_class,
+                         identifier=identifier)
+
+    @property
+    def child_indices(self) -> np.ndarray:
+        """Get the indices of the children of every node.
+
+        The children of the node at index i are
+        child_indices[child_offsets[i]:child_offsets[i + 1]].
+
+        :return: the child index array.
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._do_build_index()
+
+        return self._child_indices
+
+    @property
+    def child_offsets(self) -> np.ndarray:
+        """Get the offset of each node's children in child_indices.
+
+        :return: the child offset array; one longer than the number of nodes.
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._do_build_index()
+
+        return self._child_offsets
+
+    @property
+    def depths(self) -> np.ndarray:
+        """Get the depth of every node; the root has a depth of zero.
+
+        :return: the depth array.
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._do_build_index()
+
+        return self._depths
+
+    @property
+    def parents(self) -> np.ndarray:
+        """Get the index of the parent of every node.
+
+        :return: the parent index array; -1 for the root.
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._do_build_index()
+
+        return self._parents
+
+    @property
+    def postorder(self) -> np.ndarray:
+        """Get the node indices in post-order; every child before its parent.
+
+        :return: the post-order index array.
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._do_build_index()
+
+        return self._postorder
+
+    @property
+    def subtree_ends(self) -> np.ndarray:
+        """Get the index one past the last node in every node's subtree.
+
+        The subtree of the node at index i is the nodes at indices i up to,
+        but not including, subtree_ends[i].
+
+        :return: the subtree end array.
+        :rtype: :class:`numpy.ndarray`
+        """
+        self._do_build_index()
+
+        return self._ends
+
+    def add_node(self, node: treelib.Node, parent: Any = None) -> None:
+        """Add a node to the tree.
+
+        :param node: the treelib Node() to add.
+        :param parent: the parent treelib Node() or node ID.
+        :return: None
+        :rtype: None
+        """
+        super().add_node(node, parent=parent)
+        self._index_valid = False
+
+    def do_roll_up(self, values: Any) -> np.ndarray:
+        """Sum values over the subtree of every node.
+
+        The sums are calculated with a single cumulative sum over the nodes in
+        pre-order rather than by walking the tree.
+
+        :param values: the value of each node keyed by node index.  Values
+            may be a 1-D array or a 2-D array with one row per node.
+        :return: the sum of the values of each node and all of its
+            descendants keyed by node index.
+        :rtype: :class:`numpy.ndarray`
+        :raise: ValueError if there isn't a value for every node.
+        """
+        self._do_build_index()
+
+        _values = np.asarray(values)
+        if _values.shape[0] != len(self._lst_node_ids):
+            raise ValueError(
+                'do_roll_up: expected {0:d} values, got {1:d}.'.format(
+                    len(self._lst_node_ids), _values.shape[0]))
+
+        _cumulative = np.concatenate(
+            [np.zeros((1, ) + _values.shape[1:]),
+             np.cumsum(_values, axis=0)])
+
+        return _cumulative[self._ends] - _cumulative[:-1]
+
+    def get_child_ids(self, nid: Any) -> List[Any]:
+        """Get the IDs of the children of a node.
+
+        :param nid: the ID of the node to get the children of.
+        :return: the list of child node IDs.
+        :rtype: list
+        :raise: KeyError if the node isn't in the tree.
+        """
+        _index = self.get_index(nid)
+
+        return [
+            self._lst_node_ids[_child] for _child in self._child_indices[
+                self._child_offsets[_index]:self._child_offsets[_index + 1]]
+        ]
+
+    def get_index(self, nid: Any) -> int:
+        """Get the index of a node.
+
+        :param nid: the ID of the node to get the index of.
+        :return: the pre-order index of the node.
+        :rtype: int
+        :raise: KeyError if the node isn't in the tree.
+        """
+        self._do_build_index()
+
+        return self._dic_node_index[nid]
+
+    def get_node_ids(self) -> List[Any]:
+        """Get the IDs of all the nodes keyed by node index.
+
+        :return: the list of node IDs in pre-order.
+        :rtype: list
+        """
+        self._do_build_index()
+
+        return self._lst_node_ids
+
+    def get_subtree_ids(self, nid: Any) -> List[Any]:
+        """Get the IDs of a node and all of its descendants.
+
+        :param nid: the ID of the node at the top of the subtree.
+        :return: the list of node IDs in the subtree, in pre-order.
+        :rtype: list
+        :raise: KeyError if the node isn't in the tree.
+        """
+        _slice = self.get_subtree_slice(nid)
+
+        return self._lst_node_ids[_slice]
+
+    def get_subtree_slice(self, nid: Any) -> slice:
+        """Get the range of node indices in the subtree of a node.
+
+        :param nid: the ID of the node at the top of the subtree.
+        :return: the slice of node indices in the subtree.
+        :rtype: slice
+        :raise: KeyError if the node isn't in the tree.
+        """
+        _index = self.get_index(nid)
+
+        return slice(_index, int(self._ends[_index]))
+
+    def is_ancestor(self, ancestor: Any, grandchild: Any) -> bool:
+        """Check whether a node is an ancestor of another node.
+
+        :param ancestor: the ID of the possible ancestor.
+        :param grandchild: the ID of the possible descendant.
+        :return: True if ancestor is an ancestor of grandchild.
+        :rtype: bool
+        :raise: KeyError if either node isn't in the tree.
+        """
+        _ancestor = self.get_index(ancestor)
+        _grandchild = self.get_index(grandchild)
+
+        return bool(_ancestor < _grandchild < self._ends[_ancestor])
+
+    def link_past_node(self, nid: Any) -> None:
+        """Remove a node and link its children to its parent.
+
+        :param nid: the ID of the node to remove.
+        :return: None
+        :rtype: None
+        """
+        super().link_past_node(nid)
+        self._index_valid = False
+
+    def move_node(self, source: Any, destination: Any) -> None:
+        """Move a node to a new parent.
+
+        :param source: the ID of the node to move.
+        :param destination: the ID of the new parent.
+        :return: None
+        :rtype: None
+        """
+        super().move_node(source, destination)
+        self._index_valid = False
+
+    def paste(self, nid: Any, new_tree: treelib.Tree,
+              deep: bool = False) -> None:
+        """Paste a tree under a node.
+
+        :param nid: the ID of the node to paste new_tree under.
+        :param new_tree: the treelib Tree() to paste.
+        :param deep: whether to deep copy the nodes of new_tree.
+        :return: None
+        :rtype: None
+        """
+        super().paste(nid, new_tree, deep=deep)
+        self._index_valid = False
+
+    def remove_node(self, identifier: Any) -> int:
+        """Remove a node and all of its descendants.
+
+        :param identifier: the ID of the node to remove.
+        :return: the number of nodes removed.
+        :rtype: int
+        """
+        _n_removed = super().remove_node(identifier)
+        self._index_valid = False
+
+        return _n_removed
+
+    def remove_subtree(self, nid: Any, identifier: Optional[str] = None):
+        """Remove a subtree and return it as a new tree.
+
+        :param nid: the ID of the node at the top of the subtree.
+        :param identifier: the ID of the new tree.
+        :return: the removed subtree.
+        :rtype: :class:`ramstk.controllers.tree.RAMSTKTree`
+        """
+        _subtree = super().remove_subtree(nid, identifier=identifier)
+        self._index_valid = False
+
+        return _subtree
+
+    def update_node(self, nid: Any, **attrs: Any) -> None:
+        """Update the attributes of a node.
+
+        :param nid: the ID of the node to update.
+        :return: None
+        :rtype: None
+        """
+        super().update_node(nid, **attrs)
+        self._index_valid = False
+
+    def _do_build_index(self) -> None:
+        """Build the array index of the tree if it is out of date.
+
+        :return: None
+        :rtype: None
+        """
+        if self._index_valid:
+            return
+
+        # Only the nodes that are some node's parent are asked for their
+        # successors because asking a treelib Node() for the successors of a
+        # leaf stores a new, empty list on the leaf.
+        _children: Dict[Any, List[Any]] = {
+            _parent_id: self[_parent_id].successors(self._identifier)
+            for _parent_id in {
+                _node.predecessor(self._identifier)
+                for _node in self.nodes.values()
+            } if _parent_id is not None
+        }
+
+        _node_ids: List[Any] = []
+        _parents: List[int] = []
+        _depths: List[int] = []
+
+        _stack = [] if self.root is None else [(self.root, -1)]
+        while _stack:
+            _node_id, _parent = _stack.pop()
+            _index = len(_node_ids)
+            _node_ids.append(_node_id)
+            _parents.append(_parent)
+            _depths.append(_depths[_parent] + 1 if _parent >= 0 else 0)
+            _stack.extend(
+                (_child_id, _index)
+                for _child_id in reversed(_children.get(_node_id, [])))
+
+        _n_nodes = len(_node_ids)
+        self._parents = np.array(_parents, dtype=np.int32)
+        self._depths = np.array(_depths, dtype=np.int32)
+
+        # Children are listed in pre-order so a stable sort on the parent
+        # index keeps each node's children in the order they were added.
+        self._child_indices = (
+            np.argsort(self._parents[1:], kind='stable') + 1).astype(np.int32)
+        self._child_offsets = np.concatenate([
+            [0],
+            np.cumsum(np.bincount(self._parents[1:], minlength=_n_nodes))
+        ]).astype(np.int32)
+
+        # Walk the nodes backwards so every node's subtree size is complete
+        # before it is added to its parent's.
+        _lst_sizes = [1] * _n_nodes
+        for _index in range(_n_nodes - 1, 0, -1):
+            _lst_sizes[_parents[_index]] += _lst_sizes[_index]
+        _sizes = np.array(_lst_sizes, dtype=np.int32)
+        self._ends = np.arange(_n_nodes, dtype=np.int32) + _sizes
+
+        self._postorder = np.empty(_n_nodes, dtype=np.int32)
+        self._postorder[np.arange(_n_nodes) + _sizes - 1 -
+                        self._depths] = np.arange(_n_nodes)
+
+        self._lst_node_ids = _node_ids
+        self._dic_node_index = {
+            _node_id: _index
+            for _index, _node_id in enumerate(_node_ids)
+        }
+        self._index_valid = True
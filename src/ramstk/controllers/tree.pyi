@@ -0,0 +1,94 @@
+# Standard Library Imports
+from typing import Any, Dict, List, Optional
+
+# Third Party Imports
+import numpy as np
+import treelib
+
+class RAMSTKTree(treelib.Tree):
+    _dic_node_index: Dict[Any, int] = ...
+    _lst_node_ids: List[Any] = ...
+    _child_indices: np.ndarray = ...
+    _child_offsets: np.ndarray = ...
+    _depths: np.ndarray = ...
+    _ends: np.ndarray = ...
+    _index_valid: bool = ...
+    _parents: np.ndarray = ...
+    _postorder: np.ndarray = ...
+
+    def __init__(self,
+                 tree: Optional[treelib.Tree] = ...,
+                 deep: bool = ...,
+                 node_class: Any = ...,
+                 identifier: Optional[str] = ...) -> None:
+        ...
+
+    @property
+    def child_indices(self) -> np.ndarray:
+        ...
+
+    @property
+    def child_offsets(self) -> np.ndarray:
+        ...
+
+    @property
+    def depths(self) -> np.ndarray:
+        ...
+
+    @property
+    def parents(self) -> np.ndarray:
+        ...
+
+    @property
+    def postorder(self) -> np.ndarray:
+        ...
+
+    @property
+    def subtree_ends(self) -> np.ndarray:
+        ...
+
+    def add_node(self, node: treelib.Node, parent: Any = ...) -> None:
+        ...
+
+    def do_roll_up(self, values: Any) -> np.ndarray:
+        ...
+
+    def get_child_ids(self, nid: Any) -> List[Any]:
+        ...
+
+    def get_index(self, nid: Any) -> int:
+        ...
+
+    def get_node_ids(self) -> List[Any]:
+        ...
+
+    def get_subtree_ids(self, nid: Any) -> List[Any]:
+        ...
+
+    def get_subtree_slice(self, nid: Any) -> slice:
+        ...
+
+    def is_ancestor(self, ancestor: Any, grandchild: Any) -> bool:
+        ...
+
+    def link_past_node(self, nid: Any) -> None:
+        ...
+
+    def move_node(self, source: Any, destination: Any) -> None:
+        ...
+
+    def paste(self, nid: Any, new_tree: treelib.Tree,
+              deep: bool = ...) -> None:
+        ...
+
+    def remove_node(self, identifier: Any) -> int:
+        ...
+
+    def remove_subtree(self, nid: Any, identifier: Optional[str] = ...):
+        ...
+
+    def update_node(self, nid: Any, **attrs: Any) -> None:
+        ...
+
+    def _do_build_index(self) -> None:
+        ...
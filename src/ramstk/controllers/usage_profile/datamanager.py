@@ -149,10 +149,7 @@ class DataManager(RAMSTKDataManager):
 
         try:
             self.dao.do_update(self.tree.get_node(node_id).data["usage_profile"])
-            pub.sendMessage(
-                "succeed_update_usage_profile",
-                tree=self.tree,
-            )
+            self._do_notify_updated("succeed_update_usage_profile")
         except AttributeError:
             _error_msg: str = (
                 "{1}: Attempted to save non-existent usage profile ID {" "0}."
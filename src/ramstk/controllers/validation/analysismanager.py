@@ -13,14 +13,16 @@ from datetime import date
 from typing import Any, Dict
 
 # Third Party Imports
-# noinspection PyPackageRequirements
-import pandas as pd
 import treelib
 from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.controllers import RAMSTKAnalysisManager
+from ramstk.utilities import lazy_import
+
+# pandas is slow to import and only needed to build the program status plot.
+pd = lazy_import('pandas')
 
 
 class AnalysisManager(RAMSTKAnalysisManager):
@@ -159,7 +161,9 @@ class AnalysisManager(RAMSTKAnalysisManager):
 
         These values are calculated assuming a beta distribution (typical
         project management assumption).  This method also calculates the
-        remaining average time and cost of the overall validation plan.
+        remaining average time and cost of the overall validation plan.  The
+        results are set in a batch so the data managers announce their
+        changes once.
 
         :return: None
         :rtype: None
@@ -167,18 +171,22 @@ class AnalysisManager(RAMSTKAnalysisManager):
         _program_cost_remaining = 0.0
         _program_time_remaining = 0.0
 
-        _node: treelib.Node
-        for _node in self._tree.all_nodes_itr():
-            # noinspection PyDeepBugsBinOperand
-            if _node.identifier != 0:
-                self._do_calculate_task(_node.identifier)
-
-                _program_cost_remaining += _node.data["validation"].cost_average * (
-                    1.0 - _node.data["validation"].status / 100.0
-                )
-                _program_time_remaining += _node.data["validation"].time_average * (
-                    1.0 - _node.data["validation"].status / 100.0
-                )
+        pub.sendMessage("request_begin_batch")
+        try:
+            _node: treelib.Node
+            for _node in self._tree.all_nodes_itr():
+                # noinspection PyDeepBugsBinOperand
+                if _node.identifier != 0:
+                    self._do_calculate_task(_node.identifier)
+
+                    _program_cost_remaining += _node.data[
+                        "validation"
+                    ].cost_average * (1.0 - _node.data["validation"].status / 100.0)
+                    _program_time_remaining += _node.data[
+                        "validation"
+                    ].time_average * (1.0 - _node.data["validation"].status / 100.0)
+        finally:
+            pub.sendMessage("request_end_batch")
 
         pub.sendMessage(
             "succeed_calculate_all_validation_tasks",
@@ -249,7 +257,7 @@ class AnalysisManager(RAMSTKAnalysisManager):
             "request_get_program_status_tree",
         )
 
-    def _do_select_actual_status(self) -> pd.DataFrame:
+    def _do_select_actual_status(self) -> 'pd.DataFrame':
         """Select the actual program status remaining time and cost.
 
         :return: a pandas DataFrame() containing the actual status update
@@ -268,7 +276,7 @@ class AnalysisManager(RAMSTKAnalysisManager):
             _dic_actual.values(), index=_dic_actual.keys(), columns=["cost", "time"]
         ).sort_index()
 
-    def _do_select_assessment_targets(self) -> pd.DataFrame:
+    def _do_select_assessment_targets(self) -> 'pd.DataFrame':
         """Select the targets for all tasks of Reliability Assessment type.
 
         :return: _assessed; a pandas DataFrame() containing the assessment
@@ -27,6 +27,7 @@ class DataManager(RAMSTKDataManager):
     RAMSKTProgramStatus data models.
     """
 
+    _tables = {'validation': RAMSTKValidation}
     _tag: str = 'validations'
 
     def __init__(self, **kwargs: Dict[Any, Any]) -> None:
@@ -114,10 +115,7 @@ class DataManager(RAMSTKDataManager):
         try:
             self.dao.do_update(self.tree.get_node(node_id).data['validation'])
 
-            pub.sendMessage(
-                'succeed_update_validation',
-                tree=self.tree,
-            )
+            self._do_notify_updated('succeed_update_validation')
         except AttributeError:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
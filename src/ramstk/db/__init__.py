@@ -11,6 +11,9 @@
 from sqlalchemy.ext.declarative import declarative_base
 
 # RAMSTK Local Imports
-from .base import BaseDatabase, do_create_program_db
+from .base import (
+    BaseDatabase, do_configure_pool, do_create_program_db, do_dispose_engines,
+    get_engine, get_pool_statistics
+)
 
 RAMSTK_BASE = declarative_base()
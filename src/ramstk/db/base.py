@@ -8,6 +8,8 @@
 
 # Standard Library Imports
 import sqlite3
+import traceback
+import weakref
 from typing import Any, Dict, List, TextIO, Tuple
 
 # Third Party Imports
@@ -16,16 +18,72 @@ from psycopg2 import sql  # type: ignore
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT  # type: ignore
 from pubsub import pub
 # noinspection PyPackageRequirements
-from sqlalchemy import create_engine, exc
+from sqlalchemy import create_engine, event, exc, inspect
 # noinspection PyPackageRequirements,PyProtectedMember
 from sqlalchemy.engine import Engine  # type: ignore
 # noinspection PyPackageRequirements
-from sqlalchemy.orm import query, scoped_session, sessionmaker  # type: ignore
+from sqlalchemy.engine.url import make_url  # type: ignore
+# noinspection PyPackageRequirements
+from sqlalchemy.orm import (  # type: ignore
+    joinedload, query, scoped_session, sessionmaker
+)
 from sqlalchemy.orm.exc import FlushError  # type: ignore
+# noinspection PyPackageRequirements
+from sqlalchemy.pool import QueuePool  # type: ignore
 
 # RAMSTK Package Imports
 from ramstk.exceptions import DataAccessError
 
+# The PRAGMAs set on every connection to a SQLite program database.  The
+# default profile is SQLite's own defaults.  The performance profile trades a
+# little durability (a power failure may lose the last commit, but never
+# corrupts the database) for much faster commits and reads.  The bulk profile
+# is used while importing and saving the whole program; it doesn't wait for
+# the disk at all.
+SQLITE_PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    'default': {
+        'foreign_keys': 'OFF',
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+    },
+    'performance': {
+        'foreign_keys': 'ON',
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+    },
+    'bulk': {
+        'foreign_keys': 'ON',
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -256000,
+        'mmap_size': 268435456,
+        'temp_store': 'MEMORY',
+    },
+}
+
+# The options of the connection pool of every database engine created after
+# they're changed with do_configure_pool().
+POOL_OPTIONS: Dict[str, Any] = {
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_timeout': 30,
+    'pool_recycle': -1,
+    'pool_pre_ping': True,
+}
+
+# The process-wide engine registry.  Every BaseDatabase connected to the same
+# URL shares one engine and its pool of connections.
+_dic_engines: Dict[str, Engine] = {}
+_dic_pool_counters: Dict[str, Dict[str, int]] = {}
+# The PRAGMA profile each SQLite engine's connections should have.
+_dic_sqlite_profiles: Any = weakref.WeakKeyDictionary()
+
 
 def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None:
     """Create a shiny new, unpopulated RAMSTK program database.
@@ -38,6 +96,10 @@ def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None:
     """
     conn: Any = ''
 
+    # Pooled connections to a database with the same name would keep an old
+    # SQLite file open or stop PostgreSQL dropping the database.
+    do_dispose_engines(database['database'])
+
     if database['dialect'] == 'sqlite':
         conn = sqlite3.connect(database['database'])
         conn.executescript(sql_file.read().strip())
@@ -78,17 +140,212 @@ def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None:
     conn.close()
 
 
+def do_configure_pool(**kwargs: Any) -> None:
+    """Change the connection pool options of new database engines.
+
+    Engines already in the registry keep their pools; dispose of them with
+    do_dispose_engines() to use the new options.
+
+    :return: None
+    :rtype: None
+    :raise: DataAccessError if passed an unknown pool option.
+    """
+    for _option in kwargs:
+        if _option not in POOL_OPTIONS:
+            raise DataAccessError(
+                "Unknown connection pool option {0}; choose from {1}.".format(
+                    _option, ', '.join(POOL_OPTIONS)))
+
+    POOL_OPTIONS.update(kwargs)
+
+
+def do_dispose_engines(database: str = '') -> None:
+    """Close the pooled connections and remove engines from the registry.
+
+    Connections that are checked out are closed when they're returned.
+
+    :param database: the name of the database whose engines are disposed
+        of.  Every engine is disposed of when this is an empty string.
+    :return: None
+    :rtype: None
+    """
+    for _url, _engine in list(_dic_engines.items()):
+        if database in ['', _engine.url.database]:
+            _engine.dispose()
+            del _dic_engines[_url]
+            del _dic_pool_counters[_url]
+
+
 def do_open_session(database: str) -> Tuple[Engine, scoped_session]:
-    """Create a session to be used with an instance of the BaseDatabase."""
-    engine: Any = create_engine(database)
-    # deepcode ignore missing~close~connect: engines are disposed
-    engine.connect()
+    """Create a session to be used with an instance of the BaseDatabase.
+
+    The database is connected to once to make sure it can be.  That
+    connection is returned to the engine's pool for the session to use.
+
+    :param database: the URL of the database to open.
+    :return: (engine, session)
+    :rtype: tuple
+    :raise: sqlalchemy.exc.OperationalError if the database can't be
+        connected to.
+    """
+    engine = get_engine(database)
+    try:
+        with engine.connect():
+            pass
+    except exc.DBAPIError as _error:
+        # SQLAlchemy keeps the error in the locals of the frames that raised
+        # it.  Clear those frames so the reference cycle doesn't keep the
+        # callers' frames, and the managers they hold, alive and subscribed
+        # until the next garbage collection.
+        traceback.clear_frames(_error.__traceback__)
+        do_dispose_engines(engine.url.database or '')
+        raise
 
     return (engine,
             scoped_session(
                 sessionmaker(autocommit=False, autoflush=False, bind=engine)))
 
 
+def do_set_sqlite_pragmas(connection: Any, pragmas: Dict[str, Any]) -> None:
+    """Set PRAGMAs on a SQLite DB-API connection.
+
+    :param connection: the DB-API connection to set the PRAGMAs on.
+    :param pragmas: the PRAGMA values keyed by PRAGMA name.
+    :return: None
+    :rtype: None
+    """
+    _cursor = connection.cursor()
+    for _pragma, _value in pragmas.items():
+        _cursor.execute('PRAGMA {0:s} = {1}'.format(_pragma, _value))
+    _cursor.close()
+
+
+def get_engine(database: str) -> Engine:
+    """Get the engine for a database URL from the registry.
+
+    The engine is created and added to the registry the first time the URL
+    is asked for.  PostgreSQL and SQLite file databases are given a
+    connection pool with the POOL_OPTIONS.  In-memory SQLite databases
+    aren't added to the registry because every engine has its own database.
+
+    :param database: the URL of the database.
+    :return: the database engine.
+    :rtype: :class:`sqlalchemy.engine.Engine`
+    :raise: sqlalchemy.exc.ArgumentError if passed a database URL with an
+        unknown/unsupported SQL dialect.
+    """
+    try:
+        return _dic_engines[database]
+    except KeyError:
+        pass
+
+    _url = make_url(database)
+    _kwargs: Dict[str, Any] = dict(POOL_OPTIONS)
+    _is_sqlite = _url.get_backend_name() == 'sqlite'
+    _is_memory = _is_sqlite and _url.database in [None, '', ':memory:']
+    if _is_memory:
+        _kwargs = {}
+    elif _is_sqlite:
+        # Pooled SQLite connections are used by whichever thread checks them
+        # out.
+        _kwargs['poolclass'] = QueuePool
+        _kwargs['connect_args'] = {'check_same_thread': False}
+
+    _engine: Any = create_engine(database, **_kwargs)
+
+    if _is_sqlite:
+        _dic_sqlite_profiles[_engine] = 'default'
+        event.listen(_engine, 'checkout', _on_checkout_sqlite(_engine))
+
+    if not _is_memory:
+        _counters = {'connects': 0, 'checkouts': 0}
+        event.listen(_engine, 'connect',
+                     lambda *args: _do_count(_counters, 'connects'))
+        event.listen(_engine, 'checkout',
+                     lambda *args: _do_count(_counters, 'checkouts'))
+        _dic_engines[database] = _engine
+        _dic_pool_counters[database] = _counters
+
+    return _engine
+
+
+def get_pool_statistics() -> Dict[str, Dict[str, int]]:
+    """Get the statistics of the connection pool of each registered engine.
+
+    The statistics of each pool are:
+
+        * size - the number of connections the pool keeps open.
+        * checked_in - the number of open connections not in use.
+        * checked_out - the number of connections in use.
+        * overflow - the number of connections open beyond the pool size.
+          This is negative until the pool is full.
+        * connects - the number of connections made to the database.
+        * checkouts - the number of times a connection was taken from the
+          pool.
+
+    :return: the statistics of each pool keyed by the engine's URL with the
+        password hidden.
+    :rtype: dict
+    """
+    _statistics = {}
+    for _url, _engine in _dic_engines.items():
+        _pool: Any = _engine.pool
+        _statistics[repr(_engine.url)] = {
+            'size': _pool.size(),
+            'checked_in': _pool.checkedin(),
+            'checked_out': _pool.checkedout(),
+            'overflow': _pool.overflow(),
+            'connects': _dic_pool_counters[_url]['connects'],
+            'checkouts': _dic_pool_counters[_url]['checkouts'],
+        }
+
+    return _statistics
+
+
+def _do_count(counters: Dict[str, int], counter: str) -> None:
+    """Increment one of an engine's connection pool counters.
+
+    :param counters: the engine's counters.
+    :param counter: the name of the counter to increment.
+    :return: None
+    :rtype: None
+    """
+    counters[counter] += 1
+
+
+def _on_checkout_sqlite(engine: Engine) -> Any:
+    """Create the checkout event handler of a SQLite engine.
+
+    Pooled connections outlive the BaseDatabase that opened them so the
+    engine's current PRAGMA profile is set on each connection as it's checked
+    out if the connection doesn't already have it.
+
+    :param engine: the SQLite engine.
+    :return: the checkout event handler.
+    :rtype: callable
+    """
+    _engine = weakref.ref(engine)
+
+    def _do_set_profile(dbapi_connection: Any, connection_record: Any,
+                        connection_proxy: Any) -> None:
+        """Set the engine's PRAGMA profile on a connection being checked out.
+
+        :param dbapi_connection: the DB-API connection.
+        :param connection_record: the pool's record of the connection.
+        :param connection_proxy: the connection being checked out.
+        :return: None
+        :rtype: None
+        """
+        # pylint: disable=unused-argument
+        _profile = _dic_sqlite_profiles.get(_engine(), 'default')
+        if connection_record.info.get('sqlite_profile') != _profile:
+            do_set_sqlite_pragmas(dbapi_connection,
+                                  SQLITE_PRAGMA_PROFILES[_profile])
+            connection_record.info['sqlite_profile'] = _profile
+
+    return _do_set_profile
+
+
 # noinspection PyUnresolvedReferences
 class BaseDatabase:
     """The BaseDatabase class."""
@@ -121,6 +378,9 @@ class BaseDatabase:
         # Initialize private list instance attributes.
 
         # Initialize private scalar instance attributes.
+        self._rollback_only: bool = False
+        self._sqlite_profile: str = 'default'
+        self._transaction_depth: int = 0
 
         # Initialize public dictionary instance attributes.
 
@@ -128,9 +388,109 @@ class BaseDatabase:
 
         # Initialize public scalar instance attributes.
 
+    def do_begin_transaction(self) -> None:
+        """Begin a unit of work spanning many inserts, updates, and deletes.
+
+        Until the unit of work is committed, do_update() only adds records to
+        the session and do_insert() and do_delete() flush rather than commit
+        their changes.  Units of work may be nested; only the commit of the
+        outermost unit of work commits the changes to the database.
+
+        Every unit of work must be ended by exactly one call to either
+        do_commit_transaction() or do_rollback_transaction().
+
+        :return: None
+        :rtype: None
+        """
+        self._transaction_depth += 1
+
+    def do_commit_transaction(self) -> bool:
+        """Commit the current unit of work.
+
+        The unit of work is ended even if the commit raises an error.
+
+        :return: True if the changes were written to the database or False
+            if the unit of work is nested in another and its changes wait for
+            the outermost unit of work to be committed.
+        :rtype: bool
+        :raise: DataAccessError if the database rejects any of the changes
+            made in the unit of work or if any change was rolled back while
+            the unit of work was open.  All the changes are rolled back.
+        """
+        self._transaction_depth = max(self._transaction_depth - 1, 0)
+
+        if self._transaction_depth > 0:
+            return False
+
+        if self._rollback_only:
+            self._rollback_only = False
+            self.session.rollback()
+            raise DataAccessError(
+                "The unit of work could not be committed because the "
+                "database rejected one of its changes.  None of the changes "
+                "were saved.")
+
+        self.do_update()
+
+        return True
+
+    def do_bulk_insert(self,
+                       table: Any,
+                       records: List[Dict[str, Any]],
+                       offset: int = 0) -> None:
+        """Add rows to a database table with a single Core INSERT.
+
+        Unlike do_insert_many(), no ORM objects are created.  The rows are
+        sent to the database with one executemany() call, so this is the
+        fastest way to add large numbers of records.
+
+        :param table: the RAMSTK data table class to add the rows to.
+        :param records: the list of dicts to insert.  The keys are the
+            table's attribute names and every dict must have the same keys.
+        :keyword offset: the number of rows that came before these records
+            when they are one chunk of a larger set of rows.  It's only used
+            to number the rejected row in the error message.
+        :return: None
+        :rtype: None
+        :raise: DataAccessError if the database rejects any row.  None of
+            the rows will be added and the error message will identify the
+            first row that was rejected.
+        """
+        if not records:
+            return
+
+        # The table's Core columns are named for the database fields, not the
+        # attributes, so translate the keys before inserting.
+        _columns = inspect(table).columns
+        _keys = {
+            _attribute: _columns[_attribute].key
+            for _attribute in records[0]
+        }
+        _rows = [{_keys[_key]: _value
+                  for _key, _value in _record.items()}
+                 for _record in records]
+
+        try:
+            self.session.execute(table.__table__.insert(), _rows)
+            if self._transaction_depth == 0:
+                self.session.commit()
+        except (exc.IntegrityError, exc.StatementError) as _error:
+            self._do_rollback()
+            _index = self._do_find_failed_insert(_rows, table=table)
+            _error_message = (
+                "do_bulk_insert: Database error when attempting to add row "
+                "{0} to {1}.  Database returned:\n\t{2:s}".format(
+                    offset + _index + 1, table.__tablename__,
+                    str(_error.orig)))
+            raise DataAccessError(_error_message) from _error
+
     def do_connect(self, database: Dict) -> None:
         """Connect to the database.
 
+        SQLite databases may be passed the name of the PRAGMA profile to
+        connect with in the sqlite_profile key; the default profile is used
+        if there's no sqlite_profile key.
+
         :param database: the connection information for the database to
             connect to.
         :return: None
@@ -139,6 +499,7 @@ class BaseDatabase:
             URL.
         :raise: sqlalchemy.exc.ArgumentError if passed a database URL with
             an unknown/unsupported SQL dialect.
+        :raise: DataAccessError if passed an unknown SQLite PRAGMA profile.
         """
         self.cxnargs['dialect'] = database['dialect']
         self.cxnargs['user'] = database['user']
@@ -164,6 +525,12 @@ class BaseDatabase:
             raise DataAccessError('Unknown dialect or non-string value in '
                                   'database connection dict.') from _error
 
+        if self.cxnargs['dialect'] == 'sqlite':
+            self._sqlite_profile = self._get_sqlite_profile(
+                database.get('sqlite_profile', 'default'))
+            _dic_sqlite_profiles[get_engine(
+                self.database)] = self._sqlite_profile
+
         if self.database != '':
             self.engine, self.session = do_open_session(self.database)
 
@@ -177,14 +544,17 @@ class BaseDatabase:
         """
         try:
             self.session.delete(item)
-            self.session.commit()
+            if self._transaction_depth > 0:
+                self.session.flush()
+            else:
+                self.session.commit()
         except exc.InvalidRequestError as _error:
             # This exception generally corresponds to runtime state errors.
             # These types of errors are unlikely to be user errors and will
             # most likely be the result of a corrupted database.  Some
             # situations that can raise this exception are:
             #   1. Attempting to delete a record from a non-existent table.
-            self.session.rollback()
+            self._do_rollback()
             _error_message = (
                 "There was an database error when attempting to delete a "
                 "record.  Error returned from database was:\n\t{0:s}.".format(
@@ -198,7 +568,7 @@ class BaseDatabase:
             # a corrupted database.  Some situations that can raise this
             # exception are:
             #   1. Foreign key exists, but foreign table does not.
-            self.session.rollback()
+            self._do_rollback()
             _error_message = (
                 "There was an database error when attempting to delete a "
                 "record.  Error returned from database was:\n\t{0:s}.".format(
@@ -209,14 +579,18 @@ class BaseDatabase:
     def do_disconnect(self) -> None:
         """Close the current session.
 
+        The session's connection is returned to the engine's pool so the
+        next connection to the database doesn't have to reconnect.
+
         :return: None
         :rtype: None
         """
         self.session.close()
-        self.engine.dispose()
         # noinspection PyTypeChecker
         self.session = None  # type: ignore
         self.database = ''
+        self._rollback_only = False
+        self._transaction_depth = 0
 
     def do_insert(self, record: object) -> None:
         """Add a new record to a database table.
@@ -227,7 +601,10 @@ class BaseDatabase:
         """
         try:
             self.session.add(record)
-            self.session.commit()
+            if self._transaction_depth > 0:
+                self.session.flush()
+            else:
+                self.session.commit()
         except (exc.IntegrityError, exc.StatementError) as _error:
             # This exception is raised when there is an error during
             # execution of a SQL statement.  These types of errors are
@@ -245,7 +622,7 @@ class BaseDatabase:
             # database.  These should be used to generate the error message
             # to send to the client.  Error codes are defined in the
             # errorcodes.py file in the psycopg2 code base.
-            self.session.rollback()
+            self._do_rollback()
             print(_error.orig.pgerror)
             _error_message = (
                 "do_insert: Database error when attempting to add a record.  "
@@ -257,7 +634,7 @@ class BaseDatabase:
             )
             raise DataAccessError(_error_message) from _error
         except FlushError as _error:
-            self.session.rollback()
+            self._do_rollback()
             _error_message = (
                 "do_insert: Flush error when attempting to add records.  "
                 "Database returned:\n\t{0:s}".format(str(_error)))
@@ -267,19 +644,64 @@ class BaseDatabase:
             )
             raise DataAccessError(_error_message) from _error
 
-    def do_insert_many(self, records: List[object]) -> None:
-        """Add a group of new records to a database table.
+    def do_insert_many(self,
+                       records: List[object],
+                       return_defaults: bool = False) -> None:
+        """Add a group of new records to the RAMSTK database.
 
-        :param list records: the list of objects to add to the RAMSTK database.
+        The records are written in a single transaction using bulk INSERT
+        statements.  Consecutive records for the same table are sent to the
+        database together so group records by table to get the most benefit.
+
+        The records are not added to the session, so use do_insert() for
+        records that will be updated after they are inserted.
+
+        :param records: the list of objects to add to the RAMSTK database.
+        :keyword return_defaults: whether to set the primary key and other
+            server generated values on each record after it is inserted.  This
+            requires a RETURNING clause or a query for each record so only use
+            it when the generated values are needed.
         :return: None
         :rtype: None
+        :raise: DataAccessError if the database rejects any record.  None of
+            the records will be added and the error message will identify the
+            first record that was rejected.
         """
-        for _record in records:
-            self.do_insert(_record)
+        try:
+            self.session.bulk_save_objects(records,
+                                           return_defaults=return_defaults)
+            if self._transaction_depth == 0:
+                self.session.commit()
+        except (exc.IntegrityError, exc.StatementError) as _error:
+            self._do_rollback()
+            _index = self._do_find_failed_insert(records)
+            _error_message = (
+                "do_insert_many: Database error when attempting to add record "
+                "{0} of {1} ({2}).  Database returned:\n\t{3:s}".format(
+                    _index + 1, len(records),
+                    type(records[_index]).__name__, str(_error.orig)))
+            raise DataAccessError(_error_message) from _error
+
+    def do_rollback_transaction(self) -> None:
+        """Discard the uncommitted changes and end the current unit of work.
+
+        The database can't roll back part of a transaction, so the changes
+        made in any outer units of work are discarded too.  The commit of the
+        outer unit of work will raise an error.
+
+        :return: None
+        :rtype: None
+        """
+        self._transaction_depth = max(self._transaction_depth - 1, 0)
+        self._do_rollback()
 
     def do_select_all(self, table, **kwargs) -> query.Query:
         """Select all records from the RAMSTK database for table.
 
+        Passing a list of relationship names with the eager keyword will load
+        the related records in the same query as the selected records rather
+        than issuing a query for each related record when it is accessed.
+
         :param table: the database table object to select all from.
         :return: a list of table instances; one for each record.
         """
@@ -287,6 +709,7 @@ class BaseDatabase:
         _values: List[Any] = kwargs.get('value', None)
         _order: Any = kwargs.get('order', None)
         _all: bool = kwargs.get('_all', True)
+        _eager: List[str] = kwargs.get('eager', [])
 
         _filters = {}
         if _keys is not None:
@@ -294,6 +717,9 @@ class BaseDatabase:
                 _filters[_key] = _values[_idx]
 
         _results = self.session.query(table).filter_by(**_filters)
+        if _eager:
+            _results = _results.options(
+                *[joinedload(getattr(table, _name)) for _name in _eager])
         if isinstance(_order, list):
             _results = _results.order_by(*_order)
         else:
@@ -306,9 +732,63 @@ class BaseDatabase:
 
         return _results
 
+    def do_set_sqlite_profile(self, profile: str) -> str:
+        """Change the PRAGMA profile of the connected SQLite database.
+
+        The new profile is set on the session's current connection and on
+        every connection checked out of the engine's pool afterwards.  The
+        journal mode can't be changed while the session's connection is open
+        so it's only changed on the other connections.  Nothing is changed if
+        the database isn't SQLite or is already using the profile.
+
+        SQLite won't change the synchronous PRAGMA inside a transaction so
+        the profile must be changed before a unit of work begins.
+
+        :param profile: the name of the PRAGMA profile to change to.
+        :return: the name of the profile that was in use so the caller can
+            change back to it.
+        :rtype: str
+        :raise: DataAccessError if passed an unknown PRAGMA profile or called
+            inside a unit of work or transaction.
+        """
+        _previous = self._sqlite_profile
+        _profile = self._get_sqlite_profile(profile)
+
+        # The connection arguments are shared by every BaseDatabase so ask
+        # this instance's engine which dialect it's connected with.
+        if (_profile != _previous and self.session is not None
+                and self.engine.dialect.name == 'sqlite'):
+            _connection = self.session.connection().connection
+            if self._transaction_depth > 0 or _connection.in_transaction:
+                raise DataAccessError(
+                    "The SQLite PRAGMA profile can't be changed to {0} "
+                    "inside a unit of work or transaction.".format(_profile))
+
+            _dic_sqlite_profiles[self.engine] = _profile
+
+            _old = SQLITE_PRAGMA_PROFILES[_previous]
+            _new = SQLITE_PRAGMA_PROFILES[_profile]
+            do_set_sqlite_pragmas(
+                _connection, {
+                    _pragma: _value
+                    for _pragma, _value in _new.items()
+                    if _pragma != 'journal_mode'
+                })
+            # Leave the connection to get the new journal mode the next time
+            # it's checked out.
+            if _old['journal_mode'] == _new['journal_mode']:
+                _connection.info['sqlite_profile'] = _profile
+
+        self._sqlite_profile = _profile
+
+        return _previous
+
     def do_update(self, record: object = None) -> None:
         """Update the RAMSTK database with any pending changes.
 
+        When called inside a unit of work, the record is only added to the
+        session.  The changes are written when the unit of work is committed.
+
         :keyword record: the record to update in the database.
         :return: None
         :rtype: None
@@ -316,11 +796,14 @@ class BaseDatabase:
         if record is not None:
             self.session.add(record)
 
+        if self._transaction_depth > 0:
+            return
+
         try:
             self.session.commit()
         except (exc.IntegrityError, exc.InvalidRequestError,
                 exc.ProgrammingError) as _error:
-            self.session.rollback()
+            self._do_rollback()
             _error_message = (
                 "There was an database error when attempting to update a "
                 "record.  Faulty SQL statement was:\n\t{0:s}.\nParameters "
@@ -352,14 +835,13 @@ class BaseDatabase:
                               + database['password'] + '@' + database['host']
                               + ':' + database['port'] + '/'
                               + database['database'])
-            # pylint: disable=unused-variable
-            __, _session = do_open_session(_database)
-
             # Make list of available databases, but only those associated with
-            # RAMSTK.
-            for db in _session.execute(_query):
-                if db[0] not in ['postgres', 'template0', 'template1']:
-                    _databases.append(db[0])
+            # RAMSTK.  The connection is returned to the administrative
+            # database's pool so refreshing the list doesn't reconnect.
+            with get_engine(_database).connect() as _connection:
+                for db in _connection.execute(_query):
+                    if db[0] not in ['postgres', 'template0', 'template1']:
+                        _databases.append(db[0])
 
         return _databases
 
@@ -391,3 +873,61 @@ class BaseDatabase:
             _last_id = 0
 
         return _last_id
+
+    def _do_find_failed_insert(self, records: List[Any],
+                               table: Any = None) -> int:
+        """Find the first record in a failed bulk insert.
+
+        The records are inserted one at a time in a transaction that is
+        always rolled back.  This is only used to build the error message
+        when a bulk insert fails.
+
+        :param records: the list of objects or dicts that failed to insert.
+        :keyword table: the RAMSTK data table class the dicts were being
+            inserted into.  Leave None when records is a list of objects.
+        :return: the index of the first record the database rejects.
+        :rtype: int
+        """
+        _index = 0
+        try:
+            for _index, _record in enumerate(records):
+                if table is None:
+                    self.session.bulk_save_objects([_record])
+                else:
+                    self.session.execute(table.__table__.insert(), [_record])
+        except (exc.IntegrityError, exc.StatementError):
+            pass
+        finally:
+            self.session.rollback()
+
+        return _index
+
+    def _do_rollback(self) -> None:
+        """Discard all the uncommitted changes.
+
+        This is used when the database rejects a change.  Any unit of work
+        that is open is left open, but its commit will raise an error.
+        Nothing is rolled back if there's no connected database.
+
+        :return: None
+        :rtype: None
+        """
+        self._rollback_only = self._transaction_depth > 0
+        if self.session is not None:
+            self.session.rollback()
+
+    @staticmethod
+    def _get_sqlite_profile(profile: str) -> str:
+        """Check the name of a SQLite PRAGMA profile.
+
+        :param profile: the name of the PRAGMA profile.
+        :return: the name of the PRAGMA profile.
+        :rtype: str
+        :raise: DataAccessError if passed an unknown PRAGMA profile.
+        """
+        if profile not in SQLITE_PRAGMA_PROFILES:
+            raise DataAccessError(
+                "Unknown SQLite PRAGMA profile {0}; choose from {1}.".format(
+                    profile, ', '.join(SQLITE_PRAGMA_PROFILES)))
+
+        return profile
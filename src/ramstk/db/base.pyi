@@ -9,14 +9,48 @@ from sqlalchemy.orm import scoped_session
 # RAMSTK Package Imports
 from ramstk.exceptions import DataAccessError as DataAccessError
 
+SQLITE_PRAGMA_PROFILES: Dict[str, Dict[str, Any]]
+POOL_OPTIONS: Dict[str, Any]
+_dic_engines: Dict[str, Engine]
+_dic_pool_counters: Dict[str, Dict[str, int]]
+_dic_sqlite_profiles: Any
+
 def do_create_program_db(database: Dict[str, str], sql_file: TextIO) -> None:
     ...
 
 
+def do_configure_pool(**kwargs: Any) -> None:
+    ...
+
+
+def do_dispose_engines(database: str = ...) -> None:
+    ...
+
+
 def do_open_session(database: str) -> Tuple[Engine, scoped_session]:
     ...
 
 
+def do_set_sqlite_pragmas(connection: Any, pragmas: Dict[str, Any]) -> None:
+    ...
+
+
+def get_engine(database: str) -> Engine:
+    ...
+
+
+def get_pool_statistics() -> Dict[str, Dict[str, int]]:
+    ...
+
+
+def _do_count(counters: Dict[str, int], counter: str) -> None:
+    ...
+
+
+def _on_checkout_sqlite(engine: Engine) -> Any:
+    ...
+
+
 class BaseDatabase:
     cxnargs: Dict[str, str] = ...
     engine: Engine = ...
@@ -25,6 +59,20 @@ class BaseDatabase:
     sqlstatements: Dict[str, str] = ...
 
     def __init__(self) -> None:
+        self._rollback_only: bool = ...
+        self._sqlite_profile: str = ...
+        self._transaction_depth: int = ...
+
+    def do_begin_transaction(self) -> None:
+        ...
+
+    def do_commit_transaction(self) -> bool:
+        ...
+
+    def do_bulk_insert(self,
+                       table: Any,
+                       records: List[Dict[str, Any]],
+                       offset: int = ...) -> None:
         ...
 
     def do_connect(self, database: Dict) -> None:
@@ -39,12 +87,20 @@ class BaseDatabase:
     def do_insert(self, record: object) -> None:
         ...
 
-    def do_insert_many(self, records: List[object]) -> None:
+    def do_insert_many(self,
+                       records: List[object],
+                       return_defaults: bool = ...) -> None:
+        ...
+
+    def do_rollback_transaction(self) -> None:
         ...
 
     def do_select_all(self, table: Any, **kwargs: Any) -> query.Query:
         ...
 
+    def do_set_sqlite_profile(self, profile: str) -> str:
+        ...
+
     def do_update(self, record: object = ...) -> None:
         ...
 
@@ -53,3 +109,14 @@ class BaseDatabase:
 
     def get_last_id(self, table: str, id_column: str) -> Any:
         ...
+
+    def _do_find_failed_insert(self, records: List[Any],
+                               table: Any = ...) -> int:
+        ...
+
+    def _do_rollback(self) -> None:
+        ...
+
+    @staticmethod
+    def _get_sqlite_profile(profile: str) -> str:
+        ...
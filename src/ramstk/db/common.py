@@ -9,13 +9,14 @@
 
 # Standard Library Imports
 import gettext
+import json
 import os
 from datetime import date, datetime, timedelta
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third Party Imports
 from pubsub import pub
-from sqlalchemy import exc
+from sqlalchemy import exc, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import scoped_session
 
@@ -711,6 +712,31 @@ RAMSTK_TYPES: Dict[int, Tuple[str, str, str]] = {
     41: ('WCA', 'System Engineering, Worst Case Analysis', 'validation')
 }
 
+# The RAMSTKUserConfiguration variables loaded from the site database.  These
+# are the variables saved in the site variables cache.
+SITE_VARIABLES = [
+    'RAMSTK_ACTION_CATEGORY', 'RAMSTK_ACTION_STATUS',
+    'RAMSTK_AFFINITY_GROUPS', 'RAMSTK_CATEGORIES', 'RAMSTK_DAMAGE_MODELS',
+    'RAMSTK_DETECTION_METHODS', 'RAMSTK_FAILURE_MODES', 'RAMSTK_HAZARDS',
+    'RAMSTK_INCIDENT_CATEGORY', 'RAMSTK_INCIDENT_STATUS',
+    'RAMSTK_INCIDENT_TYPE', 'RAMSTK_LOAD_HISTORY', 'RAMSTK_MANUFACTURERS',
+    'RAMSTK_MEASURABLE_PARAMETERS', 'RAMSTK_MEASUREMENT_UNITS',
+    'RAMSTK_REQUIREMENT_TYPE', 'RAMSTK_RPN_DETECTION',
+    'RAMSTK_RPN_OCCURRENCE', 'RAMSTK_RPN_SEVERITY', 'RAMSTK_SEVERITY',
+    'RAMSTK_STAKEHOLDERS', 'RAMSTK_STRESS_LIMITS', 'RAMSTK_SUBCATEGORIES',
+    'RAMSTK_USERS', 'RAMSTK_VALIDATION_TYPE', 'RAMSTK_WORKGROUPS'
+]
+# Bump this whenever the structure of the cached variables changes.
+SITE_VARIABLES_CACHE_VERSION = 2
+# The site database tables the site variables are loaded from.  The
+# fingerprint of a PostgreSQL site database is a checksum of these tables.
+SITE_VARIABLES_TABLES = [
+    RAMSTKCategory, RAMSTKFailureMode, RAMSTKGroup, RAMSTKHazards,
+    RAMSTKLoadHistory, RAMSTKManufacturer, RAMSTKMeasurement, RAMSTKMethod,
+    RAMSTKModel, RAMSTKRPN, RAMSTKStakeholders, RAMSTKStatus,
+    RAMSTKSubCategory, RAMSTKType, RAMSTKUser
+]
+
 
 def _load_fmea_tables(session: scoped_session) -> None:
     """Load RAMSTKFailureMode and RAMSTKRPN."""
@@ -997,20 +1023,87 @@ def do_make_commondb_tables(engine: Engine) -> None:
     RAMSTKUser.__table__.create(bind=engine)
 
 
+def _do_decode_cache_value(value: Any) -> Any:
+    """Convert a value read from the site variables cache to its variable.
+
+    :param value: the value as written by _do_encode_cache_value().
+    :return: the value with its dicts and tuples restored.
+    :raise: KeyError, TypeError, or ValueError if the value wasn't written
+        by _do_encode_cache_value().
+    """
+    if isinstance(value, list):
+        return [_do_decode_cache_value(_item) for _item in value]
+    if isinstance(value, dict):
+        if 'tuple' in value:
+            return tuple(
+                _do_decode_cache_value(_item) for _item in value['tuple'])
+        return {
+            _do_decode_cache_value(_key): _do_decode_cache_value(_item)
+            for _key, _item in value['dict']
+        }
+
+    return value
+
+
+def _do_encode_cache_value(value: Any) -> Any:
+    """Convert a site variable value to one that can be written as JSON.
+
+    JSON has no tuples and only has string keys.  Dicts are written as a
+    list of key, value pairs and tuples as a list, each tagged with their
+    type, so the variables are read back exactly as they were written.
+
+    :param value: the site variable value to convert.
+    :return: the value with its dicts and tuples tagged.
+    """
+    if isinstance(value, list):
+        return [_do_encode_cache_value(_item) for _item in value]
+    if isinstance(value, tuple):
+        return {'tuple': [_do_encode_cache_value(_item) for _item in value]}
+    if isinstance(value, dict):
+        return {
+            'dict': [[
+                _do_encode_cache_value(_key),
+                _do_encode_cache_value(_item)
+            ] for _key, _item in value.items()]
+        }
+
+    return value
+
+
+def _do_filter_records(records: List[Any], column: str,
+                       value: Any) -> List[Any]:
+    """Filter a list of site database records on the value of a column.
+
+    :param records: the list of records to filter.
+    :param column: the name of the column to filter on.
+    :param value: the value of the column to keep.
+    :return: the records whose column is equal to value.
+    :rtype: list
+    """
+    return [
+        _record for _record in records if getattr(_record, column) == value
+    ]
+
+
 def _do_load_action_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load the RAMSTK_ACTION_CATEGORY variable.
 
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKCategory).filter(
-            RAMSTKCategory.category_type == 'action').all():
+    records = _do_select_records(site_db, [RAMSTKCategory, RAMSTKStatus],
+                                 records)
+
+    for _record in _do_filter_records(records[RAMSTKCategory],
+                                      'category_type', 'action'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_ACTION_CATEGORY[_record.category_id] = (
             _attributes['name'],
@@ -1018,8 +1111,8 @@ def _do_load_action_variables(
             _attributes['category_type'],
             _attributes['value'],
         )
-    for _record in site_db.session.query(RAMSTKStatus).\
-            filter(RAMSTKStatus.status_type == 'action').all():
+    for _record in _do_filter_records(records[RAMSTKStatus], 'status_type',
+                                      'action'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_ACTION_STATUS[_record.status_id] = (
             _attributes['name'],
@@ -1030,19 +1123,40 @@ def _do_load_action_variables(
 
 def _do_load_hardware_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load variables associated with hardware categories and failure modes.
 
+    The categories, subcategories, and failure modes are each selected with a
+    single query and grouped in memory.
+
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKCategory).\
-            filter(RAMSTKCategory.category_type == 'hardware').all():
-
+    records = _do_select_records(
+        site_db, [RAMSTKCategory, RAMSTKSubCategory, RAMSTKFailureMode],
+        records)
+
+    _subcategories: Dict[int, List[Any]] = {}
+    for _subcat in records[RAMSTKSubCategory]:
+        _subcategories.setdefault(_subcat.category_id, []).append(_subcat)
+
+    _modes: Dict[Tuple[int, int], Dict[int, List[Any]]] = {}
+    for _mode in records[RAMSTKFailureMode]:
+        _modes.setdefault((_mode.category_id, _mode.subcategory_id),
+                          {})[_mode.mode_id] = [
+                              _mode.description,
+                              _mode.mode_ratio,
+                              _mode.source,
+                          ]
+
+    for _record in _do_filter_records(records[RAMSTKCategory],
+                                      'category_type', 'hardware'):
         _subcats = {}
         user_configuration.RAMSTK_FAILURE_MODES[_record.category_id] = {}
         user_configuration.RAMSTK_STRESS_LIMITS[_record.category_id] = (
@@ -1051,26 +1165,12 @@ def _do_load_hardware_variables(
             _record.harsh_vr_limit, _record.mild_vr_limit,
             _record.harsh_deltat_limit, _record.mild_deltat_limit,
             _record.harsh_maxt_limit, _record.mild_maxt_limit)
-        for _subcat in site_db.session.query(RAMSTKSubCategory).\
-                filter(RAMSTKSubCategory.category_id == _record.category_id).\
-                all():
+        for _subcat in _subcategories.get(_record.category_id, []):
             _subcats[_subcat.subcategory_id] = _subcat.description
 
-            _modes = {}
-            user_configuration.RAMSTK_FAILURE_MODES[_record.category_id][
-                _subcat.subcategory_id] = {}
-            for _mode in site_db.session.query(RAMSTKFailureMode).filter(
-                    RAMSTKFailureMode.category_id == _record.category_id
-            ).filter(RAMSTKFailureMode.subcategory_id ==
-                     _subcat.subcategory_id).all():
-                _modes[_mode.mode_id] = [
-                    _mode.description,
-                    _mode.mode_ratio,
-                    _mode.source,
-                ]
-
             user_configuration.RAMSTK_FAILURE_MODES[_record.category_id][
-                _subcat.subcategory_id] = _modes
+                _subcat.subcategory_id] = _modes.get(
+                    (_record.category_id, _subcat.subcategory_id), {})
 
         user_configuration.RAMSTK_CATEGORIES[
             _record.category_id] = _record.description
@@ -1079,18 +1179,24 @@ def _do_load_hardware_variables(
 
 def _do_load_incident_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load the RAMSTK_INCIDENT_CATEGORY variable.
 
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKCategory).\
-            filter(RAMSTKCategory.category_type == 'incident').all():
+    records = _do_select_records(site_db,
+                                 [RAMSTKCategory, RAMSTKStatus, RAMSTKType],
+                                 records)
+
+    for _record in _do_filter_records(records[RAMSTKCategory],
+                                      'category_type', 'incident'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_INCIDENT_CATEGORY[_record.category_id] = (
             _attributes['name'],
@@ -1098,16 +1204,16 @@ def _do_load_incident_variables(
             _attributes['category_type'],
             _attributes['value'],
         )
-    for _record in site_db.session.query(RAMSTKStatus).\
-            filter(RAMSTKStatus.status_type == 'incident').all():
+    for _record in _do_filter_records(records[RAMSTKStatus], 'status_type',
+                                      'incident'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_INCIDENT_STATUS[_record.status_id] = (
             _attributes['name'],
             _attributes['description'],
             _attributes['status_type'],
         )
-    for _record in site_db.session.query(RAMSTKType).\
-            filter(RAMSTKType.type_type == 'incident').all():
+    for _record in _do_filter_records(records[RAMSTKType], 'type_type',
+                                      'incident'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_INCIDENT_TYPE[_record.type_id] = (
             _attributes['code'],
@@ -1118,41 +1224,48 @@ def _do_load_incident_variables(
 
 def _do_load_miscellaneous_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load miscellaneous variables that don't fit in another grouping.
 
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKMethod).\
-            filter(RAMSTKMethod.method_type == 'detection').all():
+    records = _do_select_records(site_db, [
+        RAMSTKHazards, RAMSTKManufacturer, RAMSTKMeasurement, RAMSTKMethod,
+        RAMSTKType
+    ], records)
+
+    for _record in _do_filter_records(records[RAMSTKMethod], 'method_type',
+                                      'detection'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_DETECTION_METHODS[_record.method_id] = (
             _attributes['name'],
             _attributes['description'],
             _attributes['method_type'],
         )
-    for _record in site_db.session.query(RAMSTKHazards).all():
+    for _record in records[RAMSTKHazards]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_HAZARDS[_record.hazard_id] = (
             _attributes['hazard_category'], _attributes['hazard_subcategory'])
-    for _record in site_db.session.query(RAMSTKManufacturer).all():
+    for _record in records[RAMSTKManufacturer]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_MANUFACTURERS[_record.manufacturer_id] = (
             _attributes['description'], _attributes['location'],
             _attributes['cage_code'])
-    for _record in site_db.session.query(RAMSTKMeasurement).\
-            filter(RAMSTKMeasurement.measurement_type == 'unit').all():
+    for _record in _do_filter_records(records[RAMSTKMeasurement],
+                                      'measurement_type', 'unit'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_MEASUREMENT_UNITS[_record.measurement_id] = (
             _attributes['code'], _attributes['description'],
             _attributes['measurement_type'])
-    for _record in site_db.session.query(RAMSTKType).\
-            filter(RAMSTKType.type_type == 'validation').all():
+    for _record in _do_filter_records(records[RAMSTKType], 'type_type',
+                                      'validation'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_VALIDATION_TYPE[_record.type_id] = (
             _attributes['code'], _attributes['description'],
@@ -1161,27 +1274,32 @@ def _do_load_miscellaneous_variables(
 
 def _do_load_pof_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load the RAMSTK_DAMAGE_MODELS variable.
 
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKModel). \
-            filter(RAMSTKModel.model_type == 'damage').all():
+    records = _do_select_records(
+        site_db, [RAMSTKLoadHistory, RAMSTKMeasurement, RAMSTKModel], records)
+
+    for _record in _do_filter_records(records[RAMSTKModel], 'model_type',
+                                      'damage'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_DAMAGE_MODELS[_record.model_id] = (
             _attributes['description'])
-    for _record in site_db.session.query(RAMSTKLoadHistory).all():
+    for _record in records[RAMSTKLoadHistory]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_LOAD_HISTORY[_record.history_id] = (
             _attributes['description'])
-    for _record in site_db.session.query(RAMSTKMeasurement). \
-            filter(RAMSTKMeasurement.measurement_type == 'damage').all():
+    for _record in _do_filter_records(records[RAMSTKMeasurement],
+                                      'measurement_type', 'damage'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_MEASURABLE_PARAMETERS[
             _record.measurement_id] = (_attributes['code'],
@@ -1191,30 +1309,35 @@ def _do_load_pof_variables(
 
 def _do_load_requirement_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load variables related to requiremetents and stakeholders.
 
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKGroup).\
-            filter(RAMSTKGroup.group_type == 'affinity').all():
+    records = _do_select_records(
+        site_db, [RAMSTKGroup, RAMSTKStakeholders, RAMSTKType], records)
+
+    for _record in _do_filter_records(records[RAMSTKGroup], 'group_type',
+                                      'affinity'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_AFFINITY_GROUPS[_record.group_id] = (
             _attributes['description'],
             _attributes['group_type'],
         )
-    for _record in site_db.session.query(RAMSTKType).\
-            filter(RAMSTKType.type_type == 'requirement').all():
+    for _record in _do_filter_records(records[RAMSTKType], 'type_type',
+                                      'requirement'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_REQUIREMENT_TYPE[_record.type_id] = (
             _attributes['code'], _attributes['description'],
             _attributes['type_type'])
-    for _record in site_db.session.query(RAMSTKStakeholders).all():
+    for _record in records[RAMSTKStakeholders]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_STAKEHOLDERS[_record.stakeholders_id] = (
             _attributes['stakeholder'])
@@ -1222,45 +1345,54 @@ def _do_load_requirement_variables(
 
 def _do_load_rpn_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load the RPN detection, occurremce, and severity variables.
 
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKRPN).\
-            filter(RAMSTKRPN.rpn_type == 'detection').all():
+    records = _do_select_records(site_db, [RAMSTKRPN], records)
+
+    for _record in _do_filter_records(records[RAMSTKRPN], 'rpn_type',
+                                      'detection'):
         user_configuration.RAMSTK_RPN_DETECTION[_record.value] = \
             _record.get_attributes()
 
-    for _record in site_db.session.query(RAMSTKRPN).\
-            filter(RAMSTKRPN.rpn_type == 'occurrence').all():
+    for _record in _do_filter_records(records[RAMSTKRPN], 'rpn_type',
+                                      'occurrence'):
         user_configuration.RAMSTK_RPN_OCCURRENCE[_record.value] = \
             _record.get_attributes()
 
-    for _record in site_db.session.query(RAMSTKRPN). \
-            filter(RAMSTKRPN.rpn_type == 'severity').all():
+    for _record in _do_filter_records(records[RAMSTKRPN], 'rpn_type',
+                                      'severity'):
         user_configuration.RAMSTK_RPN_SEVERITY[_record.value] = \
             _record.get_attributes()
 
 
-def _do_load_severity(site_db: BaseDatabase,
-                      user_configuration: RAMSTKUserConfiguration) -> None:
+def _do_load_severity(
+        site_db: BaseDatabase,
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load the RAMSTK_SEVERITY variable.
 
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKCategory).\
-            filter(RAMSTKCategory.category_type == 'risk').all():
+    records = _do_select_records(site_db, [RAMSTKCategory], records)
+
+    for _record in _do_filter_records(records[RAMSTKCategory],
+                                      'category_type', 'risk'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_SEVERITY[_record.category_id] = (
             _attributes['name'], _attributes['description'],
@@ -1269,17 +1401,21 @@ def _do_load_severity(site_db: BaseDatabase,
 
 def _do_load_user_workgroups(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = None) -> None:
     """Load the RAMSTK_USERS and RAMSTK_WORKGROUPS variables.
 
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
+    :param records: the site database records already selected.
     :return: None
     :rtype: None
     """
-    for _record in site_db.session.query(RAMSTKUser).all():
+    records = _do_select_records(site_db, [RAMSTKGroup, RAMSTKUser], records)
+
+    for _record in records[RAMSTKUser]:
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_USERS[_record.user_id] = (
             _attributes['user_lname'],
@@ -1288,8 +1424,8 @@ def _do_load_user_workgroups(
             _attributes['user_phone'],
             _attributes['user_group_id'],
         )
-    for _record in site_db.session.query(RAMSTKGroup).\
-            filter(RAMSTKGroup.group_type == 'workgroup').all():
+    for _record in _do_filter_records(records[RAMSTKGroup], 'group_type',
+                                      'workgroup'):
         _attributes = _record.get_attributes()
         user_configuration.RAMSTK_WORKGROUPS[_record.group_id] = (
             _attributes['description'],
@@ -1297,14 +1433,210 @@ def _do_load_user_workgroups(
         )
 
 
+def _do_read_variables_cache(cache_file: str,
+                             fingerprint: Tuple) -> Optional[Dict[str, Any]]:
+    """Read the site variables from the cache.
+
+    :param cache_file: the absolute path to the site variables cache.
+    :param fingerprint: the fingerprint of the site database.
+    :return: the cached variables or None if the cache is missing, can't be
+        read, or was written for a different version of the site database.
+    :rtype: dict
+    """
+    # A cache that can't be read for any reason is treated as missing; the
+    # variables are loaded from the site database and the cache rewritten.
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as _file:
+            _cache = json.load(_file)
+
+        if (_cache['version'] != SITE_VARIABLES_CACHE_VERSION
+                or _do_decode_cache_value(_cache['fingerprint']) !=
+                fingerprint):
+            return None
+
+        return {
+            _variable: _do_decode_cache_value(_cache['variables'][_variable])
+            for _variable in SITE_VARIABLES
+        }
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _do_select_records(
+        site_db: BaseDatabase,
+        tables: List[Any],
+        records: Optional[Dict[Any, List[Any]]] = None
+) -> Dict[Any, List[Any]]:
+    """Select all the records in each site database table.
+
+    Each table is queried once.  Tables already in records aren't queried
+    again so the loaders can share the records selected by another loader.
+
+    :param site_db: the RAMSTK Site Database to select the records from.
+    :param tables: the list of RAMSTK common database tables to select.
+    :param records: the records already selected keyed by table.
+    :return: records with the records of each table added.
+    :rtype: dict
+    """
+    if records is None:
+        records = {}
+
+    for _table in tables:
+        if _table not in records:
+            records[_table] = site_db.session.query(_table).all()
+
+    return records
+
+
+def _do_write_variables_cache(
+        cache_file: str, fingerprint: Tuple,
+        user_configuration: RAMSTKUserConfiguration) -> None:
+    """Write the site variables to the cache.
+
+    The cache is written to a temporary file and moved into place so a
+    partially written cache is never read.
+
+    :param cache_file: the absolute path to the site variables cache.
+    :param fingerprint: the fingerprint of the site database.
+    :param user_configuration: the RAMSTKUserConfiguration instance whose
+        variables are to be saved.
+    :return: None
+    :rtype: None
+    """
+    _temp_file = cache_file + '.tmp'
+    try:
+        with open(_temp_file, 'w', encoding='utf-8') as _file:
+            json.dump(
+                {
+                    'version': SITE_VARIABLES_CACHE_VERSION,
+                    'fingerprint': _do_encode_cache_value(fingerprint),
+                    'variables': {
+                        _variable: _do_encode_cache_value(
+                            getattr(user_configuration, _variable))
+                        for _variable in SITE_VARIABLES
+                    },
+                }, _file)
+        os.replace(_temp_file, cache_file)
+    except (OSError, TypeError, ValueError) as _error:
+        pub.sendMessage('do_log_debug_msg',
+                        logger_name='DEBUG',
+                        message="Failed to write the site variables cache "
+                        "{0}: {1}".format(cache_file, _error))
+
+
+def _get_site_db_fingerprint(
+        conn_info: Dict[str, Any],
+        site_db: Optional[BaseDatabase] = None) -> Optional[Tuple]:
+    """Get a fingerprint that changes whenever the site database changes.
+
+    The fingerprint of a SQLite site database is the size and modification
+    time of the database file and its write-ahead log.  It is read without
+    connecting to the database.  The fingerprint of a PostgreSQL site
+    database is an MD5 checksum of every row in the site variable tables.
+    It is calculated by the server in a single query so it needs the
+    connected site database.
+
+    :param conn_info: the site database connection information.
+    :param site_db: the connected RAMSTK Site Database; only needed for
+        PostgreSQL site databases.
+    :return: the fingerprint or None if the site database can't be
+        fingerprinted.
+    :rtype: tuple
+    """
+    _database = conn_info.get('database')
+
+    if conn_info.get('dialect') == 'sqlite':
+        if _database in [None, '', ':memory:']:
+            return None
+
+        _fingerprint = []
+        for _file in [_database, _database + '-wal']:
+            try:
+                _stat = os.stat(_file)
+                _fingerprint.append(
+                    (os.path.abspath(_file), _stat.st_size, _stat.st_mtime_ns))
+            except OSError:
+                _fingerprint.append((os.path.abspath(_file), -1, -1))
+
+        return tuple(_fingerprint)
+
+    if conn_info.get('dialect') != 'postgres' or site_db is None:
+        return None
+
+    _query = text('SELECT md5(string_agg(_row, \'\' ORDER BY _row)) FROM ('
+                  + ' UNION ALL '.join(
+                      "SELECT '{0}:' || md5(CAST(_table AS text)) AS _row "
+                      "FROM {0} AS _table".format(_table.__tablename__)
+                      for _table in SITE_VARIABLES_TABLES) + ') AS _rows')
+    try:
+        _checksum = site_db.session.execute(_query).scalar()
+    except exc.SQLAlchemyError as _error:
+        site_db.session.rollback()
+        pub.sendMessage('do_log_debug_msg',
+                        logger_name='DEBUG',
+                        message="Failed to fingerprint the site database "
+                        "{0}: {1}".format(_database, _error))
+        return None
+
+    return ('postgres', conn_info.get('host'), conn_info.get('port'),
+            _database, _checksum)
+
+
+def do_load_cached_variables(conn_info: Dict[str, Any],
+                             user_configuration: RAMSTKUserConfiguration,
+                             cache_file: str,
+                             site_db: Optional[BaseDatabase] = None) -> bool:
+    """Load the RAMSTKUserConfiguration global variables from the cache.
+
+    A SQLite site database is fingerprinted without connecting to it so the
+    cache can be checked before the site database is opened.  A PostgreSQL
+    site database can only be fingerprinted once it is connected, so
+    nothing is loaded unless passed the connected site database.
+
+    :param conn_info: the site database connection information.
+    :param user_configuration: the RAMSTKUserConfiguration instance whose
+        variables are to be loaded.
+    :param cache_file: the absolute path to the site variables cache.
+    :param site_db: the connected RAMSTK Site Database.
+    :return: True if the variables were loaded from the cache.
+    :rtype: bool
+    """
+    _fingerprint = _get_site_db_fingerprint(conn_info, site_db)
+    if _fingerprint is None:
+        return False
+
+    _variables = _do_read_variables_cache(cache_file, _fingerprint)
+    if _variables is None:
+        return False
+
+    for _variable, _value in _variables.items():
+        getattr(user_configuration, _variable).update(_value)
+
+    pub.sendMessage('do_log_info_msg',
+                    logger_name='INFO',
+                    message="Loaded global RAMSTK configuration variables "
+                    "from {0}.".format(cache_file))
+
+    return True
+
+
 def do_load_variables(site_db: BaseDatabase,
-                      user_configuration: RAMSTKUserConfiguration) -> None:
+                      user_configuration: RAMSTKUserConfiguration,
+                      cache_file: str = '') -> None:
     """Load the RAMSTKUserConfiguration global variables from the site db.
 
+    Each site database table is queried once.  When passed a cache file, the
+    variables are loaded from the cache if it was written for the current
+    version of the site database and the site variable tables aren't read.
+    Otherwise the variables are loaded from the site database and the cache
+    is rewritten.  SQLite and PostgreSQL site databases can be cached.
+
     :param site_db: the RAMSTK Site Database to read the values of the
         global variables.
     :param user_configuration: the RAMSTKUserConfiguration instance whose
         variable is to be loaded.
+    :param cache_file: the absolute path to the site variables cache.  The
+        cache isn't used when this is empty.
     :return: None
     :rtype: None
     """
@@ -1312,15 +1644,42 @@ def do_load_variables(site_db: BaseDatabase,
                     logger_name='INFO',
                     message="Loading global RAMSTK configuration variables.")
 
-    _do_load_action_variables(site_db, user_configuration)
-    _do_load_hardware_variables(site_db, user_configuration)
-    _do_load_incident_variables(site_db, user_configuration)
-    _do_load_miscellaneous_variables(site_db, user_configuration)
-    _do_load_pof_variables(site_db, user_configuration)
-    _do_load_requirement_variables(site_db, user_configuration)
-    _do_load_rpn_variables(site_db, user_configuration)
-    _do_load_severity(site_db, user_configuration)
-    _do_load_user_workgroups(site_db, user_configuration)
+    _fingerprint = None
+    if cache_file:
+        _url = site_db.engine.url
+        _fingerprint = _get_site_db_fingerprint(
+            {
+                'dialect': {
+                    'postgresql': 'postgres'
+                }.get(_url.get_backend_name(), _url.get_backend_name()),
+                'host': _url.host,
+                'port': str(_url.port),
+                'database': _url.database,
+            }, site_db)
+
+    _variables = None
+    if _fingerprint is not None:
+        _variables = _do_read_variables_cache(cache_file, _fingerprint)
+
+    if _variables is not None:
+        for _variable, _value in _variables.items():
+            getattr(user_configuration, _variable).update(_value)
+    else:
+        _records: Dict[Any, List[Any]] = {}
+        _do_load_action_variables(site_db, user_configuration, _records)
+        _do_load_hardware_variables(site_db, user_configuration, _records)
+        _do_load_incident_variables(site_db, user_configuration, _records)
+        _do_load_miscellaneous_variables(site_db, user_configuration,
+                                         _records)
+        _do_load_pof_variables(site_db, user_configuration, _records)
+        _do_load_requirement_variables(site_db, user_configuration, _records)
+        _do_load_rpn_variables(site_db, user_configuration, _records)
+        _do_load_severity(site_db, user_configuration, _records)
+        _do_load_user_workgroups(site_db, user_configuration, _records)
+
+        if _fingerprint is not None:
+            _do_write_variables_cache(cache_file, _fingerprint,
+                                      user_configuration)
 
     pub.sendMessage('do_log_info_msg',
                     logger_name='INFO',
@@ -1,6 +1,6 @@
 # Standard Library Imports
 import gettext
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third Party Imports
 from sqlalchemy.engine import Engine
@@ -45,6 +45,9 @@ RAMSTK_STAKEHOLDERS: Any
 RAMSTK_STATUSES: Any
 RAMSTK_SUBCATEGORIES: Any
 RAMSTK_TYPES: Dict[int, Tuple[str, str, str]]
+SITE_VARIABLES: List[str]
+SITE_VARIABLES_CACHE_VERSION: int
+SITE_VARIABLES_TABLES: List[Any]
 
 
 def _load_fmea_tables(session: scoped_session) -> None:
@@ -87,59 +90,115 @@ def do_make_commondb_tables(engine: Engine) -> None:
     ...
 
 
+def _do_decode_cache_value(value: Any) -> Any:
+    ...
+
+
+def _do_encode_cache_value(value: Any) -> Any:
+    ...
+
+
+def _do_filter_records(records: List[Any], column: str,
+                       value: Any) -> List[Any]:
+    ...
+
+
 def _do_load_action_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_hardware_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_incident_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_miscellaneous_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_pof_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_requirement_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_rpn_variables(
         site_db: BaseDatabase,
-        user_configuration: RAMSTKUserConfiguration) -> None:
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
-def _do_load_severity(site_db: BaseDatabase,
-                      user_configuration: RAMSTKUserConfiguration) -> None:
+def _do_load_severity(
+        site_db: BaseDatabase,
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
     ...
 
 
 def _do_load_user_workgroups(
         site_db: BaseDatabase,
+        user_configuration: RAMSTKUserConfiguration,
+        records: Optional[Dict[Any, List[Any]]] = ...) -> None:
+    ...
+
+
+def _do_read_variables_cache(cache_file: str,
+                             fingerprint: Tuple) -> Optional[Dict[str, Any]]:
+    ...
+
+
+def _do_select_records(
+        site_db: BaseDatabase,
+        tables: List[Any],
+        records: Optional[Dict[Any, List[Any]]] = ...
+) -> Dict[Any, List[Any]]:
+    ...
+
+
+def _do_write_variables_cache(
+        cache_file: str, fingerprint: Tuple,
         user_configuration: RAMSTKUserConfiguration) -> None:
     ...
 
 
+def _get_site_db_fingerprint(
+        conn_info: Dict[str, Any],
+        site_db: Optional[BaseDatabase] = ...) -> Optional[Tuple]:
+    ...
+
+
+def do_load_cached_variables(conn_info: Dict[str, Any],
+                             user_configuration: RAMSTKUserConfiguration,
+                             cache_file: str,
+                             site_db: Optional[BaseDatabase] = ...) -> bool:
+    ...
+
+
 def do_load_variables(site_db: BaseDatabase,
-                      user_configuration: RAMSTKUserConfiguration) -> None:
+                      user_configuration: RAMSTKUserConfiguration,
+                      cache_file: str = ...) -> None:
     ...
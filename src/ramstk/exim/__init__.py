@@ -9,4 +9,4 @@
 
 # RAMSTK Local Imports
 from .export import Export
-from .imports import Import, _do_replace_nan, _get_input_value
+from .imports import Import, _get_input_column
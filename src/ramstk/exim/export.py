@@ -7,29 +7,33 @@
 """The RAMSTK Export module."""
 
 # Standard Library Imports
+import csv
 import os
-from typing import Any, Dict
+from datetime import date
+from typing import Any, Dict, Iterator, List
 
 # Third Party Imports
-# noinspection PyPackageRequirements
-import pandas as pd
-# noinspection PyPackageRequirements
-from openpyxl import load_workbook
 from pubsub import pub
 from treelib import Tree
 
+# RAMSTK Package Imports
+from ramstk.utilities import lazy_import
+
+# The spreadsheet packages are only needed when exporting to a spreadsheet.
+openpyxl = lazy_import('openpyxl')
+xlwt = lazy_import('xlwt')
+
 
 class Export:
     """Contains the methods for exporting data from a program database."""
     def __init__(self) -> None:
         """Initialize an Export module instance."""
         # Initialize private dictionary attributes.
-        self._dic_output_data: Dict[str, Dict[int, Dict[Any, Any]]] = {}
+        self._dic_output_data: Dict[str, Tree] = {}
 
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
-        self._df_output_data: pd.DataFrame = pd.DataFrame()
 
         # Initialize public dictionary attributes.
 
@@ -64,72 +68,96 @@ class Export:
         elif file_type == 'text':
             self._do_export_to_delimited_text(file_name, separator=' ')
 
-    def _do_export_to_delimited_text(self, file_name: str, separator: str):
+    def _do_export_to_delimited_text(self, file_name: str,
+                                     separator: str) -> None:
         """Export RAMSTK project data to a delimited text file.
 
+        Each module is written to its own section of the file.  A section
+        starts with a line holding the module name followed by the column
+        headings and ends with a blank line.
+
         :param file_name: the name of the file to export data.
         :param separator: the field delimiter to use.
         :return: None
         :rtype: None
         """
-        for _key in self._dic_output_data:
-            self._df_output_data = pd.DataFrame(self._dic_output_data[_key])
-
-            self._df_output_data.to_csv(file_name, sep=separator, index=True)
+        with open(file_name, 'w', newline='') as _file:
+            _writer = csv.writer(_file, delimiter=separator)
+            for _module, _tree in self._dic_output_data.items():
+                _writer.writerow([_module])
+                _writer.writerows(self._do_iter_rows(_tree))
+                _writer.writerow([])
 
-    # pylint: disable=abstract-class-instantiated
     def _do_export_to_excel(self, file_name: str) -> None:
         """Export RAMSTK project data to an Excel file.
 
+        Each module is written to its own worksheet of a single workbook.
+        Excel 2007+ workbooks are written in openpyxl's write-only mode so
+        the rows are streamed to the file rather than held in memory.
+
         :param file_name: the name of the file to export data.
         :return: None
         :rtype: None
         """
         _file, _extension = os.path.splitext(file_name)
 
-        for _key in self._dic_output_data:
-            self._df_output_data = pd.DataFrame(self._dic_output_data[_key])
-            if _extension == '.xls':
-                # xlwt can't write each module to a separate sheet so we'll
-                # have to make a separate workbook for each work stream module.
-                _writer = pd.ExcelWriter('{0:s}_{1:s}.xls'.format(_file, _key),
-                                         engine='xlwt')
-            elif _extension in ['.xlsx', '.xlsm']:
-                _writer = pd.ExcelWriter(file_name, engine='openpyxl')
-                # Set the writer workbook if it already exists, otherwise
-                # just continue.  This allows each work stream module to be
-                # written to it's own worksheet.  If the workbook doesn't
-                # exist it will be created when the first module is written.
-                try:
-                    _workbook = load_workbook(file_name)
-                    _writer.book = _workbook
-                except FileNotFoundError:
-                    pass
-            else:
+        if _extension in ['.xlsx', '.xlsm']:
+            _workbook = openpyxl.Workbook(write_only=True)
+            for _module, _tree in self._dic_output_data.items():
+                _sheet = _workbook.create_sheet(title=_module)
+                for _row in self._do_iter_rows(_tree):
+                    _sheet.append(_row)
+            _workbook.save(file_name)
+        else:
+            if _extension != '.xls':
                 file_name = _file + '.xls'
-                _writer = pd.ExcelWriter(file_name, engine='xlwt')
-            self._df_output_data.to_excel(_writer,
-                                          '{0:s}'.format(_key),
-                                          index=True)
-            _writer.save()
+            _date_style = xlwt.easyxf(num_format_str='YYYY-MM-DD')
+            _workbook = xlwt.Workbook()
+            for _module, _tree in self._dic_output_data.items():
+                _sheet = _workbook.add_sheet(_module)
+                for _row_num, _row in enumerate(self._do_iter_rows(_tree)):
+                    for _col_num, _value in enumerate(_row):
+                        if isinstance(_value, date):
+                            _sheet.write(_row_num, _col_num, _value,
+                                         _date_style)
+                        else:
+                            _sheet.write(_row_num, _col_num, _value)
+            _workbook.save(file_name)
+
+    @staticmethod
+    def _do_iter_rows(tree: Tree) -> Iterator[List[Any]]:
+        """Iterate over the rows to export for a module.
+
+        The first row is the column headings followed by one row for each
+        record in the tree.  Rows are built one at a time from the records
+        in the tree.
 
-            _writer.close()
+        :param tree: the data manager tree for the module to export.
+        :return: a generator of lists of column values.
+        :rtype: generator
+        """
+        _headings: List[str] = []
+        for _node in tree.all_nodes_itr():
+            try:
+                _attributes = _node.data[_node.tag].get_attributes()
+            except (AttributeError, KeyError, TypeError):
+                continue
+
+            if not _headings:
+                _headings = list(_attributes)
+                yield _headings
+
+            yield [_attributes[_heading] for _heading in _headings]
 
     def _do_load_data(self, tree: Tree) -> None:
-        """Load the attribute data into a Pandas DataFrame.
+        """Load the module tree to export.
+
+        The records are not copied here; they are read from the tree as the
+        file is written.
 
         :param tree: the data manager tree for the module to export.
         :return: None
         :rtype: None
         """
         _module = tree.get_node(0).tag.lower()
-        self._dic_output_data[_module] = {}
-
-        # pylint: disable=unused-variable
-        for _node in tree.all_nodes()[1:]:
-            _tag = _node.tag
-            try:
-                self._dic_output_data[_module][
-                    _node.identifier] = _node.data[_tag].get_attributes()
-            except (KeyError, TypeError):
-                pass
+        self._dic_output_data[_module] = tree
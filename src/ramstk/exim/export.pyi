@@ -1,12 +1,11 @@
 # Standard Library Imports
-from typing import Any
+from typing import Any, Iterator, List
 
 # Third Party Imports
 from treelib import Tree as Tree
 
 class Export:
     _dic_output_data: Any = ...
-    _df_output_data: Any = ...
 
     def __init__(self) -> None:
         ...
@@ -15,11 +14,15 @@ class Export:
         ...
 
     def _do_export_to_delimited_text(self, file_name: str,
-                                     separator: str) -> Any:
+                                     separator: str) -> None:
         ...
 
     def _do_export_to_excel(self, file_name: str) -> None:
         ...
 
+    @staticmethod
+    def _do_iter_rows(tree: Tree) -> Iterator[List[Any]]:
+        ...
+
     def _do_load_data(self, tree: Tree) -> None:
         ...
@@ -8,18 +8,12 @@
 
 # Standard Library Imports
 import inspect
-import math
 from collections import OrderedDict
 from datetime import date
-from typing import Any, Dict
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Tuple
 
 # Third Party Imports
-# noinspection PyPackageRequirements
-import numpy as np
-# noinspection PyPackageRequirements
-import pandas as pd
-# noinspection PyPackageRequirements
-from dateutil import parser
 from pubsub import pub
 
 # RAMSTK Package Imports
@@ -30,58 +24,44 @@ from ramstk.models.programdb import (
     RAMSTKFunction, RAMSTKHardware, RAMSTKMilHdbkF, RAMSTKReliability,
     RAMSTKRequirement, RAMSTKSimilarItem, RAMSTKValidation
 )
+from ramstk.utilities import lazy_import
 
+# pandas and openpyxl are slow to import and only needed when importing.
+openpyxl = lazy_import('openpyxl')
+pd = lazy_import('pandas')
 
-def _do_replace_nan(value: Any, default: Any) -> Any:
-    """Check for NaN values and replace any with the default value.
 
-    :param value: the value to check for NaN.
-    :param default: the default value to replace NaN.
-    :return: _value; the passed value or the default if the passed value
-        was NaN.
-    """
-    _value = value
-
-    # Check for Python NaN's.
-    try:
-        if math.isnan(value):
-            _value = default
-    # Non-numeric values raise a type error, so we can just move along.
-    except TypeError:
-        pass
-
-    # Check for numpy NaN's.
-    if value is np.nan:
-        _value = default
+def _get_input_column(mapper: Dict[str, Any], df_input: 'pd.DataFrame',
+                      field: str, default: Any) -> 'pd.Series':
+    """Retrieve the input values for a field from the Pandas dataframe.
 
-    return _value
-
-
-def _get_input_value(mapper: Dict[str, Any], df_row: pd.Series, field: str,
-                     default: Any) -> Any:
-    """Retrieve the input value for a field from the Pandas dataframe.
+    Missing columns and NaN values are replaced with the default value.
 
     :param mapper: the field mapping dict to use as the Rosetta stone.
-    :param df_row: the row from the pandas DataFrame containing the input
-        data.
+    :param df_input: the pandas DataFrame containing the input data.
     :param field: the name of the RAMSTK database field to retrieve the
         data for.
-    :param default: the default value to assign to the field.
-    :return: _value
-    :rtype: the value of the requested input field or the default.
+    :param default: the default value to assign to the field.  If callable,
+        it is called to get the default value.
+    :return: _column
+    :rtype: the pandas Series with the values of the requested input field.
     """
+    if callable(default):
+        default = default()
+
     try:
-        _value = df_row.at[mapper[field]]
+        _column = df_input[mapper[field]].astype(object)
+        _column = _column.where(_column.notna(), default)
     except KeyError:
-        _value = default
-
-    _value = _do_replace_nan(_value, default)
+        _column = pd.Series([default] * len(df_input.index),
+                            index=df_input.index,
+                            dtype=object)
 
     # If it's supposed to be a date, make it a date.
-    if default == date.today():
-        _value = parser.parse(_value)
+    if isinstance(default, date):
+        _column = pd.to_datetime(_column).dt.date.astype(object)
 
-    return _value
+    return _column
 
 
 class Import:
@@ -200,6 +180,280 @@ class Import:
                      ('Maximum Task Time', ''), ('Minimum Task Time', '')])
     }
 
+    # The RAMSTK database tables populated when importing each module.  The
+    # tables are listed in the order they must be inserted.  Each table has a
+    # list of (field map, fields) tuples where fields is a list of (attribute,
+    # field map key, default value) tuples.  A callable default is called
+    # when the import starts.
+    _dic_table_fields = {
+        'Function': [
+            (RAMSTKFunction, [
+                ('Function', [
+                    ('revision_id', 'Revision ID', 1),
+                    ('function_id', 'Function ID', 1),
+                    ('function_code', 'Function Code', ''),
+                    ('level', 'Level', 0),
+                    ('name', 'Function Name', ''),
+                    ('parent_id', 'Parent', 1),
+                    ('remarks', 'Remarks', ''),
+                    ('safety_critical', 'Safety Critical', 0),
+                    ('type_id', 'Type', ''),
+                ]),
+            ]),
+        ],
+        'Requirement': [
+            (RAMSTKRequirement, [
+                ('Requirement', [
+                    ('revision_id', 'Revision ID', 1),
+                    ('requirement_id', 'Requirement ID', 1),
+                    ('derived', 'Derived?', 0),
+                    ('description', 'Requirement', ''),
+                    ('figure_number', 'Figure Number', ''),
+                    ('owner', 'Owner', ''),
+                    ('page_number', 'Page Number', ''),
+                    ('parent_id', 'Parent ID', 1),
+                    ('priority', 'Priority', 1),
+                    ('requirement_code', 'Requirement Code', ''),
+                    ('specification', 'Specification', ''),
+                    ('requirement_type', 'Requirement Type', ''),
+                    ('validated', 'Validated?', 0),
+                    ('validated_date', 'Validated Date', date.today),
+                ]),
+            ]),
+        ],
+        'Hardware': [
+            (RAMSTKHardware, [
+                ('Hardware', [
+                    ('revision_id', 'Revision ID', 1),
+                    ('hardware_id', 'Hardware ID', 1),
+                    ('alt_part_number', 'Alternate Part Number', ''),
+                    ('cage_code', 'CAGE Code', ''),
+                    ('category_id', 'Category ID', 0),
+                    ('comp_ref_des', 'Composite Ref. Des.', ''),
+                    ('cost', 'Cost', 0.0),
+                    ('cost_type_id', 'Cost Type', 0),
+                    ('description', 'Description', ''),
+                    ('duty_cycle', 'Duty Cycle', 100.0),
+                    ('figure_number', 'Figure Number', ''),
+                    ('lcn', 'LCN', ''),
+                    ('level', 'Level', 0),
+                    ('manufacturer_id', 'Manufacturer', 0),
+                    ('mission_time', 'Mission Time', 24.0),
+                    ('name', 'Name', ''),
+                    ('nsn', 'NSN', ''),
+                    ('page_number', 'Page Number', ''),
+                    ('parent_id', 'Parent Assembly', 1),
+                    ('part', 'Part', 0),
+                    ('part_number', 'Part Number', ''),
+                    ('quantity', 'Quantity', 1),
+                    ('ref_des', 'Reference Designator', ''),
+                    ('remarks', 'Remarks', ''),
+                    ('repairable', 'Repairable', 1),
+                    ('specification_number', 'Specification', ''),
+                    ('subcategory_id', 'Subcategory ID', 0),
+                    ('tagged_part', 'Tagged Part', 0),
+                    ('year_of_manufacture', 'Year of Manufacture', 1900),
+                ]),
+            ]),
+            (RAMSTKAllocation, [
+                ('Hardware', [
+                    ('revision_id', 'Revision ID', 1),
+                    ('hardware_id', 'Hardware ID', 1),
+                    ('parent_id', 'Parent Assembly', 1),
+                ]),
+            ]),
+            (RAMSTKSimilarItem, [
+                ('Hardware', [
+                    ('revision_id', 'Revision ID', 1),
+                    ('hardware_id', 'Hardware ID', 1),
+                    ('parent_id', 'Parent Assembly', 1),
+                ]),
+            ]),
+            (RAMSTKDesignElectric, [
+                ('Hardware', [
+                    ('hardware_id', 'Hardware ID', 1),
+                ]),
+                ('Design Electric', [
+                    ('application_id', 'Application ID', 0),
+                    ('area', 'Area', 0.0),
+                    ('capacitance', 'Capacitance', 0.000001),
+                    ('configuration_id', 'Configuration ID', 0),
+                    ('construction_id', 'Construction ID', 0),
+                    ('contact_form_id', 'Contact Form ID', 0),
+                    ('contact_gauge', 'Contact Gauge', 20),
+                    ('contact_rating_id', 'Contact Rating ID', 0),
+                    ('current_operating', 'Current Operating', 0.0),
+                    ('current_rated', 'Current Rated', 0.0),
+                    ('current_ratio', 'Current Ratio', 0.0),
+                    ('environment_active_id', 'Environment Active ID', 0),
+                    ('environment_dormant_id', 'Environment Dormant ID', 0),
+                    ('family_id', 'Family ID', 0),
+                    ('feature_size', 'Feature Size', 1.0),
+                    ('frequency_operating', 'Frequency Operating', 0.0),
+                    ('insert_id', 'Insert ID', 0),
+                    ('insulation_id', 'Insulation ID', 0),
+                    ('manufacturing_id', 'Manufacturing ID', 0),
+                    ('matching_id', 'Matching ID', 0),
+                    ('n_active_pins', 'N Active Pins', 0),
+                    ('n_circuit_planes', 'N Circuit Planes', 1),
+                    ('n_cycles', 'N Cycles', 0),
+                    ('n_elements', 'N Elements', 0),
+                    ('n_hand_soldered', 'N Hand Soldered', 0),
+                    ('n_wave_soldered', 'N Wave Soldered', 0),
+                    ('operating_life', 'Operating Life', 0.0),
+                    ('overstress', 'Overstress', 0),
+                    ('package_id', 'Package ID', 0),
+                    ('power_operating', 'Power Operating', 0.0),
+                    ('power_rated', 'Power Rated', 0.0),
+                    ('power_ratio', 'Power Ratio', 0.0),
+                    ('reason', 'Reason', ''),
+                    ('resistance', 'Resistance', 0.0),
+                    ('specification_id', 'Specification ID', 0),
+                    ('technology_id', 'Technology ID', 0),
+                    ('temperature_active', 'Temperature, Active', 30.0),
+                    ('temperature_case', 'Temperature, Case', 0.0),
+                    ('temperature_dormant', 'Temperature, Dormant', 25.0),
+                    ('temperature_hot_spot', 'Temperature, Hot Spot', 0.0),
+                    ('temperature_junction', 'Temperature, Junction', 0.0),
+                    ('temperature_knee', 'Temperature, Knee', 25.0),
+                    ('temperature_rated_max', 'Temperature, Rated Max', 0.0),
+                    ('temperature_rated_min', 'Temperature, Rated Min', 0.0),
+                    ('temperature_rise', 'Temperature Rise', 0.0),
+                    ('theta_jc', 'Theta JC', 0.0),
+                    ('type_id', 'Type ID', 0),
+                    ('voltage_ac_operating', 'Voltage, AC Operating', 0.0),
+                    ('voltage_dc_operating', 'Voltage, DC Operating', 0.0),
+                    ('voltage_esd', 'Voltage ESD', 0.0),
+                    ('voltage_rated', 'Voltage, Rated', 0.0),
+                    ('voltage_ratio', 'Voltage Ratio', 0.0),
+                    ('weight', 'Weight', 1.0),
+                    ('years_in_production', 'Years in Production', 2),
+                ]),
+            ]),
+            (RAMSTKMilHdbkF, [
+                ('Hardware', [
+                    ('hardware_id', 'Hardware ID', 1),
+                ]),
+            ]),
+            (RAMSTKDesignMechanic, [
+                ('Hardware', [
+                    ('hardware_id', 'Hardware ID', 1),
+                ]),
+                ('Design Mechanic', [
+                    ('altitude_operating', 'Altitude, Operating', 0.0),
+                    ('application_id', 'Application ID', 0),
+                    ('balance_id', 'Balance ID', 0),
+                    ('clearance', 'Clearance', 0.0),
+                    ('casing_id', 'Casing ID', 0),
+                    ('contact_pressure', 'Contact Pressure', 0.0),
+                    ('deflection', 'Deflection', 0.0),
+                    ('diameter_coil', 'Diameter, Coil', 0.0),
+                    ('diameter_inner', 'Diameter, Inner', 0.0),
+                    ('diameter_outer', 'Diameter, Outer', 0.0),
+                    ('diameter_wire', 'Diameter, Wire', 0.0),
+                    ('filter_size', 'Filter Size', 0.0),
+                    ('flow_design', 'Flow, Design', 0.0),
+                    ('flow_operating', 'Flow, Operating', 0.0),
+                    ('frequency_operating', 'Frequency, Operating', 0.0),
+                    ('friction', 'Friction', 0.0),
+                    ('impact_id', 'Impact ID', 0),
+                    ('leakage_allowable', 'Allowable Leakage', 0.0),
+                    ('length', 'Length', 0.0),
+                    ('length_compressed', 'Length, Compressed', 0.0),
+                    ('length_relaxed', 'Length, Relaxed', 0.0),
+                    ('load_design', 'Design Load', 0.0),
+                    ('load_id', 'Load ID', 0),
+                    ('load_operating', 'Operating Load', 0.0),
+                    ('lubrication_id', 'Lubrication ID', 0),
+                    ('manufacturing_id', 'Manufacturing ID', 0),
+                    ('material_id', 'Material ID', 0),
+                    ('meyer_hardness', 'Meyer Hardness', 0.0),
+                    ('misalignment_angle', 'Misalignment Angle', 0.0),
+                    ('n_ten', 'N Ten', 0),
+                    ('n_cycles', 'N Cycles', 0.0),
+                    ('n_elements', 'N Elements', 0),
+                    ('offset', 'Offset', 0.0),
+                    ('particle_size', 'Particle Size', 0.0),
+                    ('pressure_contact', 'Contact Pressure', 0.0),
+                    ('pressure_delta', 'Differential Pressure', 0.0),
+                    ('pressure_downstream', 'Downstream Pressure', 0.0),
+                    ('pressure_rated', 'Rated Pressure', 0.0),
+                    ('pressure_upstream', 'Upstream Pressure', 0.0),
+                    ('rpm_design', 'Design RPM', 0.0),
+                    ('rpm_operating', 'Operating RPM', 0.0),
+                    ('service_id', 'Service ID', 0),
+                    ('spring_index', 'Spring Index', 0),
+                    ('surface_finish', 'Surface Finish', 0.0),
+                    ('technology_id', 'Technology ID', 0),
+                    ('thickness', 'Thickness', 0.0),
+                    ('torque_id', 'Torque ID', 0),
+                    ('type_id', 'Type ID', 0),
+                    ('viscosity_design', 'Design Viscosity', 0.0),
+                    ('viscosity_dynamic', 'Dynamic Viscosity', 0.0),
+                    ('water_per_cent', '% Water', 0.0),
+                    ('width_minimum', 'Minimum Width', 0.0),
+                ]),
+            ]),
+            (RAMSTKNSWC, [
+                ('Hardware', [
+                    ('hardware_id', 'Hardware ID', 1),
+                ]),
+            ]),
+            (RAMSTKReliability, [
+                ('Hardware', [
+                    ('hardware_id', 'Hardware ID', 1),
+                ]),
+                ('Reliability', [
+                    ('add_adj_factor', 'Additive Adjustment Factor', 0.0),
+                    ('failure_distribution_id', 'Failure Distribution ID',
+                     0),
+                    ('hazard_rate_method_id', 'Failure Rate Method ID', 0),
+                    ('hazard_rate_model', 'Failure Rate Model', ''),
+                    ('hazard_rate_specified', 'Specified Failure Rate', 0.0),
+                    ('hazard_rate_type_id', 'Failure Rate Type ID', 0),
+                    ('location_parameter', 'Location Parameter', 0.0),
+                    ('mtbf_specified', 'Specified MTBF', 0.0),
+                    ('mult_adj_factor', 'Multiplicative Adjustment Factor',
+                     1.0),
+                    ('quality_id', 'Quality ID', 0),
+                    ('reliability_goal', 'Reliability Goal', 100.0),
+                    ('reliability_goal_measure_id',
+                     'Reliability Goal Measure ID', 0),
+                    ('scale_parameter', 'Scale Parameter', 0.0),
+                    ('shape_parameter', 'Shape Parameter', 0.0),
+                    ('survival_analysis_id', 'Survival Analysis ID', 0),
+                ]),
+            ]),
+        ],
+        'Validation': [
+            (RAMSTKValidation, [
+                ('Validation', [
+                    ('revision_id', 'Revision ID', 1),
+                    ('validation_id', 'Validation ID', 1),
+                    ('acceptable_maximum', 'Acceptable Maximum', 0.0),
+                    ('acceptable_mean', 'Acceptable Mean', 0.0),
+                    ('acceptable_minimum', 'Acceptable Minimum', 0.0),
+                    ('acceptable_variance', 'Acceptable Variance', 0.0),
+                    ('confidence', 's-Confidence', 75.0),
+                    ('cost_average', 'Average Task Cost', 0.0),
+                    ('cost_maximum', 'Maximum Task Cost', 0.0),
+                    ('cost_minimum', 'Minimum Task Cost', 0.0),
+                    ('date_start', 'Start Date', date.today),
+                    ('date_end', 'End Date', date.today),
+                    ('description', 'Task Description', ''),
+                    ('measurement_unit', 'Unit of Measure', ''),
+                    ('name', 'Name', ''),
+                    ('status', 'Task Status', 0.0),
+                    ('task_type', 'Task Type', ''),
+                    ('task_specification', 'Task Specification', ''),
+                    ('time_average', 'Average Task Time', 0.0),
+                    ('time_maximum', 'Maximum Task Time', 0.0),
+                    ('time_minimum', 'Minimum Task Time', 0.0),
+                ]),
+            ]),
+        ],
+    }
+
     def __init__(self) -> None:
         """Initialize an ImportProject module instance."""
         # Initialize private dictionary attributes.
@@ -207,8 +461,11 @@ class Import:
         # Initialize private list attributes.
 
         # Initialize private scalar attributes.
+        self._chunk_size: int = 10000
         self._dao: BaseDatabase = BaseDatabase()
-        self._df_input_data: pd.DataFrame = pd.DataFrame({})
+        self._df_input_data: 'pd.DataFrame' = pd.DataFrame({})
+        self._file_name: str = ''
+        self._file_type: str = ''
 
         # Initialize public dictionary attributes.
 
@@ -232,50 +489,55 @@ class Import:
         self._dao = dao
 
     def _do_import(self, module: str) -> None:
-        """Insert a new entity to the RAMSTK db with values from external file.
+        """Insert new records to the RAMSTK db with values from external file.
+
+        The input file is read in chunks of rows.  Each chunk is converted to
+        rows for each of the module's RAMSTK tables and each table's rows are
+        added with a single bulk INSERT.  All the chunks are imported in one
+        transaction so a rejected row leaves the database unchanged.  The
+        failure message then includes the database's error, which numbers
+        the rejected row from the start of the input file.  SQLite program
+        databases are imported with the bulk PRAGMA profile.
+
+        The import is done in a batch so the data managers announce any
+        changes made in response to the import once, when it's finished.
 
         :param module: the name of the RAMSTK module to import.
         :return: None
         :rtype: None
         """
-        _entities = []
-
-        # pylint: disable=unused-variable
-        for __, _row in self._df_input_data.iterrows():
-            if module == 'Function':
-                _entity = self._do_insert_function(_row)
-                _entities.append(_entity)
-            elif module == 'Requirement':
-                _entity = self._do_insert_requirement(_row)
-                _entities.append(_entity)
-            elif module == 'Hardware':
-                _entity = self._do_insert_hardware(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_allocation(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_similar_item(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_electric(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_mil_hdbk_f(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_design_mechanic(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_nswc(_row)
-                _entities.append(_entity)
-                _entity = self._do_insert_reliability(_row)
-                _entities.append(_entity)
-            elif module == 'Validation':
-                _entity = self._do_insert_validation(_row)
-                _entities.append(_entity)
+        try:
+            _profile = self._dao.do_set_sqlite_profile('bulk')
+        except DataAccessError as _error:
+            pub.sendMessage(
+                'fail_import_module',
+                error_message=_error.msg,
+            )
+            return
 
+        pub.sendMessage('request_begin_batch')
         try:
-            self._dao.do_insert_many(_entities)  # type: ignore
+            self._dao.do_begin_transaction()
+            try:
+                _offset = 0
+                for _chunk in self._do_read_chunks():
+                    for _table, _records in self._do_map_records(
+                            module, _chunk):
+                        self._dao.do_bulk_insert(_table,
+                                                 _records,
+                                                 offset=_offset)
+                    _offset += len(_chunk.index)
+            except (AttributeError, DataAccessError, KeyError, ValueError):
+                self._dao.do_rollback_transaction()
+                raise
+            self._dao.do_commit_transaction()
+
             pub.sendMessage(
                 'succeed_import_module',
                 module=module,
             )
-        except (AttributeError, DataAccessError):
+        except (AttributeError, DataAccessError, KeyError,
+                ValueError) as _error:
             _method_name: str = inspect.currentframe(  # type: ignore
             ).f_code.co_name
             _error_msg: str = (
@@ -283,550 +545,50 @@ class Import:
                 'This is usually caused by key violations; check the '
                 'ID and/or parent ID fields in the import file.').format(
                     module, _method_name)
+            if isinstance(_error, DataAccessError):
+                _error_msg += '\n' + _error.msg
+            elif not isinstance(_error, AttributeError):
+                _error_msg += '\n{0}: {1}'.format(
+                    type(_error).__name__, _error)
             pub.sendMessage(
                 'fail_import_module',
                 error_message=_error_msg,
             )
-
-    def _do_insert_allocation(self, row: pd.Series) -> RAMSTKAllocation:
-        """Insert a new Allocation record to the RAMSTK database.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _allocation; an instance of the RAMSTKAllocation database
-            table record.
-        :rtype: :class:`ramstk.models.programdb.RAMSTKAllocation`
-        """
-        _allocation = RAMSTKAllocation()
-        _map = self._dic_field_map['Hardware']
-
-        _allocation.revision_id = _get_input_value(_map, row, 'Revision ID', 1)
-        _allocation.hardware_id = _get_input_value(_map, row, 'Hardware ID', 1)
-        _allocation.parent_id = _get_input_value(_map, row, 'Parent Assembly',
-                                                 1)
-
-        return _allocation
-
-    def _do_insert_design_electric(self,
-                                   row: pd.Series) -> RAMSTKDesignElectric:
-        """Insert a new Design Electric entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMMSTKDesignElectric`
-        """
-        _design_electric = RAMSTKDesignElectric()
-
-        _map = self._dic_field_map['Hardware']
-
-        _design_electric.hardware_id = _get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        _map = self._dic_field_map['Design Electric']
-        _design_electric.set_attributes({
-            'application_id':
-            _get_input_value(_map, row, 'Application ID', 0),
-            'area':
-            _get_input_value(_map, row, 'Area', 0.0),
-            'capacitance':
-            _get_input_value(_map, row, 'Capacitance', 0.000001),
-            'configuration_id':
-            _get_input_value(_map, row, 'Configuration ID', 0),
-            'construction_id':
-            _get_input_value(_map, row, 'Construction ID', 0),
-            'contact_form_id':
-            _get_input_value(_map, row, 'Contact Form ID', 0),
-            'contact_gauge':
-            _get_input_value(_map, row, 'Contact Gauge', 20),
-            'contact_rating_id':
-            _get_input_value(_map, row, 'Contact Rating ID', 0),
-            'current_operating':
-            _get_input_value(_map, row, 'Current Operating', 0.0),
-            'current_rated':
-            _get_input_value(_map, row, 'Current Rated', 0.0),
-            'current_ratio':
-            _get_input_value(_map, row, 'Current Ratio', 0.0),
-            'environment_active_id':
-            _get_input_value(_map, row, 'Environment Active ID', 0),
-            'environment_dormant_id':
-            _get_input_value(_map, row, 'Environment Dormant ID', 0),
-            'family_id':
-            _get_input_value(_map, row, 'Family ID', 0),
-            'feature_size':
-            _get_input_value(_map, row, 'Feature Size', 1.0),
-            'frequency_operating':
-            _get_input_value(_map, row, 'Frequency Operating', 0.0),
-            'insert_id':
-            _get_input_value(_map, row, 'Insert ID', 0),
-            'insulation_id':
-            _get_input_value(_map, row, 'Insulation ID', 0),
-            'manufacturing_id':
-            _get_input_value(_map, row, 'Manufacturing ID', 0),
-            'matching_id':
-            _get_input_value(_map, row, 'Matching ID', 0),
-            'n_active_pins':
-            _get_input_value(_map, row, 'N Active Pins', 0),
-            'n_circuit_planes':
-            _get_input_value(_map, row, 'N Circuit Planes', 1),
-            'n_cycles':
-            _get_input_value(_map, row, 'N Cycles', 0),
-            'n_elements':
-            _get_input_value(_map, row, 'N Elements', 0),
-            'n_hand_soldered':
-            _get_input_value(_map, row, 'N Hand Soldered', 0),
-            'n_wave_soldered':
-            _get_input_value(_map, row, 'N Wave Soldered', 0),
-            'operating_life':
-            _get_input_value(_map, row, 'Operating Life', 0.0),
-            'overstress':
-            _get_input_value(_map, row, 'Overstress', 0),
-            'package_id':
-            _get_input_value(_map, row, 'Package ID', 0),
-            'power_operating':
-            _get_input_value(_map, row, 'Power Operating', 0.0),
-            'power_rated':
-            _get_input_value(_map, row, 'Power Rated', 0.0),
-            'power_ratio':
-            _get_input_value(_map, row, 'Power Ratio', 0.0),
-            'reason':
-            _get_input_value(_map, row, 'Reason', ''),
-            'resistance':
-            _get_input_value(_map, row, 'Resistance', 0.0),
-            'specification_id':
-            _get_input_value(_map, row, 'Specification ID', 0),
-            'technology_id':
-            _get_input_value(_map, row, 'Technology ID', 0),
-            'temperature_active':
-            _get_input_value(_map, row, 'Temperature, Active', 30.0),
-            'temperature_case':
-            _get_input_value(_map, row, 'Temperature, Case', 0.0),
-            'temperature_dormant':
-            _get_input_value(_map, row, 'Temperature, Dormant', 25.0),
-            'temperature_hot_spot':
-            _get_input_value(_map, row, 'Temperature, Hot Spot', 0.0),
-            'temperature_junction':
-            _get_input_value(_map, row, 'Temperature, Junction', 0.0),
-            'temperature_knee':
-            _get_input_value(_map, row, 'Temperature, Knee', 25.0),
-            'temperature_rated_max':
-            _get_input_value(_map, row, 'Temperature, Rated Max', 0.0),
-            'temperature_rated_min':
-            _get_input_value(_map, row, 'Temperature, Rated Min', 0.0),
-            'temperature_rise':
-            _get_input_value(_map, row, 'Temperature Rise', 0.0),
-            'theta_jc':
-            _get_input_value(_map, row, 'Theta JC', 0.0),
-            'type_id':
-            _get_input_value(_map, row, 'Type ID', 0),
-            'voltage_ac_operating':
-            _get_input_value(_map, row, 'Voltage, AC Operating', 0.0),
-            'voltage_dc_operating':
-            _get_input_value(_map, row, 'Voltage, DC Operating', 0.0),
-            'voltage_esd':
-            _get_input_value(_map, row, 'Voltage ESD', 0.0),
-            'voltage_rated':
-            _get_input_value(_map, row, 'Voltage, Rated', 0.0),
-            'voltage_ratio':
-            _get_input_value(_map, row, 'Voltage Ratio', 0.0),
-            'weight':
-            _get_input_value(_map, row, 'Weight', 1.0),
-            'years_in_production':
-            _get_input_value(_map, row, 'Years in Production', 2)
-        })
-
-        return _design_electric
-
-    def _do_insert_design_mechanic(self,
-                                   row: pd.Series) -> RAMSTKDesignMechanic:
-        """Insert a new Design Mechanic entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMMSTKDesignMechanic`
-        """
-        _design_mechanic = RAMSTKDesignMechanic()
-
-        _map = self._dic_field_map['Hardware']
-        _design_mechanic.hardware_id = _get_input_value(
-            _map, row, 'Hardware ID', 1)
-
-        _map = self._dic_field_map['Design Mechanic']
-        _design_mechanic.set_attributes({
-            'altitude_operating':
-            _get_input_value(_map, row, 'Altitude, Operating', 0.0),
-            'application_id':
-            _get_input_value(_map, row, 'Application ID', 0),
-            'balance_id':
-            _get_input_value(_map, row, 'Balance ID', 0),
-            'clearance':
-            _get_input_value(_map, row, 'Clearance', 0.0),
-            'casing_id':
-            _get_input_value(_map, row, 'Casing ID', 0),
-            'contact_pressure':
-            _get_input_value(_map, row, 'Contact Pressure', 0.0),
-            'deflection':
-            _get_input_value(_map, row, 'Deflection', 0.0),
-            'diameter_coil':
-            _get_input_value(_map, row, 'Diameter, Coil', 0.0),
-            'diameter_inner':
-            _get_input_value(_map, row, 'Diameter, Inner', 0.0),
-            'diameter_outer':
-            _get_input_value(_map, row, 'Diameter, Outer', 0.0),
-            'diameter_wire':
-            _get_input_value(_map, row, 'Diameter, Wire', 0.0),
-            'filter_size':
-            _get_input_value(_map, row, 'Filter Size', 0.0),
-            'flow_design':
-            _get_input_value(_map, row, 'Flow, Design', 0.0),
-            'flow_operating':
-            _get_input_value(_map, row, 'Flow, Operating', 0.0),
-            'frequency_operating':
-            _get_input_value(_map, row, 'Frequency, Operating', 0.0),
-            'friction':
-            _get_input_value(_map, row, 'Friction', 0.0),
-            'impact_id':
-            _get_input_value(_map, row, 'Impact ID', 0),
-            'leakage_allowable':
-            _get_input_value(_map, row, 'Allowable Leakage', 0.0),
-            'length':
-            _get_input_value(_map, row, 'Length', 0.0),
-            'length_compressed':
-            _get_input_value(_map, row, 'Length, Compressed', 0.0),
-            'length_relaxed':
-            _get_input_value(_map, row, 'Length, Relaxed', 0.0),
-            'load_design':
-            _get_input_value(_map, row, 'Design Load', 0.0),
-            'load_id':
-            _get_input_value(_map, row, 'Load ID', 0),
-            'load_operating':
-            _get_input_value(_map, row, 'Operating Load', 0.0),
-            'lubrication_id':
-            _get_input_value(_map, row, 'Lubrication ID', 0),
-            'manufacturing_id':
-            _get_input_value(_map, row, 'Manufacturing ID', 0),
-            'material_id':
-            _get_input_value(_map, row, 'Material ID', 0),
-            'meyer_hardness':
-            _get_input_value(_map, row, 'Meyer Hardness', 0.0),
-            'misalignment_angle':
-            _get_input_value(_map, row, 'Misalignment Angle', 0.0),
-            'n_ten':
-            _get_input_value(_map, row, 'N Ten', 0),
-            'n_cycles':
-            _get_input_value(_map, row, 'N Cycles', 0.0),
-            'n_elements':
-            _get_input_value(_map, row, 'N Elements', 0),
-            'offset':
-            _get_input_value(_map, row, 'Offset', 0.0),
-            'particle_size':
-            _get_input_value(_map, row, 'Particle Size', 0.0),
-            'pressure_contact':
-            _get_input_value(_map, row, 'Contact Pressure', 0.0),
-            'pressure_delta':
-            _get_input_value(_map, row, 'Differential Pressure', 0.0),
-            'pressure_downstream':
-            _get_input_value(_map, row, 'Downstream Pressure', 0.0),
-            'pressure_rated':
-            _get_input_value(_map, row, 'Rated Pressure', 0.0),
-            'pressure_upstream':
-            _get_input_value(_map, row, 'Upstream Pressure', 0.0),
-            'rpm_design':
-            _get_input_value(_map, row, 'Design RPM', 0.0),
-            'rpm_operating':
-            _get_input_value(_map, row, 'Operating RPM', 0.0),
-            'service_id':
-            _get_input_value(_map, row, 'Service ID', 0),
-            'spring_index':
-            _get_input_value(_map, row, 'Spring Index', 0),
-            'surface_finish':
-            _get_input_value(_map, row, 'Surface Finish', 0.0),
-            'technology_id':
-            _get_input_value(_map, row, 'Technology ID', 0),
-            'thickness':
-            _get_input_value(_map, row, 'Thickness', 0.0),
-            'torque_id':
-            _get_input_value(_map, row, 'Torque ID', 0),
-            'type_id':
-            _get_input_value(_map, row, 'Type ID', 0),
-            'viscosity_design':
-            _get_input_value(_map, row, 'Design Viscosity', 0.0),
-            'viscosity_dynamic':
-            _get_input_value(_map, row, 'Dynamic Viscosity', 0.0),
-            'water_per_cent':
-            _get_input_value(_map, row, '% Water', 0.0),
-            'width_minimum':
-            _get_input_value(_map, row, 'Minimum Width', 0.0)
-        })
-
-        return _design_mechanic
-
-    def _do_insert_function(self, row: pd.Series) -> RAMSTKFunction:
-        """Insert a new Function entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramskfunction.RAMSTKFunction`
-        """
-        _function = RAMSTKFunction()
-        _map = self._dic_field_map['Function']
-
-        _function.revision_id = _get_input_value(_map, row, 'Revision ID', 1)
-        _function.function_id = _get_input_value(_map, row, 'Function ID', 1)
-        _function.function_code = _get_input_value(_map, row, 'Function Code',
-                                                   '')
-        _function.level = _get_input_value(_map, row, 'Level', 0)
-        _function.name = _get_input_value(_map, row, 'Function Name', '')
-        _function.parent_id = _get_input_value(_map, row, 'Parent', 1)
-        _function.remarks = _get_input_value(_map, row, 'Remarks', '')
-        _function.safety_critical = _get_input_value(_map, row,
-                                                     'Safety Critical', 0)
-        _function.type_id = _get_input_value(_map, row, 'Type', '')
-
-        return _function
-
-    def _do_insert_hardware(self, row: pd.Series) -> RAMSTKHardware:
-        """Insert a new Hardware entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramstkhardware.RAMSTKHardware`
-        """
-        _hardware = RAMSTKHardware()
-        _map = self._dic_field_map['Hardware']
-
-        _hardware.revision_id = _get_input_value(_map, row, 'Revision ID', 1)
-        _hardware.hardware_id = _get_input_value(_map, row, 'Hardware ID', 1)
-        _hardware.alt_part_number = _get_input_value(_map, row,
-                                                     'Alternate Part Number',
-                                                     '')
-        _hardware.cage_code = _get_input_value(_map, row, 'CAGE Code', '')
-        _hardware.category_id = _get_input_value(_map, row, 'Category ID', 0)
-        _hardware.comp_ref_des = _get_input_value(_map, row,
-                                                  'Composite Ref. Des.', '')
-        _hardware.cost = _get_input_value(_map, row, 'Cost', 0.0)
-        _hardware.cost_type_id = _get_input_value(_map, row, 'Cost Type', 0)
-        _hardware.description = _get_input_value(_map, row, 'Description', '')
-        _hardware.duty_cycle = _get_input_value(_map, row, 'Duty Cycle', 100.0)
-        _hardware.figure_number = _get_input_value(_map, row, 'Figure Number',
-                                                   '')
-        _hardware.lcn = _get_input_value(_map, row, 'LCN', '')
-        _hardware.level = _get_input_value(_map, row, 'Level', 0)
-        _hardware.manufacturer_id = _get_input_value(_map, row, 'Manufacturer',
-                                                     0)
-        _hardware.mission_time = _get_input_value(_map, row, 'Mission Time',
-                                                  24.0)
-        _hardware.name = _get_input_value(_map, row, 'Name', '')
-        _hardware.nsn = _get_input_value(_map, row, 'NSN', '')
-        _hardware.page_number = _get_input_value(_map, row, 'Page Number', '')
-        _hardware.parent_id = _get_input_value(_map, row, 'Parent Assembly', 1)
-        _hardware.part = _get_input_value(_map, row, 'Part', 0)
-        _hardware.part_number = _get_input_value(_map, row, 'Part Number', '')
-        _hardware.quantity = _get_input_value(_map, row, 'Quantity', 1)
-        _hardware.ref_des = _get_input_value(_map, row, 'Reference Designator',
-                                             '')
-        _hardware.remarks = _get_input_value(_map, row, 'Remarks', '')
-        _hardware.repairable = _get_input_value(_map, row, 'Repairable', 1)
-        _hardware.specification_number = _get_input_value(
-            _map, row, 'Specification', '')
-        _hardware.subcategory_id = _get_input_value(_map, row,
-                                                    'Subcategory ID', 0)
-        _hardware.tagged_part = _get_input_value(_map, row, 'Tagged Part', 0)
-        _hardware.year_of_manufacture = _get_input_value(
-            _map, row, 'Year of Manufacture', 1900)
-
-        return _hardware
-
-    def _do_insert_mil_hdbk_f(self, row: pd.Series) -> RAMSTKMilHdbkF:
-        """Insert a new MIL-HDBK-217F entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKMilHdbkF`
+        finally:
+            self._dao.do_set_sqlite_profile(_profile)
+            pub.sendMessage('request_end_batch')
+
+    def _do_map_records(
+            self, module: str, df_input: 'pd.DataFrame'
+    ) -> List[Tuple[Any, List[Dict[str, Any]]]]:
+        """Convert the input data to rows for each of the module's tables.
+
+        The field map and default values are applied a whole column at a
+        time.
+
+        :param module: the name of the RAMSTK module being imported.
+        :param df_input: the pandas DataFrame containing the input data.
+        :return: a list of (table, rows) tuples in the order the tables must
+            be inserted.  The rows are dicts of attribute:value pairs.
+        :rtype: list
         """
-        _mil_hdbk_f = RAMSTKMilHdbkF()
-
-        _map = self._dic_field_map['Hardware']
-        _mil_hdbk_f.hardware_id = _get_input_value(_map, row, 'Hardware ID', 1)
-
-        return _mil_hdbk_f
-
-    def _do_insert_nswc(self, row: pd.Series) -> RAMSTKNSWC:
-        """Insert a new NSWC entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.ramstknswc.RAMSTKNSWC`
-        """
-        _nswc = RAMSTKNSWC()
-
-        _map = self._dic_field_map['Hardware']
-        _nswc.hardware_id = _get_input_value(_map, row, 'Hardware ID', 1)
-
-        return _nswc
-
-    def _do_insert_reliability(self, row: pd.Series) -> RAMSTKReliability:
-        """Insert a new Reliability entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKReliability`
-        """
-        _reliability = RAMSTKReliability()
-
-        _map = self._dic_field_map['Hardware']
-        _reliability.hardware_id = _get_input_value(_map, row, 'Hardware ID',
-                                                    1)
-
-        _map = self._dic_field_map['Reliability']
-        _reliability.add_adj_factor = _get_input_value(
-            _map, row, 'Additive Adjustment Factor', 0.0)
-        _reliability.failure_distribution_id = _get_input_value(
-            _map, row, 'Failure Distribution ID', 0)
-        _reliability.hazard_rate_method_id = _get_input_value(
-            _map, row, 'Failure Rate Method ID', 0)
-        _reliability.hazard_rate_model = _get_input_value(
-            _map, row, 'Failure Rate Model', '')
-        _reliability.hazard_rate_specified = _get_input_value(
-            _map, row, 'Specified Failure Rate', 0.0)
-        _reliability.hazard_rate_type_id = _get_input_value(
-            _map, row, 'Failure Rate Type ID', 0)
-        _reliability.location_parameter = _get_input_value(
-            _map, row, 'Location Parameter', 0.0)
-        _reliability.mtbf_specified = _get_input_value(_map, row,
-                                                       'Specified MTBF', 0.0)
-        _reliability.mult_adj_factor = _get_input_value(
-            _map, row, 'Multiplicative Adjustment Factor', 1.0)
-        _reliability.quality_id = _get_input_value(_map, row, 'Quality ID', 0)
-        _reliability.reliability_goal = _get_input_value(
-            _map, row, 'Reliability Goal', 100.0)
-        _reliability.reliability_goal_measure_id = _get_input_value(
-            _map, row, 'Reliability Goal Measure ID', 0)
-        _reliability.scale_parameter = _get_input_value(
-            _map, row, 'Scale Parameter', 0.0)
-        _reliability.shape_parameter = _get_input_value(
-            _map, row, 'Shape Parameter', 0.0)
-        _reliability.survival_analysis_id = _get_input_value(
-            _map, row, 'Survival Analysis ID', 0)
-
-        return _reliability
-
-    def _do_insert_requirement(self, row: pd.Series) -> RAMSTKRequirement:
-        """Insert a new Requirement entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.models.programdb.RAMSTKRequirement`
-        """
-        _requirement = RAMSTKRequirement()
-        _map = self._dic_field_map['Requirement']
-
-        _requirement.revision_id = _get_input_value(_map, row, 'Revision ID',
-                                                    1)
-        _requirement.requirement_id = _get_input_value(_map, row,
-                                                       'Requirement ID', 1)
-        _requirement.derived = _get_input_value(_map, row, 'Derived?', 0)
-        _requirement.description = _get_input_value(_map, row, 'Requirement',
-                                                    '')
-        _requirement.figure_number = _get_input_value(_map, row,
-                                                      'Figure Number', '')
-        _requirement.owner = _get_input_value(_map, row, 'Owner', '')
-        _requirement.page_number = _get_input_value(_map, row, 'Page Number',
-                                                    '')
-        _requirement.parent_id = _get_input_value(_map, row, 'Parent ID', 1)
-        _requirement.priority = _get_input_value(_map, row, 'Priority', 1)
-        _requirement.requirement_code = _get_input_value(
-            _map, row, 'Requirement Code', '')
-        _requirement.specification = _get_input_value(_map, row,
-                                                      'Specification', '')
-        _requirement.requirement_type = _get_input_value(
-            _map, row, 'Requirement Type', '')
-        _requirement.validated = _get_input_value(_map, row, 'Validated?', 0)
-        _requirement.validated_date = _get_input_value(_map, row,
-                                                       'Validated Date',
-                                                       date.today())
-
-        return _requirement
-
-    def _do_insert_similar_item(self, row: pd.Series) -> RAMSTKSimilarItem:
-        """Insert a new Similar Item record to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _similar_item; an instance of the RAMSTKSimilarItem database
-            table record.
-        :rtype: :class:`ramstk.models.programdb.RAMSTKSimilarItem`
-        """
-        _similar_item = RAMSTKSimilarItem()
-        _map = self._dic_field_map['Hardware']
-
-        _similar_item.revision_id = _get_input_value(_map, row, 'Revision ID',
-                                                     1)
-        _similar_item.hardware_id = _get_input_value(_map, row, 'Hardware ID',
-                                                     1)
-        _similar_item.parent_id = _get_input_value(_map, row,
-                                                   'Parent Assembly', 1)
-
-        return _similar_item
-
-    def _do_insert_validation(self, row: pd.Series) -> RAMSTKValidation:
-        """Insert a new Validation entity to the RAMSTK db.
-
-        :param row: the row from the pandas DataFrame containing the input
-            data.
-        :return: _entity
-        :rtype: :class:`ramstk.dao.programdb.RAMSTKValidation.RAMSTKValidation`
-        """
-        _validation = RAMSTKValidation()
-        _map = self._dic_field_map['Validation']
-
-        _validation.revision_id = _get_input_value(_map, row, 'Revision ID', 1)
-        _validation.validation_id = _get_input_value(_map, row,
-                                                     'Validation ID', 1)
-        _validation.acceptable_maximum = _get_input_value(
-            _map, row, 'Acceptable Maximum', 0.0)
-        _validation.acceptable_mean = _get_input_value(_map, row,
-                                                       'Acceptable Mean', 0.0)
-        _validation.acceptable_minimum = _get_input_value(
-            _map, row, 'Acceptable Minimum', 0.0)
-        _validation.acceptable_variance = _get_input_value(
-            _map, row, 'Acceptable Variance', 0.0)
-        _validation.confidence = _get_input_value(_map, row, 's-Confidence',
-                                                  75.0)
-        _validation.cost_average = _get_input_value(_map, row,
-                                                    'Average Task Cost', 0.0)
-        _validation.cost_maximum = _get_input_value(_map, row,
-                                                    'Maximum Task Cost', 0.0)
-        _validation.cost_minimum = _get_input_value(_map, row,
-                                                    'Minimum Task Cost', 0.0)
-        _validation.date_start = _get_input_value(_map, row, 'Start Date',
-                                                  date.today())
-        _validation.date_end = _get_input_value(_map, row, 'End Date',
-                                                date.today())
-        _validation.description = _get_input_value(_map, row,
-                                                   'Task Description', '')
-        _validation.measurement_unit = _get_input_value(
-            _map, row, 'Unit of Measure', '')
-        _validation.name = _get_input_value(_map, row, 'Name', '')
-        _validation.status = _get_input_value(_map, row, 'Task Status', 0.0)
-        _validation.task_type = _get_input_value(_map, row, 'Task Type', '')
-        _validation.task_specification = _get_input_value(
-            _map, row, 'Task Specification', '')
-        _validation.time_average = _get_input_value(_map, row,
-                                                    'Average Task Time', 0.0)
-        _validation.time_maximum = _get_input_value(_map, row,
-                                                    'Maximum Task Time', 0.0)
-        _validation.time_minimum = _get_input_value(_map, row,
-                                                    'Minimum Task Time', 0.0)
-
-        return _validation
+        _tables = []
+        for _table, _maps in self._dic_table_fields.get(module, []):
+            _attributes = []
+            _columns = []
+            for _map_name, _fields in _maps:
+                _map = self._dic_field_map[_map_name]
+                for _attribute, _field, _default in _fields:
+                    _attributes.append(_attribute)
+                    _columns.append(
+                        _get_input_column(_map, df_input, _field,
+                                          _default).tolist())
+
+            _tables.append((_table, [
+                dict(zip(_attributes, _row)) for _row in zip(*_columns)
+            ]))
+
+        return _tables
 
     def _do_map_to_field(self, module: str, import_field: str,
                          format_field: str) -> None:
@@ -842,6 +604,31 @@ class Import:
         """
         self._dic_field_map[module][format_field] = import_field
 
+    def _do_read_chunks(self) -> Iterator['pd.DataFrame']:
+        """Read the input file in chunks of rows.
+
+        :return: a generator of pandas DataFrame() with one chunk of rows.
+            When there is no supported input file, the only chunk is the
+            input data already read.
+        :rtype: generator
+        """
+        if self._file_type == 'csv':
+            yield from pd.read_csv(self._file_name,
+                                   sep=';',
+                                   na_values=[''],
+                                   parse_dates=True,
+                                   chunksize=self._chunk_size)
+        elif self._file_type == 'text':
+            yield from pd.read_csv(self._file_name,
+                                   sep=' ',
+                                   na_values=[''],
+                                   parse_dates=True,
+                                   chunksize=self._chunk_size)
+        elif self._file_type == 'excel':
+            yield from self._do_read_excel_chunks()
+        else:
+            yield self._df_input_data
+
     def _do_read_db_fields(self, module: str) -> None:
         """Return the database field names in a list.
 
@@ -859,8 +646,44 @@ class Import:
             db_fields=_db_fields,
         )
 
+    def _do_read_excel_chunks(self) -> Iterator['pd.DataFrame']:
+        """Read the input Excel file in chunks of rows.
+
+        Excel 2007+ workbooks are streamed a row at a time so only one chunk
+        is held in memory.  Older workbooks are read whole and then split
+        into chunks.
+
+        :return: a generator of pandas DataFrame() with one chunk of rows.
+        :rtype: generator
+        """
+        if not self._file_name.endswith(('.xlsx', '.xlsm')):
+            _df_input = pd.read_excel(self._file_name)
+            for _start in range(0, len(_df_input.index), self._chunk_size):
+                yield _df_input.iloc[_start:_start + self._chunk_size]
+            return
+
+        _workbook = openpyxl.load_workbook(self._file_name,
+                                           read_only=True,
+                                           data_only=True)
+        try:
+            _rows = _workbook.worksheets[0].iter_rows(values_only=True)
+            _header = [
+                'Unnamed: {0:d}'.format(_idx) if _title is None else _title
+                for _idx, _title in enumerate(next(_rows, []))
+            ]
+            _block = list(islice(_rows, self._chunk_size))
+            while _block:
+                yield pd.DataFrame(_block, columns=_header)
+                _block = list(islice(_rows, self._chunk_size))
+        finally:
+            _workbook.close()
+
     def _do_read_file(self, file_type: str, file_name: str) -> None:
-        """Read contents of input file into a pandas DataFrame().
+        """Read the first chunk of the input file into a pandas DataFrame().
+
+        Only the first chunk of rows is read here; it is enough to map the
+        input fields.  The whole file is read a chunk at a time when it is
+        imported.
 
         :param file_type: the type of file to import from.  Supported files
             types are:
@@ -875,14 +698,21 @@ class Import:
             self._df_input_data = pd.read_csv(file_name,
                                               sep=';',
                                               na_values=[''],
-                                              parse_dates=True)
+                                              parse_dates=True,
+                                              nrows=self._chunk_size)
         elif file_type == 'text':
             self._df_input_data = pd.read_csv(file_name,
                                               sep=' ',
                                               na_values=[''],
-                                              parse_dates=True)
+                                              parse_dates=True,
+                                              nrows=self._chunk_size)
         elif file_type == 'excel':
-            self._df_input_data = pd.read_excel(file_name)
+            self._df_input_data = pd.read_excel(file_name,
+                                                nrows=self._chunk_size)
+
+        if file_type in ['csv', 'text', 'excel']:
+            self._file_name = file_name
+            self._file_type = file_type
 
         pub.sendMessage(
             'succeed_read_import_file',
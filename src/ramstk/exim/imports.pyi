@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Tuple
 
 # Third Party Imports
 import pandas as pd
@@ -23,19 +23,19 @@ from ramstk.models.programdb import RAMSTKRequirement as RAMSTKRequirement
 from ramstk.models.programdb import RAMSTKSimilarItem as RAMSTKSimilarItem
 from ramstk.models.programdb import RAMSTKValidation as RAMSTKValidation
 
-def _do_replace_nan(value: Any, default: Any) -> Any:
-    ...
-
-
-def _get_input_value(mapper: Dict[str, Any], df_row: pd.Series, field: str,
-                     default: Any) -> Any:
+def _get_input_column(mapper: Dict[str, Any], df_input: pd.DataFrame,
+                      field: str, default: Any) -> pd.Series:
     ...
 
 
 class Import:
     _dic_field_map: Any = ...
+    _dic_table_fields: Any = ...
+    _chunk_size: int = ...
     _dao: Any = ...
     _df_input_data: Any = ...
+    _file_name: str = ...
+    _file_type: str = ...
 
     def __init__(self) -> None:
         ...
@@ -46,46 +46,22 @@ class Import:
     def _do_import(self, module: str) -> None:
         ...
 
-    def _do_insert_allocation(self, row: pd.Series) -> RAMSTKAllocation:
-        ...
-
-    def _do_insert_design_electric(self,
-                                   row: pd.Series) -> RAMSTKDesignElectric:
-        ...
-
-    def _do_insert_design_mechanic(self,
-                                   row: pd.Series) -> RAMSTKDesignMechanic:
-        ...
-
-    def _do_insert_function(self, row: pd.Series) -> RAMSTKFunction:
-        ...
-
-    def _do_insert_hardware(self, row: pd.Series) -> RAMSTKHardware:
-        ...
-
-    def _do_insert_mil_hdbk_f(self, row: pd.Series) -> RAMSTKMilHdbkF:
+    def _do_map_records(
+            self, module: str,
+            df_input: pd.DataFrame) -> List[Tuple[Any, List[Dict[str, Any]]]]:
         ...
 
-    def _do_insert_nswc(self, row: pd.Series) -> RAMSTKNSWC:
-        ...
-
-    def _do_insert_reliability(self, row: pd.Series) -> RAMSTKReliability:
-        ...
-
-    def _do_insert_requirement(self, row: pd.Series) -> RAMSTKRequirement:
-        ...
-
-    def _do_insert_similar_item(self, row: pd.Series) -> RAMSTKSimilarItem:
+    def _do_map_to_field(self, module: str, import_field: str,
+                         format_field: str) -> None:
         ...
 
-    def _do_insert_validation(self, row: pd.Series) -> RAMSTKValidation:
+    def _do_read_chunks(self) -> Iterator[pd.DataFrame]:
         ...
 
-    def _do_map_to_field(self, module: str, import_field: str,
-                         format_field: str) -> None:
+    def _do_read_db_fields(self, module: str) -> None:
         ...
 
-    def _do_read_db_fields(self, module: str) -> None:
+    def _do_read_excel_chunks(self) -> Iterator[pd.DataFrame]:
         ...
 
     def _do_read_file(self, file_type: str, file_name: str) -> None:
@@ -17,9 +17,12 @@ from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 # RAMSTK Package Imports
-from ramstk.analyses.statistics import do_calculate_beta_bounds
 from ramstk.db import RAMSTK_BASE
 from ramstk.models import RAMSTKBaseTable
+from ramstk.utilities import lazy_import
+
+# The statistics package uses scipy which is slow to import.
+statistics = lazy_import('ramstk.analyses.statistics')
 
 
 class RAMSTKValidation(RAMSTK_BASE, RAMSTKBaseTable):
@@ -204,8 +207,10 @@ class RAMSTKValidation(RAMSTK_BASE, RAMSTKBaseTable):
         :rtype: None
         """
         (self.time_ll, self.time_mean, self.time_ul,
-         _sd) = do_calculate_beta_bounds(self.time_minimum, self.time_average,
-                                         self.time_maximum, self.confidence)
+         _sd) = statistics.do_calculate_beta_bounds(self.time_minimum,
+                                                    self.time_average,
+                                                    self.time_maximum,
+                                                    self.confidence)
 
         self.time_variance = _sd**2.0
 
@@ -219,7 +224,9 @@ class RAMSTKValidation(RAMSTK_BASE, RAMSTKBaseTable):
         :rtype: None
         """
         (self.cost_ll, self.cost_mean, self.cost_ul,
-         _sd) = do_calculate_beta_bounds(self.cost_minimum, self.cost_average,
-                                         self.cost_maximum, self.confidence)
+         _sd) = statistics.do_calculate_beta_bounds(self.cost_minimum,
+                                                    self.cost_average,
+                                                    self.cost_maximum,
+                                                    self.confidence)
 
         self.cost_variance = _sd**2.0
@@ -6,15 +6,43 @@
 # Copyright 2019 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """RAMSTKBaseTable Module."""
 
+# Third Party Imports
+# noinspection PyPackageRequirements
+from sqlalchemy import inspect
+
 # RAMSTK Package Imports
 from ramstk.utilities import none_to_default
 
 
 class RAMSTKBaseTable:
     """Meta-class for RAMSTK Common and Program database tables."""
+    @property
+    def is_dirty(self) -> bool:
+        """Indicate whether the record has changes not saved to the database.
+
+        Records that have never been saved are always dirty.  Otherwise the
+        record is dirty only if the value of at least one field differs from
+        the value last loaded from or saved to the database.
+
+        :return: True if the record has unsaved changes, False otherwise.
+        :rtype: bool
+        """
+        _state = inspect(self)
+
+        if _state.transient or _state.pending:
+            return True
+
+        if not _state.modified:
+            return False
+
+        return any(_attr.history.has_changes() for _attr in _state.attrs)
+
     def set_attributes(self, attributes):
         """Set one or more RAMSTK<Table> attributes.
 
+        Only the attributes whose value changes are assigned so that setting
+        a record to the values it already holds does not make it dirty.
+
         .. note:: you should pop the primary and foreign key entries from the
             attributes dict before passing it to this method.
 
@@ -26,6 +54,8 @@ class RAMSTKBaseTable:
             a table field.
         """
         for _key in attributes:
-            getattr(self, _key)
-            setattr(self, _key,
-                    none_to_default(attributes[_key], self.__defaults__[_key]))
+            _current = getattr(self, _key)
+            _value = none_to_default(attributes[_key],
+                                     self.__defaults__[_key])
+            if _current != _value:
+                setattr(self, _key, _value)
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+#
+#       ramstk.profiler.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""RAMSTK Import Profiler Module."""
+
+# Standard Library Imports
+import sys
+import time
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class RAMSTKImportProfiler:
+    """Class to time the import of each module while RAMSTK starts.
+
+    The profiler is a meta path finder.  It doesn't find any modules itself,
+    it asks the finders after it on sys.meta_path for the module's spec and
+    then times the loader executing the module.  Each module's time is
+    reported two ways:
+
+        * self time is the time spent executing the module's own code.
+        * cumulative time also includes the modules it imported.
+
+    Modules loaded with lazy_import() are timed when they're first used
+    rather than when lazy_import() is called.
+
+    :ivar dic_times: the (self, cumulative) import time in seconds of each
+        module keyed by module name.
+    """
+    def __init__(self) -> None:
+        """Initialize an instance of the import profiler."""
+        # Initialize private dictionary attributes.
+
+        # Initialize private list attributes.
+        # The time spent importing the children of each module being
+        # executed; the last element is the innermost module.
+        self._lst_child_times: List[float] = []
+
+        # Initialize private scalar attributes.
+        self._start: float = 0.0
+
+        # Initialize public dictionary attributes.
+        self.dic_times: Dict[str, Tuple[float, float]] = {}
+
+        # Initialize public list attributes.
+
+        # Initialize public scalar attributes.
+        self.elapsed: float = 0.0
+
+    def do_start(self) -> None:
+        """Start timing module imports.
+
+        :return: None
+        :rtype: None
+        """
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        self._start = time.perf_counter()
+
+    def do_stop(self) -> None:
+        """Stop timing module imports.
+
+        :return: None
+        :rtype: None
+        """
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+            self.elapsed = time.perf_counter() - self._start
+
+    def find_spec(self,
+                  fullname: str,
+                  path: Optional[Sequence[str]],
+                  target: Optional[ModuleType] = None) -> Optional[ModuleSpec]:
+        """Find the spec of a module and time its loader.
+
+        :param fullname: the absolute name of the module to find.
+        :param path: the search path; None for top-level modules.
+        :param target: the module being reloaded, if any.
+        :return: the spec of the module or None if it can't be found.
+        :rtype: :class:`importlib.machinery.ModuleSpec`
+        """
+        for _finder in sys.meta_path:
+            if _finder is self or not hasattr(_finder, 'find_spec'):
+                continue
+
+            _spec = _finder.find_spec(fullname, path, target)
+            if _spec is not None:
+                # Built-in and frozen importers are classes shared by every
+                # module they load so they aren't timed.
+                if (_spec.loader is not None
+                        and not isinstance(_spec.loader, type)
+                        and hasattr(_spec.loader, 'exec_module')):
+                    self._do_wrap_loader(fullname, _spec.loader)
+                return _spec
+
+        return None
+
+    def get_report(self, limit: int = 25) -> str:
+        """Get the import time report sorted by cumulative time.
+
+        :param limit: the maximum number of modules to include.
+        :return: the report with one module per line.
+        :rtype: str
+        """
+        _lines = [
+            '{0:>10s} {1:>12s}  {2:s}'.format('self [ms]', 'cumul. [ms]',
+                                              'module')
+        ]
+        _times = sorted(self.dic_times.items(), key=lambda x: -x[1][1])
+        for _name, (_self, _cumulative) in _times[:limit]:
+            _lines.append('{0:10.1f} {1:12.1f}  {2:s}'.format(
+                _self * 1000.0, _cumulative * 1000.0, _name))
+        _lines.append(
+            'Imported {0:d} modules; startup took {1:.1f} ms.'.format(
+                len(self.dic_times), self.elapsed * 1000.0))
+
+        return '\n'.join(_lines)
+
+    def _do_wrap_loader(self, name: str, loader: Any) -> None:
+        """Replace the loader's exec_module() with a timed version.
+
+        The timed version is set on the loader instance and removed the first
+        time it is called so the loader's type doesn't change.
+
+        :param name: the absolute name of the module the loader will load.
+        :param loader: the loader of the module.
+        :return: None
+        :rtype: None
+        """
+        _exec_module: Callable[[ModuleType], None] = loader.exec_module
+
+        def _do_timed_exec(module: ModuleType) -> None:
+            """Execute the module and record the time it took."""
+            try:
+                del loader.exec_module
+            except AttributeError:
+                pass
+
+            self._lst_child_times.append(0.0)
+            _start = time.perf_counter()
+            try:
+                _exec_module(module)
+            finally:
+                _cumulative = time.perf_counter() - _start
+                _children = self._lst_child_times.pop()
+                if self._lst_child_times:
+                    self._lst_child_times[-1] += _cumulative
+                self.dic_times[name] = (_cumulative - _children, _cumulative)
+
+        loader.exec_module = _do_timed_exec
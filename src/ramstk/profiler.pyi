@@ -0,0 +1,32 @@
+# Standard Library Imports
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class RAMSTKImportProfiler:
+    _lst_child_times: List[float] = ...
+    _start: float = ...
+    dic_times: Dict[str, Tuple[float, float]] = ...
+    elapsed: float = ...
+
+    def __init__(self) -> None:
+        ...
+
+    def do_start(self) -> None:
+        ...
+
+    def do_stop(self) -> None:
+        ...
+
+    def find_spec(self,
+                  fullname: str,
+                  path: Optional[Sequence[str]],
+                  target: Optional[ModuleType] = ...) -> Optional[ModuleSpec]:
+        ...
+
+    def get_report(self, limit: int = ...) -> str:
+        ...
+
+    def _do_wrap_loader(self, name: str, loader: Any) -> None:
+        ...
@@ -18,7 +18,9 @@ from sqlalchemy.exc import (  # type: ignore
 
 # RAMSTK Package Imports
 from ramstk.configuration import RAMSTKUserConfiguration
-from ramstk.db import BaseDatabase, do_create_program_db
+from ramstk.db import (
+    BaseDatabase, do_create_program_db, get_pool_statistics
+)
 from ramstk.exceptions import DataAccessError
 
 
@@ -160,6 +162,12 @@ class RAMSTKProgramManager:
         """
         self.program_dao = program_db
 
+        if database['dialect'] == 'sqlite':
+            database = dict(database)
+            database['sqlite_profile'] = \
+                self.user_configuration.get_sqlite_profile(
+                    database['database'])
+
         try:
             self.program_dao.do_connect(database)
             pub.sendMessage('succeed_connect_program_database',
@@ -196,22 +204,51 @@ class RAMSTKProgramManager:
         try:
             self.program_dao.do_disconnect()
             pub.sendMessage('succeed_disconnect_program_database')
+            for _url, _statistics in get_pool_statistics().items():
+                pub.sendMessage(
+                    'do_log_debug_msg',
+                    logger_name='DEBUG',
+                    message="Connection pool {0}: {1}.".format(
+                        _url, _statistics))
         except AttributeError:
             _error_msg = ("Not currently connected to a database.  Nothing to "
                           "close.")
             pub.sendMessage('fail_disconnect_program_database',
                             error_message=_error_msg)
 
-    @staticmethod
-    def do_save_program() -> None:
+    def do_save_program(self) -> None:
         """Save the open RAMSTK Program database.
 
+        Every workstream module saves its records within a single unit of
+        work.  The program database is committed once at the end of the save
+        and, if the database rejects any record, none of the changes are
+        saved.  SQLite program databases are saved with the bulk PRAGMA
+        profile; when the save is part of a larger unit of work, the caller
+        must change to the bulk profile before the unit of work begins.
+
         :return: None
         :rtype: None
         """
-        pub.sendMessage('request_update_all_revisions')
-        pub.sendMessage('request_update_all_functions')
-        pub.sendMessage('request_update_all_requirements')
-        pub.sendMessage('request_update_all_stakeholders')
-        pub.sendMessage('request_update_all_hardware')
-        pub.sendMessage('request_update_all_validation')
+        try:
+            _profile = self.program_dao.do_set_sqlite_profile('bulk')
+        except DataAccessError as _error:
+            pub.sendMessage('fail_save_program', error_message=_error.msg)
+            return
+
+        self.program_dao.do_begin_transaction()
+        try:
+            try:
+                pub.sendMessage('request_save_project')
+            except Exception:
+                self.program_dao.do_rollback_transaction()
+                raise
+
+            # The commit ends the unit of work even when it raises an error.
+            self.program_dao.do_commit_transaction()
+        except Exception as _error:  # pylint: disable=broad-except
+            pub.sendMessage('fail_save_program', error_message=str(_error))
+            return
+        finally:
+            self.program_dao.do_set_sqlite_profile(_profile)
+
+        pub.sendMessage('succeed_save_program')
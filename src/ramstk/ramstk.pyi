@@ -7,6 +7,7 @@ from ramstk.configuration import (
 )
 from ramstk.db import BaseDatabase as BaseDatabase
 from ramstk.db import do_create_program_db as do_create_program_db
+from ramstk.db import get_pool_statistics as get_pool_statistics
 from ramstk.exceptions import DataAccessError as DataAccessError
 
 class RAMSTKProgramManager:
@@ -28,6 +29,5 @@ class RAMSTKProgramManager:
     def do_close_program(self) -> None:
         ...
 
-    @staticmethod
-    def do_save_program() -> None:
+    def do_save_program(self) -> None:
         ...
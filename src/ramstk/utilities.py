@@ -8,10 +8,12 @@
 
 # Standard Library Imports
 import gettext
+import importlib.util
 import os
 import os.path
 import sys
 from datetime import datetime
+from types import ModuleType
 from typing import Any, List
 
 # Third Party Imports
@@ -193,3 +195,35 @@ def get_install_prefix() -> str:
             _path = '/usr'
 
     return _path
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Import a module the first time one of its attributes is used.
+
+    This is used for modules that are slow to import (e.g., those that pull in
+    sympy, scipy, pandas, or openpyxl) so they aren't imported until they are
+    actually needed.  A module that has already been imported is returned
+    as is.
+
+    :param name: the absolute name of the module to import.
+    :return: the (possibly not yet loaded) module.
+    :rtype: :class:`types.ModuleType`
+    :raise: ModuleNotFoundError if the module can't be found.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+
+    _spec = importlib.util.find_spec(name)
+    if _spec is None:
+        raise ModuleNotFoundError("No module named '{0}'".format(name),
+                                  name=name)
+
+    _loader = importlib.util.LazyLoader(_spec.loader)
+    _spec.loader = _loader
+    _module = importlib.util.module_from_spec(_spec)
+    sys.modules[name] = _module
+    _loader.exec_module(_module)
+
+    return _module
@@ -1,5 +1,6 @@
 # Standard Library Imports
 import gettext
+from types import ModuleType
 from typing import Any, List
 
 _ = gettext.gettext
@@ -47,3 +48,7 @@ def string_to_boolean(string: str) -> bool:
 
 def get_install_prefix() -> str:
     ...
+
+
+def lazy_import(name: str) -> ModuleType:
+    ...
@@ -465,7 +465,7 @@ class RAMSTKDesktop(Gtk.Window):
             self.RAMSTK_USER_CONFIGURATION.RAMSTK_PROG_INFO['database'])
         self.statusbar.push(2, _message)
 
-        pub.sendMessage('request_save_project')
+        pub.sendMessage('request_update_program')
 
         if end:
             destroy(widget)
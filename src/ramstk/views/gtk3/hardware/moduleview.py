@@ -107,8 +107,21 @@ class HardwarePanel(RAMSTKPanel):
         pub.subscribe(super().do_refresh_tree, 'wvw_editing_hardware')
         pub.subscribe(super().on_delete, 'succeed_delete_hardware')
 
+        pub.subscribe(self._on_calculate_hardware,
+                      'succeed_calculate_hardware')
         pub.subscribe(self._on_module_switch, 'mvwSwitchedPage')
 
+    def _on_calculate_hardware(self, tree: treelib.Tree) -> None:
+        """Refresh the hardware rows with the results of a calculation.
+
+        :param tree: the treelib Tree() with the calculated hardware.
+        :return: None
+        """
+        super().do_refresh_rows({
+            _node.identifier: _node.data['hardware'].get_attributes()
+            for _node in tree.all_nodes_itr() if _node.data is not None
+        })
+
     def _on_module_switch(self, module: str = '') -> None:
         """Respond to changes in selected Module View module (tab).
 
@@ -28,6 +28,9 @@ class HardwarePanel(RAMSTKPanel):
     def __init__(self) -> None:
         ...
 
+    def _on_calculate_hardware(self, tree: treelib.Tree) -> None:
+        ...
+
     def _on_module_switch(self, module: str = ...) -> None:
         ...
 
@@ -270,7 +270,7 @@ class ModuleView(RAMSTKModuleView):
         :return: None
         """
         _data = tree.get_node(node_id).data['revision'].get_attributes()
-        self._pnlPanel.on_insert(_data)
+        self._pnlPanel.on_insert(_data, node_id)
 
     def __make_ui(self) -> None:
         """Build the user interface for the revision module view.
@@ -161,6 +161,7 @@ class RAMSTKBaseView(Gtk.HBox):
         pub.subscribe(self.do_set_cursor_active,
                       'succeed_calculate_{0}'.format(self._module))
         pub.subscribe(self.do_set_cursor_active, 'succeed_update_all')
+        pub.subscribe(self.do_set_cursor_active, 'succeed_save_program')
         pub.subscribe(self.do_set_cursor_active_on_fail,
                       'fail_delete_{0}'.format(self._module))
         pub.subscribe(self.do_set_cursor_active_on_fail,
@@ -604,7 +605,7 @@ class RAMSTKBaseView(Gtk.HBox):
         :rtype: None
         """
         _data = tree.get_node(node_id).data[self._module].get_attributes()
-        self._pnlPanel.on_insert(_data)
+        self._pnlPanel.on_insert(_data, node_id)
 
     def on_select_revision(self, attributes: Dict[str, Any]) -> None:
         """Set the Revision ID when a new Revision is selected.
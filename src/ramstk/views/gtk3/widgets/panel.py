@@ -9,7 +9,7 @@
 
 # Standard Library Imports
 import inspect
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 # Third Party Imports
 # pylint: disable=ungrouped-imports
@@ -106,6 +106,11 @@ class RAMSTKPanel(RAMSTKFrame):
         'mission': self.__do_load_mission
         'function': super().do_load_row
 
+    :ivar _dic_row_references: contains the Gtk.TreeRowReference() of each
+        row in the RAMSTKTreeView() where the key is the ID of the work
+        stream module item in the row.  The index is built when the tree is
+        loaded and is used to find the row for a record without searching
+        the Gtk.TreeModel().
     :ivar _lst_labels: the list of text to display in the labels
         for each widget in a panel.
     :ivar _lst_widgets: the list of widgets to display in a panel.
@@ -150,6 +155,7 @@ class RAMSTKPanel(RAMSTKFrame):
         self._dic_attribute_keys: Dict[int, List[str]] = {}
         self._dic_attribute_updater: Dict[str, Any] = {}
         self._dic_row_loader: Dict[str, Any] = {}
+        self._dic_row_references: Dict[Any, Gtk.TreeRowReference] = {}
 
         # Initialize private list instance attributes.
         self._lst_col_order: List[int] = []
@@ -180,6 +186,8 @@ class RAMSTKPanel(RAMSTKFrame):
         :return: None
         :rtype: None
         """
+        self._dic_row_references = {}
+
         _model = self.tvwTreeView.get_model()
         try:
             _model.clear()
@@ -206,6 +214,26 @@ class RAMSTKPanel(RAMSTKFrame):
 
             self.tvwTreeView.row_activated(_path, _column)
 
+    def do_get_row(self, node_id: Any) -> Optional[Gtk.TreeIter]:
+        """Get the row in the RAMSTKTreeView() displaying a record.
+
+        :param node_id: the ID of the work stream module item to find.
+        :return: the Gtk.TreeIter() of the row displaying the item or None if
+            the item isn't displayed.
+        :rtype: :class:`Gtk.TreeIter`
+        """
+        _row = None
+
+        _reference = self._dic_row_references.get(node_id)
+        if _reference is not None and _reference.valid():
+            _row = _reference.get_model().get_iter(_reference.get_path())
+        elif _reference is not None:
+            # The row was removed from the Gtk.TreeModel() with one of its
+            # ancestors.
+            self._dic_row_references.pop(node_id)
+
+        return _row
+
     # noinspection PyUnusedLocal
     # pylint: disable=unused-argument
     def do_load_panel(self,
@@ -220,14 +248,23 @@ class RAMSTKPanel(RAMSTKFrame):
         :param row: the parent row in the RAMSTKTreeView() to add the new item.
         :return: None
         """
-        _node = tree.nodes[list(tree.nodes.keys())[0]]
+        _rows: Dict[Any, Gtk.TreeIter] = {}
+
+        # Walk the tree in pre-order with a stack of (node ID, parent row)
+        # pairs rather than recursing on copies of each subtree.
+        _stack = [] if tree.root is None else [(tree.root, row)]
+        while _stack:
+            _node_id, _row = _stack.pop()
+            _node = tree[_node_id]
 
-        _new_row = self._do_load_row(_node, row)
+            _new_row = self._do_load_row(_node, _row)
+            if _new_row is not None:
+                _rows[_node_id] = _new_row
 
-        for _n in tree.children(_node.identifier):
-            _child_tree = tree.subtree(_n.identifier)
-            self.do_load_panel(_child_tree, row=_new_row)
+            _stack.extend((_child_id, _new_row) for _child_id in reversed(
+                _node.successors(tree.identifier)))
 
+        self._do_set_row_references(_rows)
         self.do_expand_tree()
 
         pub.sendMessage('request_set_cursor_active')
@@ -256,8 +293,8 @@ class RAMSTKPanel(RAMSTKFrame):
         :param tree: the treelib Tree containing the module to load.
         :return: None
         """
+        self.do_clear_tree()
         _model = self.tvwTreeView.get_model()
-        _model.clear()
 
         try:
             _tag = tree.get_node(0).tag
@@ -265,7 +302,8 @@ class RAMSTKPanel(RAMSTKFrame):
             _tag = "UNK"
 
         try:
-            self.tvwTreeView.do_load_tree(tree, _tag)
+            self._do_set_row_references(
+                self.tvwTreeView.do_load_tree(tree, _tag))
             self.tvwTreeView.expand_all()
             _row = _model.get_iter_first()
             if _row is not None:
@@ -392,9 +430,50 @@ class RAMSTKPanel(RAMSTKFrame):
 
         self._lst_col_order = list(self.tvwTreeView.position.values())
 
+    def do_refresh_rows(self, package: Dict[Any, Dict[str, Any]]) -> None:
+        """Update the RAMSTKTreeView() rows of many records in place.
+
+        This method is used to update the RAMSTKTreeView() after a bulk
+        change such as a calculation.  Only the rows displaying the records
+        in package are touched and only the cells whose value changed are
+        set.  Attributes that aren't displayed are skipped.
+
+        :param package: the dict of attribute key:value pairs for each record
+            to update where the key is the ID of the record.
+        :return: None
+        """
+        _model = self.tvwTreeView.get_model()
+
+        for _node_id, _attributes in package.items():
+            _row = self.do_get_row(_node_id)
+            if _row is None:
+                continue
+
+            for _key, _value in _attributes.items():
+                try:
+                    _position = self._lst_col_order[
+                        self._dic_attribute_updater[_key][2]]
+                    if _model.get_value(_row, _position) != _value:
+                        _model.set(_row, _position, _value)
+                except (IndexError, KeyError):
+                    pass
+                except TypeError:
+                    _method_name: str = inspect.currentframe(  # type: ignore
+                    ).f_code.co_name
+                    _error_msg = _(
+                        "{2}: An error occurred while refreshing {1} data "
+                        "for Record ID {0} in the view.  Data {4} for {3} is "
+                        "the wrong type.").format(_node_id, self._module,
+                                                  _method_name, _key, _value)
+                    pub.sendMessage(
+                        'do_log_debug',
+                        logger_name='DEBUG',
+                        message=_error_msg,
+                    )
+
     # pylint: disable=unused-argument
     # noinspection PyUnusedLocal
-    def do_refresh_tree(self, node_id: List, package: Dict[str, Any]) -> None:
+    def do_refresh_tree(self, node_id: Any, package: Dict[str, Any]) -> None:
         """Update the module view RAMSTKTreeView() with attribute changes.
 
         This method is used to update a RAMSTKPanel() containing a
@@ -415,7 +494,11 @@ class RAMSTKPanel(RAMSTKFrame):
         position in the RAMSTKTreeView() containing the same attribute data
         as the one being changed.
 
-        :param node_id: unused in this method.
+        The row displaying the record in node_id is updated.  The selected
+        row is updated if the record isn't in the row index.
+
+        :param node_id: the ID of the record being updated or a list with the
+            record ID in position 0.
         :param package: the key:value for the data being updated.
         :return: None
         """
@@ -426,6 +509,10 @@ class RAMSTKPanel(RAMSTKFrame):
                                             [2]]
 
             _model, _row = self.tvwTreeView.get_selection().get_selected()
+            _node_id = node_id[0] if isinstance(node_id, list) else node_id
+            _indexed_row = self.do_get_row(_node_id)
+            if _indexed_row is not None:
+                _row = _indexed_row
             _model.set(_row, _position, _value)
         except KeyError:
             _method_name: str = inspect.currentframe(  # type: ignore
@@ -734,6 +821,7 @@ class RAMSTKPanel(RAMSTKFrame):
         """
         _model, _row = self.tvwTreeView.selection.get_selected()
         _model.remove(_row)
+        self._dic_row_references.pop(self._record_id, None)
 
         _row = _model.get_iter_first()
         if _row is not None:
@@ -796,10 +884,12 @@ class RAMSTKPanel(RAMSTKFrame):
                 message=_error_msg,
             )
 
-    def on_insert(self, data: Any) -> None:
+    def on_insert(self, data: Any, node_id: Any = None) -> None:
         """Add row to module view for newly added work stream element.
 
         :param data: the data package for the work stream element to add.
+        :param node_id: the ID of the work stream element to add.  The new
+            row isn't added to the row index when no ID is passed.
         :return: None
         """
         _model, _row = self.tvwTreeView.selection.get_selected()
@@ -813,7 +903,9 @@ class RAMSTKPanel(RAMSTKFrame):
         else:
             _prow = _model.iter_parent(_row)
 
-        self.tvwTreeView.do_insert_row(data, _prow)
+        _row = self.tvwTreeView.do_insert_row(data, _prow)
+        if node_id is not None:
+            self._do_set_row_references({node_id: _row})
 
         pub.sendMessage('request_set_cursor_active')
 
@@ -948,6 +1040,23 @@ class RAMSTKPanel(RAMSTKFrame):
 
         return _new_row
 
+    def _do_set_row_references(self, rows: Dict[Any, Gtk.TreeIter]) -> None:
+        """Add rows to the row index.
+
+        The Gtk.TreeRowReference()s are created after the rows are loaded
+        because the Gtk.TreeModel() updates every existing reference each
+        time a row is added.
+
+        :param rows: the Gtk.TreeIter() of each row to add to the index where
+            the key is the ID of the work stream module item in the row.
+        :return: None
+        """
+        _model = self.tvwTreeView.get_model()
+
+        for _node_id, _row in rows.items():
+            self._dic_row_references[_node_id] = Gtk.TreeRowReference.new(
+                _model, _model.get_path(_row))
+
     def __do_read_text(self, entry: RAMSTKEntry,
                        keys: List[str]) -> Dict[str, Any]:
         """Read the text in a RAMSTKEntry() or Gtk.TextBuffer().
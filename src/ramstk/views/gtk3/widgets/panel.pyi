@@ -1,5 +1,5 @@
 # Standard Library Imports
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 # Third Party Imports
 import treelib
@@ -26,6 +26,7 @@ class RAMSTKPanel(RAMSTKFrame):
     _dic_attribute_keys: Any = ...
     _dic_attribute_updater: Any = ...
     _dic_row_loader: Any = ...
+    _dic_row_references: Dict[Any, Gtk.TreeRowReference] = ...
     _lst_col_order: Any = ...
     _lst_labels: Any = ...
     _lst_widgets: Any = ...
@@ -46,6 +47,9 @@ class RAMSTKPanel(RAMSTKFrame):
     def do_expand_tree(self) -> None:
         ...
 
+    def do_get_row(self, node_id: Any) -> Optional[Gtk.TreeIter]:
+        ...
+
     def do_load_panel(self,
                       tree: treelib.Tree = ...,
                       node_id: Any = ...,
@@ -70,7 +74,10 @@ class RAMSTKPanel(RAMSTKFrame):
     def do_make_treeview(self, **kwargs: Dict[str, Any]) -> None:
         ...
 
-    def do_refresh_tree(self, node_id: List, package: Dict[str, Any]) -> None:
+    def do_refresh_rows(self, package: Dict[Any, Dict[str, Any]]) -> None:
+        ...
+
+    def do_refresh_tree(self, node_id: Any, package: Dict[str, Any]) -> None:
         ...
 
     def do_set_callbacks(self) -> None:
@@ -112,7 +119,7 @@ class RAMSTKPanel(RAMSTKFrame):
     def on_edit(self, node_id: List[int], package: Dict[str, Any]) -> None:
         ...
 
-    def on_insert(self, data: Any) -> None:
+    def on_insert(self, data: Any, node_id: Any = ...) -> None:
         ...
 
     def on_row_change(self, selection: Gtk.TreeSelection) -> Dict[str, Any]:
@@ -130,6 +137,9 @@ class RAMSTKPanel(RAMSTKFrame):
                          row: Gtk.TreeIter) -> Gtk.TreeIter:
         ...
 
+    def _do_set_row_references(self, rows: Dict[Any, Gtk.TreeIter]) -> None:
+        ...
+
     def __do_read_text(self, entry: RAMSTKEntry,
                        keys: List[str]) -> Dict[str, Any]:
         ...
@@ -14,7 +14,6 @@ from typing import Any, Dict, List, Tuple, Union
 # Third Party Imports
 import toml
 import treelib
-from sortedcontainers import SortedDict
 
 # RAMSTK Package Imports
 from ramstk.utilities import string_to_boolean
@@ -304,12 +303,12 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
 
     def do_insert_row(self,
                       data: Dict[str, Any],
-                      prow: Gtk.TreeIter = None) -> None:
+                      prow: Gtk.TreeIter = None) -> Gtk.TreeIter:
         """Insert a new row in the treeview.
 
         :param data: the data dictionary for the new row to insert.
-        :return: None
-        :rtype: None
+        :return: _row; the row that was inserted.
+        :rtype: :class:`Gtk.TreeIter`
         """
         _data = []
         _model, _row = self.selection.get_selected()
@@ -324,45 +323,50 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
         self.set_cursor(_path, None, False)
         self.row_activated(_path, _column)
 
+        return _row
+
     def do_load_tree(self,
                      tree: treelib.Tree,
                      tag: str,
-                     row: Gtk.TreeIter = None) -> None:
+                     row: Gtk.TreeIter = None) -> Dict[Any, Gtk.TreeIter]:
         """Load the Module View's Gtk.TreeModel() with the Module's tree.
 
+        The tree is walked in pre-order with a stack of (node ID, parent row)
+        pairs so each node is visited once and no subtrees are copied.  The
+        Gtk.TreeModel() is detached from the Gtk.TreeView() while the rows are
+        appended so the view isn't updated for every row.
+
         :param tree: the Module's treelib Tree().
         :type tree: :class:`treelib.Tree`
         :param tag: the tag for the treelib Tree() to load.
         :param row: the parent row in the Gtk.TreeView() to add the new item.
         :type row: :class:`Gtk.TreeIter`
-        :return: None
-        :rtype: None
+        :return: _rows; the row loaded for each node with a data package.
+        :rtype: dict
         """
-        _row = None
+        _rows: Dict[Any, Gtk.TreeIter] = {}
+
         _model = self.get_model()
+        self.set_model(None)
 
-        _node = tree.nodes[list(SortedDict(tree.nodes).keys())[0]]
-        _entity = _node.data
+        try:
+            _stack = [] if tree.root is None else [(tree.root, row)]
+            while _stack:
+                _node_id, _parent_row = _stack.pop()
+                _node = tree[_node_id]
 
-        _attributes = []
-        if _entity is not None:  # pylint: disable=too-many-nested-blocks
-            _entity = _entity[tag]
-            # For simple data models that return a RAMSTK database
-            # table instance for the data object, the first try
-            # statement will create the list of attribute values.
-            try:
-                _attributes = self.get_simple_attributes(_entity)
-            except AttributeError:
-                # For aggregate data models (Hardware, Software) that
-                # return a dictionary of attributes from ALL associated
-                # RAMSTK database tables, this try statement will create
-                # the list of attribute values.
-                _attributes = self.get_aggregate_attributes(_entity)
+                _row = None
+                if _node.data is not None:
+                    _row = _model.append(_parent_row,
+                                         self._get_attributes(_node.data[tag]))
+                    _rows[_node_id] = _row
 
-            _row = _model.append(row, _attributes)
+                _stack.extend((_child_id, _row) for _child_id in reversed(
+                    _node.successors(tree.identifier)))
+        finally:
+            self.set_model(_model)
 
-        for _n in tree.children(_node.identifier):
-            self.do_load_tree(tree.subtree(_n.identifier), tag, _row)
+        return _rows
 
     # noinspection PyDefaultArgument
     # pylint: disable=dangerous-default-value
@@ -646,6 +650,28 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
         if key != 'col0':
             column.set_reorderable(True)
 
+    def _get_attributes(self, entity: object) -> List[Any]:
+        """Get the attributes of a work stream module's entity.
+
+        :param entity: the RAMSTK Program database table or the dict of
+            attributes to get the values from.
+        :return: _attributes; a list of the attributes values in the order
+            they will be displayed.
+        :rtype: list
+        """
+        # For simple data models that return a RAMSTK database table instance
+        # for the data object, the first try statement will create the list
+        # of attribute values.
+        try:
+            _attributes = self.get_simple_attributes(entity)
+        except AttributeError:
+            # For aggregate data models (Hardware, Software) that return a
+            # dictionary of attributes from ALL associated RAMSTK database
+            # tables, this will create the list of attribute values.
+            _attributes = self.get_aggregate_attributes(entity)
+
+        return _attributes
+
     @staticmethod
     def _resize_wrap(column: Gtk.TreeViewColumn, __param,
                      cell: Gtk.CellRenderer) -> None:
@@ -78,13 +78,13 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
 
     def do_insert_row(self,
                       data: Dict[str, Any],
-                      prow: Gtk.TreeIter = ...) -> None:
+                      prow: Gtk.TreeIter = ...) -> Gtk.TreeIter:
         ...
 
     def do_load_tree(self,
                      tree: treelib.Tree,
                      tag: str,
-                     row: Gtk.TreeIter = ...) -> None:
+                     row: Gtk.TreeIter = ...) -> Dict[Any, Gtk.TreeIter]:
         ...
 
     def do_make_columns(self, colors: Dict[str, str] = ...) -> None:
@@ -124,6 +124,9 @@ class RAMSTKTreeView(Gtk.TreeView, RAMSTKWidget):
                                   column: Gtk.TreeViewColumn) -> None:
         ...
 
+    def _get_attributes(self, entity: object) -> List[Any]:
+        ...
+
     @staticmethod
     def _resize_wrap(column: Gtk.TreeViewColumn, __param: Any,
                      cell: Gtk.CellRenderer) -> None:
@@ -0,0 +1,236 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.milhdbk217f.test_batch.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2019 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the milhdbk217f batch module."""
+
+# Standard Library Imports
+import time
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import batch, milhdbk217f
+
+SUBCATEGORIES = {
+    1: range(1, 11),
+    2: range(1, 14),
+    3: range(1, 16),
+    4: range(1, 20),
+    5: range(1, 3),
+    6: range(1, 3),
+    7: range(1, 6),
+    8: range(1, 6),
+    9: range(1, 3),
+    10: range(1, 5)
+}
+
+ID_COLUMNS = [
+    'application_id', 'configuration_id', 'construction_id',
+    'contact_form_id', 'contact_rating_id', 'environment_active_id',
+    'family_id', 'insert_id', 'insulation_id', 'manufacturing_id',
+    'matching_id', 'package_id', 'page_number', 'quality_id',
+    'specification_id', 'technology_id', 'type_id'
+]
+
+
+def _make_columns(category_id, subcategory_id, n_items, max_id=8, seed=1):
+    """Create random attribute columns for a category and subcategory."""
+    _rng = np.random.default_rng(seed)
+    _columns = {
+        _key: _rng.uniform(0.01, 1.0, n_items)
+        for _key in batch.ATTRIBUTES
+    }
+    for _key in ID_COLUMNS:
+        _columns[_key] = _rng.integers(1, max_id, n_items)
+    _columns['technology_id'] = _rng.integers(1, 13, n_items)
+    _columns['contact_gauge'] = _rng.choice([12, 16, 20, 22, 26, 24],
+                                            n_items)
+    _columns['n_elements'] = _rng.integers(1, 300000, n_items)
+    _columns['n_active_pins'] = _rng.integers(1, 200, n_items)
+    _columns['n_cycles'] = _rng.choice([0.01, 0.3, 3.0, 30.0, 500.0, 350000.0],
+                                       n_items)
+    _columns['capacitance'] = _rng.uniform(1.0E-6, 1.0, n_items)
+    _columns['resistance'] = _rng.uniform(1.0, 1.0E6, n_items)
+    _columns['temperature_active'] = _rng.uniform(25.0, 75.0, n_items)
+    _columns['temperature_rated_max'] = _rng.choice(
+        [70.0, 85.0, 100.0, 105.0, 125.0, 150.0], n_items)
+    _columns['voltage_esd'] = _rng.uniform(0.0, 2000.0, n_items)
+    _columns['years_in_production'] = _rng.uniform(0.5, 3.0, n_items)
+    for _key in [
+            'temperature_case', 'theta_jc', 'power_rated', 'voltage_ratio',
+            'duty_cycle', 'power_operating'
+    ]:
+        _columns[_key] = np.where(_rng.uniform(size=n_items) < 0.2, 0.0,
+                                  _columns[_key])
+    _columns['category_id'] = np.full(n_items, category_id)
+    _columns['subcategory_id'] = np.full(n_items, subcategory_id)
+    _columns['hazard_rate_method_id'] = np.full(n_items, 2)
+
+    return _columns
+
+
+def _get_expected(columns, method):
+    """Calculate the expected hazard rates one item at a time."""
+    _expected = []
+    for _index in range(len(columns['category_id'])):
+        _attributes = {
+            _key: _value[_index].item()
+            for _key, _value in columns.items()
+        }
+        try:
+            _hazard_rate = method(**_attributes)['hazard_rate_active']
+            _hazard_rate = float(_hazard_rate)
+        except (ArithmeticError, LookupError, NameError, TypeError,
+                ValueError):
+            _hazard_rate = np.nan
+        _expected.append(_hazard_rate)
+
+    _expected = np.array(_expected)
+    _expected[~np.isfinite(_expected)] = np.nan
+
+    return _expected
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("category_id", list(SUBCATEGORIES))
+def test_do_predict_active_hazard_rate_many_part_stress(category_id):
+    """do_predict_active_hazard_rate_many() should match the scalar part stress models."""
+    for _subcategory_id in SUBCATEGORIES[category_id]:
+        for _max_id in [3, 8]:
+            _columns = _make_columns(category_id, _subcategory_id, 200,
+                                     _max_id)
+
+            _hazard_rates = batch.do_predict_active_hazard_rate_many(
+                _columns)
+
+            np.testing.assert_allclose(
+                _hazard_rates,
+                _get_expected(_columns,
+                              milhdbk217f._do_calculate_part_stress),
+                rtol=1.0E-9,
+                err_msg='category {0:d}, subcategory {1:d}'.format(
+                    category_id, _subcategory_id))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("category_id", list(SUBCATEGORIES))
+def test_do_predict_active_hazard_rate_many_part_count(category_id):
+    """do_predict_active_hazard_rate_many() should match the scalar parts count models."""
+    for _subcategory_id in SUBCATEGORIES[category_id]:
+        _columns = _make_columns(category_id, _subcategory_id, 100, 4)
+        _columns['hazard_rate_method_id'] = np.full(100, 1)
+        if category_id == 1:
+            _columns['n_elements'] = np.full(100, 16000)
+
+        _hazard_rates = batch.do_predict_active_hazard_rate_many(_columns)
+
+        np.testing.assert_allclose(
+            _hazard_rates,
+            _get_expected(_columns, milhdbk217f._do_calculate_part_count),
+            rtol=1.0E-9,
+            err_msg='category {0:d}, subcategory {1:d}'.format(
+                category_id, _subcategory_id))
+        if category_id != 1 or _subcategory_id not in [3, 9, 10]:
+            assert np.any(np.isfinite(_hazard_rates))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_predict_active_hazard_rate_many_mixed():
+    """do_predict_active_hazard_rate_many() should return hazard rates in the order passed."""
+    _columns = {
+        'category_id': [4, 3, 4],
+        'subcategory_id': [1, 1, 1],
+        'hazard_rate_method_id': [2, 2, 3],
+        'hazard_rate_active': [0.0, 0.0, 0.0132],
+        'environment_active_id': [1, 1, 1],
+        'quality_id': [1, 1, 1],
+        'capacitance': [0.0000033, 0.0, 0.0],
+        'power_ratio': [0.0, 0.45, 0.0],
+        'resistance': [0.0, 1.1E4, 0.0],
+        'temperature_active': [45.0, 45.0, 45.0],
+        'temperature_rated_max': [85.0, 0.0, 0.0],
+        'voltage_ratio': [0.5, 0.0, 0.0],
+    }
+
+    _hazard_rates = batch.do_predict_active_hazard_rate_many(_columns)
+
+    assert _hazard_rates[0] == pytest.approx(0.02850450378)
+    assert _hazard_rates[1] == pytest.approx(2.414470751E-05)
+    assert _hazard_rates[2] == 0.0132
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_predict_active_hazard_rate_many_unknown_id():
+    """do_predict_active_hazard_rate_many() should return NaN for unknown ID's."""
+    _columns = {
+        'category_id': [4, 4, 4, 4],
+        'subcategory_id': [1, 1, 1, 40],
+        'hazard_rate_method_id': [2, 2, 2, 2],
+        'environment_active_id': [0, 1, 15, 1],
+        'quality_id': [1, 1, 1, 1],
+        'capacitance': [0.0000033, 0.0000033, 0.0000033, 0.0000033],
+        'temperature_active': [45.0, 45.0, 45.0, 45.0],
+        'temperature_rated_max': [85.0, 85.0, 85.0, 85.0],
+        'voltage_ratio': [0.5, 0.5, 0.5, 0.5],
+    }
+
+    _hazard_rates = batch.do_predict_active_hazard_rate_many(_columns)
+
+    assert np.isnan(_hazard_rates[0])
+    assert np.isfinite(_hazard_rates[1])
+    assert np.isnan(_hazard_rates[2])
+    assert np.isnan(_hazard_rates[3])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_predict_active_hazard_rate_many_missing_column():
+    """do_predict_active_hazard_rate_many() should raise a KeyError when a required column is missing."""
+    with pytest.raises(KeyError):
+        batch.do_predict_active_hazard_rate_many({
+            'category_id': [4],
+            'subcategory_id': [1]
+        })
+
+
+class TestBenchmarks():
+    """Class for MIL-HDBK-217F batch benchmark test suite."""
+    @pytest.mark.benchmark
+    def test_do_predict_active_hazard_rate_many(self):
+        """do_predict_active_hazard_rate_many() should predict 100,000 parts the same as the scalar models."""
+        _parts = []
+        for _category_id, _subcategories in SUBCATEGORIES.items():
+            for _subcategory_id in _subcategories:
+                _parts.append(
+                    _make_columns(_category_id, _subcategory_id, 1300))
+        _columns = {
+            _key: np.concatenate([_part[_key] for _part in _parts])[:100000]
+            for _key in _parts[0]
+        }
+
+        _start = time.perf_counter()
+        _hazard_rates = batch.do_predict_active_hazard_rate_many(_columns)
+        _elapsed = time.perf_counter() - _start
+
+        print('\nPredicted {0:d} hazard rates in {1:.3f} seconds.'.format(
+            _hazard_rates.shape[0], _elapsed))
+
+        assert _hazard_rates.shape == (100000, )
+        np.testing.assert_allclose(
+            _hazard_rates[::100],
+            _get_expected({
+                _key: _value[::100]
+                for _key, _value in _columns.items()
+            }, milhdbk217f._do_calculate_part_stress),
+            rtol=1.0E-9)
@@ -424,6 +424,29 @@ def test_get_environment_factor(category_id, subcategory_id):
     }[category_id][subcategory_id]
 
 
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_environment_factor_unknown_id():
+    """_get_environment_factor() should raise a KeyError when passed an unknown ID."""
+    with pytest.raises(KeyError):
+        milhdbk217f._get_environment_factor(3, 15, subcategory_id=1)
+    with pytest.raises(KeyError):
+        milhdbk217f._get_environment_factor(8, 1, subcategory_id=1,
+                                            quality_id=3)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_factor_id_zero():
+    """_get_environment_factor() and the piQ helpers should raise a KeyError rather than use the last factor when passed an ID of 0."""
+    with pytest.raises(KeyError):
+        milhdbk217f._get_environment_factor(4, 0, subcategory_id=1)
+    with pytest.raises(KeyError):
+        milhdbk217f._get_part_stress_quality_factor(4, 1, 0)
+    with pytest.raises(KeyError):
+        milhdbk217f._get_part_count_quality_factor(4, 1, 0)
+
+
 @pytest.mark.unit
 @pytest.mark.calculation
 @pytest.mark.parametrize("category_id", [1, 3, 4, 6, 7, 8, 9, 10])
@@ -756,3 +779,89 @@ def test_do_calculate_active_hazard_rate_zero_input():
     pub.subscribe(on_message, 'fail_predict_reliability')
 
     milhdbk217f.do_predict_active_hazard_rate(**ATTRIBUTES)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_predict_active_hazard_rate_id_zero():
+    """do_predict_active_hazard_rate() should send the fail message when passed an ID of 0."""
+    _attributes = dict(ATTRIBUTES)
+    _attributes['category_id'] = 4
+    _attributes['subcategory_id'] = 1
+    _attributes['environment_active_id'] = 0
+    _attributes['quality_id'] = 1
+    _attributes['hazard_rate_method_id'] = 2
+    _messages = []
+
+    def on_message(error_message):
+        _messages.append(error_message)
+
+    pub.subscribe(on_message, 'fail_predict_reliability')
+
+    _hazard_rate = milhdbk217f.do_predict_active_hazard_rate(**_attributes)
+
+    pub.unsubscribe(on_message, 'fail_predict_reliability')
+
+    assert _hazard_rate is None
+    assert _messages == [
+        'Failed to predict MIL-HDBK-217F hazard rate for hardware ID 12; '
+        'there is no factor for one or more of the inputs. Hardware item '
+        'category ID=4, subcategory ID=1, quality ID=1, active environment '
+        'ID=0.'
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_active_hazard_rate_no_message():
+    """do_calculate_active_hazard_rate() should return the component attribute dict with the factors without sending a message."""
+    _attributes = dict(ATTRIBUTES)
+    _attributes['category_id'] = 4
+    _attributes['subcategory_id'] = 1
+    _attributes['environment_active_id'] = 3
+    _attributes['quality_id'] = 1
+    _attributes['hazard_rate_method_id'] = 2
+    _messages = []
+
+    def on_message(attributes):
+        _messages.append(attributes)
+
+    pub.subscribe(on_message, 'succeed_predict_reliability')
+
+    _results = milhdbk217f.do_calculate_active_hazard_rate(**_attributes)
+
+    pub.unsubscribe(on_message, 'succeed_predict_reliability')
+
+    assert _messages == []
+    assert _results is not _attributes
+    assert _results['piE'] == 9.0
+    assert _results['piQ'] == 3.0
+    assert _results['hazard_rate_active'] == pytest.approx(
+        milhdbk217f.do_predict_active_hazard_rate(**_attributes))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_active_hazard_rate_raises_zero_division():
+    """do_calculate_active_hazard_rate() should raise a ZeroDivisionError when passed an input equal to 0.0."""
+    _attributes = dict(ATTRIBUTES)
+    _attributes['category_id'] = 9
+    _attributes['subcategory_id'] = 1
+    _attributes['type_id'] = 1
+    _attributes['environment_active_id'] = 1
+    _attributes['quality_id'] = 1
+    _attributes['temperature_rated_max'] = 0.0
+    _attributes['voltage_ac_operating'] = 0.04
+    _attributes['voltage_dc_operating'] = 3.3
+    _attributes['hazard_rate_method_id'] = 2
+
+    with pytest.raises(ZeroDivisionError) as _error:
+        milhdbk217f.do_calculate_active_hazard_rate(**_attributes)
+
+    assert milhdbk217f.get_error_message(_error.value, _attributes) == (
+        'Failed to predict MIL-HDBK-217F hazard rate for hardware ID 12; one '
+        'or more inputs has a value of 0.0.  Hardware item category ID=9, '
+        'subcategory ID=1, operating ac voltage=0.040000, operating DC '
+        'voltage=3.300000, operating temperature=45.000000, temperature '
+        'rise=10.000000, rated maximum temperature=0.000000, feature '
+        'size=1.500000, surface area=1.500000, and item weight=0.500000.')
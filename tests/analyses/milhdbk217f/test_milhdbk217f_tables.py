@@ -0,0 +1,108 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.analyses.milhdbk217f.test_milhdbk217f_tables.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2019 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for the milhdbk217f factor tables module."""
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.analyses.milhdbk217f import tables
+from ramstk.analyses.milhdbk217f.models import (
+    capacitor, connection, relay, resistor, semiconductor, switch
+)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_table_shapes():
+    """The compiled tables should be indexed by category, subcategory, quality/key, and environment."""
+    assert tables.PI_E.shape == (11, 20, 10, 15)
+    assert tables.PART_COUNT_LAMBDA_B.shape == (11, 20, 8, 15)
+    assert tables.PART_COUNT_PI_Q.shape == (11, 20, 10)
+    assert tables.PART_STRESS_PI_Q.shape == (11, 20, 10)
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_pi_e_table():
+    """PI_E should hold the piE values from the model tables."""
+    assert tables.PI_E[3, 2, 4, 1:15].tolist() == resistor.PI_E[2]
+    assert tables.PI_E[4, 7, 1, 1:15].tolist() == capacitor.PI_E
+    assert tables.PI_E[8, 1, 2, 1:15].tolist() == connection.PI_E[1][2]
+    assert tables.PI_E[6, 1, 3, 1:15].tolist() == relay.PI_E[1][1]
+    assert tables.PI_E[6, 1, 7, 1:15].tolist() == relay.PI_E[1][2]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_part_count_lambda_b_table():
+    """PART_COUNT_LAMBDA_B should hold the parts count lambda b values from the model tables."""
+    assert (tables.PART_COUNT_LAMBDA_B[2, 1, 3, 1:15].tolist() ==
+            semiconductor.PART_COUNT_LAMBDA_B_DICT[1][3])
+    assert (tables.PART_COUNT_LAMBDA_B[3, 2, 4, 1:15].tolist() ==
+            resistor.PART_COUNT_LAMBDA_B[2][4])
+    assert (tables.PART_COUNT_LAMBDA_B[7, 5, 2, 1:15].tolist() ==
+            switch.PART_COUNT_LAMBDA_B_BREAKER[2])
+    assert np.all(tables.PART_COUNT_LAMBDA_B[4, 3, :, 2] ==
+                  capacitor.PART_COUNT_LAMBDA_B[3][1])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_pi_q_tables():
+    """PART_COUNT_PI_Q and PART_STRESS_PI_Q should hold the piQ values from the model tables."""
+    assert tables.PART_COUNT_PI_Q[4, 12, 1:8].tolist() == (
+        capacitor.PART_COUNT_PI_Q)
+    assert tables.PART_STRESS_PI_Q[4, 12, 1:10].tolist() == (
+        capacitor.PART_STRESS_PI_Q[12])
+    assert tables.PART_STRESS_PI_Q[7, 1, 4] == 0.0
+    assert tables.PART_STRESS_PI_Q[7, 5, 2] == switch.PART_STRESS_PI_Q[5][1]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_tables_nan_sentinel():
+    """The compiled tables should hold NaN for combinations with no factor."""
+    assert np.all(np.isnan(tables.PI_E[:, :, :, 0]))
+    assert np.all(np.isnan(tables.PI_E[0]))
+    assert np.isnan(tables.PI_E[8, 1, 3, 1])
+    assert np.isnan(tables.PART_COUNT_LAMBDA_B[3, 16, 0, 1])
+    assert np.isnan(tables.PART_STRESS_PI_Q[4, 1, 3])
+    assert np.isnan(tables.PART_STRESS_PI_Q[7, 5, 3])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_factor():
+    """get_factor() should gather factors for arrays of ID's."""
+    _pi_e = tables.get_factor(tables.PI_E, [3, 4, 8], [2, 1, 1], 1, [1, 2, 3])
+
+    assert _pi_e[0] == resistor.PI_E[2][0]
+    assert _pi_e[1] == capacitor.PI_E[1]
+    assert _pi_e[2] == connection.PI_E[1][1][2]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_get_factor_trailing_axes():
+    """get_factor() should return the remaining axes when passed fewer indices than axes."""
+    _pi_e = tables.get_factor(tables.PI_E, [3, 4], 1, 1)
+
+    assert _pi_e.shape == (2, 15)
+    assert _pi_e[0, 1:].tolist() == resistor.PI_E[1]
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+@pytest.mark.parametrize("environment_active_id", [-1, 15, 1.5, np.nan])
+def test_get_factor_unknown_index(environment_active_id):
+    """get_factor() should return NaN for an unknown index."""
+    assert np.isnan(
+        tables.get_factor(tables.PI_E, 3, 1, 1, environment_active_id))
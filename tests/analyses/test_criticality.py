@@ -9,6 +9,7 @@
 """Test class for the FMEA criticality module."""
 
 # Third Party Imports
+import numpy as np
 import pytest
 
 # RAMSTK Package Imports
@@ -140,3 +141,151 @@ def test_calculate_mode_criticality_out_of_range_eff_prob():
     assert e.value.args[0] == ('calculate_mode_criticality() was passed a '
                                'failure effect probability outside the range '
                                'of [0.0, 1.0].')
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_mode_hazard_rates():
+    """calculate_mode_hazard_rates() should return an array of the products of the item hazard rates and mode ratios on success."""
+    _mode_hr = criticality.calculate_mode_hazard_rates(
+        np.array([0.000617, 0.000617, 0.0042]), np.array([0.23, 0.77, 0.5]))
+
+    assert isinstance(_mode_hr, np.ndarray)
+    assert _mode_hr == pytest.approx([0.00014191, 0.00047509, 0.0021])
+    assert _mode_hr[0] == pytest.approx(
+        criticality.calculate_mode_hazard_rate(0.000617, 0.23))
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_mode_hazard_rates_out_of_range():
+    """calculate_mode_hazard_rates() should raise an OutOfRangeError if any item hazard rate is negative or any mode ratio is outside [0.0, 1.0]."""
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_hazard_rates(np.array([0.000617, -0.1]),
+                                                np.array([0.23, 0.77]))
+    assert e.value.args[0] == ("calculate_mode_hazard_rates() was passed a "
+                               "negative or missing value for an item hazard "
+                               "rate.")
+
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_hazard_rates(np.array([0.000617, 0.1]),
+                                                np.array([0.23, 1.77]))
+    assert e.value.args[0] == ("calculate_mode_hazard_rates() was passed a "
+                               "failure mode ratio outside the range of "
+                               "[0.0, 1.0].")
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_mode_hazard_rates_nan():
+    """calculate_mode_hazard_rates() should raise an OutOfRangeError if any item hazard rate or mode ratio is missing (NaN)."""
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_hazard_rates(np.array([0.000617, np.nan]),
+                                                np.array([0.23, 0.77]))
+    assert e.value.args[0] == ("calculate_mode_hazard_rates() was passed a "
+                               "negative or missing value for an item hazard "
+                               "rate.")
+
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_hazard_rates(
+            np.array([0.000617, 0.1]), np.array([0.23, None], dtype=float))
+    assert e.value.args[0] == ("calculate_mode_hazard_rates() was passed a "
+                               "failure mode ratio outside the range of "
+                               "[0.0, 1.0].")
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_mode_criticalities():
+    """calculate_mode_criticalities() should return an array of the products of the mode hazard rates, mode operating times, and effect probabilities on success."""
+    _mode_crit = criticality.calculate_mode_criticalities(
+        np.array([0.00021595, 0.0001]), np.array([5.28, 10.0]),
+        np.array([0.75, 1.0]))
+
+    assert _mode_crit == pytest.approx([0.000855162, 0.001])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_mode_criticalities_out_of_range():
+    """calculate_mode_criticalities() should raise an OutOfRangeError when passed a negative operating time or an effect probability outside [0.0, 1.0]."""
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_criticalities(np.array([0.00021595]),
+                                                 np.array([-5.28]),
+                                                 np.array([0.75]))
+    assert e.value.args[0] == ('calculate_mode_criticalities() was passed a '
+                               'negative or missing value for failure mode '
+                               'operating time.')
+
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_criticalities(np.array([0.00021595]),
+                                                 np.array([5.28]),
+                                                 np.array([1.75]))
+    assert e.value.args[0] == ('calculate_mode_criticalities() was passed a '
+                               'failure effect probability outside the range '
+                               'of [0.0, 1.0].')
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_calculate_mode_criticalities_nan():
+    """calculate_mode_criticalities() should raise an OutOfRangeError when passed a missing (NaN) mode hazard rate, operating time, or effect probability."""
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_criticalities(np.array([np.nan]),
+                                                 np.array([5.28]),
+                                                 np.array([0.75]))
+    assert e.value.args[0] == ('calculate_mode_criticalities() was passed a '
+                               'missing value for a failure mode hazard '
+                               'rate.')
+
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_criticalities(np.array([0.00021595]),
+                                                 np.array([np.nan]),
+                                                 np.array([0.75]))
+    assert e.value.args[0] == ('calculate_mode_criticalities() was passed a '
+                               'negative or missing value for failure mode '
+                               'operating time.')
+
+    with pytest.raises(OutOfRangeError) as e:
+        criticality.calculate_mode_criticalities(np.array([0.00021595]),
+                                                 np.array([5.28]),
+                                                 np.array([np.nan]))
+    assert e.value.args[0] == ('calculate_mode_criticalities() was passed a '
+                               'failure effect probability outside the range '
+                               'of [0.0, 1.0].')
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_criticality_matrix():
+    """do_calculate_criticality_matrix() should return the sum of mode criticalities for each item and severity class."""
+    _matrix = criticality.do_calculate_criticality_matrix(
+        [1, 2, 1, 1], ['I', 'II', 'I', 'IV'],
+        np.array([0.1, 0.2, 0.3, 0.4]))
+
+    assert _matrix[1] == pytest.approx({'I': 0.4, 'II': 0.0, 'IV': 0.4})
+    assert _matrix[2] == pytest.approx({'I': 0.0, 'II': 0.2, 'IV': 0.0})
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_pareto_index():
+    """do_calculate_pareto_index() should rank items by total criticality with the cumulative fraction of system criticality."""
+    _index = criticality.do_calculate_pareto_index({
+        1: {'I': 0.1, 'II': 0.0},
+        2: {'I': 0.5, 'II': 0.2},
+        3: {'I': 0.0, 'II': 0.2},
+    })
+
+    assert [_item[0] for _item in _index] == [2, 3, 1]
+    assert [_item[1] for _item in _index] == pytest.approx([0.7, 0.2, 0.1])
+    assert [_item[2] for _item in _index] == pytest.approx([0.7, 0.9, 1.0])
+
+
+@pytest.mark.unit
+@pytest.mark.calculation
+def test_do_calculate_pareto_index_no_criticality():
+    """do_calculate_pareto_index() should return zero cumulative fractions when the system has no criticality."""
+    _index = criticality.do_calculate_pareto_index({1: {'I': 0.0}})
+
+    assert _index == [(1, 0.0, 0.0)]
@@ -32,7 +32,13 @@ from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from ramstk.configuration import (
     RAMSTKSiteConfiguration, RAMSTKUserConfiguration
 )
-from ramstk.db.base import BaseDatabase
+from ramstk.db.base import (
+    BaseDatabase, do_create_program_db, do_dispose_engines
+)
+from ramstk.models.programdb import (
+    RAMSTKNSWC, RAMSTKDesignElectric, RAMSTKDesignMechanic,
+    RAMSTKHardware, RAMSTKMilHdbkF, RAMSTKReliability
+)
 
 _ = gettext.gettext
 
@@ -239,6 +245,7 @@ def test_simple_program_database():
     yield dao
 
     dao.do_disconnect()
+    do_dispose_engines()
     conn = psycopg2.connect(host=test_simple_db['host'],
                             dbname='postgres',
                             user=test_simple_db['user'],
@@ -309,6 +316,7 @@ def test_simple_database():
     yield dao
 
     dao.do_disconnect()
+    do_dispose_engines()
 
 
 @pytest.fixture(scope='function')
@@ -374,6 +382,7 @@ def test_common_dao():
     yield dao
 
     dao.do_disconnect()
+    do_dispose_engines()
 
     conn = psycopg2.connect(host=test_common_db['host'],
                             dbname='postgres',
@@ -382,6 +391,10 @@ def test_common_dao():
     conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
 
     cursor = conn.cursor()
+    cursor.execute(
+        sql.SQL("SELECT pg_terminate_backend(pg_stat_activity.pid) FROM "
+                "pg_stat_activity WHERE pg_stat_activity.datname = "
+                "{};").format(sql.Literal(test_common_db['database'])))
     cursor.execute(
         sql.SQL('DROP DATABASE IF EXISTS {}').format(
             sql.Identifier(test_common_db['database'])))
@@ -456,6 +469,7 @@ def test_program_dao():
     yield dao
 
     dao.do_disconnect()
+    do_dispose_engines()
 
     conn = psycopg2.connect(host=test_program_db['host'],
                             dbname='postgres',
@@ -464,6 +478,10 @@ def test_program_dao():
     conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
 
     cursor = conn.cursor()
+    cursor.execute(
+        sql.SQL("SELECT pg_terminate_backend(pg_stat_activity.pid) FROM "
+                "pg_stat_activity WHERE pg_stat_activity.datname = "
+                "{};").format(sql.Literal(test_program_db['database'])))
     cursor.execute(
         sql.SQL('DROP DATABASE IF EXISTS {}').format(
             sql.Identifier(test_program_db['database'])))
@@ -474,6 +492,111 @@ def test_program_dao():
     conn.close()
 
 
+@pytest.fixture(scope='function')
+def make_bom_dao():
+    """Create RAMSTK Program databases with a synthetic hardware BoM.
+
+    The fixture yields a function that accepts the number of parts to add to
+    the BoM and, optionally, the SQLite PRAGMA profile to connect with and
+    the dialect and returns a BaseDatabase() connected to the new database.
+    SQLite databases are created by default; pass dialect='postgres' to
+    create the database on the test PostgreSQL server.  The parts are
+    divided among assemblies of 25 parts each and every hardware item has
+    the full set of design, MIL-HDBK-217F, NSWC, and reliability records.
+    This is primarily used by the tests marked as benchmarks.
+    """
+    _databases = []
+
+    def _make_hardware(hardware_id, parent_id, part):
+        _hardware = RAMSTKHardware()
+        _hardware.revision_id = 1
+        _hardware.hardware_id = hardware_id
+        _hardware.parent_id = parent_id
+        _hardware.part = part
+        _hardware.ref_des = 'HW{0:d}'.format(hardware_id)
+
+        _records = [_hardware]
+        for _table in [
+                RAMSTKDesignElectric, RAMSTKDesignMechanic, RAMSTKMilHdbkF,
+                RAMSTKNSWC, RAMSTKReliability
+        ]:
+            _record = _table()
+            _record.hardware_id = hardware_id
+            _records.append(_record)
+
+        return _records
+
+    def _make_bom_dao(n_parts, sqlite_profile='default', dialect='sqlite'):
+        if dialect == 'postgres':
+            _database = {
+                'dialect': 'postgres',
+                'user': 'postgres',
+                'password': 'postgres',
+                'host': 'localhost',
+                'port': '5432',
+                'database': 'TestBoMDB{0:d}'.format(n_parts),
+            }
+        else:
+            _database = {
+                'dialect': 'sqlite',
+                'user': '',
+                'password': '',
+                'host': '',
+                'port': '',
+                'database':
+                TEMPDIR + '/_ramstk_bom_{0:d}_{1:s}.ramstk'.format(
+                    n_parts, sqlite_profile),
+                'sqlite_profile': sqlite_profile,
+            }
+            if os.path.exists(_database['database']):
+                os.remove(_database['database'])
+
+        with open('./data/{0:s}_program_db.sql'.format(dialect),
+                  'r') as _sql_file:
+            do_create_program_db(_database, _sql_file)
+
+        dao = BaseDatabase()
+        dao.do_connect(_database)
+
+        _records = []
+        _hardware_id = 1
+        _assembly_id = 1
+        for _idx in range(n_parts):
+            if _idx % 25 == 0:
+                _hardware_id += 1
+                _assembly_id = _hardware_id
+                _records.extend(_make_hardware(_assembly_id, 1, 0))
+            _hardware_id += 1
+            _records.extend(_make_hardware(_hardware_id, _assembly_id, 1))
+        dao.session.add_all(_records)
+        dao.session.commit()
+
+        _databases.append((dao, _database))
+
+        return dao
+
+    yield _make_bom_dao
+
+    for _dao, _database in _databases:
+        _dao.do_disconnect()
+        do_dispose_engines(_database['database'])
+        if _database['dialect'] == 'postgres':
+            conn = psycopg2.connect(host=_database['host'],
+                                    dbname='postgres',
+                                    user=_database['user'],
+                                    password=_database['password'])
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+
+            cursor = conn.cursor()
+            cursor.execute(
+                sql.SQL('DROP DATABASE IF EXISTS {}').format(
+                    sql.Identifier(_database['database'])))
+            cursor.close()
+            conn.close()
+        else:
+            os.remove(_database['database'])
+
+
 @pytest.fixture(scope='session')
 def test_toml_site_configuration():
     """Create a toml site configuration file."""
@@ -14,6 +14,7 @@ from datetime import date
 # Third Party Imports
 import pytest
 from pubsub import pub
+from sqlalchemy import event
 from treelib import Tree
 
 # RAMSTK Package Imports
@@ -83,6 +84,11 @@ class TestCreateControllers():
         assert pub.isSubscribed(DUT._do_insert_mode,
                                 'request_insert_fmea_mode')
         assert pub.isSubscribed(DUT.do_update, 'request_update_fmea')
+        assert pub.isSubscribed(DUT.do_select_system_fmea,
+                                'request_retrieve_system_fmea')
+        assert pub.isSubscribed(DUT.do_set_system_attributes,
+                                'request_set_system_fmea_attributes')
+        assert pub.isSubscribed(DUT.do_update_all, 'request_update_all_fmeas')
 
     @pytest.mark.unit
     def test_data_manager_functional(self):
@@ -114,6 +120,8 @@ class TestCreateControllers():
         assert pub.isSubscribed(DUT._do_calculate_criticality,
                                 'request_calculate_criticality')
         assert pub.isSubscribed(DUT._do_calculate_rpn, 'request_calculate_rpn')
+        assert pub.isSubscribed(DUT._do_calculate_system_criticality,
+                                'succeed_retrieve_system_fmea')
 
 
 @pytest.mark.usefixtures('test_program_dao', 'test_toml_user_configuration')
@@ -161,6 +169,31 @@ class TestSelectMethods():
         pub.unsubscribe(self.on_succeed_retrieve_hardware_fmea,
                         'succeed_retrieve_hardware_fmea')
 
+    @pytest.mark.integration
+    def test_do_select_all_hardware_query_count(self, test_program_dao):
+        """do_select_all() should retrieve the hardware FMEA with one query per
+        FMEA level."""
+        _statements = []
+
+        def on_execute(conn, cursor, statement, parameters, context,
+                       executemany):
+            _statements.append(statement)
+
+        DUT = dmFMEA()
+        DUT.do_connect(test_program_dao)
+
+        event.listen(test_program_dao.engine, 'before_cursor_execute',
+                     on_execute)
+        DUT.do_select_all({'revision_id': 1, 'hardware_id': 1})
+        event.remove(test_program_dao.engine, 'before_cursor_execute',
+                     on_execute)
+
+        assert len(_statements) == 5
+        assert DUT.tree.get_node('4.1').data['mechanism'].mode_id == 4
+        assert DUT.tree.get_node('4.1.1').data['cause'].mechanism_id == 1
+        assert DUT.tree.parent('4.1.1').identifier == '4.1'
+        assert DUT.tree.parent('4.1').identifier == '4'
+
     @pytest.mark.integration
     def test_do_select_mode(self, test_program_dao):
         """do_select() should return an instance of the RAMSTKMode on
@@ -897,6 +930,53 @@ class TestGetterSetter():
 
         pub.unsubscribe(DUT.do_set_attributes, 'request_set_fmea_attributes')
 
+    @pytest.mark.integration
+    def test_do_set_system_attributes(self, test_program_dao):
+        """do_set_system_attributes() should set the attributes of the system
+        FMEA failure modes that aren't in the FMEA tree."""
+        # Discard the changes left unsaved by the other tests.
+        test_program_dao.session.rollback()
+        DUT = dmFMEA()
+        DUT.do_connect(test_program_dao)
+        DUT.do_select_system_fmea(1)
+
+        pub.sendMessage('request_set_system_fmea_attributes',
+                        package={
+                            6: {
+                                'mode_criticality': 0.0035
+                            },
+                            1000: {
+                                'mode_criticality': 0.0045
+                            },
+                        })
+
+        assert DUT._dic_system_modes[6].mode_criticality == 0.0035
+        assert DUT._do_select_dirty_system_modes() == [
+            DUT._dic_system_modes[6]
+        ]
+        assert DUT.get_dirty_count() == 1
+
+        test_program_dao.session.rollback()
+
+    @pytest.mark.integration
+    def test_do_set_system_attributes_tree(self, test_program_dao):
+        """do_set_system_attributes() should set the attributes of the
+        failure modes in the FMEA tree through the tree."""
+        # Discard the changes left unsaved by the other tests.
+        test_program_dao.session.rollback()
+        DUT = dmFMEA()
+        DUT.do_connect(test_program_dao)
+        DUT.do_select_all({'revision_id': 1, 'hardware_id': 1})
+        DUT.do_select_system_fmea(1)
+
+        DUT.do_set_system_attributes({4: {'mode_criticality': 0.0025}})
+
+        assert DUT.do_select('4', table='mode').mode_criticality == 0.0025
+        assert DUT._do_select_dirty_system_modes() == []
+        assert DUT.get_dirty_count() == 1
+
+        test_program_dao.session.rollback()
+
     @pytest.mark.integration
     def test_on_get_tree_data_manager(self, test_program_dao):
         """on_get_tree() should return the fmea treelib Tree."""
@@ -973,6 +1053,29 @@ class TestUpdateMethods():
 
         pub.unsubscribe(self.on_succeed_update_fmea, 'succeed_update_fmea')
 
+    @pytest.mark.integration
+    def test_do_update_all_system_modes(self, test_program_dao):
+        """do_update_all() should save the system FMEA failure modes that
+        aren't in the FMEA tree."""
+        DUT = dmFMEA()
+        DUT.do_connect(test_program_dao)
+        DUT.do_select_system_fmea(1)
+
+        _criticality = DUT._dic_system_modes[5].mode_criticality
+
+        DUT.do_set_system_attributes({5: {'mode_criticality': 0.0055}})
+        assert DUT.get_dirty_count() == 1
+
+        DUT.do_update_all()
+
+        assert DUT.get_dirty_count() == 0
+        test_program_dao.session.expire_all()
+        assert test_program_dao.session.query(RAMSTKMode).filter(
+            RAMSTKMode.mode_id == 5).one().mode_criticality == 0.0055
+
+        DUT.do_set_system_attributes({5: {'mode_criticality': _criticality}})
+        DUT.do_update_all()
+
     @pytest.mark.integration
     def test_do_update_non_existent_id(self, test_program_dao):
         """do_update() should return a non-zero error code when passed a FMEA
@@ -1077,6 +1180,112 @@ class TestAnalysisMethods():
         assert DUT._tree.get_node(
             '4').data['mode'].mode_criticality == 0.003085
 
+    @pytest.mark.integration
+    def test_do_select_system_fmea(self, test_program_dao):
+        """do_select_system_fmea() should retrieve every hardware failure mode
+        in the revision along with the hazard rate of its hardware item."""
+        def on_message(modes, item_hr):
+            assert len(item_hr) == len(modes)
+            assert all([isinstance(_mode, RAMSTKMode) for _mode in modes])
+            assert all([_mode.revision_id == 1 for _mode in modes])
+            assert {4, 5, 6} <= {_mode.mode_id for _mode in modes}
+
+        pub.subscribe(on_message, 'succeed_retrieve_system_fmea')
+
+        DUT = dmFMEA()
+        DUT.do_connect(test_program_dao)
+        pub.sendMessage('request_retrieve_system_fmea', revision_id=1)
+
+        pub.unsubscribe(on_message, 'succeed_retrieve_system_fmea')
+
+    @pytest.mark.unit
+    def test_do_calculate_system_criticality(self,
+                                             test_toml_user_configuration):
+        """do_calculate_system_criticality() should calculate the criticality
+        of every failure mode and the system criticality matrix."""
+        _modes = []
+        for _mode_id, _hardware_id, _ratio, _op_time, _eff_prob, _severity in [
+            (1, 1, 0.5, 10.0, 1.0, 'IV'), (2, 1, 0.2, 5.0, 0.75, 'I'),
+            (3, 2, 0.3, 10.0, 0.9, 'I')
+        ]:
+            _mode = RAMSTKMode()
+            _mode.mode_id = _mode_id
+            _mode.hardware_id = _hardware_id
+            _mode.mode_ratio = _ratio
+            _mode.mode_op_time = _op_time
+            _mode.effect_probability = _eff_prob
+            _mode.severity_class = _severity
+            _modes.append(_mode)
+
+        def on_message(criticality_matrix, pareto_index):
+            assert criticality_matrix[1]['IV'] == pytest.approx(0.003085)
+            assert criticality_matrix[1]['I'] == pytest.approx(0.00046275)
+            assert criticality_matrix[2]['I'] == pytest.approx(0.00166590)
+            assert criticality_matrix[2]['IV'] == 0.0
+            assert [_item[0] for _item in pareto_index] == [1, 2]
+            assert pareto_index[-1][2] == pytest.approx(1.0)
+
+        _packages = []
+
+        def on_request_set(package):
+            _packages.append(package)
+
+        pub.subscribe(on_message, 'succeed_calculate_system_criticality')
+        pub.subscribe(on_request_set, 'request_set_system_fmea_attributes')
+
+        DUT = amFMEA(test_toml_user_configuration)
+        DUT._do_calculate_system_criticality(_modes, [0.000617] * 3)
+
+        pub.unsubscribe(on_message, 'succeed_calculate_system_criticality')
+        pub.unsubscribe(on_request_set, 'request_set_system_fmea_attributes')
+
+        assert len(_packages) == 1
+        assert sorted(_packages[0]) == [1, 2, 3]
+        assert _packages[0][1]['mode_hazard_rate'] == pytest.approx(0.0003085)
+        assert _packages[0][1]['mode_criticality'] == pytest.approx(0.003085)
+        assert _packages[0][3]['mode_criticality'] == pytest.approx(0.0016659)
+        assert _modes[0].mode_criticality is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize('mode_ratio, item_hr', [(1.5, 0.000617),
+                                                     (None, 0.000617),
+                                                     (0.5, None)])
+    def test_do_calculate_system_criticality_out_of_range(
+            self, test_toml_user_configuration, mode_ratio, item_hr):
+        """do_calculate_system_criticality() should send the fail message
+        and leave the failure modes unchanged when an input is out of range
+        or missing."""
+        _mode = RAMSTKMode()
+        _mode.hardware_id = 1
+        _mode.mode_ratio = mode_ratio
+        _mode.mode_op_time = 10.0
+        _mode.effect_probability = 1.0
+        _mode.severity_class = 'IV'
+        _mode.mode_hazard_rate = 0.0
+        _messages = []
+
+        def on_message(error_message):
+            _messages.append(error_message)
+
+        def on_succeed(criticality_matrix, pareto_index):
+            _messages.append('succeed')
+
+        pub.subscribe(on_message, 'fail_calculate_system_criticality')
+        pub.subscribe(on_succeed, 'succeed_calculate_system_criticality')
+
+        DUT = amFMEA(test_toml_user_configuration)
+        DUT._do_calculate_system_criticality([_mode], [item_hr])
+
+        pub.unsubscribe(on_message, 'fail_calculate_system_criticality')
+        pub.unsubscribe(on_succeed, 'succeed_calculate_system_criticality')
+
+        assert len(_messages) == 1
+        assert _messages[0].startswith(
+            '_do_calculate_system_criticality: Failed to calculate the '
+            'system criticality.  calculate_mode_hazard_rates() was passed '
+            'a ')
+        assert _mode.mode_hazard_rate == 0.0
+
     @pytest.mark.integration
     def test_do_calculate_rpn_using_mechanism(self, test_program_dao,
                                               test_toml_user_configuration):
@@ -58,6 +58,15 @@ class MockDao:
 
         return self._all_functions
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         for _key in MOCK_FUNCTIONS:
             if _key == record.function_id:
@@ -9,6 +9,10 @@
 # Copyright 2007 - 2020 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
 """Test class for testing Hardware BoM module algorithms and models."""
 
+# Standard Library Imports
+import sys
+import time
+
 # Third Party Imports
 import pytest
 from __mocks__ import (
@@ -16,13 +20,16 @@ from __mocks__ import (
     MOCK_HARDWARE, MOCK_NSWC, MOCK_RELIABILITY
 )
 from pubsub import pub
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 from treelib import Tree
 
 # RAMSTK Package Imports
 from ramstk import RAMSTKUserConfiguration
 from ramstk.controllers import amHardware, dmHardware
 from ramstk.controllers.hardware.analysismanager import (
-    hazard_rate_from_s_distribution, mtbf_from_s_distribution
+    hazard_rate_from_s_distribution, mtbf_from_s_distribution,
+    predict_hazard_rates
 )
 from ramstk.db.base import BaseDatabase
 from ramstk.exceptions import DataAccessError
@@ -106,13 +113,27 @@ class MockDao:
         for _record in records:
             self.do_insert(_record)
 
-    def _do_select_all_hardware(self, table, value):
+    def _do_select_all_hardware(self, table, value, eager):
         self._all_hardware = []
         for _key in MOCK_HARDWARE:
             _record = table()
             _record.revision_id = value
             _record.hardware_id = _key
             _record.set_attributes(MOCK_HARDWARE[_key])
+            if 'design_electric' in eager:
+                _record.design_electric = self._do_select_all_design_electric(
+                    RAMSTKDesignElectric, [_key])
+            if 'design_mechanic' in eager:
+                _record.design_mechanic = self._do_select_all_design_mechanic(
+                    RAMSTKDesignMechanic, [_key])
+            if 'milhdbkf' in eager:
+                _record.milhdbkf = self._do_select_all_217f(
+                    RAMSTKMilHdbkF, [_key])
+            if 'nswc' in eager:
+                _record.nswc = self._do_select_all_nswc(RAMSTKNSWC, [_key])
+            if 'reliability' in eager:
+                _record.reliability = self._do_select_all_reliability(
+                    RAMSTKReliability, [_key])
             self._all_hardware.append(_record)
 
         return self._all_hardware
@@ -167,9 +188,10 @@ class MockDao:
                       key=None,
                       value=None,
                       order=None,
-                      _all=False):
+                      _all=False,
+                      eager=None):
         if table == RAMSTKHardware:
-            _records = self._do_select_all_hardware(table, value)
+            _records = self._do_select_all_hardware(table, value, eager or [])
         elif table == RAMSTKDesignElectric:
             _records = self._do_select_all_design_electric(table, value)
         elif table == RAMSTKDesignMechanic:
@@ -183,6 +205,15 @@ class MockDao:
 
         return _records
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         if isinstance(record, RAMSTKHardware):
             for _key in MOCK_HARDWARE:
@@ -213,6 +244,74 @@ class MockDao:
                         'hazard_rate_active'] = record.hazard_rate_active
 
 
+
+def _make_bom_tree(n_assemblies, n_parts, depth=1):
+    """Create a hardware tree without a database.
+
+    The system has n_assemblies branches, each a chain of depth assemblies
+    with n_parts parts under the last assembly.
+    """
+    _tree = Tree()
+    _tree.create_node(tag='hardwares', identifier=0, parent=None, data=None)
+
+    def _do_add_item(hardware_id, parent_id, part):
+        _hardware = RAMSTKHardware()
+        _hardware.hardware_id = hardware_id
+        _hardware.part = part
+        _hardware.category_id = 3 if part else 0
+        _hardware.subcategory_id = 1 if part else 0
+        _hardware.cost = 1.0
+        _hardware.cost_type_id = 2
+        _hardware.duty_cycle = 100.0
+        _hardware.mission_time = 100.0
+        _hardware.quantity = 1
+        _hardware.total_cost = 0.0
+        _hardware.total_part_count = 0
+        _hardware.total_power_dissipation = 0.0
+
+        _design_electric = RAMSTKDesignElectric()
+        _design_electric.environment_active_id = 1
+        _design_electric.environment_dormant_id = 1
+        _design_electric.power_operating = 0.5
+
+        _reliability = RAMSTKReliability()
+        _reliability.add_adj_factor = 0.0
+        _reliability.hazard_rate_method_id = 1
+        _reliability.hazard_rate_software = 0.0
+        _reliability.hazard_rate_specified = 0.005
+        _reliability.hazard_rate_type_id = 2
+        _reliability.mult_adj_factor = 1.0
+        _reliability.quality_id = 1
+
+        _tree.create_node(tag='hardware',
+                          identifier=hardware_id,
+                          parent=parent_id,
+                          data={
+                              'hardware': _hardware,
+                              'design_electric': _design_electric,
+                              'design_mechanic': RAMSTKDesignMechanic(),
+                              'mil_hdbk_217f': RAMSTKMilHdbkF(),
+                              'nswc': RAMSTKNSWC(),
+                              'reliability': _reliability,
+                          })
+        for _record in _tree.get_node(hardware_id).data.values():
+            _record.hardware_id = hardware_id
+
+    _do_add_item(1, 0, 0)
+    _hardware_id = 2
+    for __ in range(n_assemblies):
+        _parent_id = 1
+        for __ in range(depth):
+            _do_add_item(_hardware_id, _parent_id, 0)
+            _parent_id = _hardware_id
+            _hardware_id += 1
+        for __ in range(n_parts):
+            _do_add_item(_hardware_id, _parent_id, 1)
+            _hardware_id += 1
+
+    return _tree
+
+
 @pytest.fixture
 def mock_program_dao(monkeypatch):
     yield MockDao()
@@ -275,6 +374,21 @@ class TestCreateControllers():
                                 'request_calculate_hardware')
         assert pub.isSubscribed(DUT._do_derating_analysis,
                                 'request_derate_hardware')
+        assert pub.isSubscribed(DUT._on_edit_hardware,
+                                'request_set_hardware_attributes')
+        assert pub.isSubscribed(DUT._on_edit_hardware,
+                                'wvw_editing_component')
+        assert pub.isSubscribed(DUT._on_edit_hardware,
+                                'mvw_editing_hardware')
+        assert pub.isSubscribed(DUT._on_edit_hardware,
+                                'wvw_editing_hardware')
+        assert pub.isSubscribed(DUT._on_insert_hardware,
+                                'succeed_insert_hardware')
+        assert pub.isSubscribed(DUT._on_reset_hardware,
+                                'succeed_delete_hardware')
+        assert pub.isSubscribed(DUT._on_reset_hardware,
+                                'succeed_retrieve_hardware')
+        assert DUT._dic_dirty == {}
 
 
 @pytest.mark.usefixtures('test_program_dao', 'test_toml_user_configuration')
@@ -551,6 +665,94 @@ class TestGetterSetter():
         assert DUT.do_select(1, table='design_mechanic').load_operating == \
                0.95
 
+    @pytest.mark.unit
+    def test_do_set_attributes_many(self, mock_program_dao):
+        """do_set_attributes_many() should set each attribute in the table
+        holding it and send the tree once."""
+        DUT = dmHardware()
+        DUT.do_connect(mock_program_dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+        _trees = []
+
+        def on_message(tree):
+            _trees.append(tree)
+
+        pub.subscribe(on_message, 'succeed_get_hardwares_tree')
+
+        DUT.do_set_attributes_many(
+            1, {
+                'hardware_id': 8,
+                'name': 'Testing set many',
+                'capacitance': 0.000047,
+                'load_operating': 0.95,
+                'hazard_rate_specified': 0.0032,
+                'not_an_attribute': 1,
+            })
+
+        pub.unsubscribe(on_message, 'succeed_get_hardwares_tree')
+
+        assert len(_trees) == 1
+        assert DUT.do_select(1, table='hardware').hardware_id == 1
+        assert DUT.do_select(1, table='hardware').name == 'Testing set many'
+        assert DUT.do_select(1, table='design_electric').capacitance == \
+               0.000047
+        assert DUT.do_select(1, table='design_mechanic').load_operating == \
+               0.95
+        assert DUT.do_select(
+            1, table='reliability').hazard_rate_specified == 0.0032
+
+    @pytest.mark.unit
+    def test_do_set_attributes_many_batch(self, mock_program_dao):
+        """do_set_attributes_many() should send the tree and the changed node
+        IDs once when the batch ends."""
+        DUT = dmHardware()
+        DUT.do_connect(mock_program_dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+        _trees = []
+        _changes = []
+
+        def on_tree(tree):
+            _trees.append(tree)
+
+        def on_change(module, node_ids, tree):
+            _changes.append((module, node_ids))
+
+        pub.subscribe(on_tree, 'succeed_get_hardwares_tree')
+        pub.subscribe(on_change, 'tree_changed')
+
+        pub.sendMessage('request_begin_batch')
+        for _node_id in [1, 2, 3]:
+            DUT.do_set_attributes_many(_node_id, {'cost': 1.0})
+
+        assert _trees == []
+        assert _changes == []
+
+        pub.sendMessage('request_end_batch')
+
+        assert len(_trees) == 1
+        assert _changes == [('hardwares', {1, 2, 3})]
+
+        DUT.do_set_attributes_many(2, {'cost': 2.0})
+
+        pub.unsubscribe(on_tree, 'succeed_get_hardwares_tree')
+        pub.unsubscribe(on_change, 'tree_changed')
+
+        assert len(_trees) == 2
+        assert _changes[-1] == ('hardwares', {2})
+        assert DUT._batch_depth == 0
+        assert DUT._changed_ids == set()
+
+    @pytest.mark.unit
+    def test_column_index(self):
+        """column_index should hold the table and column of each attribute."""
+        assert dmHardware.column_index['name'] == [('hardware', 'fld_name')]
+        assert dmHardware.column_index['capacitance'] == [
+            ('design_electric', 'fld_capacitance')
+        ]
+        assert ('reliability', 'fld_hardware_id') in dmHardware.column_index[
+            'hardware_id']
+        assert len(dmHardware.column_index['hardware_id']) == 6
+
 
 @pytest.mark.usefixtures('test_program_dao', 'test_toml_user_configuration')
 class TestInsertMethods():
@@ -842,6 +1044,115 @@ class TestUpdateMethods():
         pub.sendMessage('request_update_all_hardware')
 
 
+    @pytest.mark.integration
+    def test_do_update_all_dirty_only(self, make_bom_dao):
+        """do_update_all() should only save the records with unsaved
+        changes."""
+        dao = make_bom_dao(50)
+        _statements = []
+
+        def on_execute(conn, cursor, statement, parameters, context,
+                       executemany):
+            _statements.append(statement)
+
+        DUT = dmHardware()
+        DUT.do_connect(dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+
+        assert DUT.get_dirty_count() == 0
+
+        DUT.do_set_attributes(node_id=[12], package={'cost': 12.34})
+        DUT.do_set_attributes(node_id=[12], package={'area': 10.0})
+
+        assert DUT.get_dirty_count() == 2
+        assert [_node.identifier for _node in DUT.do_select_dirty()] == [12]
+
+        event.listen(dao.engine, 'before_cursor_execute', on_execute)
+        DUT.do_update_all()
+        event.remove(dao.engine, 'before_cursor_execute', on_execute)
+
+        assert len([
+            _statement for _statement in _statements
+            if _statement.startswith('UPDATE')
+        ]) == 2
+        assert DUT.get_dirty_count() == 0
+        assert DUT.tree.get_node(12).data['hardware'].cost == 12.34
+
+    @pytest.mark.integration
+    def test_do_update_all_message_count(self, make_bom_dao):
+        """do_update_all() should send succeed_update_hardware once rather
+        than once per saved hardware item."""
+        dao = make_bom_dao(25)
+        _messages = []
+
+        def on_succeed_update_hardware(tree):
+            _messages.append('succeed_update_hardware')
+
+        def on_tree_changed(module, node_ids, tree):
+            _messages.append('tree_changed')
+
+        def on_succeed_update_all():
+            _messages.append('succeed_update_all')
+
+        DUT = dmHardware()
+        DUT.do_connect(dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+        for _node_id in range(3, 13):
+            DUT.do_set_attributes(node_id=[_node_id], package={'cost': 1.0})
+
+        pub.subscribe(on_succeed_update_hardware, 'succeed_update_hardware')
+        pub.subscribe(on_tree_changed, 'tree_changed')
+        pub.subscribe(on_succeed_update_all, 'succeed_update_all')
+
+        DUT.do_update_all()
+
+        pub.unsubscribe(on_succeed_update_hardware, 'succeed_update_hardware')
+        pub.unsubscribe(on_tree_changed, 'tree_changed')
+        pub.unsubscribe(on_succeed_update_all, 'succeed_update_all')
+
+        assert _messages == ['succeed_update_hardware', 'succeed_update_all']
+        assert DUT.get_dirty_count() == 0
+        assert DUT._batch_depth == 0
+
+    @pytest.mark.integration
+    def test_do_update_all_unexpected_error(self, make_bom_dao):
+        """do_update_all() should roll back, end the batch and the unit of
+        work, and send the fail message when saving a record raises any
+        error."""
+        dao = make_bom_dao(25)
+        _messages = []
+
+        def on_fail_update_all(error_message):
+            _messages.append(error_message)
+
+        def on_succeed_update_all():
+            _messages.append('succeed_update_all')
+
+        DUT = dmHardware()
+        DUT.do_connect(dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+        DUT.do_set_attributes(node_id=[12], package={'cost': 12.34})
+
+        def do_update(node_id):
+            raise InvalidRequestError('Object is already attached to session')
+
+        DUT.do_update = do_update
+
+        pub.subscribe(on_fail_update_all, 'fail_update_all')
+        pub.subscribe(on_succeed_update_all, 'succeed_update_all')
+
+        DUT.do_update_all()
+
+        pub.unsubscribe(on_fail_update_all, 'fail_update_all')
+        pub.unsubscribe(on_succeed_update_all, 'succeed_update_all')
+
+        assert _messages == ['Object is already attached to session']
+        assert dao._transaction_depth == 0
+        assert DUT._batch_depth == 0
+        assert dao.session.query(RAMSTKHardware).filter(
+            RAMSTKHardware.cost == 12.34).count() == 0
+
+
 @pytest.mark.usefixtures('test_toml_user_configuration')
 class TestStressCalculations():
     """Class for stress-related calculations test suite."""
@@ -1353,6 +1664,125 @@ class TestAnalysisMethods():
         assert DUT._tree.get_node(
             1).data['hardware'].total_power_dissipation == 0.1250
 
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_do_calculate_hardware_dirty(self, mock_program_dao,
+                                         test_toml_user_configuration):
+        """_do_calculate_hardware() should only recalculate the hardware items
+        edited since the last calculation and their ancestors."""
+        DUT = amHardware(test_toml_user_configuration)
+
+        DATAMGR = dmHardware()
+        DATAMGR.do_connect(mock_program_dao)
+        DATAMGR.do_select_all(attributes={'revision_id': 1})
+
+        DUT._do_calculate_hardware(1)
+
+        assert DUT._dic_dirty == {1: set()}
+
+        pub.sendMessage('request_set_hardware_attributes',
+                        node_id=[3, ''],
+                        package={'cost': 1.0})
+
+        assert DUT._dic_dirty == {1: {3}}
+
+        DUT._do_calculate_hardware(1)
+
+        assert DUT._dic_dirty == {1: set()}
+        assert DUT._tree.get_node(3).data['hardware'].total_cost == \
+               pytest.approx(5.0)
+        assert DUT._tree.get_node(2).data['hardware'].total_cost == \
+               pytest.approx(10.0)
+        assert DUT._tree.get_node(1).data['hardware'].total_cost == \
+               pytest.approx(10.0)
+
+        DUT._do_calculate_hardware(2)
+
+        assert DUT._dic_dirty == {1: {2}, 2: set()}
+
+        DUT._do_calculate_hardware(1)
+
+        assert DUT._dic_dirty == {1: set()}
+
+        DUT._on_reset_hardware(DUT._tree)
+
+        assert DUT._dic_dirty == {}
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_on_tree_changed(self, mock_program_dao,
+                             test_toml_user_configuration):
+        """_on_tree_changed() should mark only the changed hardware items
+        dirty."""
+        DUT = amHardware(test_toml_user_configuration)
+
+        DATAMGR = dmHardware()
+        DATAMGR.do_connect(mock_program_dao)
+        DATAMGR.do_select_all(attributes={'revision_id': 1})
+
+        DUT._do_calculate_hardware(1)
+
+        pub.sendMessage('request_begin_batch')
+        DATAMGR.do_set_attributes_many(2, {'cost': 1.0})
+        DATAMGR.do_set_attributes_many(3, {'cost': 1.0})
+
+        assert DUT._dic_dirty == {1: set()}
+
+        pub.sendMessage('request_end_batch')
+
+        assert DUT._dic_dirty == {1: {2, 3}}
+
+        DUT._on_tree_changed(module='allocations', node_ids={1}, tree=None)
+
+        assert DUT._dic_dirty == {1: {2, 3}}
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_do_calculate_dirty(self, test_toml_user_configuration):
+        """_do_calculate_dirty() should recalculate an edited part and its
+        ancestors and match a full calculation."""
+        _metrics = ['cost', 'part_count', 'power', 'reliabilities']
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(3, 5, depth=3)
+        DUT._do_calculate_roll_up(DUT._tree.get_node(1), _metrics)
+
+        _calculated = []
+        _do_calculate_item = DUT._do_calculate_item
+
+        def _do_count_item(node, children, flags, metrics):
+            _calculated.append(node.identifier)
+            _do_calculate_item(node, children, flags, metrics)
+
+        DUT._do_calculate_item = _do_count_item
+
+        DUT._tree.get_node(7).data['hardware'].quantity = 3
+        DUT._tree.get_node(7).data['reliability'].hazard_rate_specified = 0.5
+        DUT._do_calculate_dirty(DUT._tree.get_node(1), _metrics, {7})
+
+        assert _calculated == [7, 4, 3, 2, 1]
+
+        _expected = _make_bom_tree(3, 5, depth=3)
+        _expected.get_node(7).data['hardware'].quantity = 3
+        _expected.get_node(7).data['reliability'].hazard_rate_specified = 0.5
+        DUT._tree, _tree = _expected, DUT._tree
+        DUT._do_calculate_roll_up(_expected.get_node(1), _metrics)
+
+        for _node_id in [1, 2, 4, 7]:
+            _hardware = _tree.get_node(_node_id).data['hardware']
+            _reliability = _tree.get_node(_node_id).data['reliability']
+            _expected_hardware = _expected.get_node(_node_id).data['hardware']
+            _expected_reliability = _expected.get_node(
+                _node_id).data['reliability']
+            assert _hardware.total_part_count == (
+                _expected_hardware.total_part_count)
+            assert _hardware.total_cost == pytest.approx(
+                _expected_hardware.total_cost)
+            assert _reliability.hazard_rate_logistics == pytest.approx(
+                _expected_reliability.hazard_rate_logistics)
+            assert _reliability.reliability_mission == pytest.approx(
+                _expected_reliability.reliability_mission)
+        assert _tree.get_node(1).data['hardware'].total_part_count == 17
+
     @pytest.mark.unit
     @pytest.mark.calculation
     def test_do_calculate_hazard_rate_specified_hazard_rate(
@@ -1739,6 +2169,102 @@ class TestAnalysisMethods():
         assert DUT._tree.get_node(3).data[
             'reliability'].reliability_mission == pytest.approx(0.9999999)
 
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_do_predict_hazard_rates(self, test_toml_user_configuration):
+        """_do_predict_hazard_rates() should predict the parts in worker
+        processes."""
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(2, 5)
+        _parts = [
+            _node for _node in DUT._tree.all_nodes()[1:]
+            if _node.data['hardware'].part == 1
+        ]
+        for _node in _parts:
+            _node.data['reliability'].hazard_rate_type_id = 1
+
+        DUT.RAMSTK_USER_CONFIGURATION.RAMSTK_PREDICTION_WORKERS = 2
+        DUT.RAMSTK_USER_CONFIGURATION.RAMSTK_PREDICTION_CHUNK_SIZE = 3
+        try:
+            DUT._do_predict_hazard_rates(DUT._tree.get_node(1))
+        finally:
+            DUT.RAMSTK_USER_CONFIGURATION.RAMSTK_PREDICTION_WORKERS = 0
+            DUT.RAMSTK_USER_CONFIGURATION.RAMSTK_PREDICTION_CHUNK_SIZE = 500
+
+        assert DUT._dic_predictions == {
+            _node.identifier: predict_hazard_rates(
+                [DUT._get_prediction_attributes(_node)])[0]
+            for _node in _parts
+        }
+        assert DUT._dic_predictions[4][0]['hazard_rate_active'] == \
+               pytest.approx(1.5E-05)
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_do_predict_hazard_rates_serial(self,
+                                            test_toml_user_configuration):
+        """_do_predict_hazard_rates() should do nothing when fewer than two
+        worker processes are configured."""
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(2, 5)
+        for _node in DUT._tree.all_nodes()[1:]:
+            _node.data['reliability'].hazard_rate_type_id = 1
+
+        DUT._do_predict_hazard_rates(DUT._tree.get_node(1))
+
+        assert DUT._dic_predictions == {}
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_do_predict_active_hazard_rate_unknown_id(
+            self, test_toml_user_configuration):
+        """_do_predict_active_hazard_rate() should send the fail message and
+        return zero when a part has an unknown subcategory ID."""
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(1, 1)
+        _node = DUT._tree.get_node(3)
+        _node.data['hardware'].subcategory_id = 99
+        _errors = []
+
+        def on_fail_predict_reliability(error_message):
+            _errors.append(error_message)
+
+        pub.subscribe(on_fail_predict_reliability, 'fail_predict_reliability')
+
+        _hazard_rate = DUT._do_predict_active_hazard_rate(_node)
+
+        pub.unsubscribe(on_fail_predict_reliability,
+                        'fail_predict_reliability')
+
+        assert _hazard_rate == 0.0
+        assert len(_errors) == 1
+        assert 'there is no factor for one or more of the inputs' in _errors[
+            0]
+        assert 'subcategory ID=99' in _errors[0]
+
+    @pytest.mark.unit
+    @pytest.mark.calculation
+    def test_do_calculate_roll_up_deep_tree(self, test_toml_user_configuration):
+        """_do_calculate_roll_up() should calculate a BoM nested deeper than
+        the Python recursion limit."""
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(2, 5, depth=sys.getrecursionlimit())
+
+        DUT._do_calculate_roll_up(
+            DUT._tree.get_node(1),
+            ['cost', 'part_count', 'power', 'reliabilities'])
+
+        _time = test_toml_user_configuration.RAMSTK_HR_MULTIPLIER
+        _system = DUT._tree.get_node(1).data
+        assert _system['hardware'].total_cost == 10.0
+        assert _system['hardware'].total_part_count == 10
+        assert _system['hardware'].total_power_dissipation == 5.0
+        assert _system['reliability'].hazard_rate_active == pytest.approx(
+            10 * 0.005 / _time)
+        assert _system['reliability'].mtbf_mission == pytest.approx(
+            _time**2 / 0.05)
+        assert _system['reliability'].reliability_mission < 1.0
+
 
 @pytest.mark.usefixtures('test_toml_user_configuration')
 class TestMilHdbk217FPredictions():
@@ -1795,6 +2321,47 @@ class TestMilHdbk217FPredictions():
         pub.unsubscribe(self.on_succeed_calculate_parts_count,
                         'succeed_calculate_hardware')
 
+    @pytest.mark.unit
+    def test_do_calculate_part_mil_hdbk_217f_results(
+            self, mock_program_dao, test_toml_user_configuration):
+        """_do_calculate_hardware() should save the MIL-HDBK-217F factors to
+        the part's records without sending a message for each part."""
+        _predictions = []
+
+        def on_succeed_predict_reliability(attributes):
+            _predictions.append(attributes)
+
+        pub.subscribe(on_succeed_predict_reliability,
+                      'succeed_predict_reliability')
+
+        DUT = amHardware(test_toml_user_configuration)
+
+        DATAMGR = dmHardware()
+        DATAMGR.do_connect(mock_program_dao)
+        DATAMGR.do_select_all(attributes={'revision_id': 1})
+
+        DUT._tree.get_node(3).data['reliability'].hazard_rate_type_id = 1
+        DUT._tree.get_node(3).data['reliability'].hazard_rate_method_id = 1
+        DUT._tree.get_node(3).data['hardware'].category_id = 1
+        DUT._tree.get_node(3).data['hardware'].subcategory_id = 1
+        DUT._tree.get_node(3).data['design_electric'].n_elements = 50
+        DUT._tree.get_node(3).data['reliability'].quality_id = 1
+        DUT._tree.get_node(3).data['design_electric'].environment_active_id = 3
+
+        DUT._do_calculate_hardware(3)
+
+        pub.unsubscribe(on_succeed_predict_reliability,
+                        'succeed_predict_reliability')
+
+        assert _predictions == []
+        assert DUT._dic_prediction_results == {}
+        assert DUT._tree.get_node(
+            3).data['mil_hdbk_217f'].piQ == pytest.approx(0.25)
+        assert DUT._tree.get_node(
+            3).data['reliability'].lambda_b == pytest.approx(0.039)
+        assert DUT._tree.get_node(
+            3).data['reliability'].hazard_rate_active == 0.04875
+
     @pytest.mark.unit
     def test_do_calculate_part_mil_hdbk_217f_part_stress(
             self, mock_program_dao, test_toml_user_configuration):
@@ -1907,3 +2474,194 @@ class TestMilHdbk217FPredictions():
             'reliability'].reliability_logistics == pytest.approx(0.9999999)
         assert DUT._tree.get_node(2).data[
             'reliability'].reliability_mission == pytest.approx(0.9999978)
+
+
+@pytest.mark.usefixtures('make_bom_dao')
+class TestBenchmarks():
+    """Class for hardware data manager benchmark test suite."""
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_parts', [100, 1000, 5000])
+    def test_do_select_all_scaling(self, make_bom_dao, n_parts):
+        """do_select_all() should load the BoM in a single query regardless of
+        the number of hardware items."""
+        dao = make_bom_dao(n_parts)
+        _statements = []
+
+        def on_execute(conn, cursor, statement, parameters, context,
+                       executemany):
+            _statements.append(statement)
+
+        event.listen(dao.engine, 'before_cursor_execute', on_execute)
+
+        DUT = dmHardware()
+        DUT.do_connect(dao)
+
+        _start = time.perf_counter()
+        DUT.do_select_all(attributes={'revision_id': 1})
+        _elapsed = time.perf_counter() - _start
+
+        event.remove(dao.engine, 'before_cursor_execute', on_execute)
+
+        print('\ndo_select_all() loaded {0:d} hardware items in {1:.3f} '
+              'seconds using {2:d} queries.'.format(
+                  len(DUT.tree) - 1, _elapsed, len(_statements)))
+
+        assert len(_statements) == 1
+        assert len(DUT.tree) == n_parts + n_parts // 25 + 2
+        assert isinstance(
+            DUT.tree.get_node(n_parts).data['reliability'], RAMSTKReliability)
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('dialect', ['sqlite', 'postgres'])
+    @pytest.mark.parametrize('n_parts', [100, 500])
+    def test_do_update_all_single_transaction(self, make_bom_dao, n_parts,
+                                              dialect):
+        """do_update_all() should commit the BoM once rather than once per
+        record."""
+        dao = make_bom_dao(n_parts, dialect=dialect)
+
+        DUT = dmHardware()
+        DUT.do_connect(dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+
+        _commits = []
+
+        def on_commit(conn):
+            _commits.append(conn)
+
+        event.listen(dao.engine, 'commit', on_commit)
+
+        _start = time.perf_counter()
+        for _node in DUT.tree.all_nodes()[1:]:
+            _node.data['hardware'].cost = 1.0
+            DUT.do_update(_node.identifier)
+        _per_row = time.perf_counter() - _start
+        _n_per_row = len(_commits)
+
+        _commits.clear()
+        for _node in DUT.tree.all_nodes()[1:]:
+            _node.data['hardware'].cost = 2.0
+        _start = time.perf_counter()
+        DUT.do_update_all()
+        _single = time.perf_counter() - _start
+
+        event.remove(dao.engine, 'commit', on_commit)
+
+        print('\n{5:s}: saved {0:d} hardware items in {1:.3f} seconds using '
+              '{2:d} commits and in {3:.3f} seconds using {4:d} '
+              'commits.'.format(len(DUT.tree) - 1, _per_row, _n_per_row,
+                                _single, len(_commits), dialect))
+
+        assert _n_per_row == len(DUT.tree) - 1
+        assert len(_commits) == 1
+        assert dao.session.query(RAMSTKHardware).filter(
+            RAMSTKHardware.cost == 2.0).count() == len(DUT.tree) - 1
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_parts', [1000, 5000])
+    def test_do_update_all_one_edit(self, make_bom_dao, n_parts):
+        """do_update_all() should save a single edit quickly regardless of the
+        number of hardware items."""
+        dao = make_bom_dao(n_parts)
+
+        DUT = dmHardware()
+        DUT.do_connect(dao)
+        DUT.do_select_all(attributes={'revision_id': 1})
+
+        DUT.do_set_attributes(node_id=[n_parts], package={'cost': 12.34})
+
+        _start = time.perf_counter()
+        DUT.do_update_all()
+        _elapsed = time.perf_counter() - _start
+
+        print('\nSaved one edit to {0:d} hardware items in {1:.3f} '
+              'seconds.'.format(len(DUT.tree) - 1, _elapsed))
+
+        assert DUT.get_dirty_count() == 0
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_items', [1000, 10000, 100000])
+    def test_do_calculate_roll_up_scaling(self, monkeypatch,
+                                          test_toml_user_configuration,
+                                          n_items):
+        """_do_calculate_roll_up() should calculate every metric for a large
+        BoM in a single pass."""
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(n_items // 26, 25)
+
+        _calculated = []
+        _do_calculate_item = DUT._do_calculate_item
+
+        def on_calculate_item(node, children, flags, metrics):
+            _calculated.append(node.identifier)
+            _do_calculate_item(node, children, flags, metrics)
+
+        monkeypatch.setattr(DUT, '_do_calculate_item', on_calculate_item)
+
+        _start = time.perf_counter()
+        DUT._do_calculate_roll_up(
+            DUT._tree.get_node(1),
+            ['cost', 'part_count', 'power', 'reliabilities'])
+        _elapsed = time.perf_counter() - _start
+
+        print('\n_do_calculate_roll_up() calculated {0:d} hardware items in '
+              '{1:.3f} seconds.'.format(len(DUT._tree) - 1, _elapsed))
+
+        _n_parts = (n_items // 26) * 25
+        _system = DUT._tree.get_node(1).data
+        assert _system['hardware'].total_part_count == _n_parts
+        assert _system['hardware'].total_cost == _n_parts
+        assert _system['hardware'].total_power_dissipation == pytest.approx(
+            0.5 * _n_parts)
+        assert _system['reliability'].hazard_rate_logistics == pytest.approx(
+            0.005 * _n_parts)
+        assert DUT._tree.get_node(
+            2).data['hardware'].total_part_count == 25
+
+        # Every hardware item is calculated exactly once and after all of its
+        # children.
+        assert sorted(_calculated) == sorted(DUT._tree.nodes)[1:]
+        _order = {_node_id: _index for _index, _node_id in
+                  enumerate(_calculated)}
+        assert all(
+            _order[_node_id] < _order[DUT._tree.parent(_node_id).identifier]
+            for _node_id in _calculated[:-1])
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_items', [10000, 100000])
+    def test_do_calculate_dirty_one_edit(self, monkeypatch,
+                                         test_toml_user_configuration,
+                                         n_items):
+        """_do_calculate_dirty() should recalculate only a single edited part
+        and its ancestors regardless of the number of hardware items."""
+        _metrics = ['cost', 'part_count', 'power', 'reliabilities']
+        DUT = amHardware(test_toml_user_configuration)
+        DUT._tree = _make_bom_tree(n_items // 26, 25)
+        DUT._do_calculate_roll_up(DUT._tree.get_node(1), _metrics)
+
+        DUT._tree.get_node(n_items // 2 + 1).data['hardware'].cost = 2.0
+
+        _calculated = []
+        _do_calculate_item = DUT._do_calculate_item
+
+        def on_calculate_item(node, children, flags, metrics):
+            _calculated.append(node.identifier)
+            _do_calculate_item(node, children, flags, metrics)
+
+        monkeypatch.setattr(DUT, '_do_calculate_item', on_calculate_item)
+
+        _start = time.perf_counter()
+        DUT._do_calculate_dirty(DUT._tree.get_node(1), _metrics,
+                                {n_items // 2 + 1})
+        _elapsed = time.perf_counter() - _start
+
+        print('\n_do_calculate_dirty() recalculated one edit to {0:d} '
+              'hardware items in {1:.3f} seconds.'.format(
+                  len(DUT._tree) - 1, _elapsed))
+
+        _assembly_id = DUT._tree.parent(n_items // 2 + 1).identifier
+        assert _calculated == [n_items // 2 + 1, _assembly_id, 1]
+        assert DUT._tree.get_node(
+            _assembly_id).data['hardware'].total_cost == 26.0
+        assert DUT._tree.get_node(1).data['hardware'].total_cost == (
+            (n_items // 26) * 25 + 1)
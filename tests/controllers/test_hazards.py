@@ -60,6 +60,15 @@ class MockDao:
 
         return self._all_hazards
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         for _key in MOCK_HAZARDS:
             if _key == record.hazard_id:
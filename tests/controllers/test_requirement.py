@@ -58,6 +58,15 @@ class MockDao:
 
             return self._all_requirements
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         if isinstance(record, RAMSTKRequirement):
             for _key in MOCK_REQUIREMENTS:
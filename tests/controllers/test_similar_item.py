@@ -61,6 +61,15 @@ class MockDao:
 
         return self._all_similar_item
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         for _key in MOCK_SIMILAR_ITEM:
             if _key == record.hardware_id:
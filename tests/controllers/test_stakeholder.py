@@ -56,6 +56,15 @@ class MockDao:
 
         return self._all
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         for _key in MOCK_STAKEHOLDERS:
             if _key == record.stakeholder_id:
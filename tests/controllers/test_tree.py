@@ -0,0 +1,268 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.controllers.test_tree.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the RAMSTK module tree."""
+
+# Standard Library Imports
+import timeit
+import tracemalloc
+
+# Third Party Imports
+import numpy as np
+import pytest
+from treelib import Tree
+
+# RAMSTK Package Imports
+from ramstk.controllers import RAMSTKTree, dmHardware
+
+
+def _make_tree(tree, n_branches, n_leaves):
+    """Populate a tree with n_branches each holding n_leaves."""
+    tree.create_node(tag='root', identifier=0)
+    _node_id = 1
+    for _branch in range(n_branches):
+        _branch_id = _node_id
+        tree.create_node(tag='branch', identifier=_branch_id, parent=0)
+        _node_id += 1
+        for _leaf in range(n_leaves):
+            tree.create_node(tag='leaf', identifier=_node_id,
+                             parent=_branch_id)
+            _node_id += 1
+
+    return tree
+
+
+@pytest.mark.unit
+def test_create_tree():
+    """__init__() should create a treelib Tree() with an empty index."""
+    DUT = RAMSTKTree()
+
+    assert isinstance(DUT, Tree)
+    assert DUT.get_node_ids() == []
+    assert DUT.parents.size == 0
+    assert DUT.child_offsets.tolist() == [0]
+
+
+@pytest.mark.unit
+def test_data_manager_tree():
+    """RAMSTK data managers should hold their module in a RAMSTKTree()."""
+    DUT = dmHardware()
+
+    assert isinstance(DUT.tree, RAMSTKTree)
+
+
+@pytest.mark.unit
+def test_index():
+    """The index should number the nodes in pre-order."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    assert DUT.get_node_ids() == [0, 1, 2, 3, 4, 5, 6]
+    assert DUT.get_index(4) == 4
+    assert DUT.parents.tolist() == [-1, 0, 1, 1, 0, 4, 4]
+    assert DUT.depths.tolist() == [0, 1, 2, 2, 1, 2, 2]
+    assert DUT.subtree_ends.tolist() == [7, 4, 3, 4, 7, 6, 7]
+    assert DUT.postorder.tolist() == [2, 3, 1, 5, 6, 4, 0]
+    assert DUT.child_offsets.tolist() == [0, 2, 4, 4, 4, 6, 6, 6]
+    assert DUT.child_indices.tolist() == [1, 4, 2, 3, 5, 6]
+
+
+@pytest.mark.unit
+def test_get_child_ids():
+    """get_child_ids() should return the child IDs in the order added."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    assert DUT.get_child_ids(0) == [1, 4]
+    assert DUT.get_child_ids(4) == [5, 6]
+    assert DUT.get_child_ids(6) == []
+    assert DUT.get_child_ids(0) == [
+        _node.identifier for _node in DUT.children(0)
+    ]
+
+
+@pytest.mark.unit
+def test_get_child_ids_moved_node():
+    """get_child_ids() should list a moved node after its new siblings as treelib does."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    DUT.move_node(2, 4)
+
+    assert DUT.get_child_ids(4) == [5, 6, 2]
+    assert DUT.get_child_ids(4) == [
+        _node.identifier for _node in DUT.children(4)
+    ]
+    assert DUT.get_subtree_ids(4) == [4, 5, 6, 2]
+
+
+@pytest.mark.unit
+def test_get_subtree_ids():
+    """get_subtree_ids() should return the IDs of the node and its descendants."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    assert DUT.get_subtree_slice(4) == slice(4, 7)
+    assert DUT.get_subtree_ids(4) == [4, 5, 6]
+    assert DUT.get_subtree_ids(6) == [6]
+    assert sorted(DUT.get_subtree_ids(1)) == sorted(DUT.subtree(1).nodes)
+
+
+@pytest.mark.unit
+def test_get_index_unknown_node():
+    """get_index() should raise a KeyError when passed an unknown node ID."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    with pytest.raises(KeyError):
+        DUT.get_index(40)
+
+
+@pytest.mark.unit
+def test_is_ancestor():
+    """is_ancestor() should match treelib's result."""
+    DUT = _make_tree(RAMSTKTree(), 2, 3)
+    _tree = _make_tree(Tree(), 2, 3)
+
+    for _ancestor in _tree.nodes:
+        for _grandchild in _tree.nodes:
+            assert DUT.is_ancestor(_ancestor, _grandchild) == \
+                   _tree.is_ancestor(_ancestor, _grandchild)
+
+
+@pytest.mark.unit
+def test_do_roll_up():
+    """do_roll_up() should sum the values in each node's subtree."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    assert DUT.do_roll_up(np.ones(7)).tolist() == [7, 3, 1, 1, 3, 1, 1]
+    assert DUT.do_roll_up(np.arange(14).reshape(7, 2)).tolist() == [
+        [42, 49], [12, 15], [4, 5], [6, 7], [30, 33], [10, 11], [12, 13]
+    ]
+
+
+@pytest.mark.unit
+def test_do_roll_up_wrong_size():
+    """do_roll_up() should raise a ValueError when not passed a value for every node."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    with pytest.raises(ValueError):
+        DUT.do_roll_up(np.ones(6))
+
+
+@pytest.mark.unit
+def test_index_updated():
+    """The index should be rebuilt after the structure of the tree changes."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    assert DUT.get_subtree_ids(1) == [1, 2, 3]
+
+    DUT.move_node(5, 1)
+    assert DUT.get_subtree_ids(1) == [1, 2, 3, 5]
+    assert DUT.is_ancestor(1, 5)
+
+    DUT.remove_node(2)
+    assert DUT.get_subtree_ids(1) == [1, 3, 5]
+
+    DUT.create_node(tag='leaf', identifier=7, parent=4)
+    assert DUT.get_child_ids(4) == [6, 7]
+
+    DUT.update_node(7, identifier=8)
+    assert DUT.get_child_ids(4) == [6, 8]
+
+    DUT.link_past_node(4)
+    assert DUT.get_child_ids(0) == [1, 6, 8]
+
+    _subtree = DUT.remove_subtree(1)
+    assert isinstance(_subtree, RAMSTKTree)
+    assert _subtree.get_node_ids() == [1, 3, 5]
+    assert DUT.get_node_ids() == [0, 6, 8]
+
+    DUT.paste(6, _subtree)
+    assert DUT.get_node_ids() == [0, 6, 1, 3, 5, 8]
+
+
+@pytest.mark.unit
+def test_subtree():
+    """subtree() should return a RAMSTKTree() with its own index."""
+    DUT = _make_tree(RAMSTKTree(), 2, 2)
+
+    _subtree = DUT.subtree(4)
+
+    assert isinstance(_subtree, RAMSTKTree)
+    assert _subtree.get_node_ids() == [4, 5, 6]
+    assert _subtree.parents.tolist() == [-1, 0, 0]
+
+
+class TestBenchmarks():
+    """Class for RAMSTK module tree benchmark test suite."""
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_branches', [10, 100, 1000])
+    def test_traversal(self, n_branches):
+        """The index should walk a subtree faster than treelib."""
+        _tree = _make_tree(Tree(), n_branches, 100)
+        DUT = _make_tree(RAMSTKTree(), n_branches, 100)
+        DUT.get_node_ids()
+
+        _treelib_time = min(
+            timeit.repeat(lambda: list(_tree.expand_tree(0, sorting=False)),
+                          number=1,
+                          repeat=5))
+        _index_time = min(
+            timeit.repeat(lambda: DUT.get_subtree_ids(0), number=1, repeat=5))
+
+        print('\n{0:d} nodes: treelib {1:.3f} ms, index {2:.3f} ms'.format(
+            len(DUT), _treelib_time * 1000.0, _index_time * 1000.0))
+        assert DUT.get_subtree_ids(0) == list(
+            _tree.expand_tree(0, sorting=False))
+        assert _index_time < _treelib_time
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_branches', [10, 100, 1000])
+    def test_roll_up(self, n_branches):
+        """do_roll_up() should sum a subtree faster than walking treelib."""
+        _tree = _make_tree(Tree(), n_branches, 100)
+        DUT = _make_tree(RAMSTKTree(), n_branches, 100)
+        _values = np.ones(len(DUT))
+        DUT.get_node_ids()
+
+        def _do_roll_up_treelib():
+            _sums = {}
+            for _node_id in reversed(list(_tree.expand_tree(0,
+                                                            sorting=False))):
+                _sums[_node_id] = 1.0 + sum(
+                    _sums[_child] for _child in _tree.get_node(
+                        _node_id).successors(_tree.identifier))
+            return _sums
+
+        _treelib_time = min(
+            timeit.repeat(_do_roll_up_treelib, number=1, repeat=5))
+        _index_time = min(
+            timeit.repeat(lambda: DUT.do_roll_up(_values), number=1,
+                          repeat=5))
+
+        print('\n{0:d} nodes: treelib {1:.3f} ms, index {2:.3f} ms'.format(
+            len(DUT), _treelib_time * 1000.0, _index_time * 1000.0))
+        _sums = _do_roll_up_treelib()
+        assert DUT.do_roll_up(_values).tolist() == [
+            _sums[_node_id] for _node_id in DUT.get_node_ids()
+        ]
+        assert _index_time < _treelib_time
+
+    @pytest.mark.benchmark
+    def test_memory(self):
+        """The index should take less than half the memory of the treelib structure it indexes."""
+        tracemalloc.start()
+        _tree = _make_tree(Tree(), 1000, 100)
+        _tree_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        DUT = _make_tree(RAMSTKTree(), 1000, 100)
+        tracemalloc.start()
+        DUT.get_node_ids()
+        _index_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print('\ntreelib: {0:d} bytes, index: {1:d} bytes'.format(
+            _tree_memory, _index_memory))
+        assert _index_memory < _tree_memory / 2
@@ -112,6 +112,15 @@ class MockDao:
             for _phase in self._all_mission_phases:
                 return self._do_select_all_environments(table, _phase.phase_id)
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         for _key in MOCK_MISSIONS:
             if _key == record.mission_id:
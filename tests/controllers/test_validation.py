@@ -77,6 +77,15 @@ class MockDao:
                 self._all_status.append(_record)
             return self._all_status
 
+    def do_begin_transaction(self):
+        pass
+
+    def do_commit_transaction(self):
+        return True
+
+    def do_rollback_transaction(self):
+        pass
+
     def do_update(self, record):
         if isinstance(record, RAMSTKValidation):
             for _key in MOCK_VALIDATIONS:
@@ -9,25 +9,33 @@
 """Test class for common database methods and operations."""
 
 # Standard Library Imports
+import json
+import os
 from datetime import date, timedelta
 
 # Third Party Imports
 import pytest
 from mock import patch
 from pubsub import pub
+from sqlalchemy import event
 
 # RAMSTK Package Imports
+from ramstk.configuration import RAMSTKUserConfiguration
 from ramstk.db.base import BaseDatabase
 from ramstk.db.common import (
-    _do_load_action_variables, _do_load_hardware_variables,
-    _do_load_incident_variables, _do_load_miscellaneous_variables,
+    SITE_VARIABLES, SITE_VARIABLES_CACHE_VERSION, _do_decode_cache_value,
+    _do_encode_cache_value, _do_load_action_variables,
+    _do_load_hardware_variables, _do_load_incident_variables, _do_load_miscellaneous_variables,
     _do_load_pof_variables, _do_load_rpn_variables, _do_load_severity,
     _do_load_user_workgroups, _load_fmea_tables, _load_hazard_analysis_tables,
     _load_incident_report_tables, _load_miscellaneous_tables,
     _load_pof_tables, _load_site_info, do_add_administrator,
-    do_create_common_db, do_load_variables, do_make_commondb_tables
+    do_create_common_db, do_load_cached_variables, do_load_variables,
+    do_make_commondb_tables
+)
+from ramstk.models.commondb import (
+    RAMSTKManufacturer, RAMSTKSiteInfo, RAMSTKUser
 )
-from ramstk.models.commondb import RAMSTKSiteInfo, RAMSTKUser
 
 TEST_COMMON_DB = BaseDatabase()
 TEST_COMMON_DB.do_connect({
@@ -1031,3 +1039,243 @@ class TestLoadCommonTables():
         """_do_load_variables() should return None."""
         assert do_load_variables(test_common_dao,
                                  test_toml_user_configuration) is None
+
+
+@pytest.fixture
+def test_site_db(tmp_path):
+    """Create a RAMSTK Common database in a SQLite file."""
+    _site_db = BaseDatabase()
+    _site_db.do_connect({
+        "dialect": "sqlite",
+        "host": "localhost",
+        "port": "3306",
+        "database": str(tmp_path / 'site.ramstk'),
+        "user": "johnny.tester",
+        "password": "clear.text.password"
+    })
+    with patch('builtins.input', return_value='n'):
+        do_create_common_db(_site_db.engine, _site_db.session)
+
+    yield _site_db
+
+    _site_db.do_disconnect()
+
+
+@pytest.mark.usefixtures('test_toml_user_configuration')
+class TestLoadVariablesCache():
+    """Class for testing the site variables cache."""
+    def test_do_load_variables_one_query_per_table(self, test_site_db):
+        """do_load_variables() should query each site database table once."""
+        _statements = []
+
+        def on_execute(conn, cursor, statement, parameters, context,
+                       executemany):
+            _statements.append(statement)
+
+        event.listen(test_site_db.engine, 'before_cursor_execute', on_execute)
+        do_load_variables(test_site_db, RAMSTKUserConfiguration())
+        event.remove(test_site_db.engine, 'before_cursor_execute', on_execute)
+
+        assert len(_statements) == 15
+
+    def test_do_load_variables_write_cache(self, test_site_db, tmp_path):
+        """do_load_variables() should write the variables to the cache file."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        _configuration = RAMSTKUserConfiguration()
+
+        assert do_load_variables(test_site_db,
+                                 _configuration,
+                                 cache_file=_cache_file) is None
+        assert os.path.isfile(_cache_file)
+        with open(_cache_file, 'r') as _file:
+            assert json.load(_file)['version'] == SITE_VARIABLES_CACHE_VERSION
+        assert _configuration.RAMSTK_MANUFACTURERS[1] == ('Sprague',
+                                                          'New Hampshire',
+                                                          '13606')
+
+    def test_do_load_variables_read_cache(self, test_site_db, tmp_path):
+        """do_load_variables() should load the variables from the cache without reading the site database."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        _expected = RAMSTKUserConfiguration()
+        do_load_variables(test_site_db, _expected, cache_file=_cache_file)
+
+        _configuration = RAMSTKUserConfiguration()
+        with patch.object(test_site_db, 'session') as _session:
+            do_load_variables(test_site_db,
+                              _configuration,
+                              cache_file=_cache_file)
+
+            assert not _session.query.called
+
+        for _variable in SITE_VARIABLES:
+            assert getattr(_configuration,
+                           _variable) == getattr(_expected, _variable)
+
+    def test_do_load_variables_stale_cache(self, test_site_db, tmp_path):
+        """do_load_variables() should reload the variables from the site database when the site database changes."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        do_load_variables(test_site_db,
+                          RAMSTKUserConfiguration(),
+                          cache_file=_cache_file)
+
+        _manufacturer = RAMSTKManufacturer()
+        _manufacturer.description = 'Tester Inc.'
+        _manufacturer.location = 'Here'
+        _manufacturer.cage_code = '00000'
+        test_site_db.do_insert(_manufacturer)
+        os.utime(test_site_db.engine.url.database, ns=(0, 0))
+
+        _configuration = RAMSTKUserConfiguration()
+        do_load_variables(test_site_db,
+                          _configuration,
+                          cache_file=_cache_file)
+
+        assert _configuration.RAMSTK_MANUFACTURERS[
+            _manufacturer.manufacturer_id] == ('Tester Inc.', 'Here', '00000')
+
+    def test_do_encode_cache_value(self):
+        """_do_decode_cache_value() should restore the dicts, tuples, and lists encoded by _do_encode_cache_value() after a JSON round trip."""
+        _value = {
+            1: {
+                2: {
+                    3: ['Open', 0.5, 'FMD-97']
+                }
+            },
+            4: ('Sprague', 'New Hampshire', '13606'),
+            5: {
+                'name': 'Remote',
+                'value': 10
+            },
+        }
+
+        assert _do_decode_cache_value(
+            json.loads(json.dumps(_do_encode_cache_value(_value)))) == _value
+
+    @pytest.mark.parametrize('contents', [
+        b'not a cache',
+        b'\xff\xfe\x00',
+        b'[]',
+        b'{"version": 2}',
+        b'{"version": 2, "fingerprint": {"tuple": 1}, "variables": {}}',
+        b'[' * 100000,
+    ])
+    def test_do_load_variables_bad_cache(self, test_site_db, tmp_path,
+                                         contents):
+        """do_load_variables() should load the variables from the site database when the cache can't be read."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        with open(_cache_file, 'wb') as _file:
+            _file.write(contents)
+
+        _configuration = RAMSTKUserConfiguration()
+        do_load_variables(test_site_db,
+                          _configuration,
+                          cache_file=_cache_file)
+
+        assert _configuration.RAMSTK_MANUFACTURERS[1] == ('Sprague',
+                                                          'New Hampshire',
+                                                          '13606')
+
+    def test_do_load_cached_variables(self, test_site_db, tmp_path):
+        """do_load_cached_variables() should load the variables from the cache of a SQLite site database without connecting to it."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        _expected = RAMSTKUserConfiguration()
+        do_load_variables(test_site_db, _expected, cache_file=_cache_file)
+
+        _configuration = RAMSTKUserConfiguration()
+        with patch('ramstk.db.base.do_open_session') as _open_session:
+            assert do_load_cached_variables(
+                {
+                    'dialect': 'sqlite',
+                    'host': 'localhost',
+                    'port': '3306',
+                    'database': str(tmp_path / 'site.ramstk'),
+                }, _configuration, _cache_file)
+
+            assert not _open_session.called
+
+        for _variable in SITE_VARIABLES:
+            assert getattr(_configuration,
+                           _variable) == getattr(_expected, _variable)
+
+    def test_do_load_cached_variables_stale_cache(self, test_site_db,
+                                                  tmp_path):
+        """do_load_cached_variables() should return False when the SQLite site database changed after the cache was written."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        do_load_variables(test_site_db,
+                          RAMSTKUserConfiguration(),
+                          cache_file=_cache_file)
+        os.utime(test_site_db.engine.url.database, ns=(0, 0))
+
+        assert not do_load_cached_variables(
+            {
+                'dialect': 'sqlite',
+                'host': 'localhost',
+                'port': '3306',
+                'database': str(tmp_path / 'site.ramstk'),
+            }, RAMSTKUserConfiguration(), _cache_file)
+
+    def test_do_load_cached_variables_postgres_not_connected(self, tmp_path):
+        """do_load_cached_variables() should return False for a PostgreSQL site database that isn't connected."""
+        assert not do_load_cached_variables(
+            {
+                'dialect': 'postgres',
+                'host': 'localhost',
+                'port': '5432',
+                'database': 'TestCommonDB',
+            }, RAMSTKUserConfiguration(),
+            str(tmp_path / 'site_variables.cache'))
+
+    @pytest.mark.integration
+    def test_do_load_variables_read_cache_postgres(self, test_common_dao,
+                                                   tmp_path):
+        """do_load_variables() should load the variables for a PostgreSQL site database from the cache using only the fingerprint query."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        _expected = RAMSTKUserConfiguration()
+        do_load_variables(test_common_dao, _expected, cache_file=_cache_file)
+
+        _statements = []
+
+        def on_execute(conn, cursor, statement, parameters, context,
+                       executemany):
+            _statements.append(statement)
+
+        _configuration = RAMSTKUserConfiguration()
+        event.listen(test_common_dao.engine, 'before_cursor_execute',
+                     on_execute)
+        do_load_variables(test_common_dao,
+                          _configuration,
+                          cache_file=_cache_file)
+        event.remove(test_common_dao.engine, 'before_cursor_execute',
+                     on_execute)
+
+        assert len(_statements) == 1
+        assert 'md5' in _statements[0]
+        for _variable in SITE_VARIABLES:
+            assert getattr(_configuration,
+                           _variable) == getattr(_expected, _variable)
+
+    @pytest.mark.integration
+    def test_do_load_variables_stale_cache_postgres(self, test_common_dao,
+                                                    tmp_path):
+        """do_load_variables() should reload the variables from a PostgreSQL site database when a site variable table changes."""
+        _cache_file = str(tmp_path / 'site_variables.cache')
+        do_load_variables(test_common_dao,
+                          RAMSTKUserConfiguration(),
+                          cache_file=_cache_file)
+
+        _manufacturer = RAMSTKManufacturer()
+        _manufacturer.manufacturer_id = 999
+        _manufacturer.description = 'Tester Inc.'
+        _manufacturer.location = 'Here'
+        _manufacturer.cage_code = '00000'
+        test_common_dao.do_insert(_manufacturer)
+
+        _configuration = RAMSTKUserConfiguration()
+        do_load_variables(test_common_dao,
+                          _configuration,
+                          cache_file=_cache_file)
+
+        test_common_dao.do_delete(_manufacturer)
+
+        assert _configuration.RAMSTK_MANUFACTURERS[
+            _manufacturer.manufacturer_id] == ('Tester Inc.', 'Here', '00000')
@@ -8,10 +8,17 @@
 # Copyright 2007 - 2019 Doyle "weibullguy" Rowland
 """Test class for testing the Exports module."""
 
+# Standard Library Imports
+import csv
+import gc
+import time
+import tracemalloc
+
 # Third Party Imports
-import pandas as pd
 import pytest
+from openpyxl import load_workbook
 from pubsub import pub
+from treelib import Tree
 
 # RAMSTK Package Imports
 from ramstk.controllers import (
@@ -36,7 +43,7 @@ class TestExport():
         pub.sendMessage('request_get_functions_tree')
 
         assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data['functions'], dict)
+        assert isinstance(DUT._dic_output_data['functions'], Tree)
 
     @pytest.mark.unit
     def test_do_load_output_requirement(self, test_program_dao):
@@ -51,7 +58,7 @@ class TestExport():
         pub.sendMessage('request_get_requirements_tree')
 
         assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data['requirements'], dict)
+        assert isinstance(DUT._dic_output_data['requirements'], Tree)
 
     @pytest.mark.unit
     def test_do_load_output_hardware(self, test_program_dao):
@@ -66,7 +73,7 @@ class TestExport():
         pub.sendMessage('request_get_hardwares_tree')
 
         assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data['hardwares'], dict)
+        assert isinstance(DUT._dic_output_data['hardwares'], Tree)
 
     @pytest.mark.unit
     def test_do_load_output_validation(self, test_program_dao):
@@ -81,7 +88,7 @@ class TestExport():
         pub.sendMessage('request_get_validations_tree')
 
         assert isinstance(DUT._dic_output_data, dict)
-        assert isinstance(DUT._dic_output_data['validations'], dict)
+        assert isinstance(DUT._dic_output_data['validations'], Tree)
 
     @pytest.mark.unit
     def test_do_export_to_csv(self, test_program_dao, test_export_dir):
@@ -186,6 +193,10 @@ class TestExport():
     @pytest.mark.unit
     def test_do_export_multi_sheet(self, test_program_dao, test_export_dir):
         """do_export() should return None when exporting to a text file."""
+        # Make sure exporters left over from other tests are not listening
+        # for the export request.
+        gc.collect()
+
         _function = dmFunction()
         _function.do_connect(test_program_dao)
         _function.do_select_all(attributes={'revision_id': 1})
@@ -205,4 +216,89 @@ class TestExport():
                         file_type='excel',
                         file_name=_test_multi)
 
-        assert isinstance(DUT._df_output_data, pd.core.frame.DataFrame)
+        _workbook = load_workbook(_test_multi, read_only=True)
+        assert _workbook.sheetnames == ['functions', 'requirements']
+        _rows = list(_workbook['functions'].iter_rows(values_only=True))
+        assert 'function_id' in _rows[0]
+        assert len(_rows) == len(_function.tree.all_nodes())
+        _workbook.close()
+
+    @pytest.mark.unit
+    def test_do_export_multi_section(self, test_program_dao,
+                                     test_export_dir):
+        """do_export() should write each module to its own section of a
+        delimited text file."""
+        # Make sure exporters left over from other tests are not listening
+        # for the export request.
+        gc.collect()
+
+        _function = dmFunction()
+        _function.do_connect(test_program_dao)
+        _function.do_select_all(attributes={'revision_id': 1})
+
+        _requirement = dmRequirement()
+        _requirement.do_connect(test_program_dao)
+        _requirement.do_select_all(attributes={'revision_id': 1})
+
+        DUT = Export()
+
+        pub.sendMessage('request_get_functions_tree')
+        pub.sendMessage('request_get_requirements_tree')
+
+        _test_multi = test_export_dir + 'test_export_multi.csv'
+
+        pub.sendMessage('request_export_data',
+                        file_type='csv',
+                        file_name=_test_multi)
+
+        with open(_test_multi, newline='') as _file:
+            _rows = list(csv.reader(_file, delimiter=';'))
+
+        _n_functions = len(_function.tree.all_nodes()) - 1
+        _n_requirements = len(_requirement.tree.all_nodes()) - 1
+        assert _rows[0] == ['functions']
+        assert 'function_id' in _rows[1]
+        assert _rows[_n_functions + 2] == []
+        assert _rows[_n_functions + 3] == ['requirements']
+        assert 'requirement_id' in _rows[_n_functions + 4]
+        assert len(_rows) == _n_functions + _n_requirements + 6
+
+
+class TestBenchmarks():
+    """Class for export benchmark test suite."""
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('file_name', ['bom.csv', 'bom.xlsx'])
+    @pytest.mark.parametrize('n_parts', [1000, 10000])
+    def test_do_export_scaling(self, make_bom_dao, test_export_dir, n_parts,
+                               file_name):
+        """do_export() time should grow linearly and peak memory should stay
+        flat as the number of hardware items grows."""
+        dao = make_bom_dao(n_parts)
+
+        _hardware = dmHardware()
+        _hardware.do_connect(dao)
+        _hardware.do_select_all(attributes={'revision_id': 1})
+
+        DUT = Export()
+
+        pub.sendMessage('request_get_hardwares_tree')
+
+        _test_file = test_export_dir + file_name
+        _file_type = {'bom.csv': 'csv', 'bom.xlsx': 'excel'}[file_name]
+
+        _start = time.perf_counter()
+        DUT._do_export(_file_type, _test_file)
+        _elapsed = time.perf_counter() - _start
+
+        # Measure memory on a second export; tracing distorts the timing.
+        tracemalloc.start()
+        DUT._do_export(_file_type, _test_file)
+        _peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print('\n_do_export() wrote {0:d} hardware items to {1:s} in {2:.3f} '
+              'seconds with a peak of {3:.1f} MiB.'.format(
+                  len(_hardware.tree) - 1, file_name, _elapsed,
+                  _peak / 1048576.0))
+
+        assert _peak < 16 * 1048576
@@ -10,18 +10,25 @@
 """Test class for testing the Imports class."""
 
 # Standard Library Imports
-import math
+import copy
+import csv
+import tempfile
+import time
 from collections import OrderedDict
+from datetime import date
 
 # Third Party Imports
-import numpy as np
 import pandas as pd
 import pytest
+from openpyxl import Workbook
 from pubsub import pub
 
 # RAMSTK Package Imports
 from ramstk.db.base import BaseDatabase
-from ramstk.exim import Import, _do_replace_nan, _get_input_value
+from ramstk.exim import Import, _get_input_column
+from ramstk.models.programdb import RAMSTKFunction, RAMSTKHardware
+
+TEMPDIR = tempfile.gettempdir()
 
 
 @pytest.mark.usefixtures('test_csv_file_function', 'test_program_dao')
@@ -362,65 +369,90 @@ class TestImport():
         ])
 
     @pytest.mark.unit
-    def test__do_replace_nan_good_value(self):
-        """_do_replace_nan() should return the same value passed if not NaN."""
-        assert _do_replace_nan('Suck It', 'Real Good') == 'Suck It'
+    def test__get_input_column(self, test_csv_file_function):
+        """_get_input_column() should return the values in the input file with the default value in place of NaN."""
+        DUT = Import()
+        DUT._do_read_file('csv', test_csv_file_function)
 
-    @pytest.mark.unit
-    def test__do_replace_nan_python_nan(self):
-        """_do_replace_nan() should return the default value if passed NaN."""
-        assert _do_replace_nan(math.nan, 'Real Good') == 'Real Good'
+        for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+            DUT._do_map_to_field('Function',
+                                 list(DUT._df_input_data)[_idx], _key)
+
+        assert _get_input_column(DUT._dic_field_map['Function'],
+                                 DUT._df_input_data, 'Function ID',
+                                 1).tolist() == [5, 6]
+        assert _get_input_column(DUT._dic_field_map['Function'],
+                                 DUT._df_input_data, 'Function Code',
+                                 '').tolist() == ['PRESS-001', 'FLOW-001']
 
     @pytest.mark.unit
-    def test__do_replace_nan_numpy_nan(self):
-        """_do_replace_nan() should return the default value if passed NaN."""
-        assert _do_replace_nan(np.nan,
-                               'Suck It, Real Good') == 'Suck It, Real Good'
+    def test__get_input_column_key_error(self, test_csv_file_function):
+        """_get_input_column() should return a column of the default value when the field passed does not exist."""
+        DUT = Import()
+        DUT._do_read_file('csv', test_csv_file_function)
+
+        assert _get_input_column(DUT._dic_field_map['Function'],
+                                 DUT._df_input_data, 'Cost',
+                                 0.0).tolist() == [0.0, 0.0]
+        assert _get_input_column(DUT._dic_field_map['Function'],
+                                 DUT._df_input_data, 'Start Date',
+                                 date.today).tolist() == [
+                                     date.today(), date.today()
+                                 ]
 
     @pytest.mark.unit
-    def test__get_input_value(self, test_csv_file_hardware):
-        """_get_input_value() should return the value in the input file."""
+    def test_do_map_records(self, test_csv_file_function):
+        """_do_map_records() should return the rows for each table of the module."""
         DUT = Import()
-        DUT._do_read_file('csv', test_csv_file_hardware)
+        DUT._do_read_file('csv', test_csv_file_function)
+
+        for _idx, _key in enumerate(DUT._dic_field_map['Function']):
+            DUT._do_map_to_field('Function',
+                                 list(DUT._df_input_data)[_idx], _key)
 
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0], 'Revision '
-                                'ID', 10) == 1
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0], 'Hardware '
-                                'ID', 1) == 10
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0], 'Category ID',
-                                1) == 0
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0],
-                                'Composite Ref. Des.', '') == 'S1'
+        _tables = DUT._do_map_records('Function', DUT._df_input_data)
+
+        assert len(_tables) == 1
+        assert _tables[0][0] == RAMSTKFunction
+        assert len(_tables[0][1]) == 2
+        assert _tables[0][1][0]['function_id'] == 5
+        assert _tables[0][1][0]['function_code'] == 'PRESS-001'
+        assert _tables[0][1][1]['function_id'] == 6
+        assert _tables[0][1][1]['safety_critical'] == 0
+        assert DUT._do_map_records('Shibboly', DUT._df_input_data) == []
 
     @pytest.mark.unit
-    def test__get_input_value_nan(self, test_csv_file_hardware):
-        """_get_input_value() should return the default value when the input file contains a NaN."""
+    def test_do_read_chunks_csv(self, test_csv_file_function):
+        """_do_read_chunks() should read the input file in chunks of rows."""
         DUT = Import()
-        DUT._do_read_file('csv', test_csv_file_hardware)
+        DUT._chunk_size = 1
+        DUT._do_read_file('csv', test_csv_file_function)
+
+        _chunks = list(DUT._do_read_chunks())
 
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0],
-                                'Alternate Part Number', 'C2') == 'C2'
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0], 'CAGE Code',
-                                '') == ''
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0], 'Manufacturer',
-                                54) == 54
+        assert len(_chunks) == 2
+        assert _chunks[0]['Function ID'].tolist() == [5]
+        assert _chunks[1]['Function ID'].tolist() == [6]
 
     @pytest.mark.unit
-    def test__get_input_value_key_error(self, test_csv_file_hardware):
-        """_get_input_value() should return the default value when the key passed does not exist."""
+    def test_do_read_chunks_xlsx(self):
+        """_do_read_chunks() should stream an Excel 2007+ workbook in chunks of rows."""
+        _test_file = TEMPDIR + '/test_inputs_functions.xlsx'
+        _book = Workbook()
+        _sheet = _book.active
+        _sheet.append(['Function ID', 'Function Code'])
+        for _function_id in range(5):
+            _sheet.append([_function_id, 'FUNC-{0:d}'.format(_function_id)])
+        _book.save(_test_file)
+
         DUT = Import()
-        DUT._do_read_file('csv', test_csv_file_hardware)
+        DUT._chunk_size = 2
+        DUT._do_read_file('excel', _test_file)
 
-        assert _get_input_value(DUT._dic_field_map['Hardware'],
-                                DUT._df_input_data.iloc[0], 'Alt. Part Num.',
-                                'C2') == 'C2'
+        _chunks = list(DUT._do_read_chunks())
+
+        assert [len(_chunk.index) for _chunk in _chunks] == [2, 2, 1]
+        assert _chunks[2]['Function Code'].tolist() == ['FUNC-4']
 
     @pytest.mark.unit
     def test_do_insert_function(self, test_program_dao,
@@ -556,3 +588,108 @@ class TestImport():
                                  list(DUT._df_input_data)[_idx], _key)
 
         assert DUT._do_import('Shibboly') is None
+
+    @pytest.mark.integration
+    def test_do_import_rejected_row(self, make_bom_dao):
+        """_do_import() should roll back every chunk and send the number of the rejected row in the input file when the database rejects a row."""
+        _dao = make_bom_dao(25)
+        _test_file = TEMPDIR + '/_ramstk_import_rejected_row.csv'
+        with open(_test_file, 'w', newline='') as _csv_file:
+            _writer = csv.writer(_csv_file, delimiter=';')
+            _writer.writerow(['Revision ID', 'Function ID', 'Level',
+                              'Function Code', 'Function Name', 'Parent'])
+            for _function_id in [1000, 1001, 1002, 1000, 1003]:
+                _writer.writerow([1, _function_id, 1, 'FUNC', 'Function', 0])
+
+        _errors = []
+
+        def on_fail_import_module(error_message):
+            _errors.append(error_message)
+
+        pub.subscribe(on_fail_import_module, 'fail_import_module')
+
+        DUT = Import()
+        DUT._do_connect(_dao)
+        DUT._chunk_size = 2
+        DUT._do_read_file('csv', _test_file)
+        for _field in list(DUT._df_input_data):
+            DUT._do_map_to_field('Function', _field, _field)
+
+        DUT._do_import('Function')
+
+        pub.unsubscribe(on_fail_import_module, 'fail_import_module')
+
+        assert len(_errors) == 1
+        assert ('do_bulk_insert: Database error when attempting to add row 4 '
+                'to ramstk_function.') in _errors[0]
+        assert _dao._transaction_depth == 0
+        assert _dao.session.query(RAMSTKFunction).filter(
+            RAMSTKFunction.function_id >= 1000).count() == 0
+
+
+class TestBenchmarks():
+    """Class for import benchmark test suite."""
+    @pytest.fixture(autouse=True)
+    def field_map(self, monkeypatch):
+        """Give each benchmark its own copy of the class field map."""
+        monkeypatch.setattr(Import, '_dic_field_map',
+                            copy.deepcopy(Import._dic_field_map))
+
+    @staticmethod
+    def _make_input_file(module, n_rows):
+        """Write a large input file for the module to import."""
+        _test_file = TEMPDIR + '/_ramstk_import_{0:s}_{1:d}.csv'.format(
+            module, n_rows)
+        with open(_test_file, 'w', newline='') as _csv_file:
+            _writer = csv.writer(_csv_file, delimiter=';')
+            if module == 'Function':
+                _writer.writerow(['Revision ID', 'Function ID', 'Level',
+                                  'Function Code', 'Function Name', 'Parent'])
+                for _idx in range(1000, 1000 + n_rows):
+                    _writer.writerow([1, _idx, 1, 'FUNC-{0:d}'.format(_idx),
+                                      'Function {0:d}'.format(_idx), 0])
+            else:
+                _writer.writerow(['Revision ID', 'Hardware ID', 'Parent ID',
+                                  'Part?', 'Ref. Des.', 'Quantity'])
+                for _idx in range(1000, 1000 + n_rows):
+                    _writer.writerow([1, _idx, 1, 1,
+                                      'HW{0:d}'.format(_idx), 1])
+
+        return _test_file
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('module', ['Function', 'Hardware'])
+    @pytest.mark.parametrize('n_rows', [10000, 100000])
+    def test_do_import_throughput(self, make_bom_dao, module, n_rows):
+        """_do_import() should import large files in seconds."""
+        _dao = make_bom_dao(25)
+        _test_file = self._make_input_file(module, n_rows)
+
+        DUT = Import()
+        DUT._do_connect(_dao)
+        DUT._do_read_file('csv', _test_file)
+        for _field in list(DUT._df_input_data):
+            DUT._do_map_to_field(module, _field, _field)
+        if module == 'Hardware':
+            for _map_name in ['Design Electric', 'Reliability']:
+                DUT._do_map_to_field(_map_name, 'Hardware ID', 'Hardware ID')
+        DUT._dic_field_map['Hardware']['Composite Ref. Des.'] = 'Ref. Des.'
+
+        _start = time.perf_counter()
+        DUT._do_import(module)
+        _elapsed = time.perf_counter() - _start
+
+        print('\n_do_import() imported {0:d} {1:s} rows in {2:.3f} seconds '
+              '({3:.0f} rows/s).'.format(n_rows, module, _elapsed,
+                                         n_rows / _elapsed))
+
+        _table = {
+            'Function': RAMSTKFunction,
+            'Hardware': RAMSTKHardware
+        }[module]
+        _key = {
+            'Function': RAMSTKFunction.function_id,
+            'Hardware': RAMSTKHardware.hardware_id
+        }[module]
+        assert _dao.session.query(_table).filter(
+            _key >= 1000).count() == n_rows
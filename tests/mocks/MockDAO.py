@@ -61,6 +61,18 @@ class MockDAO():
         except ValueError:
             raise DataAccessError('Mock DAO do_delete() error.')
 
+    def do_begin_transaction(self) -> None:
+        """Mock the do_begin_transaction() method."""
+        pass
+
+    def do_commit_transaction(self) -> bool:
+        """Mock the do_commit_transaction() method."""
+        return True
+
+    def do_rollback_transaction(self) -> None:
+        """Mock the do_rollback_transaction() method."""
+        pass
+
     def do_update(self, record=None) -> None:
         """Mock the do_update() method.
 
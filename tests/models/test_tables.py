@@ -0,0 +1,81 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.models.test_tables.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the RAMSTKBaseTable meta-class."""
+
+# Third Party Imports
+import pytest
+
+# RAMSTK Package Imports
+from ramstk.models.programdb import RAMSTKHardware
+
+
+@pytest.mark.usefixtures('make_bom_dao')
+class TestDirtyTracking():
+    """Class for testing the RAMSTKBaseTable change tracking."""
+    @pytest.mark.unit
+    def test_is_dirty_new_record(self):
+        """is_dirty should be True for a record never saved to the
+        database."""
+        DUT = RAMSTKHardware()
+
+        assert DUT.is_dirty
+
+    @pytest.mark.integration
+    def test_is_dirty_loaded_record(self, make_bom_dao):
+        """is_dirty should be False for a record just loaded from the
+        database."""
+        dao = make_bom_dao(25)
+        DUT = dao.session.query(RAMSTKHardware).filter(
+            RAMSTKHardware.hardware_id == 3).first()
+
+        assert not DUT.is_dirty
+
+    @pytest.mark.integration
+    def test_set_attributes_same_values(self, make_bom_dao):
+        """set_attributes() should not make a record dirty when passed the
+        values the record already holds."""
+        dao = make_bom_dao(25)
+        DUT = dao.session.query(RAMSTKHardware).filter(
+            RAMSTKHardware.hardware_id == 3).first()
+        _attributes = DUT.get_attributes()
+        _attributes.pop('revision_id')
+        _attributes.pop('hardware_id')
+
+        DUT.set_attributes(_attributes)
+
+        assert not DUT.is_dirty
+
+    @pytest.mark.integration
+    def test_set_attributes_changed_value(self, make_bom_dao):
+        """set_attributes() should make a record dirty until it is saved."""
+        dao = make_bom_dao(25)
+        DUT = dao.session.query(RAMSTKHardware).filter(
+            RAMSTKHardware.hardware_id == 3).first()
+
+        DUT.set_attributes({'cost': 12.34})
+
+        assert DUT.is_dirty
+
+        dao.do_update(DUT)
+
+        assert not DUT.is_dirty
+
+    @pytest.mark.integration
+    def test_set_attributes_reverted_value(self, make_bom_dao):
+        """is_dirty should be False when a changed value is set back to the
+        value held in the database."""
+        dao = make_bom_dao(25)
+        DUT = dao.session.query(RAMSTKHardware).filter(
+            RAMSTKHardware.hardware_id == 3).first()
+        _cost = DUT.cost
+
+        DUT.set_attributes({'cost': 12.34})
+        DUT.set_attributes({'cost': _cost})
+
+        assert not DUT.is_dirty
@@ -0,0 +1,282 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_batch_mode.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the RAMSTK batch calculation module."""
+
+# Standard Library Imports
+import argparse
+import gc
+
+# Third Party Imports
+import psycopg2
+import pytest
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from pubsub import pub
+
+# RAMSTK Package Imports
+from ramstk import batch
+from ramstk.__main__ import do_parse_arguments
+from ramstk.batch import (
+    BATCH_MODULES, do_run_batch, get_batch_modules, get_timing_report
+)
+from ramstk.configuration import RAMSTKUserConfiguration
+from ramstk.db.base import BaseDatabase, do_dispose_engines
+from ramstk.exceptions import DataAccessError
+from ramstk.models.programdb import RAMSTKAllocation
+
+TEST_BATCH_DB = {
+    'dialect': 'postgres',
+    'user': 'postgres',
+    'password': 'postgres',
+    'host': 'localhost',
+    'port': '5432',
+    'database': 'TestBatchDB'
+}
+
+
+def _do_execute(dbname, statement):
+    """Execute a statement against a database on the test server."""
+    conn = psycopg2.connect(host=TEST_BATCH_DB['host'],
+                            dbname=dbname,
+                            user=TEST_BATCH_DB['user'],
+                            password=TEST_BATCH_DB['password'])
+    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+
+    cursor = conn.cursor()
+    cursor.execute(statement)
+    cursor.close()
+    conn.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_managers():
+    """Delete the managers left by earlier tests before each test runs.
+
+    Managers that are no longer referenced stay subscribed until they're
+    garbage collected and would respond to the messages sent by the batch.
+    """
+    gc.collect()
+    yield
+
+
+@pytest.fixture(scope='function')
+def test_batch_db():
+    """Create a copy of the test program database for the batch to change."""
+    _drop = sql.SQL('DROP DATABASE IF EXISTS {}').format(
+        sql.Identifier(TEST_BATCH_DB['database']))
+    _do_execute('postgres', _drop)
+    _do_execute(
+        'postgres',
+        sql.SQL('CREATE DATABASE {}').format(
+            sql.Identifier(TEST_BATCH_DB['database'])))
+    _do_execute(TEST_BATCH_DB['database'],
+                open('./tests/__data/test_program_db.sql', 'r').read())
+
+    yield TEST_BATCH_DB
+
+    do_dispose_engines(TEST_BATCH_DB['database'])
+    _do_execute('postgres', _drop)
+
+
+@pytest.mark.unit
+def test_get_batch_modules():
+    """get_batch_modules() should return the list of modules to calculate."""
+    assert get_batch_modules('hardware') == ['hardware']
+    assert get_batch_modules('fmea, hardware') == ['fmea', 'hardware']
+
+
+@pytest.mark.unit
+def test_get_batch_modules_unknown_module():
+    """get_batch_modules() should raise an ArgumentTypeError when passed a module that can't be calculated in batch mode."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        get_batch_modules('hardware,revision')
+
+
+@pytest.mark.unit
+def test_get_timing_report():
+    """get_timing_report() should list each stage and the total time."""
+    _lines = get_timing_report({
+        'open': 0.001,
+        'hardware': 0.0025
+    }).splitlines()
+
+    assert _lines[0].split() == ['stage', 'time', '[ms]']
+    assert _lines[1].split() == ['open', '1.0']
+    assert _lines[2].split() == ['hardware', '2.5']
+    assert _lines[3].split() == ['total', '3.5']
+
+
+@pytest.mark.unit
+def test_do_parse_arguments_batch():
+    """do_parse_arguments() should parse the batch command."""
+    _args = do_parse_arguments([
+        'batch', '--db', 'TestBatchDB', '--revision', '2', '--calculate',
+        'fmea,hardware', '--dialect', 'postgres'
+    ])
+
+    assert _args.command == 'batch'
+    assert _args.db == 'TestBatchDB'
+    assert _args.revision == 2
+    assert _args.calculate == ['fmea', 'hardware']
+    assert _args.dialect == 'postgres'
+    assert _args.host is None
+
+    _args = do_parse_arguments(['batch', '--db', 'TestBatchDB'])
+
+    assert _args.revision == 1
+    assert _args.calculate == BATCH_MODULES
+    assert do_parse_arguments([]).command is None
+
+
+@pytest.mark.integration
+def test_do_run_batch(test_batch_db):
+    """do_run_batch() should calculate and save every module and return the time taken by each stage."""
+    _timings = do_run_batch(test_batch_db, 1, BATCH_MODULES,
+                            RAMSTKUserConfiguration())
+
+    assert list(_timings) == [
+        'open', 'load', 'hardware', 'allocation', 'fmea', 'validation', 'save'
+    ]
+    assert all(_time >= 0.0 for _time in _timings.values())
+
+    # The allocation results should have been saved.
+    _dao = BaseDatabase()
+    _dao.do_connect(test_batch_db)
+    _allocation = _dao.session.query(RAMSTKAllocation).filter(
+        RAMSTKAllocation.hardware_id == 6).one()
+    assert _allocation.hazard_rate_alloc == pytest.approx(1.2797979e-05)
+    _dao.do_disconnect()
+
+
+@pytest.mark.integration
+def test_do_run_batch_modules(test_batch_db):
+    """do_run_batch() should only calculate the modules passed to it."""
+    _timings = do_run_batch(test_batch_db, 1, ['validation', 'hardware'],
+                            RAMSTKUserConfiguration())
+
+    assert list(_timings) == ['open', 'load', 'hardware', 'validation', 'save']
+
+
+@pytest.mark.integration
+def test_do_run_batch_unsubscribes(test_batch_db):
+    """do_run_batch() should unsubscribe its managers when it's done."""
+    _topic_mgr = pub.getDefaultTopicMgr()
+    _listeners = _topic_mgr.getTopic(
+        'fail_connect_program_database').getListeners()
+
+    do_run_batch(test_batch_db, 1, ['hardware'], RAMSTKUserConfiguration())
+
+    assert _topic_mgr.getTopic(
+        'fail_connect_program_database').getListeners() == _listeners
+    assert not _topic_mgr.getTopic('request_save_project').hasListeners()
+    assert not _topic_mgr.getTopic('request_calculate_hardware').hasListeners()
+
+
+@pytest.mark.integration
+def test_do_run_batch_no_database():
+    """do_run_batch() should raise a DataAccessError when the program database doesn't exist."""
+    _database = dict(TEST_BATCH_DB)
+    _database['database'] = 'NoSuchBatchDB'
+
+    with pytest.raises(DataAccessError):
+        do_run_batch(_database, 1, BATCH_MODULES, RAMSTKUserConfiguration())
+
+
+@pytest.mark.integration
+def test_do_run_batch_error(make_bom_dao, monkeypatch):
+    """do_run_batch() should raise the error that stopped the batch and close the program database when restoring the SQLite profile fails too."""
+    _dao = make_bom_dao(5)
+    _database = {
+        'dialect': 'sqlite',
+        'user': '',
+        'password': '',
+        'host': '',
+        'port': '',
+        'database': _dao.engine.url.database
+    }
+    _closed = []
+
+    def on_succeed_disconnect():
+        _closed.append(True)
+
+    def _do_calculate_hardware(program_mgr, revision_id):
+        raise RuntimeError('Calculation failed.')
+
+    def _do_set_sqlite_profile(self, profile):
+        if profile != 'bulk':
+            raise DataAccessError('Profile not restored.')
+        return 'default'
+
+    monkeypatch.setattr(batch, 'do_calculate_hardware',
+                        _do_calculate_hardware)
+    monkeypatch.setattr(BaseDatabase, 'do_set_sqlite_profile',
+                        _do_set_sqlite_profile)
+    pub.subscribe(on_succeed_disconnect, 'succeed_disconnect_program_database')
+
+    with pytest.raises(RuntimeError, match='Calculation failed.'):
+        do_run_batch(_database, 1, ['hardware'], RAMSTKUserConfiguration())
+
+    pub.unsubscribe(on_succeed_disconnect,
+                    'succeed_disconnect_program_database')
+
+    assert _closed == [True]
+    assert not pub.getDefaultTopicMgr().getTopic(
+        'request_save_project').hasListeners()
+
+
+@pytest.mark.integration
+def test_do_run_batch_sqlite(make_bom_dao):
+    """do_run_batch() should save a SQLite program with the bulk profile."""
+    _dao = make_bom_dao(25, 'performance')
+    _database = {
+        'dialect': 'sqlite',
+        'user': '',
+        'password': '',
+        'host': '',
+        'port': '',
+        'database': _dao.engine.url.database
+    }
+    _errors = []
+
+    def on_fail_save_program(error_message):
+        _errors.append(error_message)
+
+    pub.subscribe(on_fail_save_program, 'fail_save_program')
+
+    _timings = do_run_batch(_database, 1, ['hardware'],
+                            RAMSTKUserConfiguration())
+
+    pub.unsubscribe(on_fail_save_program, 'fail_save_program')
+
+    assert _errors == []
+    assert list(_timings) == ['open', 'load', 'hardware', 'save']
+
+
+class TestBenchmarks():
+    """Class for RAMSTK batch calculation benchmark test suite."""
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('n_parts', [100, 1000])
+    def test_batch_throughput(self, make_bom_dao, n_parts):
+        """do_run_batch() should calculate and save a BoM of any size."""
+        _dao = make_bom_dao(n_parts)
+        _database = {
+            'dialect': 'sqlite',
+            'user': '',
+            'password': '',
+            'host': '',
+            'port': '',
+            'database': _dao.engine.url.database
+        }
+
+        _timings = do_run_batch(_database, 1, ['hardware'],
+                                RAMSTKUserConfiguration())
+
+        print('\n{0:d} parts:\n{1:s}'.format(n_parts,
+                                             get_timing_report(_timings)))
+        assert list(_timings) == ['open', 'load', 'hardware', 'save']
@@ -337,6 +337,13 @@ class TestCreateConfiguration():
         assert DUT.RAMSTK_HR_MULTIPLIER == 1.0
         assert DUT.RAMSTK_DEC_PLACES == 6
         assert DUT.RAMSTK_MTIME == 100.0
+        assert DUT.RAMSTK_PREDICTION_CHUNK_SIZE == 500
+        assert DUT.RAMSTK_PREDICTION_WORKERS == 0
+        assert DUT.RAMSTK_SQLITE_PROFILE == "performance"
+        assert DUT.RAMSTK_SQLITE_PROFILES == {}
+        assert DUT.RAMSTK_POOL_SIZE == 5
+        assert DUT.RAMSTK_POOL_OVERFLOW == 10
+        assert DUT.RAMSTK_POOL_PRE_PING
         assert DUT.RAMSTK_GUI_LAYOUT == "advanced"
         assert DUT.RAMSTK_METHOD == "STANDARD"  # STANDARD or LRM
         assert DUT.RAMSTK_LOCALE == "en_US.UTF8"
@@ -765,6 +772,12 @@ class TestGetterSetter():
         assert DUT.RAMSTK_DEC_PLACES == 6
         assert DUT.RAMSTK_MTIME == 100.0
         assert DUT.RAMSTK_MODE_SOURCE == '1'
+        assert DUT.RAMSTK_PREDICTION_WORKERS == 0
+        assert DUT.RAMSTK_PREDICTION_CHUNK_SIZE == 500
+        assert DUT.RAMSTK_SQLITE_PROFILE == 'performance'
+        assert DUT.RAMSTK_POOL_SIZE == 5
+        assert DUT.RAMSTK_POOL_OVERFLOW == 10
+        assert DUT.RAMSTK_POOL_PRE_PING
         assert DUT.RAMSTK_TABPOS["listbook"] == 'bottom'
         assert DUT.RAMSTK_TABPOS["modulebook"] == 'top'
         assert DUT.RAMSTK_TABPOS["workbook"] == 'bottom'
@@ -772,6 +785,15 @@ class TestGetterSetter():
         assert DUT.RAMSTK_IMPORT_LOG == (DUT.RAMSTK_LOG_DIR
                                          + "/ramstk_import.log")
 
+    @pytest.mark.unit
+    def test_get_sqlite_profile(self):
+        """get_sqlite_profile() should return the program's own profile or the default profile."""
+        DUT = RAMSTKUserConfiguration()
+        DUT.RAMSTK_SQLITE_PROFILES = {'/tmp/big.ramstk': 'bulk'}
+
+        assert DUT.get_sqlite_profile('/tmp/big.ramstk') == 'bulk'
+        assert DUT.get_sqlite_profile('/tmp/small.ramstk') == 'performance'
+
     @pytest.mark.unit
     def test_get_user_configuration_no_conf_file(self):
         """get_user_configuration() should broadcase the fail message when
@@ -813,6 +835,13 @@ class TestGetterSetter():
         DUT.RAMSTK_HR_MULTIPLIER = 1000000.0
         DUT.RAMSTK_MTIME = 24.0
         DUT.RAMSTK_DEC_PLACES = 4
+        DUT.RAMSTK_PREDICTION_WORKERS = 8
+        DUT.RAMSTK_PREDICTION_CHUNK_SIZE = 250
+        DUT.RAMSTK_SQLITE_PROFILE = 'default'
+        DUT.RAMSTK_SQLITE_PROFILES = {'/tmp/big.ramstk': 'bulk'}
+        DUT.RAMSTK_POOL_SIZE = 2
+        DUT.RAMSTK_POOL_OVERFLOW = 0
+        DUT.RAMSTK_POOL_PRE_PING = False
         DUT.RAMSTK_BACKEND = 'mysql'
         DUT.RAMSTK_PROG_INFO = {
             'dialect': 'mysql',
@@ -831,6 +860,13 @@ class TestGetterSetter():
         assert DUT.RAMSTK_HR_MULTIPLIER == 1000000.0
         assert DUT.RAMSTK_MTIME == 24.0
         assert DUT.RAMSTK_DEC_PLACES == 4
+        assert DUT.RAMSTK_PREDICTION_WORKERS == 8
+        assert DUT.RAMSTK_PREDICTION_CHUNK_SIZE == 250
+        assert DUT.RAMSTK_SQLITE_PROFILE == 'default'
+        assert DUT.RAMSTK_SQLITE_PROFILES == {'/tmp/big.ramstk': 'bulk'}
+        assert DUT.RAMSTK_POOL_SIZE == 2
+        assert DUT.RAMSTK_POOL_OVERFLOW == 0
+        assert not DUT.RAMSTK_POOL_PRE_PING
         assert DUT.RAMSTK_BACKEND == 'mysql'
         assert DUT.RAMSTK_PROG_INFO == {
             'dialect': 'mysql',
@@ -0,0 +1,193 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.test_profiler.py is part of The RAMSTK Project
+#
+# All rights reserved.
+# Copyright 2007 - 2021 Doyle Rowland doyle.rowland <AT> reliaqual <DOT> com
+"""Test class for testing the import profiler and RAMSTK startup time."""
+
+# Standard Library Imports
+import os
+import shutil
+import subprocess
+import sys
+
+# Third Party Imports
+import pytest
+import toml
+
+# RAMSTK Package Imports
+from ramstk.__main__ import do_parse_arguments
+from ramstk.profiler import RAMSTKImportProfiler
+
+# The modules that make RAMSTK slow to start; none of them should be imported
+# until they're used.
+HEAVY_MODULES = ['openpyxl', 'pandas', 'scipy.stats', 'sympy', 'xlwt']
+
+
+@pytest.fixture
+def test_package(tmp_path, monkeypatch):
+    """Create a package whose module imports another module."""
+    _package = tmp_path / 'ramstk_profile_pkg'
+    _package.mkdir()
+    (_package / '__init__.py').write_text('')
+    (_package / 'outer.py').write_text(
+        'import time\n'
+        'time.sleep(0.02)\n'
+        'from ramstk_profile_pkg import inner\n')
+    (_package / 'inner.py').write_text('import time\ntime.sleep(0.05)\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield 'ramstk_profile_pkg'
+
+    for _name in ['ramstk_profile_pkg', 'ramstk_profile_pkg.outer',
+                  'ramstk_profile_pkg.inner']:
+        sys.modules.pop(_name, None)
+
+
+@pytest.mark.unit
+def test_create_profiler():
+    """__init__() should create a RAMSTKImportProfiler with no times."""
+    DUT = RAMSTKImportProfiler()
+
+    assert isinstance(DUT, RAMSTKImportProfiler)
+    assert DUT.dic_times == {}
+    assert DUT.elapsed == 0.0
+    assert DUT not in sys.meta_path
+
+
+@pytest.mark.unit
+def test_do_start_stop():
+    """do_start() and do_stop() should add and remove the profiler from the meta path."""
+    DUT = RAMSTKImportProfiler()
+
+    DUT.do_start()
+    assert sys.meta_path[0] is DUT
+
+    DUT.do_stop()
+    assert DUT not in sys.meta_path
+    assert DUT.elapsed > 0.0
+
+
+@pytest.mark.unit
+def test_profile_imports(test_package):
+    """The profiler should record the self and cumulative time of each import."""
+    DUT = RAMSTKImportProfiler()
+
+    DUT.do_start()
+    # noinspection PyUnresolvedReferences
+    import ramstk_profile_pkg.outer  # noqa
+    DUT.do_stop()
+
+    _outer_self, _outer_cumulative = DUT.dic_times['ramstk_profile_pkg.outer']
+    _inner_self, _inner_cumulative = DUT.dic_times['ramstk_profile_pkg.inner']
+    assert _inner_self == pytest.approx(_inner_cumulative)
+    assert _inner_cumulative >= 0.05
+    assert _outer_self >= 0.02
+    assert _outer_self < _inner_cumulative
+    assert _outer_cumulative == pytest.approx(_outer_self + _inner_cumulative)
+
+    # The loaders should be left the way they were found.
+    assert 'exec_module' not in vars(
+        sys.modules['ramstk_profile_pkg.inner'].__spec__.loader)
+
+
+@pytest.mark.unit
+def test_get_report(test_package):
+    """get_report() should list the modules from slowest to fastest."""
+    DUT = RAMSTKImportProfiler()
+
+    DUT.do_start()
+    # noinspection PyUnresolvedReferences
+    import ramstk_profile_pkg.outer  # noqa
+    DUT.do_stop()
+
+    _lines = DUT.get_report(limit=2).splitlines()
+
+    assert len(_lines) == 4
+    assert _lines[0].split() == ['self', '[ms]', 'cumul.', '[ms]', 'module']
+    assert _lines[1].endswith('ramstk_profile_pkg.outer')
+    assert _lines[2].endswith('ramstk_profile_pkg.inner')
+    assert _lines[3].startswith('Imported 3 modules; startup took')
+
+
+@pytest.mark.unit
+def test_do_parse_arguments():
+    """do_parse_arguments() should set startup_profile when passed the --startup-profile switch."""
+    assert not do_parse_arguments([]).startup_profile
+    assert do_parse_arguments(['--startup-profile']).startup_profile
+    assert do_parse_arguments(['--startup-profile',
+                               '--gtk-debug=all']).startup_profile
+
+
+class TestBenchmarks():
+    """Class for RAMSTK startup benchmark test suite."""
+    @pytest.mark.benchmark
+    def test_cold_start_imports(self):
+        """The controllers and exim packages should import without the heavy modules."""
+        _code = ('import sys, time\n'
+                 '_start = time.perf_counter()\n'
+                 'import ramstk.__main__, ramstk.controllers, ramstk.exim\n'
+                 'print(time.perf_counter() - _start)\n'
+                 'print(" ".join(_name for _name in {0} if _name in '
+                 'sys.modules and type(sys.modules[_name]).__name__ != '
+                 '"_LazyModule"))\n').format(HEAVY_MODULES)
+
+        _output = subprocess.run([sys.executable, '-c', _code],
+                                 capture_output=True,
+                                 check=True,
+                                 text=True).stdout.splitlines()
+
+        print('\ncold start import: {0:.1f} ms'.format(
+            float(_output[0]) * 1000.0))
+        assert _output[1:] in [[], ['']]
+
+    @pytest.mark.benchmark
+    @pytest.mark.gui
+    def test_cold_start_to_window_map(self, tmp_path):
+        """the_one_ring() should map the RAMSTK desktop and report the startup profile."""
+        pytest.importorskip('gi')
+
+        # Start RAMSTK with its own user configuration so the user's
+        # configuration is never read or changed.
+        _conf_dir = tmp_path / '.config' / 'RAMSTK'
+        shutil.copytree('./data/layouts', str(_conf_dir / 'layouts'))
+        shutil.copytree('./data/icons', str(_conf_dir / 'icons'))
+        (_conf_dir / 'logs').mkdir()
+        (tmp_path / 'analyses' / 'ramstk').mkdir(parents=True)
+        _configuration = toml.load('./data/RAMSTK.toml')
+        _configuration['directories'] = {
+            'datadir': str(_conf_dir / 'layouts'),
+            'icondir': str(_conf_dir / 'icons'),
+            'logdir': str(_conf_dir / 'logs'),
+            'progdir': str(tmp_path / 'analyses' / 'ramstk'),
+        }
+        with open(str(_conf_dir / 'RAMSTK.toml'), 'w') as _file:
+            toml.dump(_configuration, _file)
+
+        _env = dict(os.environ,
+                    HOME=str(tmp_path),
+                    XDG_CONFIG_HOME=str(tmp_path / '.config'),
+                    PYTHONUNBUFFERED='1')
+        _process = subprocess.Popen(
+            [sys.executable, '-m', 'ramstk', '--startup-profile'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=_env,
+            text=True)
+        # RAMSTK keeps running after the desktop is mapped so it's killed
+        # once it has had time to start.
+        try:
+            _output, __ = _process.communicate(timeout=60)
+        except subprocess.TimeoutExpired:
+            _process.kill()
+            _output, __ = _process.communicate()
+
+        _lines = [
+            _line for _line in _output.splitlines()
+            if _line.startswith('Imported ')
+        ]
+        assert _lines
+        print('\n' + _lines[0])
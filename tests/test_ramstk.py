@@ -15,7 +15,8 @@ import pytest
 from pubsub import pub
 
 # RAMSTK Package Imports
-from ramstk.db.base import BaseDatabase
+from ramstk.controllers import dmFunction
+from ramstk.db.base import BaseDatabase, do_create_program_db
 from ramstk.ramstk import RAMSTKProgramManager
 
 
@@ -52,23 +53,11 @@ class TestProgramManager():
                                  'Nothing to close.')
         print("\033[35m\nfail_disconnect_program_database topic was broadcast")
 
-    def on_request_update_revision(self):
-        print("\033[36m\nrequest_update_all_revisions topic was broadcast")
+    def on_request_save_project(self):
+        print("\033[36m\nrequest_save_project topic was broadcast")
 
-    def on_request_update_function(self):
-        print("\033[36mrequest_update_all_functions topic was broadcast")
-
-    def on_request_update_requirement(self):
-        print("\033[36mrequest_update_all_requirements topic was broadcast")
-
-    def on_request_update_stakeholder(self):
-        print("\033[36mrequest_update_all_stakeholders topic was broadcast")
-
-    def on_request_update_hardware(self):
-        print("\033[36mrequest_update_all_hardware topic was broadcast")
-
-    def on_request_update_validation(self):
-        print("\033[36mrequest_update_all_validation topic was broadcast")
+    def on_succeed_save_program(self):
+        print("\033[36msucceed_save_program topic was broadcast")
 
     def on_succeed_create_sqlite_program(self, program_db, database):
         assert isinstance(program_db, BaseDatabase)
@@ -260,19 +249,15 @@ class TestProgramManager():
     @pytest.mark.unit
     def test_save_program(self):
         """do_save_program() should cause all workstream modules to execute
-        their save_all() method."""
-        pub.subscribe(self.on_request_update_revision,
-                      'request_update_all_revisions')
-        pub.subscribe(self.on_request_update_function,
-                      'request_update_all_functions')
-        pub.subscribe(self.on_request_update_requirement,
-                      'request_update_all_requirements')
-        pub.subscribe(self.on_request_update_stakeholder,
-                      'request_update_all_stakeholders')
-        pub.subscribe(self.on_request_update_hardware,
-                      'request_update_all_hardware')
-        pub.subscribe(self.on_request_update_validation,
-                      'request_update_all_validation')
+        their save_all() method within a single unit of work."""
+        _update_all = []
+
+        def on_succeed_update_all():
+            _update_all.append(True)
+
+        pub.subscribe(self.on_request_save_project, 'request_save_project')
+        pub.subscribe(self.on_succeed_save_program, 'succeed_save_program')
+        pub.subscribe(on_succeed_update_all, 'succeed_update_all')
 
         test_program_db = {
             'dialect': 'postgres',
@@ -283,22 +268,111 @@ class TestProgramManager():
             'database': 'TestProgramDB'
         }
 
+        _function = dmFunction()
+
+        DUT = RAMSTKProgramManager()
+        DUT.do_open_program(BaseDatabase(), test_program_db)
+        _function.do_select_all(attributes={'revision_id': 1})
+        DUT.do_save_program()
+
+        # The function module's changes were committed with the program, not
+        # by the function module.
+        assert DUT.program_dao._transaction_depth == 0
+        assert _update_all == []
+
+        _function.do_update_all()
+
+        assert _update_all == [True]
+
+        DUT.do_close_program()
+
+        pub.unsubscribe(self.on_request_save_project, 'request_save_project')
+        pub.unsubscribe(self.on_succeed_save_program, 'succeed_save_program')
+        pub.unsubscribe(on_succeed_update_all, 'succeed_update_all')
+
+    @pytest.mark.unit
+    def test_save_program_subscriber_error(self, tmp_path):
+        """do_save_program() should roll back, restore the SQLite profile,
+        and send the fail message when a module's save raises an error."""
+        test_program_db = {
+            'dialect': 'sqlite',
+            'user': '',
+            'password': '',
+            'host': '',
+            'port': '',
+            'database': str(tmp_path / '_ramstk_save_db.ramstk')
+        }
+        with open('./data/sqlite_program_db.sql', 'r') as _sql_file:
+            do_create_program_db(test_program_db, _sql_file)
+
+        _messages = []
+
+        def on_request_save_project():
+            raise RuntimeError('Module save failed.')
+
+        def on_fail_save_program(error_message):
+            _messages.append(error_message)
+
+        def on_succeed_save_program():
+            _messages.append('succeed_save_program')
+
+        DUT = RAMSTKProgramManager()
+        DUT.do_open_program(BaseDatabase(), test_program_db)
+        _profile = DUT.program_dao._sqlite_profile
+
+        pub.subscribe(on_request_save_project, 'request_save_project')
+        pub.subscribe(on_fail_save_program, 'fail_save_program')
+        pub.subscribe(on_succeed_save_program, 'succeed_save_program')
+
+        DUT.do_save_program()
+
+        pub.unsubscribe(on_request_save_project, 'request_save_project')
+        pub.unsubscribe(on_fail_save_program, 'fail_save_program')
+        pub.unsubscribe(on_succeed_save_program, 'succeed_save_program')
+
+        assert _messages == ['Module save failed.']
+        assert DUT.program_dao._transaction_depth == 0
+        assert DUT.program_dao._sqlite_profile == _profile != 'bulk'
+
+        DUT.do_close_program()
+
+    @pytest.mark.unit
+    def test_sqlite_program_profile(self, test_toml_user_configuration,
+                                    tmp_path):
+        """do_open_program() should connect with the program's SQLite profile and do_save_program() should save with the bulk profile."""
+        test_program_db = {
+            'dialect': 'sqlite',
+            'user': '',
+            'password': '',
+            'host': '',
+            'port': '',
+            'database': str(tmp_path / '_ramstk_profile_db.ramstk')
+        }
+        with open('./data/sqlite_program_db.sql', 'r') as _sql_file:
+            do_create_program_db(test_program_db, _sql_file)
+        test_toml_user_configuration.RAMSTK_SQLITE_PROFILES = {
+            test_program_db['database']: 'default'
+        }
+
+        def on_request_save_project():
+            _profiles.append(DUT.program_dao._sqlite_profile)
+
+        _profiles = []
+        pub.subscribe(on_request_save_project, 'request_save_project')
+
         DUT = RAMSTKProgramManager()
+        DUT.user_configuration = test_toml_user_configuration
         DUT.do_open_program(BaseDatabase(), test_program_db)
         DUT.do_save_program()
 
-        pub.unsubscribe(self.on_request_update_revision,
-                        'request_update_all_revisions')
-        pub.unsubscribe(self.on_request_update_function,
-                        'request_update_all_functions')
-        pub.unsubscribe(self.on_request_update_requirement,
-                        'request_update_all_requirements')
-        pub.unsubscribe(self.on_request_update_stakeholder,
-                        'request_update_all_stakeholders')
-        pub.unsubscribe(self.on_request_update_hardware,
-                        'request_update_all_hardware')
-        pub.unsubscribe(self.on_request_update_validation,
-                        'request_update_all_validation')
+        assert _profiles == ['bulk']
+        assert DUT.program_dao._sqlite_profile == 'default'
+        assert 'sqlite_profile' not in test_program_db
+
+        DUT.do_close_program()
+
+        pub.unsubscribe(on_request_save_project, 'request_save_project')
+        test_toml_user_configuration.RAMSTK_SQLITE_PROFILES = {}
 
     @pytest.mark.unit
     def test_do_create_sqlite_program(self, test_toml_user_configuration):
@@ -12,8 +12,10 @@
 import glob
 import os
 import platform
+import sys
 import tempfile
 from datetime import datetime
+from types import ModuleType
 
 # Third Party Imports
 import pytest
@@ -24,6 +26,7 @@ from ramstk import (
     get_install_prefix, integer_to_boolean, none_to_default,
     none_to_string, ordinal_to_date, split_string, string_to_boolean
 )
+from ramstk.utilities import lazy_import
 
 TEMPDIR = tempfile.gettempdir()
 
@@ -201,3 +204,33 @@ def test_get_install_prefix():
     _path = get_install_prefix()
 
     assert _path == VIRTUAL_ENV
+
+
+@pytest.mark.unit
+def test_lazy_import(tmp_path, monkeypatch):
+    """lazy_import() should not execute the module until it's first used."""
+    (tmp_path / 'ramstk_lazy_module.py').write_text('ANSWER = 42\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, 'ramstk_lazy_module', raising=False)
+
+    _module = lazy_import('ramstk_lazy_module')
+
+    assert type(_module) is not ModuleType
+    assert sys.modules['ramstk_lazy_module'] is _module
+    assert _module.ANSWER == 42
+    assert type(_module) is ModuleType
+
+    sys.modules.pop('ramstk_lazy_module')
+
+
+@pytest.mark.unit
+def test_lazy_import_already_imported():
+    """lazy_import() should return a module that's already been imported."""
+    assert lazy_import('os') is os
+
+
+@pytest.mark.unit
+def test_lazy_import_missing_module():
+    """lazy_import() should raise a ModuleNotFoundError when passed the name of a module that doesn't exist."""
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import('ramstk_no_such_module')
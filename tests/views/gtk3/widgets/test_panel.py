@@ -0,0 +1,153 @@
+# pylint: skip-file
+# type: ignore
+# -*- coding: utf-8 -*-
+#
+#       tests.views.gtk3.widgets.test_panel.py is part of The RAMSTK Project
+#
+# All rights reserved.
+"""Test class for the GTK3 panel module algorithms and models."""
+
+# Third Party Imports
+import pytest
+import treelib
+
+# RAMSTK Package Imports
+from ramstk.views.gtk3.widgets import RAMSTKPanel
+
+
+def _make_panel():
+    """Create a RAMSTKPanel() with a two column RAMSTKTreeView()."""
+    _panel = RAMSTKPanel()
+    _panel.tvwTreeView.position = {'col0': 0, 'col1': 1}
+    _panel.tvwTreeView.datatypes = {'col0': 'gint', 'col1': 'gchararray'}
+    _panel.tvwTreeView.korder = {'hardware_id': 'hardware_id', 'name': 'name'}
+    _panel.tvwTreeView.do_make_model()
+    _panel._dic_attribute_updater = {'name': [None, 'edited', 1]}
+    _panel._lst_col_order = [0, 1]
+
+    return _panel
+
+
+def _make_tree(nodes):
+    """Create a hardware tree with the (node ID, parent ID) pairs."""
+    _tree = treelib.Tree()
+    _tree.create_node(tag='hardware', identifier=0, data=None)
+    for _node_id, _parent in nodes:
+        _tree.create_node(tag='hardware',
+                          identifier=_node_id,
+                          parent=_parent,
+                          data={
+                              'hardware': {
+                                  'hardware_id': _node_id,
+                                  'name': 'Item {0:d}'.format(_node_id)
+                              }
+                          })
+
+    return _tree
+
+
+@pytest.mark.usefixtures('test_toml_user_configuration')
+class TestRAMSTKPanel():
+    """Test class for the RAMSTKPanel."""
+    @pytest.mark.gui
+    def test_do_load_tree_row_references(self):
+        """do_load_tree() should add the row of every record to the row
+        index."""
+        DUT = _make_panel()
+
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1), (3, 1), (4, 0)]))
+
+        _model = DUT.tvwTreeView.get_model()
+        assert sorted(DUT._dic_row_references) == [1, 2, 3, 4]
+        for _node_id in [1, 2, 3, 4]:
+            assert _model.get_value(DUT.do_get_row(_node_id), 0) == _node_id
+
+    @pytest.mark.gui
+    def test_do_get_row_unknown_record(self):
+        """do_get_row() should return None when the record isn't
+        displayed."""
+        DUT = _make_panel()
+
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1)]))
+
+        assert DUT.do_get_row(10) is None
+
+    @pytest.mark.gui
+    def test_do_get_row_rows_inserted(self):
+        """do_get_row() should return the record's row after rows are
+        inserted before it."""
+        DUT = _make_panel()
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1), (3, 1), (4, 0)]))
+        _model = DUT.tvwTreeView.get_model()
+
+        _row = _model.prepend(None, [5, 'Item 5'])
+        DUT._do_set_row_references({5: _row})
+        _model.insert(DUT.do_get_row(1), 0, [6, 'Item 6'])
+
+        assert _model.get_value(DUT.do_get_row(5), 0) == 5
+        for _node_id in [1, 2, 3, 4]:
+            assert _model.get_value(DUT.do_get_row(_node_id), 0) == _node_id
+        assert str(_model.get_path(DUT.do_get_row(3))) == '1:2'
+
+    @pytest.mark.gui
+    def test_do_get_row_rows_removed(self):
+        """do_get_row() should return None and remove the record from the
+        row index after its row or an ancestor's row is removed."""
+        DUT = _make_panel()
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1), (3, 1), (4, 0)]))
+        _model = DUT.tvwTreeView.get_model()
+
+        _model.remove(DUT.do_get_row(1))
+
+        assert DUT.do_get_row(1) is None
+        assert DUT.do_get_row(3) is None
+        assert sorted(DUT._dic_row_references) == [2, 4]
+        assert _model.get_value(DUT.do_get_row(4), 0) == 4
+
+    @pytest.mark.gui
+    def test_do_get_row_tree_reloaded(self):
+        """do_get_row() should return the rows of the reloaded tree."""
+        DUT = _make_panel()
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1), (3, 1), (4, 0)]))
+
+        DUT.do_load_tree(_make_tree([(4, 0), (7, 4)]))
+
+        _model = DUT.tvwTreeView.get_model()
+        assert sorted(DUT._dic_row_references) == [4, 7]
+        assert DUT.do_get_row(1) is None
+        assert str(_model.get_path(DUT.do_get_row(4))) == '0'
+        assert _model.get_value(DUT.do_get_row(7), 0) == 7
+
+    @pytest.mark.gui
+    def test_do_refresh_rows(self):
+        """do_refresh_rows() should update the rows of the records in the
+        package and skip the records that aren't displayed."""
+        DUT = _make_panel()
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1), (3, 1), (4, 0)]))
+
+        DUT.do_refresh_rows({
+            3: {
+                'name': 'New name',
+                'cost': 10.0
+            },
+            10: {
+                'name': 'Not displayed'
+            }
+        })
+
+        _model = DUT.tvwTreeView.get_model()
+        assert _model.get_value(DUT.do_get_row(3), 1) == 'New name'
+        assert _model.get_value(DUT.do_get_row(2), 1) == 'Item 2'
+
+    @pytest.mark.gui
+    def test_do_refresh_tree(self):
+        """do_refresh_tree() should update the record's row rather than the
+        selected row."""
+        DUT = _make_panel()
+        DUT.do_load_tree(_make_tree([(1, 0), (2, 1), (3, 1), (4, 0)]))
+
+        DUT.do_refresh_tree([3, -1], {'name': 'New name'})
+
+        _model = DUT.tvwTreeView.get_model()
+        assert _model.get_value(DUT.do_get_row(3), 1) == 'New name'
+        assert _model.get_value(DUT.do_get_row(1), 1) == 'Item 1'
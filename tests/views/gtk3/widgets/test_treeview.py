@@ -9,6 +9,7 @@
 
 # Third Party Imports
 import pytest
+import treelib
 
 # RAMSTK Package Imports
 from ramstk.views.gtk3.widgets import RAMSTKTreeView
@@ -30,3 +31,36 @@ class TestRAMSTKTreeView():
         assert DUT.position == {}
         assert DUT.visible == {}
         assert DUT.widgets == {}
+
+    @pytest.mark.gui
+    def test_do_load_tree(self):
+        """do_load_tree() should load the tree's rows in pre-order under
+        their parent rows."""
+        DUT = RAMSTKTreeView()
+        DUT.position = {'col0': 0, 'col1': 1}
+        DUT.datatypes = {'col0': 'gint', 'col1': 'gchararray'}
+        DUT.korder = {'hardware_id': 'hardware_id', 'name': 'name'}
+        DUT.do_make_model()
+
+        _tree = treelib.Tree()
+        _tree.create_node(tag='hardwares', identifier=0, data=None)
+        for _node_id, _parent in [(1, 0), (2, 1), (3, 1), (4, 0)]:
+            _tree.create_node(tag='hardware',
+                              identifier=_node_id,
+                              parent=_parent,
+                              data={
+                                  'hardware': {
+                                      'hardware_id': _node_id,
+                                      'name': 'Item {0:d}'.format(_node_id)
+                                  }
+                              })
+
+        DUT.do_load_tree(_tree, 'hardware')
+
+        _model = DUT.get_model()
+        _row = _model.get_iter_first()
+        assert _model.get_value(_row, 0) == 1
+        assert _model.iter_n_children(_row) == 2
+        assert _model.get_value(_model.iter_nth_child(_row, 1), 0) == 3
+        assert _model.get_value(_model.iter_next(_row), 0) == 4
+        assert _model.iter_n_children(None) == 2